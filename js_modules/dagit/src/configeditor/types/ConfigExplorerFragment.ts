@@ -348,6 +348,7 @@ export enum LogLevel {
 export enum PipelineRunStatus {
   FAILURE = "FAILURE",
   NOT_STARTED = "NOT_STARTED",
+  QUEUED = "QUEUED",
   STARTED = "STARTED",
   SUCCESS = "SUCCESS",
 }
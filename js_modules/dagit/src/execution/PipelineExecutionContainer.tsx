@@ -78,6 +78,7 @@ export default class PipelineExecutionContainer extends React.Component<
   subscribeToRuns() {
     const validRuns = this.props.pipeline.runs.filter(({ status }) => {
       return (
+        status === PipelineRunStatus.QUEUED ||
         status === PipelineRunStatus.NOT_STARTED ||
         status === PipelineRunStatus.STARTED
       );
@@ -49,6 +49,7 @@ export interface GetExecutionPlanVariables {
 export enum PipelineRunStatus {
   FAILURE = "FAILURE",
   NOT_STARTED = "NOT_STARTED",
+  QUEUED = "QUEUED",
   STARTED = "STARTED",
   SUCCESS = "SUCCESS",
 }
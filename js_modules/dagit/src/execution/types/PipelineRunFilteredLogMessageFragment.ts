@@ -47,6 +47,7 @@ export type PipelineRunFilteredLogMessageFragment = PipelineRunFilteredLogMessag
 export enum PipelineRunStatus {
   FAILURE = "FAILURE",
   NOT_STARTED = "NOT_STARTED",
+  QUEUED = "QUEUED",
   STARTED = "STARTED",
   SUCCESS = "SUCCESS",
 }
@@ -20,7 +20,13 @@ AirlineDemoResources = namedtuple(
 
 
 SparkDataFrameType = as_dagster_type(
-    DataFrame, name='SparkDataFrameType', description='A Pyspark data frame.'
+    DataFrame,
+    name='SparkDataFrameType',
+    description='A Pyspark data frame.',
+    # Only the schema: counting rows would trigger the computation of the data frame
+    value_summary_fn=lambda data_frame: 'Spark DataFrame with columns: {columns}'.format(
+        columns=', '.join(data_frame.columns)
+    ),
 )
 
 SqlAlchemyEngineType = as_dagster_type(
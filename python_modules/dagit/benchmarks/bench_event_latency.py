@@ -0,0 +1,107 @@
+'''
+Measures how long the events of a run take to reach a subscriber of the run, from the moment
+they are created in the worker process to the moment the subscriber receives them, when runs
+are executed by the MultiprocessingExecutionManager.
+
+Usage:
+
+    python benchmarks/bench_event_latency.py [--runs 10] [--debounce 0.1]
+'''
+
+import argparse
+import time
+
+import gevent
+
+from dagster import DependencyDefinition, InputDefinition, PipelineDefinition, lambda_solid
+from dagster.cli.dynamic_loader import RepositoryTargetInfo
+from dagster.core.execution import ExecutionSelector, create_execution_plan
+
+from dagit.app import RepositoryContainer
+from dagit.pipeline_execution_manager import MultiprocessingExecutionManager
+from dagit.pipeline_run_storage import InMemoryPipelineRun
+
+NUM_SOLIDS = 20
+
+
+def define_chain_pipeline():
+    solids = []
+    dependencies = {}
+    for index in range(NUM_SOLIDS):
+        name = 'solid_{index}'.format(index=index)
+        if index == 0:
+
+            @lambda_solid(name=name)
+            def _first():
+                return 0
+
+            solids.append(_first)
+        else:
+
+            @lambda_solid(name=name, inputs=[InputDefinition('num')])
+            def _next(num):
+                return num + 1
+
+            solids.append(_next)
+            dependencies[name] = {'num': DependencyDefinition('solid_{}'.format(index - 1))}
+
+    return PipelineDefinition(name='chain', solids=solids, dependencies=dependencies)
+
+
+def _percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def main(num_runs, debounce_interval):
+    repository_container = RepositoryContainer(
+        RepositoryTargetInfo(
+            repository_yaml=None,
+            python_file=__file__,
+            fn_name='define_chain_pipeline',
+            module_name=None,
+        )
+    )
+    pipeline = define_chain_pipeline()
+    execution_manager = MultiprocessingExecutionManager()
+
+    latencies = []
+
+    def _on_events(events):
+        received = time.time()
+        latencies.extend(received - event.timestamp for event in events)
+
+    for index in range(num_runs):
+        pipeline_run = InMemoryPipelineRun(
+            'run_{index}'.format(index=index),
+            ExecutionSelector('chain'),
+            {},
+            create_execution_plan(pipeline),
+        )
+        pipeline_run.observable_after_cursor(debounce_interval=debounce_interval).subscribe(
+            _on_events
+        )
+        execution_manager.execute_pipeline(repository_container, pipeline, pipeline_run)
+        execution_manager.join()
+
+    # Let the last batch reach the subscriber
+    gevent.sleep(debounce_interval + 0.1)
+    execution_manager.shutdown()
+
+    latencies.sort()
+    print('{:>8} {:>10} {:>10} {:>10}'.format('events', 'p50 (ms)', 'p95 (ms)', 'max (ms)'))
+    print(
+        '{:>8} {:>10.1f} {:>10.1f} {:>10.1f}'.format(
+            len(latencies),
+            _percentile(latencies, 0.5) * 1000,
+            _percentile(latencies, 0.95) * 1000,
+            latencies[-1] * 1000,
+        )
+    )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--debounce', type=float, default=0.1)
+    args = parser.parse_args()
+    main(args.runs, args.debounce)
@@ -15,6 +15,7 @@ from dagster import check
 from dagster.cli.dynamic_loader import DynamicObject, load_repository_object_from_target_info
 
 from .pipeline_execution_manager import MultiprocessingExecutionManager, SynchronousExecutionManager
+from .pipeline_run_storage import DEFAULT_DEBOUNCE_INTERVAL
 from .schema import create_schema
 from .schema.context import DagsterGraphQLContext
 from .subscription_server import DagsterSubscriptionServer
@@ -29,6 +30,9 @@ class RepositoryContainer(object):
     '''
 
     def __init__(self, repository_target_info=None, repository=None):
+        # Bumped on every reload, so that processes that have loaded an older version of the
+        # repository can be retired
+        self.generation = 0
         if repository_target_info is not None:
             self.repository_target_info = repository_target_info
             self.repo_dynamic_obj = check.inst(
@@ -45,6 +49,7 @@ class RepositoryContainer(object):
     def reload(self):
         if not self.repo_dynamic_obj:
             return
+        self.generation += 1
         try:
             self.repo = self.repo_dynamic_obj.load()
             self.repo_error = None
@@ -117,7 +122,12 @@ def notebook_view(_path):
         return "<style>" + resources['inlining']['css'][0] + "</style>" + body, 200
 
 
-def create_app(repository_container, pipeline_runs, use_synchronous_execution_manager=False):
+def create_app(
+    repository_container,
+    pipeline_runs,
+    use_synchronous_execution_manager=False,
+    log_debounce_interval=DEFAULT_DEBOUNCE_INTERVAL,
+):
     app = Flask('dagster-ui')
     sockets = Sockets(app)
     app.app_protocol = lambda environ_path_info: 'graphql-ws'
@@ -133,6 +143,7 @@ def create_app(repository_container, pipeline_runs, use_synchronous_execution_ma
         repository_container=repository_container,
         pipeline_runs=pipeline_runs,
         execution_manager=execution_manager,
+        log_debounce_interval=log_debounce_interval,
     )
 
     app.add_url_rule(
@@ -8,9 +8,18 @@ from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
 from dagster.cli.dynamic_loader import repository_target_argument, load_target_info_from_cli_args
+from dagster.core.execution import create_execution_plan, get_subset_pipeline
 
 from .app import create_app, RepositoryContainer
-from .pipeline_run_storage import PipelineRunStorage, LogFilePipelineRun, InMemoryPipelineRun
+from .pipeline_run_storage import (
+    DEFAULT_DEBOUNCE_INTERVAL,
+    FsyncPolicy,
+    InMemoryPipelineRun,
+    LogFilePipelineRun,
+    PipelineRunStorage,
+    load_log_file_runs,
+)
+from .sqlite_run_storage import SqlitePipelineRunStorage
 from .version import __version__
 
 
@@ -60,21 +69,60 @@ REPO_TARGET_WARNING = (
 @click.option('--sync', is_flag=True, help='Use the synchronous execution manager')
 @click.option('--log', is_flag=False, help='Record logs of pipeline runs')
 @click.option('--log-dir', help="Directory to record logs to", default='dagit_run_logs/')
+@click.option(
+    '--log-fsync',
+    type=click.Choice([policy.value for policy in FsyncPolicy]),
+    default=FsyncPolicy.ON_CLOSE.value,
+    help='When to fsync recorded logs to disk',
+)
+@click.option(
+    '--run-db',
+    help='SQLite database to persist pipeline runs and their logs to, across restarts',
+)
+@click.option(
+    '--log-debounce-interval',
+    type=click.FLOAT,
+    default=DEFAULT_DEBOUNCE_INTERVAL,
+    help='Seconds over which the logs sent to subscribers of a run are batched',
+)
 @click.version_option(version=__version__)
-def ui(host, port, watch, sync, log, log_dir, **kwargs):
+def ui(host, port, watch, sync, log, log_dir, log_fsync, run_db, log_debounce_interval, **kwargs):
     repository_target_info = load_target_info_from_cli_args(kwargs)
 
     sys.path.append(os.getcwd())
     repository_container = RepositoryContainer(repository_target_info)
-    if log:
 
-        def create_pipeline_run(*args, **kwargs):
-            return LogFilePipelineRun(log_dir, *args, **kwargs)
+    # Runs loaded back from earlier dagit processes rebuild their execution plan on demand
+    def create_execution_plan_for_run(selector, env_config):
+        pipeline = get_subset_pipeline(
+            repository_container.repository.get_pipeline(selector.name),
+            selector.solid_subset,
+        )
+        return create_execution_plan(pipeline, env_config)
 
-    else:
-        create_pipeline_run = InMemoryPipelineRun
+    if run_db:
+        if log:
+            raise click.UsageError('Cannot use --log together with --run-db')
 
-    pipeline_run_storage = PipelineRunStorage(create_pipeline_run=create_pipeline_run)
+        pipeline_run_storage = SqlitePipelineRunStorage(
+            run_db, create_execution_plan_fn=create_execution_plan_for_run
+        )
+    elif log:
+
+        def create_pipeline_run(*args, **kwargs):
+            return LogFilePipelineRun(
+                log_dir, *args, fsync_policy=FsyncPolicy(log_fsync), **kwargs
+            )
+
+        pipeline_run_storage = PipelineRunStorage(create_pipeline_run=create_pipeline_run)
+        for pipeline_run in load_log_file_runs(
+            log_dir,
+            create_execution_plan_fn=create_execution_plan_for_run,
+            fsync_policy=FsyncPolicy(log_fsync),
+        ):
+            pipeline_run_storage.add_run(pipeline_run)
+    else:
+        pipeline_run_storage = PipelineRunStorage(create_pipeline_run=InMemoryPipelineRun)
 
     if watch:
         observer = Observer()
@@ -83,7 +131,10 @@ def ui(host, port, watch, sync, log, log_dir, **kwargs):
         observer.start()
     try:
         app = create_app(
-            repository_container, pipeline_run_storage, use_synchronous_execution_manager=sync
+            repository_container,
+            pipeline_run_storage,
+            use_synchronous_execution_manager=sync,
+            log_debounce_interval=log_debounce_interval,
         )
         server = pywsgi.WSGIServer((host, port), app, handler_class=WebSocketHandler)
         print('Serving on http://{host}:{port}'.format(host=host, port=port))
@@ -1,12 +1,16 @@
 from __future__ import absolute_import
-from collections import namedtuple
-import copy
+from collections import deque
+import atexit
 import multiprocessing
 import os
 import sys
+import threading
 import time
 
 import gevent
+import gevent.event
+import gevent.lock
+import gevent.socket
 
 from dagster import check, ReentrantInfo, PipelineDefinition
 from dagster.core.execution import (
@@ -14,6 +18,7 @@ from dagster.core.execution import (
     execute_reentrant_pipeline,
     get_subset_pipeline,
 )
+from dagster.core.event_stream import EventStreamDecoder, EventStreamEncoder
 from dagster.core.events import PipelineEventRecord, EventType
 from dagster.core.types.evaluator import evaluate_config_value
 from dagster.core.system_config.types import construct_environment_config
@@ -86,26 +91,76 @@ class PipelineProcessStartedEvent(PipelineEventRecord):
         return self._process_id
 
 
+class HubEventCallback(object):
+    '''
+    Hands the events of a run to the pipeline run on the thread of the gevent hub it was
+    created on. Runs write their logs and notify subscribers with gevent primitives, which may
+    only be used from the hub's thread.
+
+    Events from other threads, e.g. the workers of the thread_pool engine, are queued and handed
+    over by the hub. The engine blocks the hub while it waits on its workers, so the queue is
+    also drained ahead of every event from the hub's thread, and by close.
+    '''
+
+    def __init__(self, pipeline_run):
+        self._pipeline_run = check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        self._thread = threading.current_thread()
+        # Appending and popping from either end of a deque is thread safe
+        self._queue = deque()
+        # Keeps events in order when a drain blocks, e.g. on the log storage lock of the run
+        self._drain_lock = gevent.lock.Semaphore()
+        self._watcher = gevent.get_hub().loop.async_()
+        # Watcher callbacks run in the hub, which must not block
+        self._watcher.start(lambda: gevent.spawn(self.drain))
+
+    def __call__(self, event):
+        if threading.current_thread() is not self._thread:
+            self._queue.append(event)
+            self._watcher.send()
+            return
+
+        with self._drain_lock:
+            self._drain_locked()
+            self._pipeline_run.handle_new_event(event)
+
+    def drain(self):
+        check.invariant(
+            threading.current_thread() is self._thread,
+            'Events must be handed to the run on the thread of the gevent hub',
+        )
+        with self._drain_lock:
+            self._drain_locked()
+
+    def _drain_locked(self):
+        while self._queue:
+            self._pipeline_run.handle_new_event(self._queue.popleft())
+
+    def close(self):
+        self.drain()
+        self._watcher.close()
+
+
 class SynchronousExecutionManager(PipelineExecutionManager):
     def execute_pipeline(self, repository_container, pipeline, pipeline_run):
         check.inst_param(pipeline, 'pipeline', PipelineDefinition)
+        event_callback = HubEventCallback(pipeline_run)
         try:
             return execute_reentrant_pipeline(
                 pipeline,
                 create_typed_environment(pipeline, pipeline_run.config),
                 throw_on_error=False,
-                reentrant_info=ReentrantInfo(
-                    pipeline_run.run_id, event_callback=pipeline_run.handle_new_event
-                ),
+                reentrant_info=ReentrantInfo(pipeline_run.run_id, event_callback=event_callback),
             )
         except:  # pylint: disable=W0702
-            pipeline_run.handle_new_event(
+            event_callback(
                 build_synthetic_pipeline_error_record(
                     pipeline_run.run_id,
                     serializable_error_info_from_exc_info(sys.exc_info()),
                     pipeline.name,
                 )
             )
+        finally:
+            event_callback.close()
 
 
 class MultiprocessingDone(object):
@@ -122,8 +177,119 @@ class ProcessStartedSentinel(object):
         self.process_id = check.int_param(process_id, 'process_id')
 
 
+DEFAULT_MAX_RUNS_PER_WORKER = 20
+
+
+def build_process_queued_event(run_id, pipeline_name, queue_position):
+    message = 'Queued pipeline {pipeline_name} run_id {run_id} behind {count} other run(s)'.format(
+        pipeline_name=pipeline_name, run_id=run_id, count=queue_position
+    )
+
+    return PipelineEventRecord(
+        message=message,
+        user_message=message,
+        level=level_from_string('INFO'),
+        event_type=EventType.PIPELINE_PROCESS_QUEUED,
+        run_id=run_id,
+        timestamp=time.time(),
+        error_info=None,
+        pipeline_name=pipeline_name,
+    )
+
+
+class WorkerProcess(object):
+    '''
+    A process that has imported the repository once and executes the runs it is handed, one at
+    a time, until it is told to stop. The worker sends the messages of its runs back over a
+    pipe, which the parent watches for readiness.
+    '''
+
+    def __init__(self, multiprocessing_context, repository_container):
+        self.repository_container = repository_container
+        self.generation = repository_container.generation
+        self.task_queue = multiprocessing_context.Queue()
+        self.connection, child_connection = multiprocessing_context.Pipe(duplex=False)
+        self.process = multiprocessing_context.Process(
+            target=execute_pipelines_in_worker,
+            args=(repository_container.repository_info, self.task_queue, child_connection),
+        )
+        self.process.start()
+        # Only the worker writes to the pipe. Closing the parent's copy of its end means that
+        # the pipe is closed, and readable, as soon as the worker exits.
+        child_connection.close()
+        self.decoder = EventStreamDecoder()
+        self.pipeline_run = None
+        self.run_count = 0
+
+    @property
+    def is_idle(self):
+        return self.pipeline_run is None
+
+    @property
+    def is_stale(self):
+        '''Whether the repository the worker loaded has been reloaded since.'''
+        return self.generation != self.repository_container.generation
+
+    def can_execute(self, repository_container):
+        return self.repository_container is repository_container and not self.is_stale
+
+    def start_run(self, pipeline_run):
+        check.invariant(self.is_idle, 'Worker is already executing a run')
+        self.pipeline_run = pipeline_run
+        self.run_count += 1
+        self.task_queue.put(
+            (
+                pipeline_run.selector.name,
+                pipeline_run.selector.solid_subset,
+                pipeline_run.config,
+                pipeline_run.run_id,
+            )
+        )
+
+    def stop(self):
+        self.task_queue.put(None)
+
+
+def _wait_readable(connection):
+    if sys.platform == 'win32':
+        # Pipe handles cannot be waited on by the gevent loop on Windows
+        while not connection.poll():
+            gevent.sleep(0.01)
+    else:
+        gevent.socket.wait_read(connection.fileno())
+
+
+class ConnectionMessageSender(object):
+    '''
+    Sends messages over the pipe of a worker, from any thread of the worker process. Messages
+    are encoded as an event stream, see dagster.core.event_stream, which the WorkerProcess
+    decodes.
+    '''
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._lock = threading.Lock()
+        self._encoder = EventStreamEncoder()
+
+    def put(self, message):
+        with self._lock:
+            self._connection.send_bytes(self._encoder.encode(message))
+
+
 class MultiprocessingExecutionManager(PipelineExecutionManager):
-    def __init__(self):
+    '''
+    Executes runs in a bounded pool of worker processes that are kept warm between runs, so
+    that the cost of starting Python and importing the repository is not paid for every run.
+
+    Runs beyond max_workers wait in a FIFO queue, with the QUEUED status. Workers are recycled
+    after max_runs_per_worker runs, and on the first dispatch after the repository they loaded
+    has been reloaded.
+
+    Nothing polls: a greenlet per worker forwards the events of its run as soon as they arrive
+    on its pipe, and queued runs are dispatched whenever a worker becomes idle.
+    '''
+
+    def __init__(self, max_workers=None, max_runs_per_worker=DEFAULT_MAX_RUNS_PER_WORKER):
         # Set execution method to spawn, to avoid fork and to have same behavior between platforms.
         # Older versions are stuck with whatever is the default on their platform (fork on
         # Unix-like and spawn on windows)
@@ -133,119 +299,217 @@ class MultiprocessingExecutionManager(PipelineExecutionManager):
             self._multiprocessing_context = multiprocessing.get_context('spawn')
         else:
             self._multiprocessing_context = multiprocessing
-        self._processes_lock = self._multiprocessing_context.Lock()
-        self._processes = []
-        # This is actually a reverse semaphore. We keep track of number of
-        # processes we have by releasing semaphore every time we start
-        # processing, we release after processing is finished
-        self._processing_semaphore = gevent.lock.Semaphore(0)
-
-        gevent.spawn(self._start_polling)
-
-    def _start_polling(self):
-        while True:
-            self._poll()
-            gevent.sleep(0.1)
-
-    def _poll(self):
-        with self._processes_lock:
-            processes = copy.copy(self._processes)
-            self._processes = []
-            for process in processes:
-                self._processing_semaphore.release()
-
-        for process in processes:
-            done = self._consume_process_queue(process)
-            if not done and not process.process.is_alive():
-                done = self._consume_process_queue(process)
-                if not done:
-                    try:
-                        done = True
-                        raise Exception(
-                            'Pipeline execution process for {run_id} unexpectedly exited'.format(
-                                run_id=process.pipeline_run.run_id
-                            )
-                        )
-                    except:  # pylint: disable=W0702
-                        process.pipeline_run.handle_new_event(
-                            build_synthetic_pipeline_error_record(
-                                process.pipeline_run.run_id,
-                                serializable_error_info_from_exc_info(sys.exc_info()),
-                                process.pipeline_run.pipeline_name,
-                            )
-                        )
-
-            if not done:
-                with self._processes_lock:
-                    self._processes.append(process)
-
-            with self._processes_lock:
-                self._processing_semaphore.acquire()
-
-    def _consume_process_queue(self, process):
-        while not process.message_queue.empty():
-            message = process.message_queue.get(False)
-
-            if isinstance(message, MultiprocessingDone):
-                return True
-            elif isinstance(message, MultiprocessingError):
-                process.pipeline_run.handle_new_event(
-                    build_synthetic_pipeline_error_record(
-                        process.pipeline_run.run_id,
-                        message.error_info,
-                        process.pipeline_run.pipeline_name,
+
+        self._max_workers = (
+            check.int_param(max_workers, 'max_workers')
+            if max_workers is not None
+            else multiprocessing.cpu_count()
+        )
+        self._max_runs_per_worker = check.int_param(max_runs_per_worker, 'max_runs_per_worker')
+        check.param_invariant(self._max_workers > 0, 'max_workers')
+        check.param_invariant(self._max_runs_per_worker > 0, 'max_runs_per_worker')
+
+        self._lock = gevent.lock.Semaphore()
+        self._workers = []
+        # (repository_container, pipeline_run) in the order the runs were launched
+        self._run_queue = deque()
+        # Set whenever no run is queued or executing
+        self._idle_event = gevent.event.Event()
+        self._idle_event.set()
+
+        # Workers cannot be daemonic, since pipelines may start processes of their own
+        atexit.register(self.shutdown)
+
+    def _start_worker(self, repository_container):
+        worker = WorkerProcess(self._multiprocessing_context, repository_container)
+        self._workers.append(worker)
+        gevent.spawn(self._watch_worker, worker)
+        return worker
+
+    def _watch_worker(self, worker):
+        '''Forwards the messages of the worker as they arrive, until it exits.'''
+        exited = False
+        while not exited:
+            _wait_readable(worker.connection)
+
+            messages = []
+            try:
+                # Everything that has arrived is handled as one batch
+                messages.extend(worker.decoder.decode(worker.connection.recv_bytes()))
+                while worker.connection.poll():
+                    messages.extend(worker.decoder.decode(worker.connection.recv_bytes()))
+            except EOFError:
+                exited = True
+
+            with self._lock:
+                for message in messages:
+                    self._handle_worker_message(worker, message)
+                if exited:
+                    self._handle_worker_exit(worker)
+                self._dispatch_queued_runs()
+
+        worker.connection.close()
+
+    def _handle_worker_message(self, worker, message):
+        pipeline_run = worker.pipeline_run
+        check.invariant(pipeline_run is not None, 'Message from a worker without a run')
+
+        if isinstance(message, MultiprocessingDone):
+            worker.pipeline_run = None
+            if worker.run_count >= self._max_runs_per_worker:
+                self._retire_worker(worker)
+        elif isinstance(message, MultiprocessingError):
+            pipeline_run.handle_new_event(
+                build_synthetic_pipeline_error_record(
+                    pipeline_run.run_id, message.error_info, pipeline_run.pipeline_name
+                )
+            )
+        elif isinstance(message, ProcessStartedSentinel):
+            pipeline_run.handle_new_event(
+                build_process_started_event(
+                    pipeline_run.run_id, pipeline_run.pipeline_name, message.process_id
+                )
+            )
+        else:
+            pipeline_run.handle_new_event(message)
+
+    def _handle_worker_exit(self, worker):
+        if worker in self._workers:
+            self._workers.remove(worker)
+
+        pipeline_run = worker.pipeline_run
+        if pipeline_run is not None:
+            worker.pipeline_run = None
+            try:
+                raise Exception(
+                    'Pipeline execution process for {run_id} unexpectedly exited'.format(
+                        run_id=pipeline_run.run_id
                     )
                 )
-            elif isinstance(message, ProcessStartedSentinel):
-                process.pipeline_run.handle_new_event(
-                    build_process_started_event(
-                        process.pipeline_run.run_id,
-                        process.pipeline_run.pipeline_name,
-                        message.process_id,
+            except:  # pylint: disable=W0702
+                pipeline_run.handle_new_event(
+                    build_synthetic_pipeline_error_record(
+                        pipeline_run.run_id,
+                        serializable_error_info_from_exc_info(sys.exc_info()),
+                        pipeline_run.pipeline_name,
                     )
                 )
-            else:
-                process.pipeline_run.handle_new_event(message)
-        return False
+
+        # Reaps the processes of workers that have exited
+        self._multiprocessing_context.active_children()
+
+    def _retire_worker(self, worker):
+        self._workers.remove(worker)
+        worker.stop()
+
+    def _idle_worker_for(self, repository_container):
+        for worker in self._workers:
+            if worker.is_idle and worker.can_execute(repository_container):
+                return worker
+        return None
+
+    def _retire_stale_workers(self):
+        # No run can be dispatched to these again, so they would only hold on to a process
+        for worker in [w for w in self._workers if w.is_idle and w.is_stale]:
+            self._retire_worker(worker)
+
+    def _dispatch_queued_runs(self):
+        self._retire_stale_workers()
+
+        while self._run_queue:
+            repository_container, pipeline_run = self._run_queue[0]
+
+            worker = self._idle_worker_for(repository_container)
+            if worker is None:
+                if len(self._workers) >= self._max_workers:
+                    # Make room by retiring an idle worker of another repository, if any
+                    idle_workers = [w for w in self._workers if w.is_idle]
+                    if not idle_workers:
+                        break
+                    self._retire_worker(idle_workers[0])
+
+                worker = self._start_worker(repository_container)
+
+            self._run_queue.popleft()
+            pipeline_run.handle_new_event(
+                build_process_start_event(pipeline_run.run_id, pipeline_run.pipeline_name)
+            )
+            worker.start_run(pipeline_run)
+
+        if not self._run_queue and all(worker.is_idle for worker in self._workers):
+            self._idle_event.set()
+        else:
+            self._idle_event.clear()
 
     def join(self):
-        '''Waits until all there are no processes enqueued.'''
-        while True:
-            with self._processes_lock:
-                if not self._processes and self._processing_semaphore.locked():
-                    return True
-            gevent.sleep(0.1)
+        '''Waits until all queued runs have been executed.'''
+        self._idle_event.wait()
+        return True
+
+    def shutdown(self):
+        '''Stops idle workers and terminates the ones that are still executing a run.'''
+        with self._lock:
+            workers = self._workers
+            self._workers = []
+            for worker in workers:
+                if worker.is_idle:
+                    worker.stop()
+                else:
+                    worker.process.terminate()
+        for worker in workers:
+            worker.process.join()
 
     def execute_pipeline(self, repository_container, pipeline, pipeline_run):
-        message_queue = self._multiprocessing_context.Queue()
-        p = self._multiprocessing_context.Process(
-            target=execute_pipeline_through_queue,
-            args=(
-                repository_container.repository_info,
-                pipeline_run.selector.name,
-                pipeline_run.selector.solid_subset,
-                pipeline_run.config,
-            ),
-            kwargs={'run_id': pipeline_run.run_id, 'message_queue': message_queue},
-        )
+        check.inst_param(pipeline, 'pipeline', PipelineDefinition)
+        check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
 
-        pipeline_run.handle_new_event(build_process_start_event(pipeline_run.run_id, pipeline.name))
+        with self._lock:
+            self._run_queue.append((repository_container, pipeline_run))
+            self._dispatch_queued_runs()
 
-        p.start()
-        with self._processes_lock:
-            process = RunProcessWrapper(pipeline_run, p, message_queue)
-            self._processes.append(process)
+            if self._run_queue and self._run_queue[-1][1] is pipeline_run:
+                pipeline_run.handle_new_event(
+                    build_process_queued_event(
+                        pipeline_run.run_id, pipeline.name, len(self._run_queue) - 1
+                    )
+                )
 
 
-class RunProcessWrapper(namedtuple('RunProcessWrapper', 'pipeline_run process message_queue')):
-    def __new__(cls, pipeline_run, process, message_queue):
-        return super(RunProcessWrapper, cls).__new__(
-            cls, check.inst_param(pipeline_run, 'pipeline_run', PipelineRun), process, message_queue
+def execute_pipelines_in_worker(repository_info, task_queue, connection):
+    '''
+    The loop of a WorkerProcess. The repository is imported once, and each task names a
+    pipeline run to execute with it. A None task stops the worker.
+    '''
+    from .app import RepositoryContainer
+
+    repository_container = RepositoryContainer(repository_info)
+    message_queue = ConnectionMessageSender(connection)
+
+    while True:
+        task = task_queue.get()
+        if task is None:
+            return
+
+        pipeline_name, pipeline_solid_subset, config, run_id = task
+        execute_pipeline_through_queue(
+            repository_info,
+            pipeline_name,
+            pipeline_solid_subset,
+            config,
+            run_id=run_id,
+            message_queue=message_queue,
+            repository_container=repository_container,
         )
 
 
 def execute_pipeline_through_queue(
-    repository_info, pipeline_name, pipeline_solid_subset, config, run_id, message_queue
+    repository_info,
+    pipeline_name,
+    pipeline_solid_subset,
+    config,
+    run_id,
+    message_queue,
+    repository_container=None,
 ):
     """
     Execute pipeline using message queue as a transport
@@ -255,29 +519,30 @@ def execute_pipeline_through_queue(
 
     reentrant_info = ReentrantInfo(run_id, event_callback=message_queue.put)
 
-    from .app import RepositoryContainer
+    if repository_container is None:
+        from .app import RepositoryContainer
 
-    repository_container = RepositoryContainer(repository_info)
-    if repository_container.repo_error:
-        message_queue.put(
-            MultiprocessingError(
-                serializable_error_info_from_exc_info(repository_container.repo_error)
+        repository_container = RepositoryContainer(repository_info)
+
+    try:
+        if repository_container.repo_error:
+            message_queue.put(
+                MultiprocessingError(
+                    serializable_error_info_from_exc_info(repository_container.repo_error)
+                )
             )
-        )
-        return
+            return
 
-    pipeline = repository_container.repository.get_pipeline(pipeline_name)
-    pipeline = get_subset_pipeline(pipeline, pipeline_solid_subset)
+        pipeline = repository_container.repository.get_pipeline(pipeline_name)
+        pipeline = get_subset_pipeline(pipeline, pipeline_solid_subset)
 
-    typed_environment = construct_environment_config(
-        evaluate_config_value(pipeline.environment_type, config).value
-    )
+        typed_environment = construct_environment_config(
+            evaluate_config_value(pipeline.environment_type, config).value
+        )
 
-    try:
-        result = execute_reentrant_pipeline(
+        return execute_reentrant_pipeline(
             pipeline, typed_environment, throw_on_error=False, reentrant_info=reentrant_info
         )
-        return result
     except:  # pylint: disable=W0702
         message_queue.put(
             MultiprocessingError(serializable_error_info_from_exc_info(sys.exc_info()))
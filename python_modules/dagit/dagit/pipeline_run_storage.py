@@ -1,6 +1,8 @@
-from collections import OrderedDict
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
 from enum import Enum
-import copy
+import heapq
+import itertools
 import json
 import os
 import time
@@ -11,18 +13,52 @@ import gevent.lock
 import pyrsistent
 
 from dagster import check
+from dagster.core.event_stream import EventLogReader, EventStreamEncoder
 from dagster.core.events import EventRecord, EventType
 from dagster.core.execution import ExecutionSelector
 from dagster.core.execution_plan.objects import ExecutionPlan
 
+# Events sent to subscribers of a run are batched over this many seconds
+DEFAULT_DEBOUNCE_INTERVAL = 0.1
+
+# Runs that cannot select events by their fields read this many events at a time while looking
+# for the events that match a LogFilter
+LOG_SCAN_CHUNK_SIZE = 1000
+
 
 class PipelineRunStatus(Enum):
+    QUEUED = 'QUEUED'
     NOT_STARTED = 'NOT_STARTED'
     STARTED = 'STARTED'
     SUCCESS = 'SUCCESS'
     FAILURE = 'FAILURE'
 
 
+def _opt_frozenset(values):
+    return frozenset(values) if values is not None else None
+
+
+class LogFilter(object):
+    '''
+    Selects the events of a run by their fields. Each of levels, step_keys and event_types is
+    either None, to match events with any value of the field, or the values to match.
+    '''
+
+    def __init__(self, levels=None, step_keys=None, event_types=None):
+        self.levels = _opt_frozenset(levels)
+        self.step_keys = _opt_frozenset(step_keys)
+        self.event_types = _opt_frozenset(event_types)
+
+    def matches(self, event):
+        if self.levels is not None and event.level not in self.levels:
+            return False
+        if self.step_keys is not None and getattr(event, 'step_key', None) not in self.step_keys:
+            return False
+        if self.event_types is not None and event.event_type not in self.event_types:
+            return False
+        return True
+
+
 class PipelineRunStorage(object):
     def __init__(self, create_pipeline_run=None):
         self._runs = OrderedDict()
@@ -58,7 +94,10 @@ class PipelineRun(object):
         self._run_id = check.str_param(run_id, 'run_id')
         self._selector = check.inst_param(selector, 'selector', ExecutionSelector)
         self._env_config = check.opt_dict_param(env_config, 'environment_config', key_type=str)
-        self._execution_plan = check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+        # Optional for runs that rebuild their plan on demand, see SqlitePipelineRun
+        self._execution_plan = check.opt_inst_param(
+            execution_plan, 'execution_plan', ExecutionPlan
+        )
 
     @property
     def run_id(self):
@@ -84,35 +123,94 @@ class PipelineRun(object):
     def execution_plan(self):
         return self._execution_plan
 
-    def logs_after(self, cursor):
+    def logs_after(self, cursor, limit=None):
+        '''
+        Returns the events after the one at the cursor, i.e. at index cursor + 1 onwards, and at
+        most limit of them.
+        '''
         raise NotImplementedError()
 
     def all_logs(self):
         raise NotImplementedError()
 
+    def log_count(self):
+        raise NotImplementedError()
+
+    def logs_matching(self, log_filter, after=-1, before=None, limit=None, reverse=False):
+        '''
+        Returns (cursor, event) for the events that match log_filter with after < cursor <
+        before, and at most limit of them. Events are ordered by cursor, or by descending cursor
+        if reverse, so a limit keeps the ones nearest to after, or to before if reverse.
+
+        This scans the events of the range in chunks. Runs that can select events by their
+        fields override it.
+        '''
+        check.inst_param(log_filter, 'log_filter', LogFilter)
+        check.opt_int_param(limit, 'limit')
+        matching = (
+            (cursor, event)
+            for cursor, event in self._scan_logs(int(after) + 1, before, reverse)
+            if log_filter.matches(event)
+        )
+        return list(itertools.islice(matching, limit))
+
+    def has_logs_matching(self, log_filter, after=-1, before=None):
+        '''Whether any event with after < cursor < before matches log_filter.'''
+        return bool(self.logs_matching(log_filter, after, before, limit=1))
+
+    def _scan_logs(self, start, stop, reverse):
+        '''Yields (cursor, event) for the events with start <= cursor < stop.'''
+        log_count = self.log_count()
+        stop = log_count if stop is None else min(int(stop), log_count)
+        while start < stop:
+            if reverse:
+                chunk_start = max(start, stop - LOG_SCAN_CHUNK_SIZE)
+            else:
+                chunk_start = start
+            chunk_size = min(LOG_SCAN_CHUNK_SIZE, stop - chunk_start)
+            chunk = list(self.logs_after(chunk_start - 1, limit=chunk_size))
+
+            indexed_chunk = list(enumerate(chunk, chunk_start))
+            for cursor, event in reversed(indexed_chunk) if reverse else indexed_chunk:
+                yield cursor, event
+
+            if reverse:
+                stop = chunk_start
+            else:
+                if len(chunk) < chunk_size:
+                    return
+                start += chunk_size
+
     def store_event(self, new_event):
         raise NotImplementedError()
 
     def handle_new_event(self, new_event):
         check.inst_param(new_event, 'new_event', EventRecord)
 
-        if new_event.event_type == EventType.PIPELINE_START:
+        self._update_status(new_event)
+        self.store_event(new_event)
+        for subscriber in self.__subscribers:
+            subscriber.handle_new_event(new_event)
+
+    def _update_status(self, new_event):
+        if new_event.event_type == EventType.PIPELINE_PROCESS_QUEUED:
+            self._status = PipelineRunStatus.QUEUED
+        elif new_event.event_type == EventType.PIPELINE_PROCESS_START:
+            # Out of the queue, if the run had to wait for a worker
+            self._status = PipelineRunStatus.NOT_STARTED
+        elif new_event.event_type == EventType.PIPELINE_START:
             self._status = PipelineRunStatus.STARTED
         elif new_event.event_type == EventType.PIPELINE_SUCCESS:
             self._status = PipelineRunStatus.SUCCESS
         elif new_event.event_type == EventType.PIPELINE_FAILURE:
             self._status = PipelineRunStatus.FAILURE
 
-        self.store_event(new_event)
-        for subscriber in self.__subscribers:
-            subscriber.handle_new_event(new_event)
-
     def subscribe(self, subscriber):
         self.__subscribers.append(subscriber)
 
-    def observable_after_cursor(self, cursor=None):
+    def observable_after_cursor(self, cursor=None, debounce_interval=None):
         return Observable.create(  # pylint: disable=E1101
-            PipelineRunObservableSubscribe(self, cursor)
+            PipelineRunObservableSubscribe(self, cursor, debounce_interval)
         )
 
 
@@ -121,34 +219,262 @@ class InMemoryPipelineRun(PipelineRun):
         super(InMemoryPipelineRun, self).__init__(*args, **kwargs)
         self._log_storage_lock = gevent.lock.Semaphore()
         self._log_sequence = LogSequence()
+        # Ascending cursors of the events with each value of the fields a LogFilter selects on
+        self._cursors_by_level = defaultdict(list)
+        self._cursors_by_step_key = defaultdict(list)
+        self._cursors_by_event_type = defaultdict(list)
 
-    def logs_after(self, cursor):
+    def logs_after(self, cursor, limit=None):
+        check.opt_int_param(limit, 'limit')
         cursor = int(cursor) + 1
         with self._log_storage_lock:
-            return self._log_sequence[cursor:]
+            if limit is None:
+                return self._log_sequence[cursor:]
+            return self._log_sequence[cursor : cursor + limit]
 
     def all_logs(self):
         with self._log_storage_lock:
             return self._log_sequence
 
+    def log_count(self):
+        with self._log_storage_lock:
+            return len(self._log_sequence)
+
+    def logs_matching(self, log_filter, after=-1, before=None, limit=None, reverse=False):
+        check.inst_param(log_filter, 'log_filter', LogFilter)
+        check.opt_int_param(limit, 'limit')
+
+        with self._log_storage_lock:
+            log_sequence = self._log_sequence
+            start = max(int(after) + 1, 0)
+            stop = len(log_sequence) if before is None else min(int(before), len(log_sequence))
+            matching = (
+                (cursor, log_sequence[cursor])
+                for cursor in self._candidate_cursors(log_filter, start, stop, reverse)
+                if log_filter.matches(log_sequence[cursor])
+            )
+            return list(itertools.islice(matching, limit))
+
+    def _candidate_cursors(self, log_filter, start, stop, reverse):
+        '''
+        Yields the cursors with start <= cursor < stop of the events that have one of the values
+        of the filtered field with the fewest such events, so that a filter is only checked
+        against events that could match it.
+        '''
+        candidate_ranges = None
+        for values, cursors_by_value in (
+            (log_filter.levels, self._cursors_by_level),
+            (log_filter.step_keys, self._cursors_by_step_key),
+            (log_filter.event_types, self._cursors_by_event_type),
+        ):
+            if values is None:
+                continue
+            ranges = []
+            for value in values:
+                cursors = cursors_by_value.get(value)
+                if cursors:
+                    ranges.append(
+                        (cursors, bisect_left(cursors, start), bisect_left(cursors, stop))
+                    )
+            if candidate_ranges is None or _range_length(ranges) < _range_length(candidate_ranges):
+                candidate_ranges = ranges
+
+        if candidate_ranges is None:
+            cursors = range(start, stop)
+            return reversed(cursors) if reverse else iter(cursors)
+
+        return heapq.merge(
+            *[_iter_range(cursors, lo, hi, reverse) for cursors, lo, hi in candidate_ranges],
+            reverse=reverse
+        )
+
     def store_event(self, new_event):
         check.inst_param(new_event, 'new_event', EventRecord)
 
         with self._log_storage_lock:
+            cursor = len(self._log_sequence)
             self._log_sequence = self._log_sequence.append(new_event)
+            self._cursors_by_level[new_event.level].append(cursor)
+            self._cursors_by_step_key[getattr(new_event, 'step_key', None)].append(cursor)
+            self._cursors_by_event_type[new_event.event_type].append(cursor)
+
+
+def _range_length(ranges):
+    return sum(hi - lo for _cursors, lo, hi in ranges)
+
+
+def _iter_range(cursors, lo, hi, reverse):
+    indexes = range(hi - 1, lo - 1, -1) if reverse else range(lo, hi)
+    return (cursors[index] for index in indexes)
+
+
+class FsyncPolicy(Enum):
+    '''When a BufferedLogFileWriter asks the OS to commit written events to disk.'''
+
+    NEVER = 'NEVER'
+    ON_FLUSH = 'ON_FLUSH'
+    ON_CLOSE = 'ON_CLOSE'
+
+
+DEFAULT_MAX_BUFFER_SIZE = 64 * 1024
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+
+class BufferedLogFileWriter(object):
+    '''
+    Appends data to a log file through a handle that stays open until the writer is closed.
+
+    Data is buffered in memory and written out once max_buffer_size bytes are buffered,
+    flush_interval seconds after the first write was buffered, or when the writer is flushed or
+    closed. This keeps chatty runs from blocking the gevent loop on disk for every event.
+
+    Flushes are scheduled on the gevent hub, so the writer must only be used from the hub's
+    thread. See HubEventCallback for runs whose events come from other threads.
+    '''
+
+    def __init__(
+        self,
+        path,
+        max_buffer_size=DEFAULT_MAX_BUFFER_SIZE,
+        flush_interval=DEFAULT_FLUSH_INTERVAL,
+        fsync_policy=FsyncPolicy.ON_CLOSE,
+    ):
+        self._path = check.str_param(path, 'path')
+        self._max_buffer_size = check.int_param(max_buffer_size, 'max_buffer_size')
+        self._flush_interval = check.float_param(flush_interval, 'flush_interval')
+        self._fsync_policy = check.inst_param(fsync_policy, 'fsync_policy', FsyncPolicy)
+
+        self._lock = gevent.lock.Semaphore()
+        self._handle = open(path, 'ab')
+        self._buffer = []
+        self._buffer_size = 0
+        self._flush_greenlet = None
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def closed(self):
+        return self._handle is None
+
+    def write_line(self, line):
+        check.str_param(line, 'line')
+        self.write((line + '\n').encode('utf-8'))
+
+    def write(self, data):
+        check.inst_param(data, 'data', bytes)
+
+        with self._lock:
+            check.invariant(self._handle is not None, 'Cannot write to a closed log file')
+
+            self._buffer.append(data)
+            self._buffer_size += len(data)
+
+            if self._buffer_size >= self._max_buffer_size:
+                self._flush_locked()
+            elif self._flush_greenlet is None:
+                self._flush_greenlet = gevent.spawn_later(
+                    self._flush_interval, self._flush_from_greenlet
+                )
+
+    def flush(self):
+        with self._lock:
+            if self._handle is not None:
+                self._flush_locked()
+
+    def close(self):
+        with self._lock:
+            if self._handle is None:
+                return
+
+            if self._flush_greenlet is not None:
+                self._flush_greenlet.kill(block=False)
+                self._flush_greenlet = None
+
+            self._flush_locked()
+            if self._fsync_policy == FsyncPolicy.ON_CLOSE:
+                os.fsync(self._handle.fileno())
+
+            self._handle.close()
+            self._handle = None
+
+    def _flush_from_greenlet(self):
+        with self._lock:
+            self._flush_greenlet = None
+            if self._handle is not None:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._buffer:
+            return
+
+        self._handle.write(b''.join(self._buffer))
+        self._buffer = []
+        self._buffer_size = 0
+
+        self._handle.flush()
+        if self._fsync_policy == FsyncPolicy.ON_FLUSH:
+            os.fsync(self._handle.fileno())
 
 
 class LogFilePipelineRun(InMemoryPipelineRun):
+    '''
+    Keeps the events of a run in memory, and writes the run's metadata and events to files in
+    log_dir from which load_log_file_runs loads the run back into a later dagit process.
+    '''
+
     def __init__(self, log_dir, *args, **kwargs):
+        # Options for the BufferedLogFileWriter of the event log
+        self._max_buffer_size = kwargs.pop('max_buffer_size', DEFAULT_MAX_BUFFER_SIZE)
+        self._flush_interval = kwargs.pop('flush_interval', DEFAULT_FLUSH_INTERVAL)
+        self._fsync_policy = kwargs.pop('fsync_policy', FsyncPolicy.ON_CLOSE)
+        # Set for runs loaded back from the files of an earlier dagit process
+        file_prefix = kwargs.pop('file_prefix', None)
+        self._create_execution_plan_fn = kwargs.pop('create_execution_plan_fn', None)
+
         super(LogFilePipelineRun, self).__init__(*args, **kwargs)
         self._log_dir = check.str_param(log_dir, 'log_dir')
-        self._file_prefix = os.path.join(
-            self._log_dir, '{}_{}'.format(int(time.time()), self.run_id)
-        )
-        ensure_dir(log_dir)
-        self._write_metadata_to_file()
-        self._log_file = '{}.log'.format(self._file_prefix)
+        if file_prefix is None:
+            self._file_prefix = os.path.join(
+                self._log_dir, '{}_{}'.format(int(time.time()), self.run_id)
+            )
+            ensure_dir(log_dir)
+            self._write_metadata_to_file()
+        else:
+            self._file_prefix = check.str_param(file_prefix, 'file_prefix')
+        self._log_file = '{}.events'.format(self._file_prefix)
         self._log_file_lock = gevent.lock.Semaphore()
+        # Opened on the first event, and closed once the pipeline has finished
+        self._log_writer = None
+        self._log_reader = EventLogReader(self._log_file)
+        if file_prefix is None:
+            # Events are written as a binary event stream, see dagster.core.event_stream
+            self._log_encoder = EventStreamEncoder()
+        else:
+            self._load_events()
+
+    def _load_events(self):
+        for event in self._log_reader.events_after(-1):
+            self._update_status(event)
+            super(LogFilePipelineRun, self).store_event(event)
+
+        # The dagit process that wrote the run exited before the run finished
+        if self._status in (PipelineRunStatus.QUEUED, PipelineRunStatus.STARTED):
+            self._status = PipelineRunStatus.FAILURE
+
+        # Events that still arrive continue the event stream of the file
+        self._log_encoder = EventStreamEncoder(strings=self._log_reader.strings)
+
+    @property
+    def execution_plan(self):
+        if self._execution_plan is None and self._create_execution_plan_fn is not None:
+            self._execution_plan = self._create_execution_plan_fn(self.selector, self.config)
+        return self._execution_plan
+
+    @property
+    def log_file(self):
+        return self._log_file
 
     def _write_metadata_to_file(self):
         metadata_file = '{}.json'.format(self._file_prefix)
@@ -171,11 +497,82 @@ class LogFilePipelineRun(InMemoryPipelineRun):
         super().store_event(new_event)
 
         with self._log_file_lock:
-            # Going to do the less error-prone, simpler, but slower strategy:
-            # open, append, close for every log message for now
-            with open(self._log_file, 'a', encoding='utf-8') as log_file_handle:
-                log_file_handle.write(json.dumps(new_event.to_dict()))
-                log_file_handle.write('\n')
+            data = self._log_encoder.encode(new_event)
+
+            if self._log_writer is None:
+                self._log_writer = BufferedLogFileWriter(
+                    self._log_file,
+                    max_buffer_size=self._max_buffer_size,
+                    flush_interval=self._flush_interval,
+                    fsync_policy=self._fsync_policy,
+                )
+
+            self._log_writer.write(data)
+
+            # Events that still arrive after the pipeline has finished, e.g. an error from the
+            # execution process, reopen the log file
+            if new_event.event_type in (EventType.PIPELINE_SUCCESS, EventType.PIPELINE_FAILURE):
+                self._close_log_writer()
+
+    @property
+    def log_reader(self):
+        '''
+        The EventLogReader over the events written to the log file of the run, which loads
+        them back. Events that are still buffered by the writer are not in the file yet.
+        '''
+        return self._log_reader
+
+    def close(self):
+        with self._log_file_lock:
+            self._close_log_writer()
+
+    def _close_log_writer(self):
+        if self._log_writer is not None:
+            self._log_writer.close()
+            self._log_writer = None
+
+
+def load_log_file_runs(log_dir, create_execution_plan_fn=None, **kwargs):
+    '''
+    Loads the LogFilePipelineRuns that earlier dagit processes wrote to log_dir, in the order
+    they were created. Runs that had not finished are marked as failed.
+
+    Args:
+        log_dir (str): The log_dir of the runs.
+        create_execution_plan_fn (Callable[[ExecutionSelector, dict], ExecutionPlan]):
+            Rebuilds the execution plan of a loaded run, which is not written to its files.
+        **kwargs: Options for the BufferedLogFileWriter of each run, see LogFilePipelineRun.
+    '''
+    check.str_param(log_dir, 'log_dir')
+    check.opt_callable_param(create_execution_plan_fn, 'create_execution_plan_fn')
+    if not os.path.isdir(log_dir):
+        return []
+
+    metadata_files = sorted(
+        (
+            os.path.join(log_dir, file_name)
+            for file_name in os.listdir(log_dir)
+            if file_name.endswith('.json')
+        ),
+        key=os.path.getmtime,
+    )
+    runs = []
+    for metadata_file in metadata_files:
+        with open(metadata_file, 'r', encoding='utf-8') as f:
+            metadata = json.load(f)
+        runs.append(
+            LogFilePipelineRun(
+                log_dir,
+                metadata['run_id'],
+                ExecutionSelector(metadata['pipeline_name'], metadata['pipeline_solid_subset']),
+                metadata['config'],
+                None,
+                file_prefix=metadata_file[: -len('.json')],
+                create_execution_plan_fn=create_execution_plan_fn,
+                **kwargs
+            )
+        )
+    return runs
 
 
 def ensure_dir(file_path):
@@ -185,8 +582,11 @@ def ensure_dir(file_path):
 
 
 class PipelineRunObservableSubscribe(object):
-    def __init__(self, pipeline_run, after_cursor=None):
-        self.debouncing_queue = DebouncingLogQueue()
+    def __init__(self, pipeline_run, after_cursor=None, debounce_interval=None):
+        self.debouncing_queue = DebouncingLogQueue(
+            self._flush_logs,
+            DEFAULT_DEBOUNCE_INTERVAL if debounce_interval is None else debounce_interval,
+        )
         self.pipeline_run = pipeline_run
         self.observer = None
         self.after_cursor = after_cursor or -1
@@ -200,12 +600,9 @@ class PipelineRunObservableSubscribe(object):
 
     def handle_new_event(self, new_event):
         self.debouncing_queue.enqueue(new_event)
-        gevent.spawn(self._enqueue_flush_logs)
 
-    def _enqueue_flush_logs(self):
-        events = self.debouncing_queue.attempt_dequeue()
-        if events:
-            self.observer.on_next(events)
+    def _flush_logs(self, events):
+        self.observer.on_next(events)
 
 
 class LogSequence(pyrsistent.CheckedPVector):
@@ -214,65 +611,26 @@ class LogSequence(pyrsistent.CheckedPVector):
 
 class DebouncingLogQueue(object):
     '''
-    A queue that debounces dequeuing operation
+    Batches the events enqueued within debounce_interval seconds of the first one, and hands
+    them to flush_fn as a single LogSequence. The flush is scheduled when the first event of a
+    batch is enqueued, so a lone event is delivered debounce_interval seconds after it arrived.
+    Like the BufferedLogFileWriter, it must only be used from the thread of the gevent hub.
     '''
 
-    def __init__(self, timeout_length=1.0, sleep_length=0.1):
-        self._log_queue_lock = gevent.lock.Semaphore()
+    def __init__(self, flush_fn, debounce_interval=DEFAULT_DEBOUNCE_INTERVAL):
+        self._flush_fn = check.callable_param(flush_fn, 'flush_fn')
+        self._debounce_interval = check.float_param(debounce_interval, 'debounce_interval')
         self._log_sequence = LogSequence()
-        self._is_dequeueing_blocked = False
-        self._queue_timeout = time.time()
-        self._timeout_length = check.float_param(timeout_length, 'timeout_length')
-        self._sleep_length = check.float_param(sleep_length, 'sleep_length')
-
-    def attempt_dequeue(self):
-        '''
-        Attempt to dequeue from queue. Will block first call to this until the
-        timeout_length has elapsed from last enqueue. Subsequent calls return
-        empty list, until the dequeing timeout happens.
-        '''
-        with self._log_queue_lock:
-            if self._is_dequeueing_blocked:
-                return LogSequence()
-            else:
-                self._is_dequeueing_blocked = True
-
-        # wait till we have elapsed timeout_length seconds from first event, while
-        # letting other gevent threads do the work (sleep_length is the chosen sleep cycle)
-        while True:
-            queue_timeout = self._threadsafe_read_queue_timeout()
-
-            # Queue timeout being none indicates that someone
-            # else has emptied the queue without another event
-            # being *enqueued*
-            if queue_timeout is None:
-                check.invariant(
-                    not self._log_sequence,
-                    (
-                        'queue_timeout is None should correspond to the state where another '
-                        'greenlet has emptied the queue and no one other greenlet has enqueued'
-                    ),
-                )
-                return LogSequence()
-            else:
-                if (time.time() - queue_timeout) >= self._timeout_length:
-                    break
-
-            gevent.sleep(self._sleep_length)
-
-        with self._log_queue_lock:
-            events = self._log_sequence
-            self._log_sequence = LogSequence()
-            self._is_dequeueing_blocked = False
-            self._queue_timeout = None
-            return events
-
-    def _threadsafe_read_queue_timeout(self):
-        with self._log_queue_lock:
-            return copy.copy(self._queue_timeout)
+        self._flush_greenlet = None
 
     def enqueue(self, item):
-        with self._log_queue_lock:
-            if not self._queue_timeout:
-                self._queue_timeout = time.time()
-            self._log_sequence = self._log_sequence.append(item)
+        self._log_sequence = self._log_sequence.append(item)
+        if self._flush_greenlet is None:
+            self._flush_greenlet = gevent.spawn_later(self._debounce_interval, self._flush)
+
+    def _flush(self):
+        events = self._log_sequence
+        self._log_sequence = LogSequence()
+        self._flush_greenlet = None
+        if events:
+            self._flush_fn(events)
@@ -1,10 +1,16 @@
 from dagster import check
-from dagit.pipeline_run_storage import PipelineRunStorage
+from dagit.pipeline_run_storage import DEFAULT_DEBOUNCE_INTERVAL, PipelineRunStorage
 from dagit.pipeline_execution_manager import PipelineExecutionManager
 
 
 class DagsterGraphQLContext(object):
-    def __init__(self, repository_container, pipeline_runs, execution_manager):
+    def __init__(
+        self,
+        repository_container,
+        pipeline_runs,
+        execution_manager,
+        log_debounce_interval=DEFAULT_DEBOUNCE_INTERVAL,
+    ):
         from dagit.app import RepositoryContainer
 
         self.repository_container = check.inst_param(
@@ -14,3 +20,6 @@ class DagsterGraphQLContext(object):
         self.execution_manager = check.inst_param(
             execution_manager, 'pipeline_execution_manager', PipelineExecutionManager
         )
+        self.log_debounce_interval = check.float_param(
+            log_debounce_interval, 'log_debounce_interval'
+        )
@@ -73,7 +73,7 @@ def get_run(info, runId):
     if not run:
         raise Exception('No run with such id: {run_id}'.format(run_id=runId))
     else:
-        return info.schema.type_named('PipelineRun')
+        return info.schema.type_named('PipelineRun')(run)
 
 
 def get_runs(info):
@@ -162,7 +162,7 @@ def get_pipeline_run_observable(info, run_id, after=None):
 
     def get_observable(pipeline):
         pipeline_run_event_type = info.schema.type_named('PipelineRunEvent')
-        return run.observable_after_cursor(after).map(
+        return run.observable_after_cursor(after, info.context.log_debounce_interval).map(
             lambda events: info.schema.type_named('PipelineRunLogsSubscriptionPayload')(
                 messages=[
                     pipeline_run_event_type.from_dagster_event(info, event, pipeline)
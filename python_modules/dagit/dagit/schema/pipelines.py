@@ -489,7 +489,7 @@ def type_attributes(runtime_type):
 
 
 def inner_types_of_runtime(info, runtime_type):
-    if runtime_type.is_list or runtime_type.is_nullable:
+    if runtime_type.is_list or runtime_type.is_nullable or runtime_type.is_stream:
         return [DauphinType.to_dauphin_type(info, runtime_type.inner_type)]
     else:
         return []
@@ -2,11 +2,19 @@ from __future__ import absolute_import
 
 from dagster import check
 from dagster.core.events import EventRecord, EventType
-from dagster.utils.logging import CRITICAL, DEBUG, ERROR, INFO, WARNING, check_valid_level_param
+from dagster.utils.logging import (
+    CRITICAL,
+    DEBUG,
+    ERROR,
+    INFO,
+    WARNING,
+    check_valid_level_param,
+    level_from_string,
+)
 
 from dagster.utils.error import SerializableErrorInfo
 from dagit import pipeline_run_storage
-from dagit.pipeline_run_storage import PipelineRunStatus, PipelineRun
+from dagit.pipeline_run_storage import LogFilter, PipelineRunStatus, PipelineRun
 from dagit.schema import dauphin, model
 
 DauphinPipelineRunStatus = dauphin.Enum.from_enum(PipelineRunStatus)
@@ -19,7 +27,14 @@ class DauphinPipelineRun(dauphin.ObjectType):
     runId = dauphin.NonNull(dauphin.String)
     status = dauphin.NonNull('PipelineRunStatus')
     pipeline = dauphin.NonNull('Pipeline')
-    logs = dauphin.NonNull('LogMessageConnection')
+    logs = dauphin.Field(
+        dauphin.NonNull('LogMessageConnection'),
+        first=dauphin.Int(),
+        after=dauphin.Argument('Cursor'),
+        last=dauphin.Int(),
+        before=dauphin.Argument('Cursor'),
+        filter=dauphin.Argument('LogMessageFilter'),
+    )
     executionPlan = dauphin.NonNull('ExecutionPlan')
 
     def __init__(self, pipeline_run):
@@ -31,8 +46,8 @@ class DauphinPipelineRun(dauphin.ObjectType):
     def resolve_pipeline(self, info):
         return model.get_pipeline_or_raise(info, self._pipeline_run.selector)
 
-    def resolve_logs(self, info):
-        return info.schema.type_named('LogMessageConnection')(self._pipeline_run)
+    def resolve_logs(self, info, **kwargs):
+        return info.schema.type_named('LogMessageConnection')(self._pipeline_run, **kwargs)
 
     def resolve_executionPlan(self, info):
         pipeline = self.resolve_pipeline(info)
@@ -76,18 +91,93 @@ class DauphinMessageEvent(dauphin.Interface):
     level = dauphin.NonNull('LogLevel')
 
 
+DauphinEventType = dauphin.Enum.from_enum(EventType)
+
+
+class DauphinLogMessageFilter(dauphin.InputObjectType):
+    class Meta:
+        name = 'LogMessageFilter'
+        description = '''Only events that match every given field are returned. Events
+        that are not about an execution step never match stepKeys.'''
+
+    levels = dauphin.List(dauphin.NonNull('LogLevel'))
+    stepKeys = dauphin.List(dauphin.NonNull(dauphin.String))
+    eventTypes = dauphin.List(dauphin.NonNull('EventType'))
+
+
+def _log_filter(log_filter):
+    if not log_filter:
+        return LogFilter()
+
+    levels = (
+        [level_from_string(level) for level in log_filter['levels']]
+        if log_filter.get('levels') is not None
+        else None
+    )
+    event_types = (
+        [EventType(event_type) for event_type in log_filter['eventTypes']]
+        if log_filter.get('eventTypes') is not None
+        else None
+    )
+    return LogFilter(levels=levels, step_keys=log_filter.get('stepKeys'), event_types=event_types)
+
+
 class DauphinLogMessageConnection(dauphin.ObjectType):
+    '''
+    The events of a pipeline run, paginated with cursors. The cursor of an event is its index
+    in the log of the run. The filter and the bounds of the page are handed to the run, which
+    selects the matching events through its indexes, so only the events of the page and one
+    past it are read and converted. Without any arguments, every event of the run is returned.
+    '''
+
     class Meta:
         name = 'LogMessageConnection'
 
     nodes = dauphin.non_null_list('PipelineRunEvent')
     pageInfo = dauphin.NonNull('PageInfo')
 
-    def __init__(self, pipeline_run):
+    def __init__(self, pipeline_run, first=None, after=None, last=None, before=None, filter=None):
+        # pylint: disable=W0622
         self._pipeline_run = check.inst_param(
             pipeline_run, 'pipeline_run', pipeline_run_storage.PipelineRun
         )
-        self._logs = self._pipeline_run.all_logs()
+        check.opt_int_param(first, 'first')
+        check.opt_int_param(last, 'last')
+        check.param_invariant(first is None or first >= 0, 'first')
+        check.param_invariant(last is None or last >= 0, 'last')
+
+        self._total_count = self._pipeline_run.log_count()
+
+        after = int(after) if after is not None else -1
+        before = int(before) if before is not None else None
+        log_filter = _log_filter(filter)
+
+        if last is not None and first is None:
+            # Read backwards from the end of the range, one extra to tell if there are more
+            page = self._pipeline_run.logs_matching(
+                log_filter, after=after, before=before, limit=last + 1, reverse=True
+            )
+            self._has_previous_page = len(page) > last
+            # Only events that match the filter make for a next page
+            self._has_next_page = before is not None and self._pipeline_run.has_logs_matching(
+                log_filter, after=before - 1
+            )
+            page = list(reversed(page[:last]))
+        else:
+            page = self._pipeline_run.logs_matching(
+                log_filter, after=after, before=before, limit=None if first is None else first + 1
+            )
+            self._has_next_page = first is not None and len(page) > first
+            self._has_previous_page = self._pipeline_run.has_logs_matching(
+                log_filter, before=after + 1
+            )
+            page = page if first is None else page[:first]
+            if last is not None and len(page) > last:
+                self._has_previous_page = True
+                page = page[len(page) - last :]
+
+        self._cursors = [cursor for cursor, _event in page]
+        self._logs = [event for _cursor, event in page]
 
     def resolve_nodes(self, info):
         pipeline = model.get_pipeline_or_raise(info, self._pipeline_run.selector)
@@ -97,16 +187,13 @@ class DauphinLogMessageConnection(dauphin.ObjectType):
         ]
 
     def resolve_pageInfo(self, info):
-        count = len(self._logs)
-        lastCursor = None
-        if count > 0:
-            lastCursor = str(count - 1)
         return info.schema.type_named('PageInfo')(
-            lastCursor=lastCursor,
-            hasNextPage=None,
-            hasPreviousPage=None,
-            count=count,
-            totalCount=count,
+            firstCursor=str(self._cursors[0]) if self._cursors else None,
+            lastCursor=str(self._cursors[-1]) if self._cursors else None,
+            hasNextPage=self._has_next_page,
+            hasPreviousPage=self._has_previous_page,
+            count=len(self._logs),
+            totalCount=self._total_count,
         )
 
 
@@ -0,0 +1,303 @@
+'''
+Pipeline run storage that persists runs and their events to a SQLite database, so that they
+survive restarts of dagit without being held in memory.
+
+Events are stored as pickled EventRecords next to the columns they are queried by. Reading the
+logs of a run after a cursor, the events that match a LogFilter, or the runs of a pipeline are
+all served by index range scans.
+'''
+
+import json
+import pickle
+import sqlite3
+import time
+
+import gevent.lock
+
+from dagster import check
+from dagster.core.events import EventRecord
+from dagster.core.execution import ExecutionSelector
+
+from .pipeline_run_storage import (
+    LogFilter,
+    LogSequence,
+    PipelineRun,
+    PipelineRunStatus,
+    PipelineRunStorage,
+)
+
+SCHEMA_STATEMENTS = [
+    '''
+    CREATE TABLE IF NOT EXISTS runs (
+        run_id TEXT PRIMARY KEY,
+        pipeline_name TEXT NOT NULL,
+        solid_subset TEXT,
+        config TEXT,
+        status TEXT NOT NULL,
+        created_at REAL NOT NULL
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS runs_by_pipeline_name ON runs (pipeline_name)',
+    '''
+    CREATE TABLE IF NOT EXISTS events (
+        run_id TEXT NOT NULL,
+        sequence INTEGER NOT NULL,
+        event_type TEXT,
+        step_key TEXT,
+        level INTEGER,
+        timestamp REAL NOT NULL,
+        record BLOB NOT NULL,
+        PRIMARY KEY (run_id, sequence)
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS events_by_event_type ON events (run_id, event_type, sequence)',
+    'CREATE INDEX IF NOT EXISTS events_by_step_key ON events (run_id, step_key, sequence)',
+    'CREATE INDEX IF NOT EXISTS events_by_level ON events (run_id, level, sequence)',
+]
+
+RUN_COLUMNS = 'run_id, pipeline_name, solid_subset, config, status'
+
+
+def _serialize_event(event):
+    return sqlite3.Binary(pickle.dumps(event, protocol=2))
+
+
+def _deserialize_events(rows):
+    return LogSequence([pickle.loads(bytes(row[0])) for row in rows])
+
+
+def _log_filter_clauses(log_filter):
+    '''Returns the WHERE clauses that select the events matching log_filter, and their params.'''
+    clauses = []
+    params = []
+    for column, values in (
+        ('level', log_filter.levels),
+        ('step_key', log_filter.step_keys),
+        (
+            'event_type',
+            None
+            if log_filter.event_types is None
+            else [event_type.value for event_type in log_filter.event_types],
+        ),
+    ):
+        if values is None:
+            continue
+        values = sorted(values)
+        clauses.append('{} IN ({})'.format(column, ', '.join('?' * len(values))))
+        params.extend(values)
+    return clauses, params
+
+
+class SqlitePipelineRunStorage(PipelineRunStorage):
+    '''
+    Runs created by this storage are kept in memory while the process is alive, so that
+    subscribers of a run get its new events. Every other run is loaded from the database on
+    demand.
+
+    Runs that are still queued or started when the storage is opened were left behind by a
+    dagit process that exited before they finished, so they are marked as failed.
+
+    Args:
+        db_path (str): Path of the SQLite database. Created if it does not exist.
+        create_execution_plan_fn (Callable[[ExecutionSelector, dict], ExecutionPlan]):
+            Rebuilds the execution plan of a run loaded from the database. Plans hold the
+            transform functions of the pipeline, so they are not persisted.
+    '''
+
+    def __init__(self, db_path, create_execution_plan_fn=None):
+        super(SqlitePipelineRunStorage, self).__init__(create_pipeline_run=self._create_run)
+        self._db_path = check.str_param(db_path, 'db_path')
+        self._create_execution_plan_fn = check.opt_callable_param(
+            create_execution_plan_fn, 'create_execution_plan_fn'
+        )
+
+        # Greenlets share the connection, so statements are serialized by the lock
+        self._lock = gevent.lock.Semaphore()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            # Safe with WAL, and avoids an fsync per stored event
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            for statement in SCHEMA_STATEMENTS:
+                self._conn.execute(statement)
+            self._conn.execute(
+                'UPDATE runs SET status = ? WHERE status IN (?, ?)',
+                (
+                    PipelineRunStatus.FAILURE.value,
+                    PipelineRunStatus.QUEUED.value,
+                    PipelineRunStatus.STARTED.value,
+                ),
+            )
+
+    def _create_run(self, run_id, selector, env_config, execution_plan):
+        return SqlitePipelineRun(self, run_id, selector, env_config, execution_plan)
+
+    def execute(self, sql, params=()):
+        with self._lock:
+            with self._conn:
+                return self._conn.execute(sql, params).fetchall()
+
+    def add_run(self, pipeline_run):
+        check.inst_param(pipeline_run, 'pipeline_run', SqlitePipelineRun)
+        self.execute(
+            'INSERT INTO runs (run_id, pipeline_name, solid_subset, config, status, created_at) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (
+                pipeline_run.run_id,
+                pipeline_run.selector.name,
+                json.dumps(pipeline_run.selector.solid_subset),
+                json.dumps(pipeline_run.config),
+                pipeline_run.status.value,
+                time.time(),
+            ),
+        )
+        super(SqlitePipelineRunStorage, self).add_run(pipeline_run)
+
+    def _run_from_row(self, row):
+        run_id, pipeline_name, solid_subset, config, status = row
+        if run_id in self._runs:
+            return self._runs[run_id]
+
+        return SqlitePipelineRun(
+            self,
+            run_id,
+            ExecutionSelector(pipeline_name, json.loads(solid_subset)),
+            json.loads(config),
+            status=PipelineRunStatus(status),
+        )
+
+    def all_runs(self):
+        return [
+            self._run_from_row(row)
+            for row in self.execute('SELECT {} FROM runs ORDER BY rowid'.format(RUN_COLUMNS))
+        ]
+
+    def all_runs_for_pipeline(self, pipeline_name):
+        check.str_param(pipeline_name, 'pipeline_name')
+        return [
+            self._run_from_row(row)
+            for row in self.execute(
+                'SELECT {} FROM runs WHERE pipeline_name = ? ORDER BY rowid'.format(RUN_COLUMNS),
+                (pipeline_name,),
+            )
+        ]
+
+    def get_run_by_id(self, id_):
+        if id_ in self._runs:
+            return self._runs[id_]
+
+        rows = self.execute('SELECT {} FROM runs WHERE run_id = ?'.format(RUN_COLUMNS), (id_,))
+        return self._run_from_row(rows[0]) if rows else None
+
+    def create_execution_plan(self, selector, env_config):
+        check.invariant(
+            self._create_execution_plan_fn is not None,
+            'Cannot rebuild the execution plan of run for pipeline {name} without a '
+            'create_execution_plan_fn'.format(name=selector.name),
+        )
+        return self._create_execution_plan_fn(selector, env_config)
+
+
+class SqlitePipelineRun(PipelineRun):
+    def __init__(self, storage, run_id, selector, env_config, execution_plan=None, status=None):
+        super(SqlitePipelineRun, self).__init__(run_id, selector, env_config, execution_plan)
+        self._storage = check.inst_param(storage, 'storage', SqlitePipelineRunStorage)
+        if status is not None:
+            self._status = check.inst_param(status, 'status', PipelineRunStatus)
+        self._stored_status = self._status
+        self._next_sequence = None
+
+    @property
+    def execution_plan(self):
+        if self._execution_plan is None:
+            self._execution_plan = self._storage.create_execution_plan(self.selector, self.config)
+        return self._execution_plan
+
+    def logs_after(self, cursor, limit=None):
+        check.opt_int_param(limit, 'limit')
+        return _deserialize_events(
+            self._storage.execute(
+                'SELECT record FROM events WHERE run_id = ? AND sequence > ? ORDER BY sequence '
+                'LIMIT ?',
+                # A negative limit means no limit to SQLite
+                (self.run_id, int(cursor), -1 if limit is None else limit),
+            )
+        )
+
+    def all_logs(self):
+        return self.logs_after(-1)
+
+    def log_count(self):
+        rows = self._storage.execute(
+            'SELECT MAX(sequence) FROM events WHERE run_id = ?', (self.run_id,)
+        )
+        return 0 if rows[0][0] is None else rows[0][0] + 1
+
+    def logs_matching(self, log_filter, after=-1, before=None, limit=None, reverse=False):
+        check.inst_param(log_filter, 'log_filter', LogFilter)
+        check.opt_int_param(limit, 'limit')
+        clauses, params = self._range_clauses(log_filter, after, before)
+        # With several values for every filtered field, SQLite walks the run in sequence order
+        # rather than sort, which reads the whole run when few events match. The unary plus
+        # keeps it on the index of a filtered field, at the cost of sorting the field's matches.
+        value_counts = [
+            len(values)
+            for values in (log_filter.levels, log_filter.step_keys, log_filter.event_types)
+            if values is not None
+        ]
+        order_by = '+sequence' if value_counts and min(value_counts) > 1 else 'sequence'
+        rows = self._storage.execute(
+            'SELECT sequence, record FROM events WHERE {} ORDER BY {} {} LIMIT ?'.format(
+                ' AND '.join(clauses), order_by, 'DESC' if reverse else 'ASC'
+            ),
+            params + [-1 if limit is None else limit],
+        )
+        return [(row[0], pickle.loads(bytes(row[1]))) for row in rows]
+
+    def has_logs_matching(self, log_filter, after=-1, before=None):
+        check.inst_param(log_filter, 'log_filter', LogFilter)
+        clauses, params = self._range_clauses(log_filter, after, before)
+        rows = self._storage.execute(
+            'SELECT EXISTS (SELECT 1 FROM events WHERE {} LIMIT 1)'.format(' AND '.join(clauses)),
+            params,
+        )
+        return bool(rows[0][0])
+
+    def _range_clauses(self, log_filter, after, before):
+        clauses = ['run_id = ?', 'sequence > ?']
+        params = [self.run_id, int(after)]
+        if before is not None:
+            clauses.append('sequence < ?')
+            params.append(int(before))
+        filter_clauses, filter_params = _log_filter_clauses(log_filter)
+        return clauses + filter_clauses, params + filter_params
+
+    def store_event(self, new_event):
+        check.inst_param(new_event, 'new_event', EventRecord)
+
+        if self._next_sequence is None:
+            rows = self._storage.execute(
+                'SELECT MAX(sequence) FROM events WHERE run_id = ?', (self.run_id,)
+            )
+            self._next_sequence = 0 if rows[0][0] is None else rows[0][0] + 1
+
+        self._storage.execute(
+            'INSERT INTO events (run_id, sequence, event_type, step_key, level, timestamp, record) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (
+                self.run_id,
+                self._next_sequence,
+                new_event.event_type.value,
+                getattr(new_event, 'step_key', None),
+                new_event.level,
+                new_event.timestamp,
+                _serialize_event(new_event),
+            ),
+        )
+        self._next_sequence += 1
+
+        if self._status != self._stored_status:
+            self._storage.execute(
+                'UPDATE runs SET status = ? WHERE run_id = ?', (self._status.value, self.run_id)
+            )
+            self._stored_status = self._status
@@ -1,5 +1,7 @@
 import uuid
 
+import pytest
+
 from graphql import graphql, parse
 
 from dagster import (
@@ -34,6 +36,7 @@ from dagit.app import RepositoryContainer
 from dagit.pipeline_execution_manager import SynchronousExecutionManager
 from dagit.pipeline_run_storage import PipelineRunStorage
 from dagit.schema import create_schema
+from dagit.sqlite_run_storage import SqlitePipelineRunStorage
 from dagit.schema.context import DagsterGraphQLContext
 
 
@@ -360,10 +363,10 @@ def define_repository():
     )
 
 
-def define_context():
+def define_context(pipeline_runs=None):
     return DagsterGraphQLContext(
         RepositoryContainer(repository=define_repository()),
-        PipelineRunStorage(),
+        pipeline_runs or PipelineRunStorage(),
         execution_manager=SynchronousExecutionManager(),
     )
 
@@ -1594,6 +1597,155 @@ def test_basic_sync_execution():
     assert first_event_of_type(logs, 'PipelineStartEvent')['level'] == 'INFO'
 
 
+PAGINATED_LOGS_QUERY = '''
+query PaginatedLogsQuery(
+    $runId: ID!
+    $first: Int
+    $after: Cursor
+    $last: Int
+    $before: Cursor
+    $filter: LogMessageFilter
+) {
+    pipelineRun(runId: $runId) {
+        logs(first: $first, after: $after, last: $last, before: $before, filter: $filter) {
+            nodes {
+                __typename
+                ... on MessageEvent {
+                    message
+                    level
+                }
+                ... on ExecutionStepEvent {
+                    step { name }
+                }
+            }
+            pageInfo {
+                firstCursor
+                lastCursor
+                hasNextPage
+                hasPreviousPage
+                count
+                totalCount
+            }
+        }
+    }
+}
+'''
+
+
+@pytest.mark.parametrize('storage', ['in_memory', 'sqlite'])
+def test_paginated_logs(tmpdir, storage):
+    context = define_context(
+        SqlitePipelineRunStorage(str(tmpdir.join('runs.db'))) if storage == 'sqlite' else None
+    )
+    result = execute_dagster_graphql(
+        context,
+        SYNC_MUTATION_QUERY,
+        variables={
+            'config': pandas_hello_world_solids_config(),
+            'pipeline': {'name': 'pandas_hello_world'},
+        },
+    )
+    assert not result.errors
+    run_id = result.data['startPipelineExecution']['run']['runId']
+
+    def query_logs(**variables):
+        variables['runId'] = run_id
+        result = execute_dagster_graphql(context, PAGINATED_LOGS_QUERY, variables=variables)
+        assert not result.errors
+        return result.data['pipelineRun']['logs']
+
+    all_logs = query_logs()
+    total_count = all_logs['pageInfo']['totalCount']
+    assert total_count == len(all_logs['nodes']) > 5
+    assert all_logs['pageInfo']['lastCursor'] == str(total_count - 1)
+
+    # Paging forward
+    paged_nodes = []
+    after = None
+    while True:
+        page = query_logs(first=2, after=after)
+        assert page['pageInfo']['count'] == len(page['nodes']) <= 2
+        assert page['pageInfo']['totalCount'] == total_count
+        paged_nodes.extend(page['nodes'])
+        if not page['pageInfo']['hasNextPage']:
+            break
+        after = page['pageInfo']['lastCursor']
+    assert paged_nodes == all_logs['nodes']
+
+    # Paging backward
+    paged_nodes = []
+    before = None
+    while True:
+        page = query_logs(last=3, before=before)
+        paged_nodes = page['nodes'] + paged_nodes
+        if not page['pageInfo']['hasPreviousPage']:
+            break
+        before = page['pageInfo']['firstCursor']
+    assert paged_nodes == all_logs['nodes']
+
+    last_page = query_logs(last=1)
+    assert last_page['nodes'] == all_logs['nodes'][-1:]
+    assert last_page['pageInfo']['firstCursor'] == str(total_count - 1)
+    assert not last_page['pageInfo']['hasNextPage']
+
+    # Filtering
+    step_starts = query_logs(filter={'eventTypes': ['EXECUTION_PLAN_STEP_START']})['nodes']
+    assert step_starts == [
+        node for node in all_logs['nodes'] if node['__typename'] == 'ExecutionStepStartEvent'
+    ]
+
+    step_key = 'sum_solid.transform'
+    step_logs = query_logs(filter={'stepKeys': [step_key]})['nodes']
+    assert step_logs
+    assert all(node['step']['name'] == step_key for node in step_logs)
+
+    first_step_log = query_logs(first=1, filter={'stepKeys': [step_key]})
+    assert first_step_log['nodes'] == step_logs[:1]
+    assert first_step_log['pageInfo']['hasNextPage']
+
+    # Paging with a filter, where pages only account for the events that match it
+    step_start_filter = {'eventTypes': ['EXECUTION_PLAN_STEP_START']}
+    paged_nodes = []
+    after = None
+    while True:
+        page = query_logs(first=2, after=after, filter=step_start_filter)
+        paged_nodes.extend(page['nodes'])
+        if not page['pageInfo']['hasNextPage']:
+            break
+        after = page['pageInfo']['lastCursor']
+    assert paged_nodes == step_starts
+
+    paged_nodes = []
+    before = None
+    while True:
+        page = query_logs(last=2, before=before, filter=step_start_filter)
+        paged_nodes = page['nodes'] + paged_nodes
+        if not page['pageInfo']['hasPreviousPage']:
+            break
+        before = page['pageInfo']['firstCursor']
+    assert paged_nodes == step_starts
+
+    # The run logs more events after its last step start, none of which match
+    last_step_start = query_logs(last=1, filter=step_start_filter)
+    assert last_step_start['nodes'] == step_starts[-1:]
+    assert int(last_step_start['pageInfo']['lastCursor']) < total_count - 1
+    assert not last_step_start['pageInfo']['hasNextPage']
+    assert last_step_start['pageInfo']['hasPreviousPage']
+
+    # Likewise the run logs events before its first step start
+    first_step_start = query_logs(first=1, filter=step_start_filter)
+    after_first_cursor = str(int(first_step_start['pageInfo']['firstCursor']) - 1)
+    assert int(after_first_cursor) >= 0
+    assert not query_logs(first=1, after=after_first_cursor, filter=step_start_filter)[
+        'pageInfo'
+    ]['hasPreviousPage']
+
+    assert not query_logs(filter={'levels': ['CRITICAL']})['nodes']
+    assert query_logs(filter={'levels': ['INFO']})['nodes'] == [
+        node for node in all_logs['nodes'] if node['level'] == 'INFO'
+    ]
+
+
 def first_event_of_type(logs, message_type):
     for log in logs:
         if log['__typename'] == message_type:
@@ -1,4 +1,8 @@
 import os
+import threading
+
+import gevent
+
 from dagster import (
     DependencyDefinition,
     PipelineDefinition,
@@ -13,8 +17,11 @@ from dagster.utils import script_relative_path
 import dagster_pandas as dagster_pd
 
 from dagit.app import RepositoryContainer
-from dagit.pipeline_execution_manager import MultiprocessingExecutionManager
-from dagit.pipeline_run_storage import InMemoryPipelineRun, PipelineRunStatus
+from dagit.pipeline_execution_manager import (
+    MultiprocessingExecutionManager,
+    SynchronousExecutionManager,
+)
+from dagit.pipeline_run_storage import InMemoryPipelineRun, LogFilePipelineRun, PipelineRunStatus
 
 
 def get_events_of_type(events, event_type):
@@ -112,6 +119,205 @@ def test_execution_crash():
     ).format(run_id=run_id)
 
 
+def define_passing_repository_container():
+    return RepositoryContainer(
+        RepositoryTargetInfo(
+            repository_yaml=None,
+            python_file=__file__,
+            fn_name='define_passing_pipeline',
+            module_name=None,
+        )
+    )
+
+
+def create_passing_pipeline_run(run_id):
+    pipeline = define_passing_pipeline()
+    env_config = {
+        'solids': {
+            'sum_solid': {'inputs': {'num': {'csv': {'path': script_relative_path('num.csv')}}}}
+        }
+    }
+    return InMemoryPipelineRun(
+        run_id,
+        ExecutionSelector('pandas_hello_world'),
+        env_config,
+        create_execution_plan(pipeline, env_config),
+    )
+
+
+def execute_passing_runs(execution_manager, repository_container, run_ids):
+    pipeline_runs = [create_passing_pipeline_run(run_id) for run_id in run_ids]
+    for pipeline_run in pipeline_runs:
+        execution_manager.execute_pipeline(
+            repository_container, define_passing_pipeline(), pipeline_run
+        )
+    return pipeline_runs
+
+
+def process_id_of_run(pipeline_run):
+    (started_event,) = get_events_of_type(
+        pipeline_run.all_logs(), EventType.PIPELINE_PROCESS_STARTED
+    )
+    return started_event.process_id
+
+
+def test_worker_reused_between_runs():
+    repository_container = define_passing_repository_container()
+    execution_manager = MultiprocessingExecutionManager(max_workers=1)
+
+    (first_run,) = execute_passing_runs(execution_manager, repository_container, ['run-1'])
+    execution_manager.join()
+    (second_run,) = execute_passing_runs(execution_manager, repository_container, ['run-2'])
+    execution_manager.join()
+
+    assert first_run.status == PipelineRunStatus.SUCCESS
+    assert second_run.status == PipelineRunStatus.SUCCESS
+    assert process_id_of_run(first_run) == process_id_of_run(second_run)
+    execution_manager.shutdown()
+
+
+def test_worker_recycled_after_max_runs():
+    repository_container = define_passing_repository_container()
+    execution_manager = MultiprocessingExecutionManager(max_workers=1, max_runs_per_worker=1)
+
+    (first_run,) = execute_passing_runs(execution_manager, repository_container, ['run-1'])
+    execution_manager.join()
+    (second_run,) = execute_passing_runs(execution_manager, repository_container, ['run-2'])
+    execution_manager.join()
+
+    assert second_run.status == PipelineRunStatus.SUCCESS
+    assert process_id_of_run(first_run) != process_id_of_run(second_run)
+    execution_manager.shutdown()
+
+
+def test_worker_recycled_after_reload():
+    repository_container = define_passing_repository_container()
+    execution_manager = MultiprocessingExecutionManager(max_workers=1)
+
+    (first_run,) = execute_passing_runs(execution_manager, repository_container, ['run-1'])
+    execution_manager.join()
+    repository_container.reload()
+    (second_run,) = execute_passing_runs(execution_manager, repository_container, ['run-2'])
+    execution_manager.join()
+
+    assert second_run.status == PipelineRunStatus.SUCCESS
+    assert process_id_of_run(first_run) != process_id_of_run(second_run)
+    execution_manager.shutdown()
+
+
+def test_stale_workers_retired_after_reload():
+    repository_container = define_passing_repository_container()
+    # Room for a new worker, so the stale one is not retired to make room for it
+    execution_manager = MultiprocessingExecutionManager(max_workers=2)
+
+    (first_run,) = execute_passing_runs(execution_manager, repository_container, ['run-1'])
+    execution_manager.join()
+    # What reload() does, without reloading the modules this test already reloaded in
+    # test_worker_recycled_after_reload, which would leave its classes out of date
+    repository_container.generation += 1
+    (second_run,) = execute_passing_runs(execution_manager, repository_container, ['run-2'])
+    execution_manager.join()
+
+    assert second_run.status == PipelineRunStatus.SUCCESS
+    assert process_id_of_run(first_run) != process_id_of_run(second_run)
+    # pylint: disable=W0212
+    assert [worker.process.pid for worker in execution_manager._workers] == [
+        process_id_of_run(second_run)
+    ]
+    execution_manager.shutdown()
+
+
+def test_runs_queued_beyond_max_workers():
+    repository_container = define_passing_repository_container()
+    execution_manager = MultiprocessingExecutionManager(max_workers=1)
+
+    pipeline_runs = execute_passing_runs(
+        execution_manager, repository_container, ['run-1', 'run-2', 'run-3']
+    )
+    assert [pipeline_run.status for pipeline_run in pipeline_runs] == [
+        PipelineRunStatus.NOT_STARTED,
+        PipelineRunStatus.QUEUED,
+        PipelineRunStatus.QUEUED,
+    ]
+    assert not get_events_of_type(pipeline_runs[0].all_logs(), EventType.PIPELINE_PROCESS_QUEUED)
+
+    execution_manager.join()
+    assert all(pipeline_run.status == PipelineRunStatus.SUCCESS for pipeline_run in pipeline_runs)
+    assert len(set(process_id_of_run(pipeline_run) for pipeline_run in pipeline_runs)) == 1
+
+    # First in, first out
+    start_times = [
+        get_events_of_type(pipeline_run.all_logs(), EventType.PIPELINE_START)[0].timestamp
+        for pipeline_run in pipeline_runs
+    ]
+    assert start_times == sorted(start_times)
+    execution_manager.shutdown()
+
+
+def test_events_forwarded_to_subscribers_as_they_arrive():
+    repository_container = define_passing_repository_container()
+    execution_manager = MultiprocessingExecutionManager(max_workers=1)
+
+    pipeline_run = create_passing_pipeline_run('run-1')
+    batches = []
+    pipeline_run.observable_after_cursor(debounce_interval=0.0).subscribe(batches.append)
+    execution_manager.execute_pipeline(
+        repository_container, define_passing_pipeline(), pipeline_run
+    )
+    execution_manager.join()
+    gevent.sleep(0.1)
+
+    received = [event for batch in batches for event in batch]
+    assert [event.message for event in received] == [
+        event.message for event in pipeline_run.all_logs()
+    ]
+    # Without a debounce window, events are not held back until the run finishes
+    assert len(batches) > 1
+    execution_manager.shutdown()
+
+
+class ThreadRecordingPipelineRun(LogFilePipelineRun):
+    def __init__(self, *args, **kwargs):
+        super(ThreadRecordingPipelineRun, self).__init__(*args, **kwargs)
+        self.event_threads = []
+
+    def handle_new_event(self, new_event):
+        self.event_threads.append(threading.current_thread())
+        super(ThreadRecordingPipelineRun, self).handle_new_event(new_event)
+
+
+def test_synchronous_thread_pool_events_handled_on_hub_thread(tmpdir):
+    pipeline = define_passing_pipeline()
+    env_config = {
+        'solids': {
+            'sum_solid': {'inputs': {'num': {'csv': {'path': script_relative_path('num.csv')}}}}
+        },
+        'execution': {'engine': {'thread_pool': {'max_workers': 2}}},
+    }
+    pipeline_run = ThreadRecordingPipelineRun(
+        str(tmpdir) + '/',
+        'run-1',
+        ExecutionSelector('pandas_hello_world'),
+        env_config,
+        create_execution_plan(pipeline, env_config),
+    )
+    batches = []
+    pipeline_run.observable_after_cursor(debounce_interval=0.01).subscribe(batches.append)
+
+    SynchronousExecutionManager().execute_pipeline(None, pipeline, pipeline_run)
+    assert pipeline_run.status == PipelineRunStatus.SUCCESS
+    events = pipeline_run.all_logs()
+    assert get_events_of_type(events, EventType.EXECUTION_PLAN_STEP_SUCCESS)
+
+    # The steps ran on the threads of the engine, but their events reached the run, its log
+    # file and its subscribers on the thread of the gevent hub
+    assert set(pipeline_run.event_threads) == {threading.current_thread()}
+    gevent.sleep(0.05)
+    assert [event.message for batch in batches for event in batch] == [
+        event.message for event in events
+    ]
+
+
 @lambda_solid(
     inputs=[InputDefinition('num', dagster_pd.DataFrame)],
     output=OutputDefinition(dagster_pd.DataFrame),
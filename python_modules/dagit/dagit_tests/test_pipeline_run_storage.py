@@ -0,0 +1,300 @@
+import os
+import time
+
+import gevent
+
+from dagster import PipelineDefinition
+from dagster.core.events import EventType, PipelineEventRecord
+from dagster.core.execution import ExecutionSelector, create_execution_plan
+from dagster.utils.logging import level_from_string
+
+from dagit import pipeline_run_storage
+from dagit.pipeline_run_storage import (
+    BufferedLogFileWriter,
+    DebouncingLogQueue,
+    FsyncPolicy,
+    InMemoryPipelineRun,
+    LogFilePipelineRun,
+    LogFilter,
+    PipelineRun,
+    PipelineRunStatus,
+    load_log_file_runs,
+)
+
+
+def read_lines(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r') as ff:
+        return ff.read().splitlines()
+
+
+def build_event(run_id, event_type, message='message', level='INFO'):
+    return PipelineEventRecord(
+        message=message,
+        user_message=message,
+        level=level_from_string(level),
+        event_type=event_type,
+        run_id=run_id,
+        timestamp=time.time(),
+        error_info=None,
+        pipeline_name='pipeline',
+    )
+
+
+def create_log_file_run(log_dir, **kwargs):
+    pipeline = PipelineDefinition(name='pipeline', solids=[])
+    return LogFilePipelineRun(
+        str(log_dir) + '/',
+        'run_id',
+        ExecutionSelector('pipeline'),
+        {},
+        create_execution_plan(pipeline),
+        **kwargs
+    )
+
+
+def test_writer_flushes_on_size(tmpdir):
+    path = str(tmpdir.join('events.log'))
+    writer = BufferedLogFileWriter(path, max_buffer_size=10, flush_interval=60.0)
+
+    writer.write_line('one')
+    assert read_lines(path) == []
+
+    writer.write_line('two')
+    writer.write_line('three')
+    assert read_lines(path) == ['one', 'two', 'three']
+
+    writer.close()
+    assert writer.closed
+
+
+def test_writer_flushes_on_interval(tmpdir):
+    path = str(tmpdir.join('events.log'))
+    writer = BufferedLogFileWriter(path, flush_interval=0.01)
+
+    writer.write_line('one')
+    assert read_lines(path) == []
+
+    gevent.sleep(0.1)
+    assert read_lines(path) == ['one']
+
+    writer.close()
+
+
+def test_writer_flushes_on_close(tmpdir):
+    path = str(tmpdir.join('events.log'))
+    for fsync_policy in FsyncPolicy:
+        writer = BufferedLogFileWriter(path, flush_interval=60.0, fsync_policy=fsync_policy)
+        writer.write_line(fsync_policy.value)
+        writer.flush()
+        writer.write_line(fsync_policy.value)
+        writer.close()
+        # Closing twice is harmless
+        writer.close()
+
+    assert read_lines(path) == [policy.value for policy in FsyncPolicy for _ in range(2)]
+
+
+def test_log_file_run_closes_on_pipeline_finish(tmpdir):
+    run = create_log_file_run(tmpdir, flush_interval=60.0)
+
+    run.handle_new_event(build_event(run.run_id, EventType.PIPELINE_START, 'start'))
+    run.handle_new_event(build_event(run.run_id, EventType.UNCATEGORIZED, 'log'))
+    assert run.log_reader.count() == 0
+
+    run.handle_new_event(build_event(run.run_id, EventType.PIPELINE_SUCCESS, 'success'))
+    assert [event.message for event in run.log_reader.events_after(-1)] == [
+        'start',
+        'log',
+        'success',
+    ]
+
+    # Late events reopen the log
+    run.handle_new_event(build_event(run.run_id, EventType.PIPELINE_FAILURE))
+    assert run.log_reader.count() == 4
+    assert len(run.all_logs()) == 4
+
+    events = run.log_reader.events_after(1)
+    assert [event.event_type for event in events] == [
+        EventType.PIPELINE_SUCCESS,
+        EventType.PIPELINE_FAILURE,
+    ]
+    assert events[0].to_dict() == run.all_logs()[2].to_dict()
+
+
+def test_log_file_runs_loaded(tmpdir):
+    finished_run = create_log_file_run(tmpdir)
+    finished_run.handle_new_event(build_event('run_id', EventType.PIPELINE_START, 'start'))
+    finished_run.handle_new_event(build_event('run_id', EventType.PIPELINE_SUCCESS, 'success'))
+
+    pipeline = PipelineDefinition(name='pipeline', solids=[])
+    crashed_run = LogFilePipelineRun(
+        str(tmpdir) + '/',
+        'crashed_run_id',
+        ExecutionSelector('pipeline', ['solid']),
+        {'solids': {}},
+        create_execution_plan(pipeline),
+    )
+    crashed_run.handle_new_event(build_event('crashed_run_id', EventType.PIPELINE_START, 'start'))
+    crashed_run.close()
+
+    plans = []
+
+    def create_execution_plan_fn(selector, env_config):
+        plans.append((selector.name, selector.solid_subset, env_config))
+        return create_execution_plan(pipeline)
+
+    loaded_runs = load_log_file_runs(
+        str(tmpdir) + '/', create_execution_plan_fn=create_execution_plan_fn
+    )
+    assert [run.run_id for run in loaded_runs] == ['run_id', 'crashed_run_id']
+    loaded_finished_run, loaded_crashed_run = loaded_runs
+
+    assert loaded_finished_run.status == PipelineRunStatus.SUCCESS
+    assert [event.to_dict() for event in loaded_finished_run.all_logs()] == [
+        event.to_dict() for event in finished_run.all_logs()
+    ]
+    # Its logs are indexed like those of a run that received them
+    [(cursor, _event)] = loaded_finished_run.logs_matching(
+        LogFilter(event_types=[EventType.PIPELINE_SUCCESS])
+    )
+    assert cursor == 1
+
+    # The process that wrote the run exited before it finished
+    assert loaded_crashed_run.status == PipelineRunStatus.FAILURE
+    assert loaded_crashed_run.selector.solid_subset == ['solid']
+    assert loaded_crashed_run.config == {'solids': {}}
+    assert plans == []
+    assert loaded_crashed_run.execution_plan
+    assert plans == [('pipeline', ['solid'], {'solids': {}})]
+
+    # Late events continue the log file of the run
+    loaded_crashed_run.handle_new_event(
+        build_event('crashed_run_id', EventType.PIPELINE_FAILURE, 'failure')
+    )
+    [reloaded_crashed_run] = [
+        run for run in load_log_file_runs(str(tmpdir) + '/') if run.run_id == 'crashed_run_id'
+    ]
+    assert [event.message for event in reloaded_crashed_run.all_logs()] == ['start', 'failure']
+
+    assert load_log_file_runs(str(tmpdir.join('missing')) + '/') == []
+
+
+def test_debouncing_log_queue_batches_events():
+    batches = []
+    queue = DebouncingLogQueue(batches.append, debounce_interval=0.05)
+
+    events = [build_event('run_id', EventType.UNCATEGORIZED, str(i)) for i in range(3)]
+    for event in events:
+        queue.enqueue(event)
+    assert batches == []
+
+    gevent.sleep(0.1)
+    assert [list(batch) for batch in batches] == [events]
+
+    queue.enqueue(events[0])
+    gevent.sleep(0.1)
+    assert [list(batch) for batch in batches] == [events, [events[0]]]
+
+
+def test_subscriber_gets_logs_after_cursor():
+    pipeline = PipelineDefinition(name='pipeline', solids=[])
+    run = InMemoryPipelineRun(
+        'run_id', ExecutionSelector('pipeline'), {}, create_execution_plan(pipeline)
+    )
+    run.handle_new_event(build_event(run.run_id, EventType.PIPELINE_START, 'start'))
+    run.handle_new_event(build_event(run.run_id, EventType.UNCATEGORIZED, 'log'))
+
+    batches = []
+    run.observable_after_cursor('0', debounce_interval=0.01).subscribe(batches.append)
+    run.handle_new_event(build_event(run.run_id, EventType.PIPELINE_SUCCESS, 'success'))
+    assert [[event.message for event in batch] for batch in batches] == [['log']]
+
+    gevent.sleep(0.05)
+    assert [[event.message for event in batch] for batch in batches] == [['log'], ['success']]
+
+
+def test_filtered_logs_read_only_candidate_events(monkeypatch):
+    pipeline = PipelineDefinition(name='pipeline', solids=[])
+    run = InMemoryPipelineRun(
+        'run_id', ExecutionSelector('pipeline'), {}, create_execution_plan(pipeline)
+    )
+    for i in range(1000):
+        run.store_event(build_event(run.run_id, EventType.UNCATEGORIZED, str(i)))
+    run.store_event(build_event(run.run_id, EventType.UNCATEGORIZED, 'debug', level='DEBUG'))
+
+    checked = []
+    matches = LogFilter.matches
+
+    def recording_matches(log_filter, event):
+        checked.append(event.message)
+        return matches(log_filter, event)
+
+    monkeypatch.setattr(LogFilter, 'matches', recording_matches)
+
+    # No event has the type, so no event of the run is read
+    step_filter = LogFilter(
+        event_types=[EventType.EXECUTION_PLAN_STEP_START, EventType.EXECUTION_PLAN_STEP_SUCCESS]
+    )
+    assert run.logs_matching(step_filter, limit=2) == []
+    assert run.logs_matching(step_filter, limit=2, reverse=True) == []
+    assert not run.has_logs_matching(step_filter, after=10)
+    assert checked == []
+
+    # Only the events with the rarest of the filtered values are checked
+    debug_filter = LogFilter(
+        levels=[level_from_string('DEBUG')], event_types=[EventType.UNCATEGORIZED]
+    )
+    assert [(cursor, event.message) for cursor, event in run.logs_matching(debug_filter)] == [
+        (1000, 'debug')
+    ]
+    assert checked == ['debug']
+
+    # Without a filter, only the events of the page are read
+    assert [event.message for _cursor, event in run.logs_matching(LogFilter(), limit=2)] == [
+        '0',
+        '1',
+    ]
+    page = run.logs_matching(LogFilter(), before=500, limit=2, reverse=True)
+    assert [cursor for cursor, _event in page] == [499, 498]
+    assert checked == ['debug', '0', '1', '499', '498']
+
+
+def test_scanned_logs_match_indexed_logs(monkeypatch):
+    # Small enough for ranges to span several chunks of the run's log
+    monkeypatch.setattr(pipeline_run_storage, 'LOG_SCAN_CHUNK_SIZE', 2)
+
+    pipeline = PipelineDefinition(name='pipeline', solids=[])
+    run = InMemoryPipelineRun(
+        'run_id', ExecutionSelector('pipeline'), {}, create_execution_plan(pipeline)
+    )
+    for i in range(9):
+        run.store_event(
+            build_event(
+                run.run_id,
+                EventType.UNCATEGORIZED if i % 3 else EventType.PIPELINE_START,
+                str(i),
+                level='DEBUG' if i % 2 else 'INFO',
+            )
+        )
+
+    for log_filter in [
+        LogFilter(),
+        LogFilter(event_types=[EventType.PIPELINE_START]),
+        LogFilter(levels=[level_from_string('DEBUG')], event_types=[EventType.UNCATEGORIZED]),
+        LogFilter(step_keys=['missing']),
+    ]:
+        for kwargs in [
+            {},
+            {'after': 2, 'limit': 2},
+            {'before': 8, 'limit': 3, 'reverse': True},
+            {'after': 1, 'before': 7, 'reverse': True},
+        ]:
+            # The scan of the base class, which runs without indexes fall back to
+            assert PipelineRun.logs_matching(run, log_filter, **kwargs) == run.logs_matching(
+                log_filter, **kwargs
+            )
+        assert PipelineRun.has_logs_matching(run, log_filter, after=6) == run.has_logs_matching(
+            log_filter, after=6
+        )
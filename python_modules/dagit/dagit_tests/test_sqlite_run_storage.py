@@ -0,0 +1,219 @@
+import time
+
+from dagster import PipelineDefinition, lambda_solid
+from dagster.core.events import EventType, ExecutionStepEventRecord, PipelineEventRecord
+from dagster.core.execution import ExecutionSelector, create_execution_plan
+from dagster.utils.logging import DEBUG, INFO, level_from_string
+
+from dagit.pipeline_run_storage import InMemoryPipelineRun, LogFilter, PipelineRunStatus
+from dagit.sqlite_run_storage import SqlitePipelineRunStorage
+
+
+def define_pipeline(name):
+    @lambda_solid
+    def return_one():
+        return 1
+
+    return PipelineDefinition(name=name, solids=[return_one])
+
+
+def event_kwargs(run_id, event_type, message, level='INFO'):
+    return dict(
+        message=message,
+        user_message=message,
+        level=level_from_string(level),
+        event_type=event_type,
+        run_id=run_id,
+        timestamp=time.time(),
+        error_info=None,
+        pipeline_name='pipeline',
+    )
+
+
+def build_pipeline_event(run_id, event_type, message='message'):
+    return PipelineEventRecord(**event_kwargs(run_id, event_type, message))
+
+
+def build_step_event(run_id, event_type, step_key, message='message', level='INFO'):
+    return ExecutionStepEventRecord(
+        step_key=step_key,
+        solid_name='return_one',
+        solid_definition_name='return_one',
+        **event_kwargs(run_id, event_type, message, level)
+    )
+
+
+def start_run(storage, run_id, pipeline_name, env_config=None):
+    run = storage.create_run(
+        run_id,
+        ExecutionSelector(pipeline_name),
+        env_config or {},
+        create_execution_plan(define_pipeline(pipeline_name)),
+    )
+    storage.add_run(run)
+    return run
+
+
+def test_runs_and_logs_persisted(tmpdir):
+    db_path = str(tmpdir.join('runs.db'))
+    storage = SqlitePipelineRunStorage(db_path)
+
+    run = start_run(storage, 'run_one', 'pipeline')
+    start_run(storage, 'run_two', 'other_pipeline')
+    start_run(storage, 'run_three', 'pipeline')
+
+    run.handle_new_event(build_pipeline_event(run.run_id, EventType.PIPELINE_START, 'start'))
+    run.handle_new_event(
+        build_step_event(run.run_id, EventType.EXECUTION_PLAN_STEP_START, 'return_one.transform')
+    )
+    run.handle_new_event(build_pipeline_event(run.run_id, EventType.PIPELINE_SUCCESS, 'done'))
+    assert run.status == PipelineRunStatus.SUCCESS
+    assert storage.get_run_by_id('run_one') is run
+
+    reopened_storage = SqlitePipelineRunStorage(db_path)
+    assert [r.run_id for r in reopened_storage.all_runs()] == ['run_one', 'run_two', 'run_three']
+    assert [r.run_id for r in reopened_storage.all_runs_for_pipeline('pipeline')] == [
+        'run_one',
+        'run_three',
+    ]
+    assert reopened_storage.get_run_by_id('missing') is None
+
+    reopened_run = reopened_storage.get_run_by_id('run_one')
+    assert reopened_run.status == PipelineRunStatus.SUCCESS
+    assert reopened_run.pipeline_name == 'pipeline'
+    assert [event.message for event in reopened_run.all_logs()] == ['start', 'message', 'done']
+    assert [event.message for event in reopened_run.logs_after(0)] == ['message', 'done']
+    assert reopened_storage.get_run_by_id('run_two').status == PipelineRunStatus.NOT_STARTED
+
+    # Events keep their types
+    [(cursor, step_event)] = reopened_run.logs_matching(
+        LogFilter(step_keys=['return_one.transform'])
+    )
+    assert cursor == 1
+    assert isinstance(step_event, ExecutionStepEventRecord)
+    assert step_event.event_type == EventType.EXECUTION_PLAN_STEP_START
+
+    # Late events continue the sequence of the run
+    reopened_run.handle_new_event(
+        build_pipeline_event(run.run_id, EventType.PIPELINE_FAILURE, 'late')
+    )
+    assert [event.message for event in reopened_run.logs_after(2)] == ['late']
+    assert SqlitePipelineRunStorage(db_path).get_run_by_id('run_one').status == (
+        PipelineRunStatus.FAILURE
+    )
+
+
+def test_execution_plan_rebuilt_for_loaded_runs(tmpdir):
+    db_path = str(tmpdir.join('runs.db'))
+    start_run(SqlitePipelineRunStorage(db_path), 'run_one', 'pipeline')
+
+    calls = []
+
+    def create_execution_plan_fn(selector, env_config):
+        calls.append((selector.name, env_config))
+        return create_execution_plan(define_pipeline(selector.name), env_config)
+
+    storage = SqlitePipelineRunStorage(db_path, create_execution_plan_fn=create_execution_plan_fn)
+    run = storage.get_run_by_id('run_one')
+    assert run.execution_plan.get_step_by_key('return_one.transform')
+    assert run.execution_plan.get_step_by_key('return_one.transform')
+    assert calls == [('pipeline', {})]
+
+
+def test_started_runs_marked_failed_on_startup(tmpdir):
+    db_path = str(tmpdir.join('runs.db'))
+    storage = SqlitePipelineRunStorage(db_path)
+    started = start_run(storage, 'started', 'pipeline')
+    started.handle_new_event(build_pipeline_event('started', EventType.PIPELINE_START))
+    queued = start_run(storage, 'queued', 'pipeline')
+    queued.handle_new_event(build_pipeline_event('queued', EventType.PIPELINE_PROCESS_QUEUED))
+    finished = start_run(storage, 'finished', 'pipeline')
+    finished.handle_new_event(build_pipeline_event('finished', EventType.PIPELINE_SUCCESS))
+    start_run(storage, 'not_started', 'pipeline')
+
+    reopened_storage = SqlitePipelineRunStorage(db_path)
+    assert {run.run_id: run.status for run in reopened_storage.all_runs()} == {
+        'started': PipelineRunStatus.FAILURE,
+        'queued': PipelineRunStatus.FAILURE,
+        'finished': PipelineRunStatus.SUCCESS,
+        'not_started': PipelineRunStatus.NOT_STARTED,
+    }
+
+
+def test_logs_matching(tmpdir):
+    storage = SqlitePipelineRunStorage(str(tmpdir.join('runs.db')))
+    sqlite_run = start_run(storage, 'run_one', 'pipeline')
+    in_memory_run = InMemoryPipelineRun(
+        'run_one',
+        ExecutionSelector('pipeline'),
+        {},
+        create_execution_plan(define_pipeline('pipeline')),
+    )
+
+    for run in [sqlite_run, in_memory_run]:
+        run.handle_new_event(build_pipeline_event(run.run_id, EventType.PIPELINE_START, 'start'))
+        for i in range(3):
+            for step_key in ['a.transform', 'b.transform']:
+                run.handle_new_event(
+                    build_step_event(
+                        run.run_id,
+                        EventType.EXECUTION_PLAN_STEP_SUCCESS,
+                        step_key,
+                        message='{} {}'.format(step_key, i),
+                        level='DEBUG' if i % 2 else 'INFO',
+                    )
+                )
+        run.handle_new_event(build_pipeline_event(run.run_id, EventType.PIPELINE_SUCCESS, 'done'))
+
+    def messages(run, log_filter, **kwargs):
+        return [
+            (cursor, event.message) for cursor, event in run.logs_matching(log_filter, **kwargs)
+        ]
+
+    for run in [sqlite_run, in_memory_run]:
+        assert messages(run, LogFilter(event_types=[EventType.PIPELINE_SUCCESS])) == [(7, 'done')]
+        assert messages(run, LogFilter(step_keys=['b.transform'], levels=[INFO])) == [
+            (2, 'b.transform 0'),
+            (6, 'b.transform 2'),
+        ]
+        assert messages(run, LogFilter(step_keys=['a.transform']), after=1, limit=1) == [
+            (3, 'a.transform 1')
+        ]
+        assert messages(
+            run, LogFilter(step_keys=['a.transform']), before=5, limit=1, reverse=True
+        ) == [(3, 'a.transform 1')]
+        assert len(messages(run, LogFilter())) == 8
+
+        assert run.has_logs_matching(LogFilter(levels=[DEBUG]), after=3)
+        assert not run.has_logs_matching(LogFilter(levels=[DEBUG]), after=4)
+        assert not run.has_logs_matching(LogFilter(levels=[DEBUG]), before=3)
+        assert not run.has_logs_matching(LogFilter(step_keys=['missing']))
+
+
+def test_unmatched_filter_does_not_read_run(tmpdir):
+    storage = SqlitePipelineRunStorage(str(tmpdir.join('runs.db')))
+    short_run = start_run(storage, 'short', 'pipeline')
+    long_run = start_run(storage, 'long', 'pipeline')
+    for run, event_count in [(short_run, 10), (long_run, 1000)]:
+        for i in range(event_count):
+            run.handle_new_event(build_pipeline_event(run.run_id, EventType.UNCATEGORIZED, str(i)))
+
+    def count_sqlite_instructions(run):
+        instructions = []
+        # pylint: disable=W0212
+        storage._conn.set_progress_handler(lambda: instructions.append(1), 1)
+        try:
+            for event_types in [
+                [EventType.EXECUTION_PLAN_STEP_START],
+                [EventType.EXECUTION_PLAN_STEP_START, EventType.EXECUTION_PLAN_STEP_SUCCESS],
+            ]:
+                log_filter = LogFilter(event_types=event_types)
+                assert run.logs_matching(log_filter, limit=2) == []
+                assert run.logs_matching(log_filter, before=5, limit=2, reverse=True) == []
+                assert not run.has_logs_matching(log_filter, after=2)
+        finally:
+            storage._conn.set_progress_handler(None, 1)
+        return len(instructions)
+
+    # Reading the whole run would take several instructions per event
+    assert count_sqlite_instructions(long_run) < 2 * count_sqlite_instructions(short_run)
@@ -0,0 +1,87 @@
+'''
+Measures the time taken to put and get objects of various sizes through the storage backends of
+dagma, i.e. the storage overhead the handler pays per input and output of a step. Local storage
+is always measured. Pass --s3-bucket to also measure S3, both with the client the storage reuses
+and with a fresh session and client per request, as before clients were cached.
+
+Usage:
+
+    python benchmarks/bench_storage.py [--sizes 1024 1048576] [--iterations 10] [--s3-bucket b]
+'''
+
+import argparse
+import contextlib
+import os
+import shutil
+import tempfile
+import time
+import uuid
+
+import boto3
+
+from dagma.config import DEFAULT_PUT_OBJECT_KWARGS
+from dagma.storage import LocalStorage, S3Storage
+
+
+class FreshClientS3Storage(S3Storage):
+    @property
+    def client(self):
+        return self.session.client('s3')
+
+
+def _timed(fn, iterations):
+    start = time.time()
+    for _ in range(iterations):
+        fn()
+    return (time.time() - start) / iterations
+
+
+def _read_object(storage, key):
+    with contextlib.closing(storage.get_object(key=key)['Body']) as body:
+        return body.read()
+
+
+def _measure(storage, size, iterations):
+    key = 'bench_storage_{uid}.pickle'.format(uid=uuid.uuid4())
+    body = os.urandom(size)
+    put_secs = _timed(lambda: storage.put_object(key=key, body=body), iterations)
+    get_secs = _timed(lambda: _read_object(storage, key), iterations)
+    return put_secs, get_secs
+
+
+def _define_storages(base_dir, s3_bucket):
+    storages = [('local', LocalStorage(base_dir))]
+    if s3_bucket:
+        config = {
+            's3_bucket': s3_bucket,
+            'sessionmaker': boto3.Session,
+            'put_object_kwargs': DEFAULT_PUT_OBJECT_KWARGS,
+        }
+        storages.append(('s3', S3Storage(config)))
+        storages.append(('s3 fresh client', FreshClientS3Storage(config)))
+    return storages
+
+
+def main(sizes, iterations, s3_bucket):
+    base_dir = tempfile.mkdtemp()
+    try:
+        print('{:>16} {:>12} {:>12} {:>12}'.format('storage', 'bytes', 'put (ms)', 'get (ms)'))
+        for name, storage in _define_storages(base_dir, s3_bucket):
+            for size in sizes:
+                put_secs, get_secs = _measure(storage, size, iterations)
+                print(
+                    '{:>16} {:>12} {:>12.3f} {:>12.3f}'.format(
+                        name, size, put_secs * 1000, get_secs * 1000
+                    )
+                )
+    finally:
+        shutil.rmtree(base_dir)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1024, 1024 * 1024])
+    parser.add_argument('--iterations', type=int, default=10)
+    parser.add_argument('--s3-bucket')
+    args = parser.parse_args()
+    main(args.sizes, args.iterations, args.s3_bucket)
@@ -1,7 +1,11 @@
 """Public API for dagma"""
 
-from .engine import execute_plan
+from .engine import DagmaStepExecutionError, execute_plan
 from .handler import aws_lambda_handler
 from .resources import define_dagma_resource
 
-__all__ = ['aws_lambda_handler', 'define_dagma_resource', 'execute_plan']
+__all__ = [
+    'DagmaStepExecutionError',
+    'aws_lambda_handler',     'define_dagma_resource',
+    'execute_plan',
+]
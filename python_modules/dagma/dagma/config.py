@@ -4,6 +4,9 @@ from .version import __version__
 
 DEFAULT_S3_BUCKET = 'dagster-lambda-execution'
 
+# The number of Lambda invocations the engine keeps in flight at most
+DEFAULT_MAX_CONCURRENT_STEPS = 16
+
 DEFAULT_PUT_OBJECT_KWARGS = {'ACL': 'bucket-owner-full-control', 'StorageClass': 'STANDARD'}
 
 DEFAULT_STORAGE_CONFIG = {'put_object_kwargs': DEFAULT_PUT_OBJECT_KWARGS}
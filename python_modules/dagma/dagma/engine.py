@@ -1,29 +1,38 @@
 """The core dagma execution engine."""
 
 import base64
+import functools
 import io
 import json
+import logging
 import os
 import pickle
 import shutil
 import subprocess
 
-# import sys
+import sys
 import tempfile
 
 from collections import namedtuple
+from multiprocessing.pool import ThreadPool
 
 import cloudpickle as pickle
+import six
+
+from six.moves import queue
 
 from dagster import check
+from dagster.core.errors import DagsterError
 from dagster.core.execution_context import RuntimeExecutionContext
-from dagster.core.execution_plan.objects import ExecutionPlan
+from dagster.core.execution_plan.objects import ExecutionPlan, StepOutputHandle
+from dagster.core.execution_plan.ready_queue import StepReadyQueue
 from dagster.utils.zip import zip_folder
 
 from .config import ASSUME_ROLE_POLICY_DOCUMENT, BUCKET_POLICY_DOCUMENT_TEMPLATE
 from .deployment_package import get_or_create_deployment_package
-from .serialize import deserialize, serialize
-from .utils import get_input_key, get_resources_key, get_step_key, LambdaInvocationPayload
+from .handler import execute_invocation
+from .serialize import deserialize, Serializer
+from .utils import get_output_key, get_resources_key, get_step_key, LambdaInvocationPayload
 
 # TODO make this configurable on the dagma resource
 LAMBDA_MEMORY_SIZE = 3008
@@ -33,6 +42,19 @@ TEMPDIR_REGISTRY = []
 
 SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+logger = logging.getLogger(__name__)
+
+
+class DagmaStepExecutionError(DagsterError):
+    """Raised when the invocation of a step fails, e.g. when its Lambda function raises."""
+
+    def __init__(self, step_key, response):
+        self.step_key = check.str_param(step_key, 'step_key')
+        self.response = response
+        super(DagmaStepExecutionError, self).__init__(
+            'Execution of step {key} failed: {response}'.format(key=step_key, response=response)
+        )
+
 
 def _get_python_runtime():
     # if sys.version_info[0] < 3:
@@ -69,18 +91,28 @@ def _get_or_create_s3_bucket(s3_client, aws_region, role, context):
     s3_client.put_bucket_policy(Bucket=context.resources.dagma.s3_bucket, Policy=policy)
 
 
-def _seed_intermediate_results(context):
-    intermediate_results = {}
+def _upload_step(serializer, step_idx, step, context):
     return context.resources.dagma.storage.put_object(
-        key=get_input_key(context, 0), body=serialize(intermediate_results)
+        key=get_step_key(context, step_idx), body=serializer.serialize(step)
     )
 
 
-def _upload_step(s3, step_idx, step, context):
-    return context.resources.dagma.storage.put_object(
-        key=get_step_key(context, step_idx), body=serialize(step)
+def _upload_run(context, steps):
+    serializer = Serializer(context.resources.dagma.storage)
+
+    context.debug('Uploading execution_context')
+    context.resources.dagma.storage.put_object(
+        key=get_resources_key(context), body=serializer.serialize(context.resources)
     )
 
+    for step_idx, step in enumerate(steps):
+        context.debug(
+            'Uploading step {step_key}: {s3_key}'.format(
+                step_key=step.key, s3_key=get_step_key(context, step_idx)
+            )
+        )
+        _upload_step(serializer, step_idx, step, context)
+
 
 def _get_function_name(context):
     return '{run_id}_function'.format(run_id=context.run_id)
@@ -144,9 +176,150 @@ def _execute_step_sync(lambda_client, lambda_step, context, payload):
         else:
             context.info(line)
 
+    response = json.loads(res['Payload'].read().decode('utf-8'))
+    if res.get('FunctionError'):
+        context.error(
+            'Execution of step {key} failed: {response}'.format(key=payload.key, response=response)
+        )
+        raise DagmaStepExecutionError(payload.key, response)
+    return response
+
+
+def _execute_step_in_process(context, payload):
+    return execute_invocation(context.resources.dagma.storage, payload, logger)
+
+
+def _all_inputs_written(step, output_manifest):
+    for step_input in step.step_inputs:
+        handle = step_input.prev_output_handle
+        if (handle.step.key, handle.output_name) not in output_manifest:
+            return False
+    return True
+
+
+def _get_input_keys(step, output_manifest):
+    """Looks up the keys of the outputs the inputs of a step depend on in the manifest."""
+    input_keys = {}
+    for step_input in step.step_inputs:
+        handle = step_input.prev_output_handle
+        output_handle = (handle.step.key, handle.output_name)
+        check.invariant(
+            output_handle in output_manifest,
+            'Output {output_name} of step {step_key} for input {input_name} of step {key} '
+            'was not written'.format(
+                output_name=handle.output_name,
+                step_key=handle.step.key,
+                input_name=step_input.name,
+                key=step.key,
+            ),
+        )
+        input_keys[step_input.name] = output_manifest[output_handle]
+    return input_keys
+
+
+def _get_output_keys(step, context):
+    return {
+        step_output.name: get_output_key(context, step.key, step_output.name)
+        for step_output in step.step_outputs
+    }
+
+
+def _invoke_step_in_thread(invoke_step, step, context, payload, done_queue):
+    """Puts (step, response, None) on the done queue once the step is done, or
+    (step, None, exc_info) if invoking it failed."""
+    try:
+        done_queue.put((step, invoke_step(context, payload), None))
+    except:  # pylint: disable=W0702
+        # Errors are re-raised on the thread dispatching the steps
+        done_queue.put((step, None, sys.exc_info()))
+
+
+def _execute_steps(context, execution_plan, invoke_step, max_concurrent_steps):
+    """Invokes the steps of the plan, up to max_concurrent_steps at a time, as soon as every output
+    they consume has been written, so that independent branches of the plan run concurrently.
+
+    Args:
+        invoke_step (Callable[[RuntimeExecutionContext, LambdaInvocationPayload], dict]): Executes
+            a step, e.g. by invoking the Lambda function, and returns a dict whose 'outputs' are
+            the keys of the outputs it wrote, by output name.
+
+    Returns:
+        (dict): The manifest of the outputs that were written, i.e. their keys in storage by
+            (step key, output name).
+    """
+    check.int_param(max_concurrent_steps, 'max_concurrent_steps')
+    check.param_invariant(
+        max_concurrent_steps > 0, 'max_concurrent_steps', 'Must run at least one step at a time'
+    )
+
+    step_indices = {step.key: idx for idx, step in enumerate(execution_plan.topological_steps())}
+    ready_queue = StepReadyQueue(execution_plan)
+    done_queue = queue.Queue()
+    in_flight = 0
+
+    # Maps the (step key, output name) of each output that was written to its key in storage
+    output_manifest = {}
+
+    pool = ThreadPool(max_concurrent_steps)
+    try:
+        while ready_queue.has_ready_steps() or in_flight:
+            while ready_queue.has_ready_steps():
+                step = ready_queue.pop_ready_step()
+                if not _all_inputs_written(step, output_manifest):
+                    context.error(
+                        'Not all inputs of step {key} were written. Not executing.'.format(
+                            key=step.key
+                        )
+                    )
+                    ready_queue.mark_complete(step.key)
+                    continue
+
+                step_idx = step_indices[step.key]
+                payload = LambdaInvocationPayload(
+                    context.run_id,
+                    step_idx,
+                    step.key,
+                    context.resources.dagma.s3_bucket,
+                    _get_input_keys(step, output_manifest),
+                    get_step_key(context, step_idx),
+                    get_resources_key(context),
+                    _get_output_keys(step, context),
+                )
+                pool.apply_async(
+                    _invoke_step_in_thread,
+                    (invoke_step, step, context.fork(), payload, done_queue),
+                )
+                in_flight += 1
+
+            if not in_flight:
+                break
+
+            step, response, exc_info = done_queue.get()
+            in_flight -= 1
+
+            if exc_info:
+                six.reraise(*exc_info)
+
+            for output_name, output_key in response['outputs'].items():
+                output_manifest[(step.key, output_name)] = output_key
+                ready_queue.mark_output_available(StepOutputHandle(step, output_name))
+            ready_queue.mark_complete(step.key)
+    finally:
+        pool.close()
+        pool.join()
+
+    return output_manifest
+
 
 def execute_plan(context, execution_plan, cleanup_lambda_functions=True, local=False):
-    """Core executor."""
+    """Core executor.
+
+    Args:
+        cleanup_lambda_functions (bool): Whether to delete the Lambda function once the run is done.
+        local (bool): Execute the steps in this process rather than on Lambda, reading and writing
+            their objects through the storage of the dagma resource. With local storage, no AWS
+            access is needed.
+    """
     check.inst_param(context, 'context', RuntimeExecutionContext)
     check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
 
@@ -168,6 +341,30 @@ def execute_plan(context, execution_plan, cleanup_lambda_functions=True, local=F
 
     check.invariant(len(steps[0].step_inputs) == 0)
 
+    if local:
+        _upload_run(context, steps)
+        output_manifest = _execute_steps(
+            context,
+            execution_plan,
+            _execute_step_in_process,
+            context.resources.dagma.max_concurrent_steps,
+        )
+    else:
+        output_manifest = _execute_steps_on_lambda(
+            context, execution_plan, cleanup_lambda_functions
+        )
+
+    final_results = {}
+    for output_handle, output_key in output_manifest.items():
+        output_object = context.resources.dagma.storage.get_object(key=output_key)
+        final_results[output_handle] = deserialize(
+            output_object['Body'], context.resources.dagma.storage
+        )
+
+    return final_results
+
+
+def _execute_steps_on_lambda(context, execution_plan, cleanup_lambda_functions):
     aws_lambda_client = context.resources.dagma.session.client('lambda')
     aws_iam_client = context.resources.dagma.session.client('iam')
     aws_iam_resource = context.resources.dagma.session.resource('iam')
@@ -181,50 +378,20 @@ def execute_plan(context, execution_plan, cleanup_lambda_functions=True, local=F
     context.debug('Creating S3 bucket')
     _get_or_create_s3_bucket(aws_s3_client, aws_region_name, role, context)
 
-    context.debug('Seeding intermediate results')
-    _seed_intermediate_results(context)
-
     deployment_package_key = get_or_create_deployment_package(context)
 
-    context.debug('Uploading execution_context')
-    context.resources.dagma.storage.put_object(
-        key=get_resources_key(context), body=serialize(context.resources)
-    )
-
-    for step_idx, step in enumerate(steps):
-        context.debug(
-            'Uploading step {step_key}: {s3_key}'.format(
-                step_key=step.key, s3_key=get_step_key(context, step_idx)
-            )
-        )
-        _upload_step(aws_s3_client, step_idx, step, context)
+    _upload_run(context, list(execution_plan.topological_steps()))
 
     try:
         lambda_step = _create_lambda_step(aws_lambda_client, deployment_package_key, context, role)
 
-        for step_idx, _ in enumerate(steps):
-            payload = LambdaInvocationPayload(
-                context.run_id,
-                step_idx,
-                steps[step_idx].key,
-                context.resources.dagma.s3_bucket,
-                get_input_key(context, step_idx),
-                get_step_key(context, step_idx),
-                get_resources_key(context),
-                get_input_key(context, step_idx + 1),
-            )
-
-            _execute_step_sync(aws_lambda_client, lambda_step, context, payload)
-            # _poll_for_completion(step_handle, context)  # TODO: Need an error handling path here
-
-        final_results_object = context.resources.dagma.storage.get_object(
-            key=get_input_key(context, step_idx + 1)
+        return _execute_steps(
+            context,
+            execution_plan,
+            functools.partial(_execute_step_sync, aws_lambda_client, lambda_step),
+            context.resources.dagma.max_concurrent_steps,
         )
 
-        final_results = deserialize(final_results_object['Body'].read())
-
-        return final_results
-
     finally:
         if cleanup_lambda_functions:
             context.debug(
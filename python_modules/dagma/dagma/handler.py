@@ -1,105 +1,122 @@
 import logging
-import pickle
 
 import boto3
 
-from io import BytesIO
-
 from dagster import check
 from dagster.core.execution_context import RuntimeExecutionContext
 from dagster.core.execution_plan.objects import StepResult
 from dagster.core.execution_plan.simple_engine import execute_step
 
-from .serialize import deserialize, serialize
-from .utils import get_input_key, get_resources_key, get_step_key, LambdaInvocationPayload
+from .serialize import deserialize, Serializer
+from .storage import S3Storage, Storage
+from .utils import LambdaInvocationPayload
 
 logger = logging.getLogger(__name__)
 
 
-def _all_inputs_covered(step, results):
-    for step_input in step.step_inputs:
-        handle = step_input.prev_output_handle
-        if (handle.step.key, handle.output_name) not in results:
-            return False
-    return True
+# Storage by S3 bucket, kept across the invocations that reuse the same Lambda container
+_S3_STORAGE = {}
+
+
+def _get_s3_storage(s3_bucket):
+    if s3_bucket not in _S3_STORAGE:
+        _S3_STORAGE[s3_bucket] = S3Storage(
+            {
+                's3_bucket': s3_bucket,
+                'sessionmaker': boto3.Session,
+                'put_object_kwargs': {'ACL': 'public-read'},
+            }
+        )
+    return _S3_STORAGE[s3_bucket]
 
 
 def aws_lambda_handler(event, _context):
     """The lambda handler function."""
     logger.setLevel(logging.INFO)
 
+    payload = LambdaInvocationPayload(*event['config'])
+    return execute_invocation(_get_s3_storage(payload.s3_bucket), payload, logger)
+
+
+def execute_invocation(storage, payload, step_logger):
+    """Executes the step of an invocation of the lambda handler, reading its inputs from and
+    writing its outputs to storage.
+
+    Args:
+        storage (Storage): The storage holding the objects of the run.
+        payload (LambdaInvocationPayload): The payload of the invocation.
+        step_logger (logging.Logger): The logger for the execution of the step.
+
+    Returns:
+        (dict): A dict whose 'outputs' are the keys of the outputs the step wrote, by output name.
+    """
+    check.inst_param(storage, 'storage', Storage)
+    check.inst_param(payload, 'payload', LambdaInvocationPayload)
+
     (
         run_id,
         step_idx,
         key,
         s3_bucket,
-        s3_key_inputs,
+        s3_keys_inputs,
         s3_key_body,
         s3_key_resources,
-        s3_key_outputs,
-    ) = LambdaInvocationPayload(*event['config'])
-
-    s3 = boto3.client('s3')
+        s3_keys_outputs,
+    ) = payload
 
     logger.info(
         'Beginning execution of lambda function for run_id %s step %s (%s)', run_id, step_idx, key
     )
-    logger.info('Looking for inputs at %s/%s', s3_bucket, s3_key_inputs)
-
-    intermediate_results_object = s3.get_object(Bucket=s3_bucket, Key=s3_key_inputs)
-    intermediate_results = deserialize(intermediate_results_object['Body'].read())
 
     logger.info('Looking for resources at %s/%s', s3_bucket, s3_key_resources)
-    resources_object = s3.get_object(Bucket=s3_bucket, Key=s3_key_resources)
-    resources = deserialize(resources_object['Body'].read())
-    execution_context = RuntimeExecutionContext(run_id, loggers=[logger], resources=resources)
+    resources_object = storage.get_object(key=s3_key_resources)
+    resources = deserialize(resources_object['Body'], storage)
+    execution_context = RuntimeExecutionContext(run_id, loggers=[step_logger], resources=resources)
 
     logger.info('Looking for step body at %s/%s', s3_bucket, s3_key_body)
-    step_body_object = s3.get_object(Bucket=s3_bucket, Key=s3_key_body)
-    step = deserialize(step_body_object['Body'].read())
+    step_body_object = storage.get_object(key=s3_key_body)
+    step = deserialize(step_body_object['Body'], storage)
 
     logger.info('Checking inputs')
-    if not _all_inputs_covered(step, intermediate_results):
-        result_keys = set(intermediate_results.keys())
-        expected_outputs = [ni.prev_output_handle for ni in step.step_inputs]
+    missing_inputs = [
+        step_input.name for step_input in step.step_inputs if step_input.name not in s3_keys_inputs
+    ]
+    if missing_inputs:
         logger.error(
-            'Not all inputs covered for %s. Not executing.\nKeys in result: %s'
-            '\nOutputs needed for inputs %s',
+            'Not all inputs covered for %s. Not executing.\nKeys of inputs: %s'
+            '\nInputs with no key: %s',
             key,
-            result_keys,
-            expected_outputs,
+            s3_keys_inputs,
+            missing_inputs,
         )
         raise Exception()
 
     logger.info('Constructing input values')
     input_values = {}
     for step_input in step.step_inputs:
-        prev_output_handle = step_input.prev_output_handle
-        handle = (prev_output_handle.step.key, prev_output_handle.output_name)
+        s3_key_input = s3_keys_inputs[step_input.name]
+        logger.info('Looking for input %s at %s/%s', step_input.name, s3_bucket, s3_key_input)
+        input_object = storage.get_object(key=s3_key_input)
         # FIXME - we need a less hacky strategy for serializing and deserializing input handles and
         # result values -- the subscript below is like accessing .success_data on the namedtuple
         # in the simple engine
-        input_value = intermediate_results[handle][1].value
-        input_values[step_input.name] = input_value
+        input_values[step_input.name] = deserialize(input_object['Body'], storage)[1].value
 
     logger.info('Executing step {key}'.format(key=key))
-    results = [result for result in execute_step(step, execution_context, input_values)]
-
-    for result in results:
+    serializer = Serializer(storage)
+    written_keys = {}
+    for result in execute_step(step, execution_context, input_values):
         check.invariant(isinstance(result, StepResult))
         output_name = result.success_data.output_name
-        output_handle = (step.key, output_name)
-        intermediate_results[output_handle] = (
-            result.success,
-            result.success_data,
-            result.failure_data,
-        )
         logger.info('Processing result: %s', output_name)
 
-    logger.info('Uploading intermediate_results to %s', s3_key_outputs)
-    s3.put_object(
-        ACL='public-read',
-        Body=serialize(intermediate_results),
-        Bucket=s3_bucket,
-        Key=s3_key_outputs,
-    )
+        s3_key_output = s3_keys_outputs[output_name]
+        logger.info('Uploading output %s to %s', output_name, s3_key_output)
+        storage.put_object(
+            key=s3_key_output,
+            body=serializer.serialize((result.success, result.success_data, result.failure_data)),
+        )
+        written_keys[output_name] = s3_key_output
+
+    # Returned to the engine, which adds the keys to its manifest of outputs
+    return {'outputs': written_keys}
@@ -0,0 +1,259 @@
+"""The format of the objects dagma serializes to storage.
+
+A payload is a header followed by a body:
+
+- The header holds a magic string, the version of the format, the codec the body is compressed
+  with, and the hash of the module bundle of the object.
+- The body holds the pickle of the object, then the out-of-band buffers of the pickle, each
+  prefixed by its length.
+
+Where pickle protocol 5 is available, large contiguous buffers, e.g. the data of numpy arrays
+and pandas frames, are kept out of the pickle. They are written to storage straight from the
+memory of the object, and read back into one buffer each, which the unpickled object uses
+without a further copy. Bodies larger than a threshold are compressed with zlib, if a sample of
+them compresses well.
+
+Protocol 5 also needs a pickler that accepts a buffer_callback. The CloudPickler of the
+cloudpickle version dagma pins (0.3.1) does not, so the Serializer currently writes every
+buffer in-band; the out-of-band path is only taken with picklers that support it, and payloads
+in either form are read the same way.
+
+Payloads are produced and consumed in chunks, so that neither writing nor reading one builds the
+whole payload in memory.
+"""
+
+import io
+import pickle
+import struct
+import zlib
+
+import six
+
+from dagster import check
+
+MAGIC = b'DGMA'
+
+FORMAT_VERSION = 1
+
+NO_COMPRESSION = 0
+ZLIB_COMPRESSION = 1
+
+# Bodies at least this large are compressed
+DEFAULT_COMPRESSION_THRESHOLD = 1024 * 1024
+
+# Fast compression: payloads are compressed on the critical path of every step
+ZLIB_COMPRESSION_LEVEL = 1
+
+# Bodies are left uncompressed unless a sample of them compresses at least this well, e.g. the
+# data of arrays of random floats barely compresses
+MAX_COMPRESSION_RATIO = 0.9
+
+CHUNK_SIZE = 1024 * 1024
+
+_HEADER = struct.Struct('>4sBBH')
+_LENGTH = struct.Struct('>Q')
+_COUNT = struct.Struct('>I')
+
+# Only in Python 3.8 onwards
+_PickleBuffer = getattr(pickle, 'PickleBuffer', None)
+
+
+def _supports_out_of_band_buffers(pickler_cls):
+    if _PickleBuffer is None:
+        return False
+    try:
+        pickler_cls(io.BytesIO(), 5, buffer_callback=lambda _buffer: None)
+    except TypeError:
+        return False
+    return True
+
+
+class _ChunkReader(io.RawIOBase):
+    """A file-like object reading from an iterator of chunks of bytes."""
+
+    def __init__(self, chunks):
+        super(_ChunkReader, self).__init__()
+        self._chunks = chunks
+        self._chunk = memoryview(b'')
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not len(self._chunk):
+            try:
+                self._chunk = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+
+        size = min(len(b), len(self._chunk))
+        b[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+
+def _iter_stream_chunks(stream):
+    while True:
+        chunk = stream.read(CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _iter_compressed_chunks(chunks):
+    compressor = zlib.compressobj(ZLIB_COMPRESSION_LEVEL)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _iter_decompressed_chunks(chunks):
+    decompressor = zlib.decompressobj()
+    for chunk in chunks:
+        # Bound the size of each decompressed chunk, however well the body compresses
+        while chunk:
+            decompressed = decompressor.decompress(chunk, CHUNK_SIZE)
+            chunk = decompressor.unconsumed_tail
+            if decompressed:
+                yield decompressed
+    decompressed = decompressor.flush()
+    if decompressed:
+        yield decompressed
+
+
+def _iter_body_chunks(pickled, buffers):
+    yield _LENGTH.pack(len(pickled))
+    yield pickled
+    yield _COUNT.pack(len(buffers))
+    for buffer in buffers:
+        yield _LENGTH.pack(len(buffer))
+        for offset in range(0, len(buffer), CHUNK_SIZE):
+            yield buffer[offset : offset + CHUNK_SIZE]
+
+
+def _read_exact(reader, size):
+    data = bytearray(size)
+    view = memoryview(data)
+    offset = 0
+    while offset < size:
+        read = reader.readinto(view[offset:])
+        check.invariant(read, 'Payload ended unexpectedly')
+        offset += read
+    return data
+
+
+def _should_compress(pickled, buffers, compression_threshold):
+    body_size = len(pickled) + sum(len(buffer) for buffer in buffers)
+    if body_size < compression_threshold:
+        return False
+
+    sample = bytes(max([pickled] + buffers, key=len)[:CHUNK_SIZE])
+    return len(zlib.compress(sample, ZLIB_COMPRESSION_LEVEL)) <= MAX_COMPRESSION_RATIO * len(sample)
+
+
+def pickle_object(obj, pickler_cls):
+    """Pickles an object, keeping its large contiguous buffers out of the pickle where pickle
+    protocol 5 is available.
+
+    Args:
+        obj (object): The object to pickle.
+        pickler_cls (type): The pickle.Pickler subclass to pickle the object with.
+
+    Returns:
+        (Tuple[pickle.Pickler, bytes, List[memoryview]]): The pickler, e.g. to find the modules
+            the object depends on, the pickle, and the buffers that were kept out of it.
+    """
+    buffers = []
+
+    def _buffer_callback(buffer):
+        try:
+            buffers.append(buffer.raw())
+        except BufferError:
+            # Not contiguous, pickle it in-band
+            return True
+        return False
+
+    pickled = io.BytesIO()
+    if _supports_out_of_band_buffers(pickler_cls):
+        pickler = pickler_cls(pickled, 5, buffer_callback=_buffer_callback)
+    else:
+        pickler = pickler_cls(pickled, -1)
+    pickler.dump(obj)
+    return pickler, pickled.getvalue(), buffers
+
+
+def dump_payload(pickled, buffers, module_bundle_hash, compression_threshold):
+    """Returns a readable file-like object producing the payload of a pickled object as it is
+    read.
+
+    Args:
+        pickled (bytes): The pickle of the object.
+        buffers (List[memoryview]): The out-of-band buffers of the pickle.
+        module_bundle_hash (Optional[str]): The hash of the module bundle of the object.
+        compression_threshold (int): The body is compressed if it is at least this large.
+    """
+    check.opt_str_param(module_bundle_hash, 'module_bundle_hash')
+    check.int_param(compression_threshold, 'compression_threshold')
+
+    codec = (
+        ZLIB_COMPRESSION
+        if _should_compress(pickled, buffers, compression_threshold)
+        else NO_COMPRESSION
+    )
+
+    hash_bytes = module_bundle_hash.encode('ascii') if module_bundle_hash else b''
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, codec, len(hash_bytes)) + hash_bytes
+
+    def _iter_payload_chunks():
+        yield header
+        body_chunks = _iter_body_chunks(pickled, buffers)
+        if codec == ZLIB_COMPRESSION:
+            body_chunks = _iter_compressed_chunks(body_chunks)
+        for chunk in body_chunks:
+            yield chunk
+
+    return io.BufferedReader(_ChunkReader(_iter_payload_chunks()), CHUNK_SIZE)
+
+
+def read_payload_header(stream):
+    """Reads the header of a payload.
+
+    Args:
+        stream (file): A readable file-like object, e.g. the body of an object in storage.
+
+    Returns:
+        (Tuple[Optional[str], file]): The hash of the module bundle of the object, and a file-like
+            object reading the body of the payload.
+    """
+    reader = _ChunkReader(_iter_stream_chunks(stream))
+    magic, version, codec, hash_length = _HEADER.unpack(bytes(_read_exact(reader, _HEADER.size)))
+    check.invariant(magic == MAGIC, 'Not a dagma payload')
+    check.invariant(
+        version == FORMAT_VERSION, 'Unknown payload format {version}'.format(version=version)
+    )
+    module_bundle_hash = bytes(_read_exact(reader, hash_length)).decode('ascii') or None
+
+    if codec == ZLIB_COMPRESSION:
+        reader = _ChunkReader(_iter_decompressed_chunks(_iter_stream_chunks(reader)))
+    else:
+        check.invariant(codec == NO_COMPRESSION, 'Unknown codec {codec}'.format(codec=codec))
+
+    return module_bundle_hash, reader
+
+
+def load_payload_body(reader):
+    """Unpickles the object from the body of a payload, as returned by read_payload_header."""
+    (pickled_length,) = _LENGTH.unpack(bytes(_read_exact(reader, _LENGTH.size)))
+    pickled = _read_exact(reader, pickled_length)
+
+    (num_buffers,) = _COUNT.unpack(bytes(_read_exact(reader, _COUNT.size)))
+    buffers = []
+    for _ in range(num_buffers):
+        (buffer_length,) = _LENGTH.unpack(bytes(_read_exact(reader, _LENGTH.size)))
+        buffers.append(_read_exact(reader, buffer_length))
+
+    if buffers:
+        return pickle.loads(pickled, buffers=buffers)
+    return pickle.loads(bytes(pickled) if six.PY2 else pickled)
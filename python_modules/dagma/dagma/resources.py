@@ -3,10 +3,15 @@ from collections import namedtuple
 
 import boto3
 
-from dagster import ResourceDefinition, Dict, String, Field
+from dagster import ResourceDefinition, Dict, Field, Int, String
 
-from .config import DEFAULT_S3_BUCKET, DEFAULT_STORAGE_CONFIG, DEFAULT_RUNTIME_BUCKET
-from .storage import Storage
+from .config import (
+    DEFAULT_MAX_CONCURRENT_STEPS,
+    DEFAULT_RUNTIME_BUCKET,
+    DEFAULT_S3_BUCKET,
+    DEFAULT_STORAGE_CONFIG,
+)
+from .storage import LocalStorage, S3Storage
 
 DagmaResourceConfig = Dict(
     {
@@ -16,6 +21,11 @@ DagmaResourceConfig = Dict(
         'aws_region_name': Field(String),
         's3_bucket': Field(String, default_value=DEFAULT_S3_BUCKET, is_optional=True),
         'runtime_bucket': Field(String, default_value=DEFAULT_RUNTIME_BUCKET, is_optional=True),
+        # Keep the objects of runs in this directory rather than in the S3 bucket
+        'local_storage_dir': Field(String, is_optional=True),
+        'max_concurrent_steps': Field(
+            Int, default_value=DEFAULT_MAX_CONCURRENT_STEPS, is_optional=True
+        ),
         # 'cleanup_lambda_functions': types.Field(types.Bool, default_value=False,
         #                                         is_optional=True),  # TODO: Thread this through
         # TODO also parametrize local tempfile cleanup
@@ -28,7 +38,8 @@ DagmaResourceConfig = Dict(
 
 class DagmaResourceType(
     namedtuple(
-        '_AwsLambdaExecutionInfo', 'sessionmaker aws_region_name storage s3_bucket runtime_bucket'
+        '_AwsLambdaExecutionInfo',
+        'sessionmaker aws_region_name storage s3_bucket runtime_bucket max_concurrent_steps',
     )
 ):
     """The dagma resource type."""
@@ -63,16 +74,24 @@ def define_dagma_resource():
             region_name=info.config['aws_region_name'],
         )
 
-        storage_config = dict(
-            DEFAULT_STORAGE_CONFIG, sessionmaker=sessionmaker, s3_bucket=info.config['s3_bucket']
-        )
+        if info.config.get('local_storage_dir'):
+            storage = LocalStorage(info.config['local_storage_dir'])
+        else:
+            storage = S3Storage(
+                dict(
+                    DEFAULT_STORAGE_CONFIG,
+                    sessionmaker=sessionmaker,
+                    s3_bucket=info.config['s3_bucket'],
+                )
+            )
 
         return DagmaResourceType(
             sessionmaker=sessionmaker,
             aws_region_name=info.config['aws_region_name'],
-            storage=Storage(storage_config),
+            storage=storage,
             s3_bucket=info.config['s3_bucket'],
             runtime_bucket=info.config['runtime_bucket'],
+            max_concurrent_steps=info.config['max_concurrent_steps'],
         )
 
     return ResourceDefinition(
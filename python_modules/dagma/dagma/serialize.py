@@ -37,65 +37,172 @@ POSSIBILITY OF SUCH DAMAGE.
 
 """
 
+import contextlib
+import hashlib
 import logging
 import os
 import pickle
-import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 
-from io import BytesIO as StringIO
+from collections import namedtuple
 
 from cloudpickle import CloudPickler
 
+from dagster import check
+
 from .module_dependency import ModuleDependencyAnalyzer
-from .utils import b64str_to_bytes, create_mod_data, mkdir_p
+from .payload import (
+    DEFAULT_COMPRESSION_THRESHOLD,
+    dump_payload,
+    load_payload_body,
+    pickle_object,
+    read_payload_header,
+)
+from .storage import Storage
+from .utils import b64str_to_bytes, create_mod_data, get_module_bundle_key, mkdir_p
 
 logger = logging.getLogger(__name__)
 
 TEMP = tempfile.gettempdir()
-PYTHON_MODULE_PATH = os.path.join(TEMP, "pymodules")
 
+# these templates will get filled in by runtime ETAG
+PYTHON_MODULE_PATH = os.path.join(TEMP, "pymodules_{0}")
 
-def serialize(obj):
-    """Serializes an object and all of its dependencies.
+# Marker files for the module bundles that were unpacked into PYTHON_MODULE_PATH, by hash
+UNPACKED_MODULE_BUNDLES_PATH = os.path.join(PYTHON_MODULE_PATH, '.module_bundles')
 
-    Args:
-        obj (object): The object to serialize
+# Hashes of the module bundles that were unpacked by this process
+_UNPACKED_MODULE_BUNDLES = set()
 
-    Returns:
-        (bytes): The serialized representation of the object and its dependencies.
-    """
-    module_manager = ModuleDependencyAnalyzer()
+# Steps may be deserialized concurrently, e.g. by the threads of the engine in local mode, and
+# must neither unpack the same bundle at once nor add PYTHON_MODULE_PATH to sys.path twice
+_UNPACK_LOCK = threading.Lock()
 
-    stringio = StringIO()
-    pickler = CloudPickler(stringio, -1)
 
-    pickler.dump(obj)
+class ModuleBundle(namedtuple('_ModuleBundle', 'content_hash module_data')):
+    """The source of a set of modules, by file name, and the hash of that source."""
 
-    for module in pickler.modules:
-        module_manager.add(module.__name__)
 
-    module_paths = module_manager.get_and_clear_paths()
+def create_module_bundle(module_names):
+    """Analyzes the dependencies of modules and bundles the source of every module they need.
 
-    module_data = create_mod_data(module_paths)
+    Args:
+        module_names (Iterable[str]): The names of the modules.
 
-    return pickle.dumps({'obj': stringio.getvalue(), 'module_data': module_data}, -1)
+    Returns:
+        (ModuleBundle): The bundle, whose content_hash is None if no module needs shipping.
+    """
+    module_manager = ModuleDependencyAnalyzer()
+    for module_name in module_names:
+        module_manager.add(module_name)
 
+    module_data = create_mod_data(module_manager.get_and_clear_paths())
+    if not module_data:
+        return ModuleBundle(None, module_data)
 
-# these templates will get filled in by runtime ETAG
-PYTHON_MODULE_PATH = os.path.join(TEMP, "pymodules_{0}")
+    content_hash = hashlib.sha256()
+    for m_filename in sorted(module_data):
+        content_hash.update(m_filename.encode('utf-8'))
+        content_hash.update(b'\0')
+        content_hash.update(module_data[m_filename].encode('ascii'))
+        content_hash.update(b'\0')
+    return ModuleBundle(content_hash.hexdigest(), module_data)
 
 
-def deserialize(pickled_obj):
-    all_loaded = pickle.loads(pickled_obj)
+class Serializer(object):
+    """Serializes objects and the modules they depend on.
 
-    # shutil.rmtree(PYTHON_MODULE_PATH, True)  # delete old modules
-    mkdir_p(PYTHON_MODULE_PATH)
-    sys.path.append(PYTHON_MODULE_PATH)
+    The modules are shipped as bundles in storage, rather than embedded in every object. The
+    dependencies of a set of modules are analyzed once per serializer, and each bundle is stored
+    once, under its content hash, so the objects of a run that depend on the same modules, like
+    its steps, all refer to the same bundle. Use one serializer per run, so that changes to the
+    source of modules are picked up by the next run.
 
-    for m_filename, m_data in all_loaded['module_data'].items():
+    Objects are serialized to the payload format of dagma.payload, compressed if they are at
+    least compression_threshold bytes large.
+    """
+
+    def __init__(self, storage, compression_threshold=DEFAULT_COMPRESSION_THRESHOLD):
+        self.storage = check.inst_param(storage, 'storage', Storage)
+        self.compression_threshold = check.int_param(
+            compression_threshold, 'compression_threshold'
+        )
+        # Module bundles by the names of the modules they bundle
+        self._module_bundles = {}
+        self._stored_module_bundles = set()
+
+    def _get_module_bundle(self, module_names):
+        if module_names not in self._module_bundles:
+            self._module_bundles[module_names] = create_module_bundle(module_names)
+        return self._module_bundles[module_names]
+
+    def _store_module_bundle(self, module_bundle):
+        content_hash = module_bundle.content_hash
+        if (
+            content_hash is None
+            or content_hash in self._stored_module_bundles
+            # Bundles this process unpacked were read from storage
+            or content_hash in _UNPACKED_MODULE_BUNDLES
+        ):
+            return
+
+        logger.info('Storing module bundle %s', content_hash)
+        self.storage.put_object(
+            key=get_module_bundle_key(content_hash),
+            body=pickle.dumps(module_bundle.module_data, -1),
+        )
+        self._stored_module_bundles.add(content_hash)
+
+    def serialize(self, obj):
+        """Serializes an object, storing the bundle of the modules it depends on.
+
+        Args:
+            obj (object): The object to serialize
+
+        Returns:
+            (file): A readable file-like object producing the serialized representation of the
+                object, with the hash of its module bundle, as it is read. Pass it as the body of
+                Storage.put_object to stream it to storage.
+        """
+        pickler, pickled, buffers = pickle_object(obj, CloudPickler)
+
+        module_bundle = self._get_module_bundle(
+            frozenset(module.__name__ for module in pickler.modules)
+        )
+        self._store_module_bundle(module_bundle)
+
+        return dump_payload(
+            pickled, buffers, module_bundle.content_hash, self.compression_threshold
+        )
+
+
+def _unpack_module_bundle(storage, content_hash):
+    if content_hash in _UNPACKED_MODULE_BUNDLES:
+        return
+
+    with _UNPACK_LOCK:
+        _unpack_module_bundle_locked(storage, content_hash)
+
+
+def _unpack_module_bundle_locked(storage, content_hash):
+    # Another thread may have unpacked the bundle while this one waited for the lock
+    if content_hash in _UNPACKED_MODULE_BUNDLES:
+        return
+
+    marker_path = os.path.join(UNPACKED_MODULE_BUNDLES_PATH, content_hash)
+    if os.path.exists(marker_path):
+        # Unpacked by an earlier process, e.g. an earlier invocation in the same Lambda container
+        _UNPACKED_MODULE_BUNDLES.add(content_hash)
+        return
+
+    module_bundle_object = storage.get_object(key=get_module_bundle_key(content_hash))
+    with contextlib.closing(module_bundle_object['Body']) as body:
+        module_data = pickle.loads(body.read())
+
+    for m_filename, m_data in module_data.items():
         m_path = os.path.dirname(m_filename)
         if len(m_path) > 0 and m_path[0] == "/":
             m_path = m_path[1:]
@@ -112,11 +219,41 @@ def deserialize(pickled_obj):
         with open(full_filename, 'wb') as fid:
             fid.write(b64str_to_bytes(m_data))
 
-    logger.info("Finished writing {} module files".format(len(all_loaded['module_data'])))
-    logger.debug(subprocess.check_output("find {}".format(PYTHON_MODULE_PATH), shell=True))
-    logger.debug(subprocess.check_output("find {}".format(os.getcwd()), shell=True))
+    mkdir_p(UNPACKED_MODULE_BUNDLES_PATH)
+    open(marker_path, 'wb').close()
+    _UNPACKED_MODULE_BUNDLES.add(content_hash)
+
+    logger.info("Finished writing {} module files".format(len(module_data)))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(subprocess.check_output("find {}".format(PYTHON_MODULE_PATH), shell=True))
+        logger.debug(subprocess.check_output("find {}".format(os.getcwd()), shell=True))
+
+
+def deserialize(stream, storage):
+    """Deserializes an object, unpacking the bundle of the modules it depends on from storage
+    unless this process or container has already unpacked it.
+
+    Args:
+        stream (file): A readable file-like object, e.g. the body of an object in storage, that
+            reads the serialized representation of the object. Deserializing takes ownership of
+            the stream, which is closed once the object has been read, or on error.
+        storage (Storage): The storage holding the module bundle of the object.
+
+    Returns:
+        (object): The object.
+    """
+    check.inst_param(storage, 'storage', Storage)
+
+    with contextlib.closing(stream):
+        module_bundle_hash, body_reader = read_payload_header(stream)
+
+        with _UNPACK_LOCK:
+            mkdir_p(PYTHON_MODULE_PATH)
+            if PYTHON_MODULE_PATH not in sys.path:
+                sys.path.append(PYTHON_MODULE_PATH)
 
-    # now unpickle function; it will expect modules to be there
-    loaded_obj = pickle.loads(all_loaded['obj'])
+        if module_bundle_hash is not None:
+            _unpack_module_bundle(storage, module_bundle_hash)
 
-    return loaded_obj
+        # now unpickle function; it will expect modules to be there
+        return load_payload_body(body_reader)
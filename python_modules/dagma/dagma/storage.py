@@ -1,13 +1,67 @@
 """Storage for dagma."""
 
+import io
+import os
+import shutil
+import tempfile
+
+from boto3.s3.transfer import TransferConfig
+
+from dagster import check
+
+from .utils import mkdir_p
+
+# Bodies larger than this are uploaded in parts, streamed from the body rather than read whole
+MULTIPART_THRESHOLD = 64 * 1024 * 1024
+
+MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+
 
 class Storage(object):
-    """S3 backend for storage."""
+    """The interface of the storage backends of dagma, which hold the steps, resources and
+    intermediate outputs of a run."""
+
+    def put_object(self, key, body, **kwargs):
+        """Put an object into storage.
+
+        Args:
+            key (str): The key to use.
+            body (bytes or file): The body of the object.
+        """
+        check.not_implemented('Must implement put_object')
+
+    def get_object(self, key):
+        """Get an object from storage.
+
+        Args:
+            key (str): The key to retrieve.
+
+        Returns:
+            (dict): The object, whose 'Body' is a file-like object holding its body. The caller
+                owns the body and must close it once it has been read.
+        """
+        check.not_implemented('Must implement get_object')
+
+
+class S3Storage(Storage):
+    """S3 backend for storage.
+
+    The storage creates one boto3 session and S3 client per process, on first use, and reuses
+    its connection pool for every request after that."""
 
     def __init__(self, config):
         self.s3_bucket = config['s3_bucket']
         self.sessionmaker = config['sessionmaker']
         self.put_object_kwargs = config['put_object_kwargs']
+        self._client = None
+        self._client_pid = None
+
+    def __getstate__(self):
+        # Clients can't be pickled, and mustn't be shared with other processes
+        state = dict(self.__dict__)
+        state['_client'] = None
+        state['_client_pid'] = None
+        return state
 
     @property
     def session(self):
@@ -17,11 +71,17 @@ class Storage(object):
     @property
     def client(self):
         """The S3 client."""
-        return self.session.client('s3')
+        if self._client is None or self._client_pid != os.getpid():
+            self._client = self.session.client('s3')
+            self._client_pid = os.getpid()
+        return self._client
 
     def put_object(self, key, body, **kwargs):
         """Put an object into the S3 backend.
 
+        Bodies larger than MULTIPART_THRESHOLD, and files, are streamed to S3, with a multipart
+        upload if they are large.
+
         Args:
             key (str): The S3 key to use.
             body (bytes or file): The body of the object.
@@ -30,8 +90,23 @@ class Storage(object):
             Takes optional kwargs for boto3.S3.Client.put_object:
             https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.put_object
         """
-        return self.client.put_object(
-            Bucket=self.s3_bucket, Key=key, Body=body, **dict(self.put_object_kwargs, **kwargs)
+        put_object_kwargs = dict(self.put_object_kwargs, **kwargs)
+
+        if isinstance(body, bytes):
+            if len(body) <= MULTIPART_THRESHOLD:
+                return self.client.put_object(
+                    Bucket=self.s3_bucket, Key=key, Body=body, **put_object_kwargs
+                )
+            body = io.BytesIO(body)
+
+        return self.client.upload_fileobj(
+            body,
+            self.s3_bucket,
+            key,
+            ExtraArgs=put_object_kwargs,
+            Config=TransferConfig(
+                multipart_threshold=MULTIPART_THRESHOLD, multipart_chunksize=MULTIPART_CHUNKSIZE
+            ),
         )
 
     def get_object(self, key):
@@ -40,11 +115,55 @@ class Storage(object):
         Args:
             key (str): The S3 key to retrieve.
 
-        Kwargs:
-            Takes optional kwargs for boto3.S3.Client.get_object:
-            https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.put_object
+        Returns:
+            (dict): The response of boto3.S3.Client.get_object, whose 'Body' streams the object.
         """
         return self.client.get_object(Bucket=self.s3_bucket, Key=key)
 
     # TODO Use this to implement cancellation as well ?
     # def put_cancelled
+
+
+class LocalStorage(Storage):
+    """Local filesystem backend for storage, which keeps each object in a file under a base
+    directory. Useful to run the dagma engine offline, e.g. in tests and benchmarks."""
+
+    def __init__(self, base_dir):
+        self.base_dir = check.str_param(base_dir, 'base_dir')
+
+    def _get_path(self, key):
+        return os.path.join(self.base_dir, key)
+
+    def put_object(self, key, body, **kwargs):
+        """Put an object into a file under the base directory.
+
+        The object is written to a temporary file first, then moved into place, so that readers
+        never see a partially written object.
+
+        Args:
+            key (str): The key to use.
+            body (bytes or file): The body of the object.
+        """
+        check.str_param(key, 'key')
+        mkdir_p(self.base_dir)
+
+        fd, temp_path = tempfile.mkstemp(dir=self.base_dir)
+        with os.fdopen(fd, 'wb') as ff:
+            if isinstance(body, bytes):
+                ff.write(body)
+            else:
+                shutil.copyfileobj(body, ff)
+        os.rename(temp_path, self._get_path(key))
+
+    def get_object(self, key):
+        """Get an object from a file under the base directory.
+
+        Args:
+            key (str): The key to retrieve.
+
+        Returns:
+            (dict): The object, whose 'Body' is the open file holding its body, which the caller
+                must close.
+        """
+        check.str_param(key, 'key')
+        return {'Body': open(self._get_path(key), 'rb')}
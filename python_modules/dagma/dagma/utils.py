@@ -40,9 +40,9 @@ def get_step_key(context, step_idx):
     return '{run_id}_step_{step_idx}.pickle'.format(run_id=context.run_id, step_idx=step_idx)
 
 
-def get_input_key(context, step_idx):
-    return '{run_id}_intermediate_results_{step_idx}.pickle'.format(
-        run_id=context.run_id, step_idx=step_idx
+def get_output_key(context, step_key, output_name):
+    return '{run_id}_output_{step_key}_{output_name}.pickle'.format(
+        run_id=context.run_id, step_key=step_key, output_name=output_name
     )
 
 
@@ -50,13 +50,17 @@ def get_deployment_package_key(context):
     return '{run_id}_deployment_package.zip'.format(run_id=context.run_id)
 
 
+def get_module_bundle_key(content_hash):
+    return 'module_bundle_{content_hash}.pickle'.format(content_hash=content_hash)
+
+
 def get_resources_key(context):
     return '{run_id}_resources.pickle'.format(run_id=context.run_id)
 
 
 LambdaInvocationPayload = namedtuple(
     'LambdaInvocationPayload',
-    'run_id step_idx key s3_bucket s3_key_inputs s3_key_body ' 's3_key_resources s3_key_outputs',
+    'run_id step_idx key s3_bucket s3_keys_inputs s3_key_body s3_key_resources s3_keys_outputs',
 )
 
 ####################################################################################################
@@ -1,10 +1,17 @@
+import functools
+import io
+import json
 import logging
+import threading
+import time
 import uuid
 
 from collections import namedtuple
 
 import boto3
 
+from cloudpickle import CloudPickler
+
 # import numpy
 import pytest
 
@@ -28,6 +35,13 @@ from dagster.core.execution import (
     yield_context,
 )
 from dagma import execute_plan, define_dagma_resource
+from dagma.engine import (
+    DagmaStepExecutionError,
+    _execute_step_sync,
+    _execute_steps,
+    _get_input_keys,
+    _get_output_keys,
+)
 
 
 def create_lambda_context():
@@ -124,3 +138,144 @@ def test_execution_single():
     assert results[('solid_a.transform', 'result')][1].output_name == 'result'
     assert results[('solid_a.transform', 'result')][1].value == 1
     assert results[('solid_a.transform', 'result')][2] is None
+
+
+def test_input_keys_from_output_manifest():
+    pipeline = define_diamond_dag_pipeline()
+    typed_environment = create_typed_environment(pipeline, TEST_ENVIRONMENT)
+
+    with yield_context(pipeline, typed_environment, ReentrantInfo(run_id='run_id')) as context:
+        execution_plan = create_execution_plan_core(
+            ExecutionPlanInfo(context, pipeline, typed_environment)
+        )
+        steps = {step.key: step for step in execution_plan.topological_steps()}
+
+        output_manifest = {}
+        for step_key in ['solid_a.transform', 'solid_b.transform']:
+            for output_name, output_key in _get_output_keys(steps[step_key], context).items():
+                output_manifest[(step_key, output_name)] = output_key
+
+        assert _get_input_keys(steps['solid_b.transform'], output_manifest) == {
+            'arg_a': 'run_id_output_solid_a.transform_result.pickle'
+        }
+
+        # solid_c has not run yet
+        with pytest.raises(check.CheckError):
+            _get_input_keys(steps['solid_d.transform'], output_manifest)
+
+
+class InProcessInvoker(object):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.invoked = []
+
+    def __call__(self, context, payload):
+        with self._lock:
+            self.invoked.append(payload.key)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.1)
+        with self._lock:
+            self.in_flight -= 1
+        return {'outputs': payload.s3_keys_outputs}
+
+
+class FailingLambdaClient(object):
+    """Stands in for a Lambda client whose function raises, as reported by boto3."""
+
+    def __init__(self):
+        self.invoked = []
+
+    def invoke(self, FunctionName, Payload, **_kwargs):  # pylint: disable=C0103
+        self.invoked.append(json.loads(Payload)['config'][2])
+        return {
+            'FunctionError': 'Unhandled',
+            'LogResult': '',
+            'Payload': io.BytesIO(b'{"errorMessage": "bad", "errorType": "Exception"}'),
+        }
+
+
+def _execute_diamond_steps(max_concurrent_steps, invoker=None):
+    pipeline = define_diamond_dag_pipeline()
+    typed_environment = create_typed_environment(pipeline, TEST_ENVIRONMENT)
+    invoker = invoker or InProcessInvoker()
+
+    with yield_context(pipeline, typed_environment, ReentrantInfo(run_id='run_id')) as context:
+        execution_plan = create_execution_plan_core(
+            ExecutionPlanInfo(context, pipeline, typed_environment)
+        )
+        output_manifest = _execute_steps(context, execution_plan, invoker, max_concurrent_steps)
+
+    return invoker, output_manifest
+
+
+def test_execute_steps_concurrently():
+    invoker, output_manifest = _execute_diamond_steps(max_concurrent_steps=4)
+
+    assert invoker.max_in_flight == 2
+    assert invoker.invoked[0] == 'solid_a.transform'
+    assert set(invoker.invoked[1:3]) == set(['solid_b.transform', 'solid_c.transform'])
+    assert invoker.invoked[3] == 'solid_d.transform'
+    assert output_manifest[('solid_d.transform', 'result')] == (
+        'run_id_output_solid_d.transform_result.pickle'
+    )
+    assert len(output_manifest) == 4
+
+
+def test_execute_steps_concurrency_cap():
+    invoker, output_manifest = _execute_diamond_steps(max_concurrent_steps=1)
+
+    assert invoker.max_in_flight == 1
+    assert len(invoker.invoked) == 4
+    assert len(output_manifest) == 4
+
+
+def test_execute_steps_failed_invocation():
+    lambda_client = FailingLambdaClient()
+    invoker = functools.partial(
+        _execute_step_sync, lambda_client, {'FunctionArn': 'arn:aws:lambda:function'}
+    )
+
+    with pytest.raises(DagmaStepExecutionError) as exc_info:
+        _execute_diamond_steps(max_concurrent_steps=4, invoker=invoker)
+
+    assert exc_info.value.step_key == 'solid_a.transform'
+    assert exc_info.value.response['errorMessage'] == 'bad'
+    # The run stops rather than carrying on without the outputs of the failed step
+    assert lambda_client.invoked == ['solid_a.transform']
+
+
+@pytest.mark.skipif(
+    not hasattr(CloudPickler(io.BytesIO()), 'modules'),
+    reason='Needs the module tracking of the pinned cloudpickle. Issue #491',
+)
+def test_execution_diamond_local_storage(tmpdir):
+    pipeline = define_diamond_dag_pipeline()
+    environment = {
+        'context': {
+            'lambda': {
+                'resources': {
+                    'dagma': {
+                        'config': {
+                            'aws_region_name': 'us-east-2',
+                            'local_storage_dir': str(tmpdir.join('storage')),
+                        }
+                    }
+                }
+            }
+        }
+    }
+    typed_environment = create_typed_environment(pipeline, environment)
+
+    with yield_context(pipeline, typed_environment, ReentrantInfo(run_id='run_id')) as context:
+        execution_plan = create_execution_plan_core(
+            ExecutionPlanInfo(context, pipeline, typed_environment)
+        )
+        results = execute_plan(context, execution_plan, local=True)
+
+    assert len(results) == 4
+    success, result, _ = results[('solid_d.transform', 'result')]
+    assert success
+    assert result.value == 3.5
@@ -0,0 +1,67 @@
+import io
+import pickle
+import sys
+import zlib
+
+import pytest
+
+from dagster import check
+
+from dagma import payload
+from dagma.payload import dump_payload, load_payload_body, pickle_object, read_payload_header
+
+
+def _round_trip(obj, module_bundle_hash=None, compression_threshold=1024):
+    _pickler, pickled, buffers = pickle_object(obj, pickle.Pickler)
+    data = dump_payload(pickled, buffers, module_bundle_hash, compression_threshold).read()
+    read_hash, body_reader = read_payload_header(io.BytesIO(data))
+    assert read_hash == module_bundle_hash
+    return load_payload_body(body_reader), buffers, data
+
+
+def test_small_payload():
+    obj, _buffers, data = _round_trip({'value': 1}, module_bundle_hash='abc')
+    assert obj == {'value': 1}
+    assert data[5:6] == bytes(bytearray([payload.NO_COMPRESSION]))
+
+
+def test_compressed_payload():
+    obj = {'values': list(range(10000)), 'text': u'unicodé' * 1000}
+    round_tripped, _buffers, data = _round_trip(obj)
+    assert round_tripped == obj
+    assert data[5:6] == bytes(bytearray([payload.ZLIB_COMPRESSION]))
+    assert len(data) < len(pickle.dumps(obj, -1))
+
+
+def test_incompressible_payload():
+    obj = bytes(bytearray(range(256))) + zlib.compress(b'compressed' * 1000)
+    round_tripped, _buffers, data = _round_trip(obj, compression_threshold=0)
+    assert round_tripped == obj
+    assert data[5:6] == bytes(bytearray([payload.NO_COMPRESSION]))
+
+
+def test_payload_read_in_chunks(monkeypatch):
+    monkeypatch.setattr(payload, 'CHUNK_SIZE', 7)
+    obj = [str(i) * 10 for i in range(1000)]
+    assert _round_trip(obj)[0] == obj
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason='Requires pickle protocol 5')
+def test_out_of_band_buffers():
+    # Buffers exported like the data of numpy arrays, which pickle them with PickleBuffers
+    data = bytearray(zlib.compress(b'not very compressible') * 100000)
+    obj = {'data': pickle.PickleBuffer(data), 'small': pickle.PickleBuffer(b'small')}
+
+    round_tripped, buffers, _ = _round_trip(obj)
+    assert sorted(len(buffer) for buffer in buffers) == [len(b'small'), len(data)]
+    assert round_tripped['data'] == data
+    assert bytes(round_tripped['small']) == b'small'
+
+    # The buffers of the payload are views of the memory of the object
+    data[0:1] = b'x'
+    assert any(buffer[0:1] == b'x' for buffer in buffers)
+
+
+def test_not_a_payload():
+    with pytest.raises(check.CheckError):
+        read_payload_header(io.BytesIO(pickle.dumps({'value': 1})))
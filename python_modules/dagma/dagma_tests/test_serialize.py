@@ -0,0 +1,167 @@
+import io
+import os
+import pickle
+import sys
+import threading
+import time
+
+from cloudpickle import CloudPickler
+
+import pytest
+
+from dagster import check
+
+from dagma import serialize
+from dagma.payload import DEFAULT_COMPRESSION_THRESHOLD, dump_payload
+from dagma.serialize import Serializer, create_module_bundle, deserialize
+from dagma.storage import LocalStorage
+from dagma.utils import get_module_bundle_key
+
+
+class RecordingStorage(LocalStorage):
+    def __init__(self, base_dir, get_delay=0):
+        super(RecordingStorage, self).__init__(base_dir)
+        self._get_delay = get_delay
+        self._lock = threading.Lock()
+        self.put_keys = []
+        self.get_keys = []
+
+    def put_object(self, key, body, **kwargs):
+        with self._lock:
+            self.put_keys.append(key)
+        return super(RecordingStorage, self).put_object(key, body, **kwargs)
+
+    def get_object(self, key):
+        with self._lock:
+            self.get_keys.append(key)
+        time.sleep(self._get_delay)
+        return super(RecordingStorage, self).get_object(key)
+
+
+@pytest.fixture
+def bundled_module(tmpdir):
+    module_dir = tmpdir.mkdir('modules')
+    module_dir.join('dagma_bundled_module.py').write('VALUE = 1\n')
+    sys.path.insert(0, str(module_dir))
+    try:
+        yield module_dir.join('dagma_bundled_module.py')
+    finally:
+        sys.path.remove(str(module_dir))
+
+
+@pytest.fixture
+def module_path(tmpdir, monkeypatch):
+    python_module_path = str(tmpdir.join('pymodules'))
+    monkeypatch.setattr(serialize, 'PYTHON_MODULE_PATH', python_module_path)
+    monkeypatch.setattr(
+        serialize, 'UNPACKED_MODULE_BUNDLES_PATH', os.path.join(python_module_path, '.bundles')
+    )
+    monkeypatch.setattr(serialize, '_UNPACKED_MODULE_BUNDLES', set())
+    try:
+        yield python_module_path
+    finally:
+        if python_module_path in sys.path:
+            sys.path.remove(python_module_path)
+
+
+def test_module_bundle_content_hash(bundled_module):  # pylint: disable=W0621
+    module_bundle = create_module_bundle(['dagma_bundled_module'])
+    assert list(module_bundle.module_data) == ['dagma_bundled_module.py']
+    assert create_module_bundle(['dagma_bundled_module']) == module_bundle
+
+    bundled_module.write('VALUE = 2\n')
+    assert create_module_bundle(['dagma_bundled_module']).content_hash != (
+        module_bundle.content_hash
+    )
+
+
+def test_module_bundle_unpacked_once(
+    tmpdir, bundled_module, module_path
+):  # pylint: disable=W0621,W0613
+    storage = LocalStorage(str(tmpdir.join('storage')))
+    module_bundle = create_module_bundle(['dagma_bundled_module'])
+    storage.put_object(
+        key=get_module_bundle_key(module_bundle.content_hash),
+        body=pickle.dumps(module_bundle.module_data),
+    )
+    payload = dump_payload(
+        pickle.dumps({'value': 1}), [], module_bundle.content_hash, DEFAULT_COMPRESSION_THRESHOLD
+    ).read()
+
+    assert deserialize(io.BytesIO(payload), storage) == {'value': 1}
+    assert os.path.exists(os.path.join(module_path, 'dagma_bundled_module.py'))
+
+    # Neither this process nor the next reads the bundle again
+    os.remove(os.path.join(storage.base_dir, get_module_bundle_key(module_bundle.content_hash)))
+    assert deserialize(io.BytesIO(payload), storage) == {'value': 1}
+    serialize._UNPACKED_MODULE_BUNDLES.clear()  # pylint: disable=W0212
+    assert deserialize(io.BytesIO(payload), storage) == {'value': 1}
+
+
+def test_deserialize_closes_stream(tmpdir, module_path):  # pylint: disable=W0621,W0613
+    storage = LocalStorage(str(tmpdir.join('storage')))
+    storage.put_object(
+        key='run_id_output.pickle',
+        body=dump_payload(pickle.dumps({'value': 1}), [], None, DEFAULT_COMPRESSION_THRESHOLD),
+    )
+
+    body = storage.get_object(key='run_id_output.pickle')['Body']
+    assert deserialize(body, storage) == {'value': 1}
+    assert body.closed
+
+    # Also when the stream is not a payload
+    storage.put_object(key='run_id_garbage.pickle', body=b'garbage')
+    body = storage.get_object(key='run_id_garbage.pickle')['Body']
+    with pytest.raises(check.CheckError):
+        deserialize(body, storage)
+    assert body.closed
+
+
+@pytest.mark.skipif(
+    not hasattr(CloudPickler(io.BytesIO()), 'modules'),
+    reason='Needs the module tracking of the pinned cloudpickle. Issue #491',
+)
+def test_serializer_stores_module_bundle_once(
+    tmpdir, bundled_module
+):  # pylint: disable=W0621,W0613
+    import dagma_bundled_module  # pylint: disable=E0401
+
+    storage = RecordingStorage(str(tmpdir.join('storage')))
+    serializer = Serializer(storage)
+
+    serializer.serialize(lambda: dagma_bundled_module.VALUE)
+    serializer.serialize(lambda: dagma_bundled_module.VALUE + 1)
+
+    module_bundle_keys = [key for key in storage.put_keys if key.startswith('module_bundle_')]
+    assert len(module_bundle_keys) == 1
+
+
+def test_module_bundle_unpacked_once_concurrently(
+    tmpdir, bundled_module, module_path
+):  # pylint: disable=W0621,W0613
+    # Slow reads, so that the threads would all miss the bundle without the lock
+    storage = RecordingStorage(str(tmpdir.join('storage')), get_delay=0.05)
+    module_bundle = create_module_bundle(['dagma_bundled_module'])
+    module_bundle_key = get_module_bundle_key(module_bundle.content_hash)
+    storage.put_object(key=module_bundle_key, body=pickle.dumps(module_bundle.module_data))
+    payload = dump_payload(
+        pickle.dumps({'value': 1}), [], module_bundle.content_hash, DEFAULT_COMPRESSION_THRESHOLD
+    ).read()
+
+    start = threading.Event()
+    results = []
+
+    def _deserialize():
+        start.wait()
+        results.append(deserialize(io.BytesIO(payload), storage))
+
+    threads = [threading.Thread(target=_deserialize) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    start.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == [{'value': 1}] * 8
+    assert storage.get_keys.count(module_bundle_key) == 1
+    assert sys.path.count(module_path) == 1
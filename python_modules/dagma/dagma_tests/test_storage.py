@@ -0,0 +1,57 @@
+import contextlib
+import io
+import os
+import pickle
+
+import boto3
+
+from dagma.storage import LocalStorage, S3Storage
+
+
+def _read_object(storage, key):
+    with contextlib.closing(storage.get_object(key=key)['Body']) as body:
+        return body.read()
+
+
+def test_local_storage(tmpdir):
+    storage = LocalStorage(str(tmpdir.join('storage')))
+
+    storage.put_object(key='run_id_resources.pickle', body=b'resources')
+    storage.put_object(key='run_id_step_0.pickle', body=io.BytesIO(b'step'))
+
+    assert _read_object(storage, 'run_id_resources.pickle') == b'resources'
+    assert _read_object(storage, 'run_id_step_0.pickle') == b'step'
+
+    storage.put_object(key='run_id_resources.pickle', body=b'overwritten')
+    assert _read_object(storage, 'run_id_resources.pickle') == b'overwritten'
+
+    # No temporary files are left behind
+    assert sorted(os.listdir(storage.base_dir)) == [
+        'run_id_resources.pickle',
+        'run_id_step_0.pickle',
+    ]
+
+
+class CountingSessionmaker(object):
+    def __init__(self):
+        self.sessions = 0
+
+    def __call__(self):
+        self.sessions += 1
+        return boto3.Session(region_name='us-east-2')
+
+
+def test_s3_storage_reuses_client():
+    sessionmaker = CountingSessionmaker()
+    storage = S3Storage(
+        {'s3_bucket': 'bucket', 'sessionmaker': sessionmaker, 'put_object_kwargs': {}}
+    )
+
+    client = storage.client
+    assert storage.client is client
+    assert sessionmaker.sessions == 1
+
+    # The client is not pickled with the storage
+    unpickled = pickle.loads(pickle.dumps(storage))
+    assert unpickled.s3_bucket == 'bucket'
+    assert unpickled._client is None  # pylint: disable=W0212
@@ -77,6 +77,14 @@ def dataframe_input_schema(file_type, file_options):
         )
 
 
+def summarize_data_frame(pandas_df):
+    return 'DataFrame with {num_rows} rows and {num_columns} columns: {columns}'.format(
+        num_rows=len(pandas_df.index),
+        num_columns=len(pandas_df.columns),
+        columns=', '.join(str(column) for column in pandas_df.columns),
+    )
+
+
 DataFrame = as_dagster_type(
     pd.DataFrame,
     name='PandasDataFrame',
@@ -85,4 +93,5 @@ DataFrame = as_dagster_type(
     See http://pandas.pydata.org/''',
     input_schema=dataframe_input_schema,
     output_schema=dataframe_output_schema,
+    value_summary_fn=summarize_data_frame,
 )
@@ -0,0 +1,66 @@
+'''
+Measures the overhead of the parameter checks on hot-path objects by building execution plans
+for, and executing, synthetic pipelines with the checks enabled and in production mode. The
+pipelines are the ones of bench_dependency_structure.py. Plans are rebuilt on every iteration
+rather than taken from the plan cache.
+
+Usage:
+
+    python benchmarks/bench_check_overhead.py [--sizes 100 500 1000] [--iterations 5]
+'''
+
+import argparse
+import time
+
+from dagster import execute_pipeline
+from dagster.check import hot_path
+from dagster.core.execution import EXECUTION_PLAN_CACHE, create_execution_plan
+
+from bench_dependency_structure import define_synthetic_pipeline
+
+QUIET_ENVIRONMENT = {'context': {'default': {'config': {'log_level': 'ERROR'}}}}
+
+
+def _timed(fn, iterations):
+    start = time.time()
+    for _ in range(iterations):
+        EXECUTION_PLAN_CACHE.clear()
+        fn()
+    return (time.time() - start) / iterations
+
+
+def _measure(pipeline_def, iterations):
+    plan_secs = _timed(lambda: create_execution_plan(pipeline_def, QUIET_ENVIRONMENT), iterations)
+    execute_secs = _timed(lambda: execute_pipeline(pipeline_def, QUIET_ENVIRONMENT), iterations)
+    return plan_secs, execute_secs
+
+
+def main(sizes, iterations):
+    print(
+        '{:>8} {:>18} {:>18} {:>18} {:>18}'.format(
+            'solids', 'plan (s)', 'plan prod (s)', 'execute (s)', 'execute prod (s)'
+        )
+    )
+    for size in sizes:
+        pipeline_def = define_synthetic_pipeline(size)
+
+        hot_path.set_production_mode(False)
+        plan_secs, execute_secs = _measure(pipeline_def, iterations)
+
+        hot_path.set_production_mode(True)
+        prod_plan_secs, prod_execute_secs = _measure(pipeline_def, iterations)
+        hot_path.set_production_mode(False)
+
+        print(
+            '{:>8} {:>18.3f} {:>18.3f} {:>18.3f} {:>18.3f}'.format(
+                size, plan_secs, prod_plan_secs, execute_secs, prod_execute_secs
+            )
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 500, 1000])
+    parser.add_argument('--iterations', type=int, default=5)
+    args = parser.parse_args()
+    main(args.sizes, args.iterations)
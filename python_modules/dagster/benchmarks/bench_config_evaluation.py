@@ -0,0 +1,101 @@
+'''
+Measures the evaluation of environment configs against the environment type of pipelines of
+increasing size, comparing the interpreted validator and default applier to the evaluator
+compiled for the type. Every solid has a config with a few scalar, list and optional fields.
+
+Usage:
+
+    python benchmarks/bench_config_evaluation.py [--sizes 100 500 1000] [--iterations 20]
+'''
+
+import argparse
+import time
+
+from dagster import Dict, Field, Int, List, PipelineDefinition, String, solid
+from dagster.core.types.default_applier import apply_default_values
+from dagster.core.types.evaluator import (
+    evaluate_config_value,
+    get_compiled_evaluator,
+    validate_config,
+)
+
+SOLID_CONFIG_TYPE = Dict(
+    {
+        'name': Field(String),
+        'num': Field(Int),
+        'tags': Field(List(String)),
+        'retries': Field(Int, is_optional=True, default_value=3),
+        'options': Field(
+            Dict({'verbose': Field(Int, is_optional=True, default_value=0)}), is_optional=True
+        ),
+    }
+)
+
+
+def _define_solid(name):
+    @solid(name=name, config_field=Field(SOLID_CONFIG_TYPE))
+    def _solid(_info):
+        return 1
+
+    return _solid
+
+
+def define_synthetic_pipeline(num_solids):
+    return PipelineDefinition(
+        name='synthetic_{num_solids}'.format(num_solids=num_solids),
+        solids=[_define_solid('solid_{index}'.format(index=index)) for index in range(num_solids)],
+    )
+
+
+def define_environment(num_solids):
+    return {
+        'solids': {
+            'solid_{index}'.format(index=index): {
+                'config': {'name': 'solid', 'num': index, 'tags': ['a', 'b', 'c']}
+            }
+            for index in range(num_solids)
+        }
+    }
+
+
+def _interpreted(config_type, environment):
+    errors = validate_config(config_type, environment)
+    assert not errors
+    return apply_default_values(config_type, environment)
+
+
+def _timed(fn, iterations):
+    start = time.time()
+    for _ in range(iterations):
+        fn()
+    return (time.time() - start) / iterations
+
+
+def main(sizes, iterations):
+    print(
+        '{:>8} {:>16} {:>16} {:>16}'.format(
+            'solids', 'compile (ms)', 'interpreted (ms)', 'compiled (ms)'
+        )
+    )
+    for size in sizes:
+        environment_type = define_synthetic_pipeline(size).environment_type
+        environment = define_environment(size)
+
+        compile_secs = _timed(lambda: get_compiled_evaluator(environment_type), 1)
+        interpreted_secs = _timed(lambda: _interpreted(environment_type, environment), iterations)
+        compiled_secs = _timed(
+            lambda: evaluate_config_value(environment_type, environment), iterations
+        )
+        print(
+            '{:>8} {:>16.2f} {:>16.2f} {:>16.2f}'.format(
+                size, compile_secs * 1000, interpreted_secs * 1000, compiled_secs * 1000
+            )
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 500, 1000])
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+    main(args.sizes, args.iterations)
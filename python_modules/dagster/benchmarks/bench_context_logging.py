@@ -0,0 +1,56 @@
+'''
+Measures the per-call overhead of RuntimeExecutionContext logging, both for messages that
+are dropped because no logger accepts their level and for messages that are emitted, with
+and without an event callback, as dagit and execute_pipeline always set one.
+
+Usage:
+
+    python benchmarks/bench_context_logging.py [--number 100000]
+'''
+
+import argparse
+import logging
+import timeit
+import uuid
+
+from dagster.core.execution_context import RuntimeExecutionContext
+from dagster.utils.logging import DEBUG, INFO
+
+
+class NullLogger(logging.Logger):
+    '''Accepts messages at its level but does not format or write them anywhere.'''
+
+    def __init__(self, level):
+        super(NullLogger, self).__init__('bench', level)
+        self.addHandler(logging.NullHandler())
+
+
+def _per_call_micros(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e6
+
+
+def main(number):
+    cases = [
+        ('debug dropped by INFO logger', INFO, 'debug', None),
+        ('debug emitted to DEBUG logger', DEBUG, 'debug', None),
+        ('info emitted to INFO logger', INFO, 'info', None),
+        ('debug to callback, INFO logger', INFO, 'debug', lambda _record: None),
+        ('info to callback, INFO logger', INFO, 'info', lambda _record: None),
+    ]
+
+    for name, level, method, event_callback in cases:
+        context = RuntimeExecutionContext(
+            str(uuid.uuid4()), loggers=[NullLogger(level)], event_callback=event_callback
+        )
+        log_fn = getattr(context, method)
+        with context.values({'pipeline': 'bench_pipeline', 'solid': 'bench_solid'}):
+            micros = _per_call_micros(
+                lambda log_fn=log_fn: log_fn('some message', some_key='some_value'), number
+            )
+        print('{name:<32} {micros:8.2f} us/call'.format(name=name, micros=micros))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=100000)
+    main(parser.parse_args().number)
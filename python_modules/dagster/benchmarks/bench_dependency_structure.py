@@ -0,0 +1,81 @@
+'''
+Measures pipeline construction and dependency lookups on synthetic DAGs of increasing size.
+Every solid after the first two depends on two earlier solids, so the number of edges grows
+linearly with the number of solids.
+
+Usage:
+
+    python benchmarks/bench_dependency_structure.py [--sizes 500 1000 5000]
+'''
+
+import argparse
+import random
+import time
+
+from dagster import DependencyDefinition, InputDefinition, PipelineDefinition, lambda_solid
+from dagster.core.definitions import solids_in_topological_order
+
+
+def _define_solid(name, num_inputs):
+    @lambda_solid(
+        name=name, inputs=[InputDefinition('in_{i}'.format(i=i)) for i in range(num_inputs)]
+    )
+    def _solid(**_kwargs):
+        return 1
+
+    return _solid
+
+
+def define_synthetic_pipeline(num_solids, seed=0):
+    rand = random.Random(seed)
+    solids = []
+    dependencies = {}
+    for index in range(num_solids):
+        name = 'solid_{index}'.format(index=index)
+        upstream = rand.sample(range(index), min(index, 2))
+        solids.append(_define_solid(name, len(upstream)))
+        dependencies[name] = {
+            'in_{i}'.format(i=i): DependencyDefinition('solid_{index}'.format(index=upstream_index))
+            for i, upstream_index in enumerate(upstream)
+        }
+    return PipelineDefinition(
+        name='synthetic_{num_solids}'.format(num_solids=num_solids),
+        solids=solids,
+        dependencies=dependencies,
+    )
+
+
+def _timed(fn):
+    start = time.time()
+    result = fn()
+    return result, time.time() - start
+
+
+def main(sizes):
+    print(
+        '{:>8} {:>14} {:>14} {:>14}'.format(
+            'solids', 'construct (s)', 'toposort (s)', 'lookups (s)'
+        )
+    )
+    for size in sizes:
+        pipeline_def, construct_secs = _timed(lambda: define_synthetic_pipeline(size))
+        _, toposort_secs = _timed(lambda: solids_in_topological_order(pipeline_def))
+
+        def _lookups():
+            # What dagit does to render every solid of the pipeline
+            for solid in pipeline_def.solids:
+                pipeline_def.dependency_structure.deps_of_solid_with_input(solid.name)
+                pipeline_def.dependency_structure.depended_by_of_solid(solid.name)
+
+        _, lookup_secs = _timed(_lookups)
+        print(
+            '{:>8} {:>14.3f} {:>14.3f} {:>14.3f}'.format(
+                size, construct_secs, toposort_secs, lookup_secs
+            )
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 1000, 5000])
+    main(parser.parse_args().sizes)
@@ -57,13 +57,14 @@ from dagster.core.types import (
     Path,
     PythonObjectType,
     Selector,
+    Stream,
     String,
 )
 
 from dagster.core.types.decorator import dagster_type, as_dagster_type
 from dagster.core.types.config import ConfigType, Enum, EnumValue
 from dagster.core.types.evaluator import DagsterEvaluateConfigValueError
-from dagster.core.types.runtime import RuntimeType
+from dagster.core.types.runtime import RuntimeType, TypeCheckPolicy
 
 from dagster.utils.test import execute_solid, execute_solids
 
@@ -127,7 +128,9 @@ __all__ = [
     'output_selector_schema',
     'Path',
     'PythonObjectType',
+    'Stream',
     'String',
+    'TypeCheckPolicy',
     # type creation
     'as_dagster_type',
     'dagster_type',
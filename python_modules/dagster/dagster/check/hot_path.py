@@ -0,0 +1,111 @@
+'''
+Parameter checks for the internal objects that are created over and over while plans are
+built and executed: steps and their results, event records, evaluation errors and the like.
+
+They are the same checks as the ones in dagster.check, until production mode is enabled, either
+by setting the DAGSTER_PRODUCTION_MODE environment variable to 1 or by calling
+set_production_mode(True). In production mode they skip validation and only return their
+parameter, or its default, exactly as the check would have. Checks on user-facing definitions
+always use dagster.check and are never switched off.
+
+Call sites must look the checks up on the module, e.g. hot_path.inst_param(...), rather than
+import them, so that switching modes takes effect for code that has already been imported.
+'''
+
+import os
+
+from dagster import check
+
+PRODUCTION_MODE_ENV_VAR = 'DAGSTER_PRODUCTION_MODE'
+
+_CHECKS = {
+    'inst_param': check.inst_param,
+    'opt_inst_param': check.opt_inst_param,
+    'callable_param': check.callable_param,
+    'opt_callable_param': check.opt_callable_param,
+    'str_param': check.str_param,
+    'opt_str_param': check.opt_str_param,
+    'int_param': check.int_param,
+    'float_param': check.float_param,
+    'bool_param': check.bool_param,
+    'list_param': check.list_param,
+    'opt_list_param': check.opt_list_param,
+    'dict_param': check.dict_param,
+    'opt_dict_param': check.opt_dict_param,
+    'param_invariant': check.param_invariant,
+}
+
+
+def _return_param(obj, _param_name, *_args, **_kwargs):
+    return obj
+
+
+def _return_opt_inst_param(obj, _param_name, _ttype, default=None):
+    return default if obj is None else obj
+
+
+def _return_opt_param(obj, _param_name, default=None):
+    return default if obj is None else obj
+
+
+def _return_opt_list_param(obj_list, _param_name, of_type=None):  # pylint: disable=W0613
+    return obj_list if obj_list else []
+
+
+def _return_opt_dict_param(obj, _param_name, key_type=None, value_type=None):
+    # pylint: disable=W0613
+    return obj if obj else {}
+
+
+def _skip_param_invariant(_condition, _param_name, _desc=None):
+    pass
+
+
+_UNCHECKED = {
+    'inst_param': _return_param,
+    'opt_inst_param': _return_opt_inst_param,
+    'callable_param': _return_param,
+    'opt_callable_param': _return_opt_param,
+    'str_param': _return_param,
+    'opt_str_param': _return_opt_param,
+    'int_param': _return_param,
+    'float_param': _return_param,
+    'bool_param': _return_param,
+    'list_param': _return_param,
+    'opt_list_param': _return_opt_list_param,
+    'dict_param': _return_param,
+    'opt_dict_param': _return_opt_dict_param,
+    'param_invariant': _skip_param_invariant,
+}
+
+# Rebound by set_production_mode
+inst_param = check.inst_param
+opt_inst_param = check.opt_inst_param
+callable_param = check.callable_param
+opt_callable_param = check.opt_callable_param
+str_param = check.str_param
+opt_str_param = check.opt_str_param
+int_param = check.int_param
+float_param = check.float_param
+bool_param = check.bool_param
+list_param = check.list_param
+opt_list_param = check.opt_list_param
+dict_param = check.dict_param
+opt_dict_param = check.opt_dict_param
+param_invariant = check.param_invariant
+
+_production_mode = False
+
+
+def is_production_mode():
+    return _production_mode
+
+
+def set_production_mode(enabled):
+    '''Turns the checks of this module into no-ops, or back into checks, for the process.'''
+    global _production_mode  # pylint: disable=W0603
+    _production_mode = check.bool_param(enabled, 'enabled')
+    globals().update(_UNCHECKED if enabled else _CHECKS)
+
+
+set_production_mode(os.getenv(PRODUCTION_MODE_ENV_VAR) == '1')
@@ -83,11 +83,12 @@ class MultipleResults(namedtuple('_MultipleResults', 'results')):
 
 
 class _LambdaSolid(object):
-    def __init__(self, name=None, inputs=None, output=None, description=None):
+    def __init__(self, name=None, inputs=None, output=None, description=None, version=None):
         self.name = check.opt_str_param(name, 'name')
         self.input_defs = check.opt_list_param(inputs, 'inputs', InputDefinition)
         self.output_def = check.inst_param(output, 'output', OutputDefinition)
         self.description = check.opt_str_param(description, 'description')
+        self.version = check.opt_str_param(version, 'version')
 
     def __call__(self, fn):
         check.callable_param(fn, 'fn')
@@ -103,17 +104,27 @@ class _LambdaSolid(object):
             outputs=[self.output_def],
             transform_fn=transform_fn,
             description=self.description,
+            version=self.version,
         )
 
 
 class _Solid(object):
-    def __init__(self, name=None, inputs=None, outputs=None, description=None, config_field=None):
+    def __init__(
+        self,
+        name=None,
+        inputs=None,
+        outputs=None,
+        description=None,
+        config_field=None,
+        version=None,
+    ):
         self.name = check.opt_str_param(name, 'name')
         self.input_defs = check.opt_list_param(inputs, 'inputs', InputDefinition)
         outputs = outputs or ([OutputDefinition()] if outputs is None else [])
         self.outputs = check.list_param(outputs, 'outputs', OutputDefinition)
         self.description = check.opt_str_param(description, 'description')
         self.config_field = check_opt_field_param(config_field, 'config_field')
+        self.version = check.opt_str_param(version, 'version')
 
     def __call__(self, fn):
         check.callable_param(fn, 'fn')
@@ -130,10 +141,11 @@ class _Solid(object):
             transform_fn=transform_fn,
             config_field=self.config_field,
             description=self.description,
+            version=self.version,
         )
 
 
-def lambda_solid(name=None, inputs=None, output=None, description=None):
+def lambda_solid(name=None, inputs=None, output=None, description=None, version=None):
     '''(decorator) Create a simple solid.
 
     This shortcut allows the creation of simple solids that do not require
@@ -147,6 +159,7 @@ def lambda_solid(name=None, inputs=None, output=None, description=None):
         inputs (list[InputDefinition]): List of inputs.
         output (OutputDefinition): The output of the solid. Defaults to ``OutputDefinition()``.
         description (str): Solid description.
+        version (str): Version of the solid's logic. See :py:class:`SolidDefinition`.
 
     Examples:
 
@@ -166,12 +179,17 @@ def lambda_solid(name=None, inputs=None, output=None, description=None):
     if callable(name):
         check.invariant(inputs is None)
         check.invariant(description is None)
+        check.invariant(version is None)
         return _LambdaSolid(output=output)(name)
 
-    return _LambdaSolid(name=name, inputs=inputs, output=output, description=description)
+    return _LambdaSolid(
+        name=name, inputs=inputs, output=output, description=description, version=version
+    )
 
 
-def solid(name=None, inputs=None, outputs=None, config_field=None, description=None):
+def solid(
+    name=None, inputs=None, outputs=None, config_field=None, description=None, version=None
+):
     '''(decorator) Create a solid with specified parameters.
 
     This shortcut simplifies the core solid API by exploding arguments into kwargs of the
@@ -195,6 +213,7 @@ def solid(name=None, inputs=None, outputs=None, config_field=None, description=N
         config_field (Field):
             The configuration for this solid.
         description (str): Description of this solid.
+        version (str): Version of the solid's logic. See :py:class:`SolidDefinition`.
 
     Examples:
 
@@ -260,6 +279,7 @@ def solid(name=None, inputs=None, outputs=None, config_field=None, description=N
         check.invariant(outputs is None)
         check.invariant(description is None)
         check.invariant(config_field is None)
+        check.invariant(version is None)
         return _Solid()(name)
 
     return _Solid(
@@ -268,6 +288,7 @@ def solid(name=None, inputs=None, outputs=None, config_field=None, description=N
         outputs=outputs,
         config_field=config_field,
         description=description,
+        version=version,
     )
 
 
@@ -195,29 +195,38 @@ class DependencyStructure(object):
     def __init__(self, handle_dict):
         self._handle_dict = check.inst_param(handle_dict, 'handle_dict', InputToOutputHandleDict)
 
+        # Forward and reverse adjacency, indexed by solid name, so that lookups for a single
+        # solid do not scan every edge of the pipeline
+        self._deps_by_solid = defaultdict(list)
+        self._depended_by_by_solid = defaultdict(lambda: defaultdict(list))
+        for input_handle, output_handle in self._handle_dict.items():
+            self._deps_by_solid[input_handle.solid.name].append((input_handle, output_handle))
+            self._depended_by_by_solid[output_handle.solid.name][output_handle].append(
+                input_handle
+            )
+
     def has_dep(self, solid_input_handle):
         check.inst_param(solid_input_handle, 'solid_input_handle', SolidInputHandle)
         return solid_input_handle in self._handle_dict
 
     def deps_of_solid(self, solid_name):
         check.str_param(solid_name, 'solid_name')
-        return list(handles[1] for handles in self.__gen_deps_of_solid(solid_name))
+        return [output_handle for _input_handle, output_handle in self._deps_of(solid_name)]
 
     def deps_of_solid_with_input(self, solid_name):
         check.str_param(solid_name, 'solid_name')
-        return dict(self.__gen_deps_of_solid(solid_name))
+        return dict(self._deps_of(solid_name))
 
-    def __gen_deps_of_solid(self, solid_name):
-        for input_handle, output_handle in self._handle_dict.items():
-            if input_handle.solid.name == solid_name:
-                yield (input_handle, output_handle)
+    def _deps_of(self, solid_name):
+        return self._deps_by_solid.get(solid_name, [])
 
     def depended_by_of_solid(self, solid_name):
         check.str_param(solid_name, 'solid_name')
         result = defaultdict(list)
-        for input_handle, output_handle in self._handle_dict.items():
-            if output_handle.solid.name == solid_name:
-                result[output_handle].append(input_handle)
+        for output_handle, input_handles in self._depended_by_by_solid.get(
+            solid_name, {}
+        ).items():
+            result[output_handle] = list(input_handles)
         return result
 
     def get_dep(self, solid_input_handle):
@@ -1,6 +1,6 @@
 from dagster import check
 
-from dagster.core.types.runtime import RuntimeType, resolve_to_runtime_type
+from dagster.core.types.runtime import RuntimeType, TypeCheckPolicy, resolve_to_runtime_type
 
 from .expectation import ExpectationDefinition
 from .utils import check_valid_name
@@ -16,9 +16,14 @@ class InputDefinition(object):
         expectations (List[ExpectationDefinition]):
             List of expectations that applies to the value passed to the solid.
         description (str): Description of the input. Optional.
+        type_check_policy (TypeCheckPolicy):
+            How thoroughly the values of the input are type checked. Optional. Defaults to the
+            policy of the run.
     '''
 
-    def __init__(self, name, dagster_type=None, expectations=None, description=None):
+    def __init__(
+        self, name, dagster_type=None, expectations=None, description=None, type_check_policy=None
+    ):
         ''
         self.name = check_valid_name(name)
 
@@ -28,6 +33,9 @@ class InputDefinition(object):
             expectations, 'expectations', of_type=ExpectationDefinition
         )
         self.description = check.opt_str_param(description, 'description')
+        self.type_check_policy = check.opt_inst_param(
+            type_check_policy, 'type_check_policy', TypeCheckPolicy
+        )
 
     @property
     def descriptive_key(self):
@@ -1,5 +1,5 @@
 from dagster import check
-from dagster.core.types.runtime import RuntimeType, resolve_to_runtime_type
+from dagster.core.types.runtime import RuntimeType, TypeCheckPolicy, resolve_to_runtime_type
 
 from .expectation import ExpectationDefinition
 from .utils import check_valid_name, DEFAULT_OUTPUT
@@ -16,9 +16,19 @@ class OutputDefinition(object):
         name (str): Name of the output. Defaults to "result".
         expectations List[ExpectationDefinition]: Expectations for this output.
         description (str): Description of the output. Optional.
+        type_check_policy (TypeCheckPolicy):
+            How thoroughly the values of the output are type checked. Optional. Defaults to the
+            policy of the run.
     '''
 
-    def __init__(self, dagster_type=None, name=None, expectations=None, description=None):
+    def __init__(
+        self,
+        dagster_type=None,
+        name=None,
+        expectations=None,
+        description=None,
+        type_check_policy=None,
+    ):
         self.name = check_valid_name(check.opt_str_param(name, 'name', DEFAULT_OUTPUT))
 
         self.runtime_type = check.inst(resolve_to_runtime_type(dagster_type), RuntimeType)
@@ -27,6 +37,9 @@ class OutputDefinition(object):
             expectations, 'expectations', of_type=ExpectationDefinition
         )
         self.description = check.opt_str_param(description, 'description')
+        self.type_check_policy = check.opt_inst_param(
+            type_check_policy, 'type_check_policy', TypeCheckPolicy
+        )
 
     @property
     def descriptive_key(self):
@@ -1,3 +1,5 @@
+import weakref
+
 from toposort import toposort_flatten
 
 from dagster import check
@@ -102,6 +104,23 @@ class PipelineDefinition(object):
 
         self._runtime_type_dict = construct_runtime_type_dictionary(solids)
 
+        # Computed on first use by solids_in_topological_order
+        self._topological_solid_names = None
+
+        # The execution plans built for this pipeline, by ExecutionPlanCache. Kept on the pipeline
+        # so that they are collected with it.
+        self._execution_plans = weakref.WeakKeyDictionary()
+
+    def __getstate__(self):
+        # Cached plans are not shipped along with pipelines, e.g. to other processes
+        state = dict(self.__dict__)
+        state['_execution_plans'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._execution_plans = weakref.WeakKeyDictionary()
+
     @property
     def display_name(self):
         '''Name suitable for exception messages, logging etc. If pipeline
@@ -198,26 +217,17 @@ def _create_adjacency_lists(solids, dep_structure):
     check.list_param(solids, 'solids', Solid)
     check.inst_param(dep_structure, 'dep_structure', DependencyStructure)
 
-    visit_dict = {s.name: False for s in solids}
     forward_edges = {s.name: set() for s in solids}
     backward_edges = {s.name: set() for s in solids}
 
-    def visit(solid_name):
-        if visit_dict[solid_name]:
-            return
-
-        visit_dict[solid_name] = True
-
-        for output_handle in dep_structure.deps_of_solid(solid_name):
+    # Every solid is visited exactly once, iteratively, so that deep pipelines do not
+    # exhaust the recursion limit
+    for s in solids:
+        for output_handle in dep_structure.deps_of_solid(s.name):
             forward_node = output_handle.solid.name
-            backward_node = solid_name
             if forward_node in forward_edges:
-                forward_edges[forward_node].add(backward_node)
-                backward_edges[backward_node].add(forward_node)
-                visit(forward_node)
-
-    for s in solids:
-        visit(s.name)
+                forward_edges[forward_node].add(s.name)
+                backward_edges[s.name].add(forward_node)
 
     return (forward_edges, backward_edges)
 
@@ -225,9 +235,12 @@ def _create_adjacency_lists(solids, dep_structure):
 def solids_in_topological_order(pipeline):
     check.inst_param(pipeline, 'pipeline', PipelineDefinition)
 
-    _forward_edges, backward_edges = _create_adjacency_lists(
-        pipeline.solids, pipeline.dependency_structure
-    )
+    # Pipelines do not change once constructed, so the order is only computed once
+    # pylint: disable=W0212
+    if pipeline._topological_solid_names is None:
+        _forward_edges, backward_edges = _create_adjacency_lists(
+            pipeline.solids, pipeline.dependency_structure
+        )
+        pipeline._topological_solid_names = toposort_flatten(backward_edges, sort=True)
 
-    order = toposort_flatten(backward_edges, sort=True)
-    return [pipeline.solid_named(solid_name) for solid_name in order]
+    return [pipeline.solid_named(solid_name) for solid_name in pipeline._topological_solid_names]
@@ -42,6 +42,8 @@ class SolidDefinition(object):
         description (str): Description of the solid.
         metadata (dict): Arbitrary metadata for the solid. Some frameworks expect and require
             certain metadata to be attached to a solid.
+        version (str): Version of the solid's logic. Bump it whenever the transform changes
+            what it computes. Only solids with a version are eligible for the step cache.
 
     Examples:
         .. code-block:: python
@@ -67,6 +69,7 @@ class SolidDefinition(object):
         config_field=None,
         description=None,
         metadata=None,
+        version=None,
     ):
         self.name = check_valid_name(name)
         self.input_defs = check.list_param(inputs, 'inputs', InputDefinition)
@@ -75,6 +78,7 @@ class SolidDefinition(object):
         self.description = check.opt_str_param(description, 'description')
         self.config_field = check_opt_field_param(config_field, 'config_field')
         self.metadata = check.opt_dict_param(metadata, 'metadata', key_type=str)
+        self.version = check.opt_str_param(version, 'version')
         self._input_dict = {inp.name: inp for inp in inputs}
         self._output_dict = {output.name: output for output in outputs}
 
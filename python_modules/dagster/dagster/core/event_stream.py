@@ -0,0 +1,315 @@
+'''
+A compact binary encoding for streams of EventRecords, used for event logs on disk and to send
+events between processes.
+
+A stream is a sequence of frames, each a one byte kind and a four byte length followed by that
+many bytes of payload:
+
+- String frames define the next entry of the string table of the stream. The run id, event type,
+  pipeline, step and solid names of events are written once, as strings, and referred to by
+  their index in the table afterwards.
+- Event frames hold the fields of a record of one of the EventRecord classes of
+  dagster.core.events, packed with struct.
+- Pickle frames hold any other object, including records of other subclasses of EventRecord.
+
+Frames are self-delimiting, so a reader can skip the events before a cursor by their length,
+without decoding them.
+'''
+
+import os
+import pickle
+import struct
+
+from dagster import check
+
+from dagster.utils.error import SerializableErrorInfo
+
+from .events import (
+    EventType,
+    ExecutionStepEventRecord,
+    ExecutionStepSuccessRecord,
+    LogMessageRecord,
+    PipelineEventRecord,
+)
+
+STRING_FRAME = 1
+EVENT_FRAME = 2
+PICKLE_FRAME = 3
+
+# Readable by both Python 2 and 3
+PICKLE_PROTOCOL = 2
+
+_FRAME_HEADER = struct.Struct('>BI')
+_LENGTH = struct.Struct('>I')
+_BASE_FIELDS = struct.Struct('>BHdII')
+_STRING_ID = struct.Struct('>I')
+_STEP_FIELDS = struct.Struct('>IIII')
+_SUCCESS_FIELDS = struct.Struct('>dd')
+
+_LOG_MESSAGE_RECORD = 0
+_PIPELINE_RECORD = 1
+_STEP_RECORD = 2
+_STEP_SUCCESS_RECORD = 3
+
+_RECORD_TAGS = {
+    LogMessageRecord: _LOG_MESSAGE_RECORD,
+    PipelineEventRecord: _PIPELINE_RECORD,
+    ExecutionStepEventRecord: _STEP_RECORD,
+    ExecutionStepSuccessRecord: _STEP_SUCCESS_RECORD,
+}
+
+
+def _frame(kind, payload):
+    return _FRAME_HEADER.pack(kind, len(payload)) + payload
+
+
+def _pack_text(text, parts):
+    data = text.encode('utf-8')
+    parts.append(_LENGTH.pack(len(data)))
+    parts.append(data)
+
+
+def _unpack_text(payload, offset):
+    (length,) = _LENGTH.unpack_from(payload, offset)
+    offset += _LENGTH.size
+    return payload[offset : offset + length].decode('utf-8'), offset + length
+
+
+class EventStreamEncoder(object):
+    '''
+    Encodes objects as frames of an event stream. An encoder interns the strings of the events
+    it encodes, so all the frames it returns must reach the same EventStreamDecoder, in order.
+
+    Args:
+        strings (Optional[List[str]]): The string table of an existing stream, e.g. the
+            strings of an EventLogReader, for an encoder that continues it.
+    '''
+
+    def __init__(self, strings=None):
+        self._string_ids = {
+            string: string_id
+            for string_id, string in enumerate(check.opt_list_param(strings, 'strings', str))
+        }
+
+    def encode(self, obj):
+        '''Returns the frames, as bytes, that the decoder of the stream decodes back into obj.'''
+        tag = _RECORD_TAGS.get(type(obj))
+        if tag is None:
+            return _frame(PICKLE_FRAME, pickle.dumps(obj, PICKLE_PROTOCOL))
+
+        string_frames = []
+        payload = self._encode_event(tag, obj, string_frames)
+        string_frames.append(_frame(EVENT_FRAME, payload))
+        return b''.join(string_frames)
+
+    def _intern(self, string, string_frames):
+        string_id = self._string_ids.get(string)
+        if string_id is None:
+            string_id = len(self._string_ids)
+            self._string_ids[string] = string_id
+            string_frames.append(_frame(STRING_FRAME, string.encode('utf-8')))
+        return string_id
+
+    def _encode_event(self, tag, event, string_frames):
+        parts = [
+            _BASE_FIELDS.pack(
+                tag,
+                event.level,
+                event.timestamp,
+                self._intern(event.event_type.value, string_frames),
+                self._intern(event.run_id, string_frames),
+            )
+        ]
+        _pack_text(event.message, parts)
+        _pack_text(event.user_message, parts)
+
+        if event.error_info is None:
+            parts.append(b'\x00')
+        else:
+            parts.append(b'\x01')
+            _pack_text(event.error_info.message, parts)
+            parts.append(_LENGTH.pack(len(event.error_info.stack)))
+            for line in event.error_info.stack:
+                _pack_text(line, parts)
+
+        if tag == _PIPELINE_RECORD:
+            parts.append(_STRING_ID.pack(self._intern(event.pipeline_name, string_frames)))
+        elif tag in (_STEP_RECORD, _STEP_SUCCESS_RECORD):
+            parts.append(
+                _STEP_FIELDS.pack(
+                    self._intern(event.step_key, string_frames),
+                    self._intern(event.pipeline_name, string_frames),
+                    self._intern(event.solid_name, string_frames),
+                    self._intern(event.solid_definition_name, string_frames),
+                )
+            )
+            if tag == _STEP_SUCCESS_RECORD:
+                parts.append(_SUCCESS_FIELDS.pack(event.millis, event.type_check_millis))
+
+        return b''.join(parts)
+
+
+class EventStreamDecoder(object):
+    '''Decodes the frames of an event stream, in the order they were encoded.'''
+
+    def __init__(self):
+        self._strings = []
+
+    @property
+    def strings(self):
+        '''The string table of the frames decoded so far.'''
+        return list(self._strings)
+
+    def decode(self, data):
+        '''Returns the objects encoded in data, which must hold whole frames.'''
+        objs = []
+        offset = 0
+        while offset < len(data):
+            kind, length = _FRAME_HEADER.unpack_from(data, offset)
+            offset += _FRAME_HEADER.size
+            obj = self.decode_frame(kind, data[offset : offset + length])
+            offset += length
+            if kind != STRING_FRAME:
+                objs.append(obj)
+        return objs
+
+    def decode_frame(self, kind, payload):
+        '''Decodes the payload of one frame. String frames only extend the string table.'''
+        if kind == STRING_FRAME:
+            self._strings.append(payload.decode('utf-8'))
+            return None
+        if kind == PICKLE_FRAME:
+            return pickle.loads(payload)
+
+        check.invariant(kind == EVENT_FRAME, 'Unknown frame kind {kind}'.format(kind=kind))
+        return self._decode_event(payload)
+
+    def _decode_event(self, payload):
+        tag, level, timestamp, event_type_id, run_id_id = _BASE_FIELDS.unpack_from(payload, 0)
+        offset = _BASE_FIELDS.size
+        message, offset = _unpack_text(payload, offset)
+        user_message, offset = _unpack_text(payload, offset)
+
+        error_info = None
+        has_error_info = payload[offset : offset + 1] == b'\x01'
+        offset += 1
+        if has_error_info:
+            error_message, offset = _unpack_text(payload, offset)
+            (num_lines,) = _LENGTH.unpack_from(payload, offset)
+            offset += _LENGTH.size
+            stack = []
+            for _ in range(num_lines):
+                line, offset = _unpack_text(payload, offset)
+                stack.append(line)
+            error_info = SerializableErrorInfo(error_message, stack)
+
+        kwargs = dict(
+            error_info=error_info,
+            message=message,
+            level=level,
+            user_message=user_message,
+            event_type=EventType(self._strings[event_type_id]),
+            run_id=self._strings[run_id_id],
+            timestamp=timestamp,
+        )
+
+        if tag == _LOG_MESSAGE_RECORD:
+            return LogMessageRecord(**kwargs)
+
+        if tag == _PIPELINE_RECORD:
+            (pipeline_name_id,) = _STRING_ID.unpack_from(payload, offset)
+            return PipelineEventRecord(pipeline_name=self._strings[pipeline_name_id], **kwargs)
+
+        step_string_ids = _STEP_FIELDS.unpack_from(payload, offset)
+        kwargs.update(
+            zip(
+                ('step_key', 'pipeline_name', 'solid_name', 'solid_definition_name'),
+                (self._strings[string_id] for string_id in step_string_ids),
+            )
+        )
+        if tag == _STEP_RECORD:
+            return ExecutionStepEventRecord(**kwargs)
+
+        check.invariant(tag == _STEP_SUCCESS_RECORD, 'Unknown record tag {tag}'.format(tag=tag))
+        millis, type_check_millis = _SUCCESS_FIELDS.unpack_from(
+            payload, offset + _STEP_FIELDS.size
+        )
+        return ExecutionStepSuccessRecord(
+            millis=millis, type_check_millis=type_check_millis, **kwargs
+        )
+
+
+class EventLogReader(object):
+    '''
+    Reads the events of an event stream written to a file, e.g. the event log of a run, while it
+    may still be appended to.
+
+    The reader remembers the file offset of each event it has come across, and only scans what
+    was appended since its last read. Scanning decodes the string frames but skips over the
+    events, so reading the events after a cursor only decodes the events that are returned.
+    '''
+
+    def __init__(self, path):
+        self._path = check.str_param(path, 'path')
+        self._decoder = EventStreamDecoder()
+        self._event_offsets = []
+        self._scanned_offset = 0
+
+    def _scan(self):
+        try:
+            ff = open(self._path, 'rb')
+        except IOError:
+            # Nothing was written yet
+            return
+
+        with ff:
+            file_size = os.fstat(ff.fileno()).st_size
+            ff.seek(self._scanned_offset)
+            # Frames are only ever partially written at the end of the file
+            while self._scanned_offset + _FRAME_HEADER.size <= file_size:
+                kind, length = _FRAME_HEADER.unpack(ff.read(_FRAME_HEADER.size))
+                frame_end = self._scanned_offset + _FRAME_HEADER.size + length
+                if frame_end > file_size:
+                    break
+
+                if kind == STRING_FRAME:
+                    self._decoder.decode_frame(kind, ff.read(length))
+                else:
+                    self._event_offsets.append(self._scanned_offset)
+                    ff.seek(frame_end)
+
+                self._scanned_offset = frame_end
+
+    def count(self):
+        self._scan()
+        return len(self._event_offsets)
+
+    @property
+    def strings(self):
+        '''The string table of the stream, e.g. to continue it with an EventStreamEncoder.'''
+        self._scan()
+        return self._decoder.strings
+
+    def events_after(self, cursor, limit=None):
+        '''
+        Returns the events after the one at the cursor, i.e. at index cursor + 1 onwards, and at
+        most limit of them.
+        '''
+        check.int_param(cursor, 'cursor')
+        check.opt_int_param(limit, 'limit')
+
+        self._scan()
+        start = cursor + 1
+        end = None if limit is None else start + limit
+        offsets = self._event_offsets[start:end]
+        if not offsets:
+            return []
+
+        events = []
+        with open(self._path, 'rb') as ff:
+            for offset in offsets:
+                ff.seek(offset)
+                kind, length = _FRAME_HEADER.unpack(ff.read(_FRAME_HEADER.size))
+                events.append(self._decoder.decode_frame(kind, ff.read(length)))
+        return events
+
@@ -2,6 +2,7 @@ from enum import Enum
 import json
 
 from dagster import check
+from dagster.check import hot_path
 
 from dagster.utils.error import serializable_error_info_from_exc_info, SerializableErrorInfo
 
@@ -19,12 +20,15 @@ class EventType(Enum):
     PIPELINE_SUCCESS = 'PIPELINE_SUCCESS'
     PIPELINE_FAILURE = 'PIPELINE_FAILURE'
 
+    PIPELINE_PROCESS_QUEUED = 'PIPELINE_PROCESS_QUEUED'
     PIPELINE_PROCESS_START = 'PIPELINE_PROCESS_START'
     PIPELINE_PROCESS_STARTED = 'PIPELINE_PROCESS_STARTED'
 
     EXECUTION_PLAN_STEP_SUCCESS = 'EXECUTION_PLAN_STEP_SUCCESS'
     EXECUTION_PLAN_STEP_START = 'EXECUTION_PLAN_STEP_START'
     EXECUTION_PLAN_STEP_FAILURE = 'EXECUTION_PLAN_STEP_FAILURE'
+    EXECUTION_PLAN_STEP_CACHE_HIT = 'EXECUTION_PLAN_STEP_CACHE_HIT'
+    EXECUTION_PLAN_STEP_CACHE_MISS = 'EXECUTION_PLAN_STEP_CACHE_MISS'
 
     UNCATEGORIZED = 'UNCATEGORIZED'
 
@@ -66,9 +70,10 @@ class ExecutionEvents:
             step_key=step_key,
         )
 
-    def execution_plan_step_success(self, step_key, millis):
+    def execution_plan_step_success(self, step_key, millis, type_check_millis=0.0):
         check.str_param(step_key, 'step_key')
         check.float_param(millis, 'millis')
+        check.float_param(type_check_millis, 'type_check_millis')
 
         self.context.info(
             'Execution of {step_key} succeeded in {millis}'.format(
@@ -76,6 +81,7 @@ class ExecutionEvents:
             ),
             event_type=EventType.EXECUTION_PLAN_STEP_SUCCESS.value,
             millis=millis,
+            type_check_millis=type_check_millis,
             step_key=step_key,
         )
 
@@ -85,8 +91,27 @@ class ExecutionEvents:
             'Execution of {step_key} failed'.format(step_key=step_key),
             event_type=EventType.EXECUTION_PLAN_STEP_FAILURE.value,
             step_key=step_key,
-            # We really need a better serialization story here
-            error_info=json.dumps(serializable_error_info_from_exc_info(exc_info)),
+            error_info=serializable_error_info_from_exc_info(exc_info),
+        )
+
+    def execution_plan_step_cache_hit(self, step_key, cache_key):
+        check.str_param(step_key, 'step_key')
+        check.str_param(cache_key, 'cache_key')
+        self.context.info(
+            'Loaded outputs of {step_key} from the step cache'.format(step_key=step_key),
+            event_type=EventType.EXECUTION_PLAN_STEP_CACHE_HIT.value,
+            step_key=step_key,
+            cache_key=cache_key,
+        )
+
+    def execution_plan_step_cache_miss(self, step_key, cache_key):
+        check.str_param(step_key, 'step_key')
+        check.str_param(cache_key, 'cache_key')
+        self.context.info(
+            'No outputs for {step_key} in the step cache'.format(step_key=step_key),
+            event_type=EventType.EXECUTION_PLAN_STEP_CACHE_MISS.value,
+            step_key=step_key,
+            cache_key=cache_key,
         )
 
     def pipeline_name(self):
@@ -111,18 +136,52 @@ def construct_event_type(event_type):
     return EventType(event_type) if valid_event_type(event_type) else EventType.UNCATEGORIZED
 
 
+def structured_message(props):
+    '''
+    Renders the structured props of a message, including its orig_message, as the
+    semi-structured key=value message that loggers receive.
+    '''
+    return ' '.join(
+        ['{key}={value}'.format(key=key, value=json.dumps(value)) for key, value in props.items()]
+    )
+
+
 class EventRecord(object):
-    def __init__(self, error_info, message, level, user_message, event_type, run_id, timestamp):
-        self._error_info = check.opt_inst_param(error_info, 'error_info', SerializableErrorInfo)
-        self._message = check.str_param(message, 'message')
+    '''
+    Records built directly from the structured props of a message, see
+    construct_event_record_from_props, are given the props instead of the message, which is
+    only rendered from them if it is asked for.
+    '''
+
+    def __init__(
+        self,
+        error_info,
+        message,
+        level,
+        user_message,
+        event_type,
+        run_id,
+        timestamp,
+        message_props=None,
+    ):
+        self._error_info = hot_path.opt_inst_param(error_info, 'error_info', SerializableErrorInfo)
+        if message is None:
+            self._message = None
+            self._message_props = hot_path.dict_param(message_props, 'message_props')
+        else:
+            self._message = hot_path.str_param(message, 'message')
+            self._message_props = None
         self._level = check_valid_level_param(level)
-        self._user_message = check.str_param(user_message, 'user_message')
-        self._event_type = check.inst_param(event_type, 'event_type', EventType)
-        self._run_id = check.str_param(run_id, 'run_id')
-        self._timestamp = check.float_param(timestamp, 'timestamp')
+        self._user_message = hot_path.str_param(user_message, 'user_message')
+        self._event_type = hot_path.inst_param(event_type, 'event_type', EventType)
+        self._run_id = hot_path.str_param(run_id, 'run_id')
+        self._timestamp = hot_path.float_param(timestamp, 'timestamp')
 
     @property
     def message(self):
+        if self._message is None:
+            self._message = structured_message(self._message_props)
+            self._message_props = None
         return self._message
 
     @property
@@ -164,7 +223,7 @@ class EventRecord(object):
 class PipelineEventRecord(EventRecord):
     def __init__(self, pipeline_name, **kwargs):
         super(PipelineEventRecord, self).__init__(**kwargs)
-        self._pipeline_name = check.str_param(pipeline_name, 'pipeline_name')
+        self._pipeline_name = hot_path.str_param(pipeline_name, 'pipeline_name')
 
     @property
     def pipeline_name(self):
@@ -179,10 +238,10 @@ class PipelineEventRecord(EventRecord):
 class ExecutionStepEventRecord(EventRecord):
     def __init__(self, step_key, pipeline_name, solid_name, solid_definition_name, **kwargs):
         super(ExecutionStepEventRecord, self).__init__(**kwargs)
-        self._step_key = check.str_param(step_key, 'step_key')
-        self._pipeline_name = check.str_param(pipeline_name, 'pipeline_name')
-        self._solid_name = check.str_param(solid_name, 'solid_name')
-        self._solid_definition_name = check.str_param(
+        self._step_key = hot_path.str_param(step_key, 'step_key')
+        self._pipeline_name = hot_path.str_param(pipeline_name, 'pipeline_name')
+        self._solid_name = hot_path.str_param(solid_name, 'solid_name')
+        self._solid_definition_name = hot_path.str_param(
             solid_definition_name, 'solid_definition_name'
         )
 
@@ -216,17 +275,23 @@ class ExecutionStepEventRecord(EventRecord):
 
 
 class ExecutionStepSuccessRecord(ExecutionStepEventRecord):
-    def __init__(self, millis, **kwargs):
+    def __init__(self, millis, type_check_millis=0.0, **kwargs):
         super(ExecutionStepSuccessRecord, self).__init__(**kwargs)
-        self._millis = check.float_param(millis, 'millis')
+        self._millis = hot_path.float_param(millis, 'millis')
+        self._type_check_millis = hot_path.float_param(type_check_millis, 'type_check_millis')
 
     @property
     def millis(self):
         return self._millis
 
+    @property
+    def type_check_millis(self):
+        return self._type_check_millis
+
     def to_dict(self):
         orig = super(ExecutionStepSuccessRecord, self).to_dict()
         orig['millis'] = self.millis
+        orig['type_check_millis'] = self.type_check_millis
         return orig
 
 
@@ -238,6 +303,8 @@ EVENT_CLS_LOOKUP = {
     EventType.EXECUTION_PLAN_STEP_FAILURE: ExecutionStepEventRecord,
     EventType.EXECUTION_PLAN_STEP_START: ExecutionStepEventRecord,
     EventType.EXECUTION_PLAN_STEP_SUCCESS: ExecutionStepSuccessRecord,
+    EventType.EXECUTION_PLAN_STEP_CACHE_HIT: ExecutionStepEventRecord,
+    EventType.EXECUTION_PLAN_STEP_CACHE_MISS: ExecutionStepEventRecord,
     EventType.PIPELINE_FAILURE: PipelineEventRecord,
     EventType.PIPELINE_START: PipelineEventRecord,
     EventType.PIPELINE_SUCCESS: PipelineEventRecord,
@@ -247,14 +314,16 @@ EVENT_CLS_LOOKUP = {
 PIPELINE_EVENTS = {EventType.PIPELINE_FAILURE, EventType.PIPELINE_START, EventType.PIPELINE_SUCCESS}
 
 
-def construct_error_info(logger_message):
-    if 'error_info' not in logger_message.meta:
+def construct_error_info(meta):
+    if 'error_info' not in meta:
         return None
 
-    raw_error_info = logger_message.meta['error_info']
-
-    message, stack = json.loads(raw_error_info)
+    error_info = meta['error_info']
+    if isinstance(error_info, SerializableErrorInfo):
+        return error_info
 
+    # Error info that was logged already encoded
+    message, stack = json.loads(error_info)
     return SerializableErrorInfo(message, stack)
 
 
@@ -269,43 +338,60 @@ def is_pipeline_event_type(event_type):
     return issubclass(event_cls, PipelineEventRecord)
 
 
-def logger_to_kwargs(logger_message):
-    event_type = construct_event_type(logger_message.meta.get('event_type'))
+def props_to_kwargs(level, message, props, timestamp):
+    event_type = construct_event_type(props.get('event_type'))
 
     base_args = {
-        'message': logger_message.message,
-        'level': logger_message.level,
-        'user_message': logger_message.meta['orig_message'],
+        'message': message,
+        'message_props': None if message is not None else props,
+        'level': level,
+        'user_message': props['orig_message'],
         'event_type': event_type,
-        'run_id': logger_message.meta['run_id'],
-        'timestamp': logger_message.record.created,
+        'run_id': props['run_id'],
+        'timestamp': timestamp,
     }
 
     event_cls = EVENT_CLS_LOOKUP[event_type]
     if issubclass(event_cls, PipelineEventRecord):
-        return merge_two_dicts(base_args, {'pipeline_name': logger_message.meta['pipeline']})
+        return merge_two_dicts(base_args, {'pipeline_name': props['pipeline']})
     elif issubclass(event_cls, ExecutionStepEventRecord):
         step_args = {
-            'step_key': logger_message.meta['step_key'],
-            'pipeline_name': logger_message.meta['pipeline'],
-            'solid_name': logger_message.meta['solid'],
-            'solid_definition_name': logger_message.meta['solid_definition'],
+            'step_key': props['step_key'],
+            'pipeline_name': props['pipeline'],
+            'solid_name': props['solid'],
+            'solid_definition_name': props['solid_definition'],
         }
         if event_cls == ExecutionStepSuccessRecord:
-            step_args['millis'] = logger_message.meta['millis']
+            step_args['millis'] = props['millis']
+            step_args['type_check_millis'] = props.get('type_check_millis', 0.0)
 
         return merge_two_dicts(base_args, step_args)
     else:
         return base_args
 
 
+def construct_event_record_from_props(level, message, props, timestamp):
+    '''
+    Builds the typed record of a message logged by a RuntimeExecutionContext directly from its
+    structured props. This is how execution contexts deliver events to their event callback,
+    without going through the logging module. If message is None, it is rendered from the props
+    only when the message of the record is asked for, see structured_message.
+    '''
+    event_cls = EVENT_CLS_LOOKUP[construct_event_type(props.get('event_type'))]
+    return event_cls(
+        error_info=construct_error_info(props),
+        **props_to_kwargs(level, message, props, timestamp)
+    )
+
+
 def construct_event_record(logger_message):
     check.inst_param(logger_message, 'logger_message', StructuredLoggerMessage)
-    event_type = construct_event_type(logger_message.meta.get('event_type'))
-    log_record_cls = EVENT_CLS_LOOKUP[event_type]
-
-    kwargs = logger_to_kwargs(logger_message)
-    return log_record_cls(error_info=construct_error_info(logger_message), **kwargs)
+    return construct_event_record_from_props(
+        logger_message.level,
+        logger_message.message,
+        logger_message.meta,
+        logger_message.record.created,
+    )
 
 
 def construct_event_logger(event_record_callback):
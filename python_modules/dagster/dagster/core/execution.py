@@ -42,22 +42,31 @@ from .errors import DagsterInvariantViolationError, DagsterUserCodeExecutionErro
 
 from .types.evaluator import EvaluationError, evaluate_config_value, friendly_string_for_error
 
-from .events import construct_event_logger
-
 from .execution_plan.create import create_execution_plan_core, create_subplan
 
 from .execution_plan.objects import (
     ExecutionPlan,
     ExecutionPlanInfo,
     ExecutionPlanSubsetInfo,
+    StepOutputHandle,
     StepResult,
     StepTag,
 )
 
+from .execution_plan.intermediates import terminal_step_output_handles
+from .execution_plan.multiprocess_engine import execute_plan_multiprocess
+from .execution_plan.plan_cache import ExecutionPlanCache
 from .execution_plan.simple_engine import execute_plan_core
-
-from .system_config.objects import EnvironmentConfig
-from .system_config.types import construct_environment_config
+from .execution_plan.step_cache import StepCache
+from .execution_plan.thread_pool_engine import execute_plan_thread_pool
+
+from .system_config.objects import (
+    EnvironmentConfig,
+    IN_PROCESS_ENGINE,
+    MULTIPROCESS_ENGINE,
+    THREAD_POOL_ENGINE,
+)
+from .system_config.types import DEFAULT_MAX_WORKERS, construct_environment_config
 
 
 class PipelineExecutionResult(object):
@@ -175,7 +184,7 @@ class SolidExecutionResult(object):
         Returns None if execution result isn't a success.'''
         if self.success and self.transforms:
             return {
-                result.success_data.output_name: result.success_data.value
+                result.success_data.output_name: self._value_of(result)
                 for result in self.transforms
             }
         else:
@@ -196,7 +205,7 @@ class SolidExecutionResult(object):
         if self.success:
             for result in self.transforms:
                 if result.success_data.output_name == output_name:
-                    return result.success_data.value
+                    return self._value_of(result)
             raise DagsterInvariantViolationError(
                 (
                     'Did not find result {output_name} in solid {self.solid.name} '
@@ -206,6 +215,17 @@ class SolidExecutionResult(object):
         else:
             return None
 
+    def _value_of(self, result):
+        if result.success_data.value_released:
+            raise DagsterInvariantViolationError(
+                (
+                    'The value of output {output_name} of solid {solid_name} was released once '
+                    'the solids consuming it had run. Set '
+                    'execution.retain_intermediate_values to true to keep it.'
+                ).format(output_name=result.success_data.output_name, solid_name=self.solid.name)
+            )
+        return result.success_data.value
+
     def reraise_user_error(self):
         if not self.success:
             for result in itertools.chain(
@@ -227,6 +247,11 @@ class SolidExecutionResult(object):
                 return result.failure_data.dagster_error
 
 
+# Plans are shared by repeated launches of the same pipeline with the same environment, and
+# by dagit's plan previews
+EXECUTION_PLAN_CACHE = ExecutionPlanCache()
+
+
 def create_execution_plan(pipeline, env_config=None):
     check.inst_param(pipeline, 'pipeline', PipelineDefinition)
     check.opt_dict_param(env_config, 'env_config', key_type=str)
@@ -239,8 +264,13 @@ def create_execution_plan_with_typed_environment(pipeline, typed_environment):
     check.inst_param(pipeline, 'pipeline', PipelineDefinition)
     check.inst_param(typed_environment, 'environment', EnvironmentConfig)
 
-    with yield_context(pipeline, typed_environment) as context:
-        return create_execution_plan_core(ExecutionPlanInfo(context, pipeline, typed_environment))
+    def _create_plan():
+        with yield_context(pipeline, typed_environment) as context:
+            return create_execution_plan_core(
+                ExecutionPlanInfo(context, pipeline, typed_environment)
+            )
+
+    return EXECUTION_PLAN_CACHE.get_or_create(pipeline, typed_environment, _create_plan)
 
 
 def get_run_id(reentrant_info):
@@ -335,23 +365,17 @@ def yield_context(pipeline, environment, reentrant_info=None):
         with _create_resources(
             pipeline, context_definition, environment, execution_context, run_id
         ) as resources:
-            loggers = _create_loggers(reentrant_info, execution_context)
-
             yield RuntimeExecutionContext(
                 run_id=get_run_id(reentrant_info),
-                loggers=loggers,
+                loggers=execution_context.loggers,
                 resources=resources,
                 context_stack=get_context_stack(execution_context, reentrant_info),
+                log_value_summaries=environment.execution.log_value_summaries,
+                type_check_policy=environment.execution.type_check_policy,
+                event_callback=reentrant_info.event_callback if reentrant_info else None,
             )
 
 
-def _create_loggers(reentrant_info, execution_context):
-    if reentrant_info and reentrant_info.event_callback:
-        return execution_context.loggers + [construct_event_logger(reentrant_info.event_callback)]
-    else:
-        return execution_context.loggers
-
-
 @contextmanager
 def _create_resources(pipeline_def, context_def, environment, execution_context, run_id):
     if not context_def.resources:
@@ -401,8 +425,12 @@ def _do_iterate_pipeline(pipeline, context, typed_environment, throw_on_error=Tr
     with context.value('pipeline', pipeline.display_name):
         context.events.pipeline_start()
 
-        execution_plan = create_execution_plan_core(
-            ExecutionPlanInfo(context, pipeline, typed_environment)
+        execution_plan = EXECUTION_PLAN_CACHE.get_or_create(
+            pipeline,
+            typed_environment,
+            lambda: create_execution_plan_core(
+                ExecutionPlanInfo(context, pipeline, typed_environment)
+            ),
         )
 
         steps = list(execution_plan.topological_steps())
@@ -425,7 +453,9 @@ def _do_iterate_pipeline(pipeline, context, typed_environment, throw_on_error=Tr
         check.invariant(len(steps[0].step_inputs) == 0)
 
         for solid_result in _process_step_results(
-            context, pipeline, execute_plan_core(context, execution_plan)
+            context,
+            pipeline,
+            _execute_plan_with_engine(context, execution_plan, typed_environment),
         ):
             if throw_on_error and not solid_result.success:
                 solid_result.reraise_user_error()
@@ -440,6 +470,69 @@ def _do_iterate_pipeline(pipeline, context, typed_environment, throw_on_error=Tr
             context.events.pipeline_failure()
 
 
+def _execute_plan_with_engine(context, execution_plan, typed_environment):
+    check.inst_param(typed_environment, 'typed_environment', EnvironmentConfig)
+
+    execution_config = typed_environment.execution
+    engine = execution_config.engine
+
+    if execution_config.step_cache and engine.name != IN_PROCESS_ENGINE:
+        raise DagsterInvariantViolationError(
+            'The step cache is only supported by the {in_process} engine, not {name}'.format(
+                in_process=IN_PROCESS_ENGINE, name=engine.name
+            )
+        )
+
+    if engine.name == IN_PROCESS_ENGINE:
+        step_results = execute_plan_core(
+            context,
+            execution_plan,
+            step_cache=StepCache(
+                execution_config.step_cache.directory,
+                execution_config.step_cache.max_bytes,
+                typed_environment,
+            )
+            if execution_config.step_cache
+            else None,
+        )
+    elif engine.name == THREAD_POOL_ENGINE:
+        # The config scaffolder emits max_workers: 0, which means the default like a missing value
+        step_results = execute_plan_thread_pool(
+            context, execution_plan, max_workers=engine.config['max_workers'] or DEFAULT_MAX_WORKERS
+        )
+    elif engine.name == MULTIPROCESS_ENGINE:
+        # As above, max_workers: 0 means the default, the number of cores on the machine
+        step_results = execute_plan_multiprocess(
+            context, execution_plan, max_workers=engine.config.get('max_workers') or None
+        )
+    else:
+        check.failed('Unsupported execution engine {name}'.format(name=engine.name))
+
+    if execution_config.retain_intermediate_values:
+        return step_results
+
+    return _release_intermediate_values(execution_plan, step_results)
+
+
+def _release_intermediate_values(execution_plan, step_results):
+    '''
+    The engines drop intermediate values as soon as the steps consuming them have run, but the
+    StepResults handed back to the caller would otherwise keep every value of the run alive.
+    Only the values of outputs that no other solid consumes are kept in those.
+    '''
+    terminal_handles = terminal_step_output_handles(execution_plan)
+
+    for step_result in step_results:
+        if (
+            step_result.success
+            and StepOutputHandle(step_result.step, step_result.success_data.output_name)
+            not in terminal_handles
+        ):
+            yield step_result._replace(success_data=step_result.success_data.with_value_released())
+        else:
+            yield step_result
+
+
 def execute_pipeline_iterator(
     pipeline, environment=None, throw_on_error=True, reentrant_info=None, solid_subset=None
 ):
@@ -528,7 +621,9 @@ def execute_plan(pipeline, execution_plan, environment=None, subset_info=None, r
             if subset_info
             else execution_plan
         )
-        return list(execute_plan_core(context, plan_to_execute))
+        return list(
+            _execute_plan_with_engine(context, plan_to_execute, typed_environment)
+        )
 
 
 def execute_pipeline(
@@ -1,26 +1,65 @@
 import itertools
-import json
 import logging
+import os
+import threading
+import time
 import uuid
 
 from collections import namedtuple
 from contextlib import contextmanager
 
 from dagster import check
-from dagster.utils.logging import CompositeLogger, INFO, define_colored_console_logger
-
-from .events import ExecutionEvents
+from dagster.check import hot_path
+from dagster.utils.logging import (
+    CRITICAL,
+    DEBUG,
+    ERROR,
+    INFO,
+    WARNING,
+    CompositeLogger,
+    define_colored_console_logger,
+)
+
+from .events import ExecutionEvents, construct_event_record_from_props, structured_message
+from .types.runtime import TypeCheckPolicy
 
 Metric = namedtuple('Metric', 'context_dict metric_name value')
 
 
-def _kv_message(all_items):
-    return ' '.join(
-        ['{key}={value}'.format(key=key, value=json.dumps(value)) for key, value in all_items]
-    )
+DAGSTER_META_KEY = 'dagster_meta'
 
+LEVEL_FOR_METHOD = {
+    'debug': DEBUG,
+    'info': INFO,
+    'warning': WARNING,
+    'error': ERROR,
+    'critical': CRITICAL,
+}
 
-DAGSTER_META_KEY = 'dagster_meta'
+
+class _LogMessageIdSequence(object):
+    '''
+    Hands out log message ids that are unique without the cost of a uuid4 per message: a
+    random prefix drawn once per process followed by a monotonically increasing counter. The
+    prefix is redrawn in forked children so that they do not repeat their parent's ids.
+    '''
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._prefix = uuid.uuid4().hex
+        self._counter = itertools.count()
+
+    def next_id(self):
+        if os.getpid() != self._pid:
+            self._reset()
+
+        return '{prefix}-{count}'.format(prefix=self._prefix, count=next(self._counter))
+
+
+_LOG_MESSAGE_IDS = _LogMessageIdSequence()
 
 
 class ExecutionContext(namedtuple('_ExecutionContext', 'loggers resources context_stack')):
@@ -61,9 +100,38 @@ class RuntimeExecutionContext:
             then access during pipeline execution. This exists so that a user can
             inject their own objects into the context without having to subclass
             ExecutionContext.
+
+        log_value_summaries (bool):
+            Whether the framework includes a summary of each value that a step emits in its
+            log messages. See RuntimeType.summarize_value.
+
+        type_check_policy (TypeCheckPolicy):
+            How thoroughly the values that flow between steps are type checked, unless the
+            definitions of their inputs and outputs say otherwise. Defaults to full checks.
+
+        event_callback (Callable[[EventRecord], None]):
+            Receives an EventRecord for every message of the context, whatever the level of
+            its loggers. Records are built directly from the structured props of the message,
+            so that tools consuming events do not have to parse them back out of log records.
+            The callback is never invoked concurrently by the context and its forks, so it
+            does not need to be thread safe itself.
+
+        event_callback_lock (threading.Lock):
+            The lock event callback invocations are serialized on. Forks that share the event
+            callback of their context share its lock. Defaults to a new lock.
     '''
 
-    def __init__(self, run_id, loggers=None, resources=None, context_stack=None):
+    def __init__(
+        self,
+        run_id,
+        loggers=None,
+        resources=None,
+        context_stack=None,
+        log_value_summaries=True,
+        type_check_policy=None,
+        event_callback=None,
+        event_callback_lock=None,
+    ):
 
         if loggers is None:
             loggers = [define_colored_console_logger('dagster')]
@@ -72,12 +140,33 @@ class RuntimeExecutionContext:
         self.resources = resources
         self._run_id = check.str_param(run_id, 'run_id')
         self._context_stack = check.opt_dict_param(context_stack, 'context_stack')
+        self.log_value_summaries = check.bool_param(log_value_summaries, 'log_value_summaries')
+        self.type_check_policy = check.opt_inst_param(
+            type_check_policy, 'type_check_policy', TypeCheckPolicy, TypeCheckPolicy.full()
+        )
+        self._event_callback = check.opt_callable_param(event_callback, 'event_callback')
+        self._event_callback_lock = (
+            event_callback_lock if event_callback_lock is not None else threading.Lock()
+        )
         self.events = ExecutionEvents(self)
 
+    def _emit_event_record(self, record):
+        with self._event_callback_lock:
+            self._event_callback(record)
+
     def _log(self, method, orig_message, message_props):
-        check.str_param(method, 'method')
-        check.str_param(orig_message, 'orig_message')
-        check.dict_param(message_props, 'message_props')
+        hot_path.str_param(method, 'method')
+
+        level = LEVEL_FOR_METHOD[method]
+        is_logged = self._logger.isEnabledFor(level)
+
+        # Messages that no logger accepts and no event callback receives are dropped before
+        # any of the (comparatively expensive) structured props are built
+        if not is_logged and self._event_callback is None:
+            return
+
+        hot_path.str_param(orig_message, 'orig_message')
+        hot_path.dict_param(message_props, 'message_props')
 
         check.invariant(
             'extra' not in message_props, 'do not allow until explicit support is handled'
@@ -90,7 +179,7 @@ class RuntimeExecutionContext:
         check.invariant('message' not in message_props, 'message reserved value')
         check.invariant('log_message_id' not in message_props, 'log_message_id reserved value')
 
-        log_message_id = str(uuid.uuid4())
+        log_message_id = _LOG_MESSAGE_IDS.next_id()
 
         synth_props = {
             'orig_message': orig_message,
@@ -99,13 +188,11 @@ class RuntimeExecutionContext:
         }
 
         # We first generate all props for the purpose of producing the semi-structured
-        # log message via _kv_messsage
+        # log message via structured_message
         all_props = dict(
             itertools.chain(synth_props.items(), self._context_stack.items(), message_props.items())
         )
 
-        message_with_structured_props = _kv_message(all_props.items())
-
         # So here we use the arbitrary key DAGSTER_META_KEY to store a dictionary of
         # all the meta information that dagster injects into log message.
         # The python logging module, in its infinite wisdom, actually takes all the
@@ -114,9 +201,22 @@ class RuntimeExecutionContext:
         # collisions with internal variables of the LogRecord class.
         # See __init__.py:363 (makeLogRecord) in the python 3.6 logging module source
         # for the gory details.
-        getattr(self._logger, method)(
-            message_with_structured_props, extra={DAGSTER_META_KEY: all_props}
-        )
+        #
+        # The message is only rendered, json encoding every prop, for loggers. Event records
+        # render it from the props if and when their message is asked for.
+        message_with_structured_props = None
+        if is_logged:
+            message_with_structured_props = structured_message(all_props)
+            getattr(self._logger, method)(
+                message_with_structured_props, extra={DAGSTER_META_KEY: all_props}
+            )
+
+        if self._event_callback is not None:
+            self._emit_event_record(
+                construct_event_record_from_props(
+                    level, message_with_structured_props, all_props, time.time()
+                )
+            )
 
     def debug(self, msg, **kwargs):
         '''
@@ -214,6 +314,56 @@ class RuntimeExecutionContext:
             for key in ddict.keys():
                 self._context_stack.pop(key)
 
+    def forward_structured_message(self, level, message, meta, timestamp):
+        '''
+        Re-emits a message that was already adorned with structured props, e.g. by a
+        context in an engine worker process, on the loggers and to the event callback of this
+        context.
+        '''
+        check.int_param(level, 'level')
+        check.str_param(message, 'message')
+        check.dict_param(meta, 'meta')
+        check.float_param(timestamp, 'timestamp')
+
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, message, extra={DAGSTER_META_KEY: meta})
+
+        if self._event_callback is not None:
+            self._emit_event_record(
+                construct_event_record_from_props(level, message, meta, timestamp)
+            )
+
+    def fork(self, loggers=None, event_callback=None):
+        '''
+        Returns a context that shares the resources and run id of this context but owns a
+        copy of its context stack. Engines that execute steps concurrently give each step a
+        forked context, since the framework pushes per-step values (e.g. the solid name)
+        onto the stack while the step runs.
+
+        Args:
+            loggers (Optional[List[logging.Logger]]):
+                Loggers for the forked context. Defaults to the loggers of this context.
+            event_callback (Optional[Callable[[EventRecord], None]]):
+                Event callback for the forked context. Defaults to the callback of this context
+                unless loggers are given: engines that send the messages of a forked context
+                elsewhere, e.g. to another process, are responsible for its events as well.
+        '''
+        forked_event_callback = self._event_callback if loggers is None else event_callback
+        return RuntimeExecutionContext(
+            run_id=self._run_id,
+            loggers=self._logger.loggers if loggers is None else loggers,
+            resources=self.resources,
+            context_stack=dict(self._context_stack),
+            log_value_summaries=self.log_value_summaries,
+            type_check_policy=self.type_check_policy,
+            event_callback=forked_event_callback,
+            # Forks run concurrently, e.g. on the threads of an engine, and callbacks such as
+            # the run storage of dagit are not thread safe, so they are serialized on one lock
+            event_callback_lock=self._event_callback_lock
+            if forked_event_callback is self._event_callback
+            else None,
+        )
+
     @property
     def run_id(self):
         return self._run_id
@@ -186,7 +186,12 @@ def create_step_inputs(info, state, solid):
 
         state.steps.extend(subplan.steps)
         step_inputs.append(
-            StepInput(input_def.name, input_def.runtime_type, subplan.terminal_step_output_handle)
+            StepInput(
+                input_def.name,
+                input_def.runtime_type,
+                subplan.terminal_step_output_handle,
+                input_def.type_check_policy,
+            )
         )
 
     return step_inputs
@@ -229,7 +234,12 @@ def _create_new_steps_for_input(step, subset_info):
             new_steps.append(new_value_step)
 
             new_step_inputs.append(
-                StepInput(step_input.name, step_input.runtime_type, value_thunk_step_output_handle)
+                StepInput(
+                    step_input.name,
+                    step_input.runtime_type,
+                    value_thunk_step_output_handle,
+                    step_input.type_check_policy,
+                )
             )
         else:
             new_step_inputs.append(step_input)
@@ -27,6 +27,12 @@ EXPECTATION_INPUT = 'expectation_input'
 EXPECTATION_VALUE_OUTPUT = 'expectation_value'
 
 
+def _describe_value(context, inout_def, value):
+    if not context.log_value_summaries:
+        return ''
+    return ' on {value}'.format(value=inout_def.runtime_type.summarize_value(value))
+
+
 def _create_expectation_lambda(solid, inout_def, expectation_def, internal_output_name):
     check.inst_param(solid, 'solid', Solid)
     check.inst_param(inout_def, 'inout_def', (InputDefinition, OutputDefinition))
@@ -42,12 +48,16 @@ def _create_expectation_lambda(solid, inout_def, expectation_def, internal_outpu
             expt_result = expectation_def.expectation_fn(info, value)
             if expt_result.success:
                 context.debug(
-                    'Expectation {key} succeeded on {value}.'.format(key=step.key, value=value)
+                    'Expectation {key} succeeded{on_value}.'.format(
+                        key=step.key, on_value=_describe_value(context, inout_def, value)
+                    )
                 )
                 yield Result(output_name=internal_output_name, value=inputs[EXPECTATION_INPUT])
             else:
                 context.debug(
-                    'Expectation {key} failed on {value}.'.format(key=step.key, value=value)
+                    'Expectation {key} failed{on_value}.'.format(
+                        key=step.key, on_value=_describe_value(context, inout_def, value)
+                    )
                 )
                 raise DagsterExpectationFailedError(info, value)
 
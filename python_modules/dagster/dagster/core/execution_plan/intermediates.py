@@ -0,0 +1,95 @@
+from collections import defaultdict
+
+from dagster import check
+
+from .objects import ExecutionPlan, ExecutionStep, StepOutputHandle
+
+
+def _consumers_by_output_handle(execution_plan):
+    consumers = defaultdict(list)
+    for step in execution_plan.steps:
+        for step_input in step.step_inputs:
+            consumers[step_input.prev_output_handle].append(step)
+    return consumers
+
+
+class IntermediateStore(object):
+    '''
+    Holds the intermediate results of an executing plan, keyed by StepOutputHandle, only for
+    as long as they are needed. The number of consuming step inputs for every output is
+    computed from the plan up front. Outputs that nothing consumes are never stored, and an
+    output is dropped once its last consumer has run (or been skipped), so that peak memory
+    tracks the live frontier of the plan rather than everything it has produced.
+    '''
+
+    def __init__(self, execution_plan):
+        check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+        self._consumer_counts = {
+            handle: len(consumers)
+            for handle, consumers in _consumers_by_output_handle(execution_plan).items()
+        }
+        self._values = {}
+
+    def __contains__(self, step_output_handle):
+        return step_output_handle in self._values
+
+    def __getitem__(self, step_output_handle):
+        return self._values[step_output_handle]
+
+    def keys(self):
+        return self._values.keys()
+
+    def put(self, step_output_handle, value):
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+        if self._consumer_counts.get(step_output_handle):
+            self._values[step_output_handle] = value
+
+    def release_inputs(self, step):
+        '''
+        Called once step has run or been skipped. Returns the values that no remaining step
+        consumes, which are no longer held by the store.
+        '''
+        check.inst_param(step, 'step', ExecutionStep)
+
+        released = []
+        for step_input in step.step_inputs:
+            handle = step_input.prev_output_handle
+            self._consumer_counts[handle] -= 1
+            if not self._consumer_counts[handle] and handle in self._values:
+                released.append(self._values.pop(handle))
+        return released
+
+
+def terminal_step_output_handles(execution_plan):
+    '''
+    The outputs of the plan that no other solid consumes. Steps that the framework injects
+    for a solid (e.g. output expectations and the join that follows them) belong to the same
+    solid, so the transform output of a leaf solid is terminal even though those steps
+    consume it.
+    '''
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+
+    consumers = _consumers_by_output_handle(execution_plan)
+    memo = {}
+
+    def _is_terminal(handle):
+        if handle not in memo:
+            memo[handle] = all(
+                consumer.solid.name == handle.step.solid.name
+                and all(
+                    _is_terminal(StepOutputHandle(consumer, step_output.name))
+                    for step_output in consumer.step_outputs
+                )
+                for consumer in consumers[handle]
+            )
+        return memo[handle]
+
+    return set(
+        handle
+        for handle in (
+            StepOutputHandle(step, step_output.name)
+            for step in execution_plan.steps
+            for step_output in step.step_outputs
+        )
+        if _is_terminal(handle)
+    )
@@ -0,0 +1,280 @@
+'''
+An engine that executes each step of the plan in a pool of worker processes, so that
+CPU-bound solids are not serialized by the GIL.
+
+Steps themselves are never pickled: compute functions are typically closures. Instead the
+pool is forked after the plan is built, so every worker inherits the plan, the resources,
+and the context stack, and tasks only reference steps by key. Step inputs and outputs move
+between processes as files written with the runtime type's MarshallingStrategy (pickle
+by default). Log messages emitted in a worker are forwarded over a queue and re-emitted on
+the parent context, on the same channel as step completions, so the parent sees the events
+of a step in order and before its results.
+'''
+
+from collections import namedtuple
+import multiprocessing
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+
+from dagster import check
+
+from dagster.core.errors import DagsterUserCodeExecutionError
+from dagster.core.execution_context import RuntimeExecutionContext
+from dagster.core.types.marshal import DEFAULT_MARSHALLING_STRATEGY
+from dagster.utils.error import serializable_error_info_from_exc_info
+from dagster.utils.logging import DEBUG, define_structured_logger
+
+from .intermediates import IntermediateStore
+from .objects import (
+    ExecutionPlan,
+    StepFailureData,
+    StepOutputHandle,
+    StepResult,
+    StepSuccessData,
+)
+from .ready_queue import StepReadyQueue
+from .simple_engine import _all_inputs_covered, _log_inputs_not_covered, execute_step
+
+
+class ForwardedLogMessage(namedtuple('_ForwardedLogMessage', 'level message meta timestamp')):
+    pass
+
+
+class MarshalledStepResult(
+    namedtuple('_MarshalledStepResult', 'success output_name marshalled_path dagster_error')
+):
+    pass
+
+
+class StepOutputMarshalled(namedtuple('_StepOutputMarshalled', 'step_key marshalled_result')):
+    pass
+
+
+class StepProcessDone(namedtuple('_StepProcessDone', 'step_key error_info')):
+    pass
+
+
+def _marshalling_strategy_for(runtime_type):
+    return runtime_type.marshalling_strategy or DEFAULT_MARSHALLING_STRATEGY
+
+
+def _picklable_dagster_error(dagster_error):
+    if isinstance(dagster_error, DagsterUserCodeExecutionError) and dagster_error.original_exc_info:
+        # Tracebacks cannot cross the process boundary; keep the user exception so that
+        # reraise_user_error still raises it in the parent
+        exc_type, exc_value, _exc_tb = dagster_error.original_exc_info
+        dagster_error.original_exc_info = (exc_type, exc_value, None)
+
+    try:
+        pickle.dumps(dagster_error)
+        return dagster_error
+    except Exception:  # pylint: disable=W0703
+        return DagsterUserCodeExecutionError(str(dagster_error))
+
+
+# Populated in each worker process by _init_worker. Holds the forked execution plan and the
+# worker's execution context.
+_WORKER_STATE = {}
+
+
+def _init_worker(context, execution_plan, message_queue):
+    _WORKER_STATE['execution_plan'] = execution_plan
+    _WORKER_STATE['message_queue'] = message_queue
+    _WORKER_STATE['context'] = context.fork(
+        loggers=[
+            define_structured_logger(
+                'dagster-multiprocess-worker',
+                lambda logger_message: message_queue.put(
+                    ForwardedLogMessage(
+                        logger_message.level,
+                        logger_message.message,
+                        logger_message.meta,
+                        logger_message.record.created,
+                    )
+                ),
+                DEBUG,
+            )
+        ]
+    )
+
+
+def _execute_step_in_process(step_key, input_paths, marshal_dir):
+    execution_plan = _WORKER_STATE['execution_plan']
+    message_queue = _WORKER_STATE['message_queue']
+    context = _WORKER_STATE['context']
+
+    try:
+        step = execution_plan.get_step_by_key(step_key)
+
+        input_values = {}
+        for input_name, input_path in input_paths.items():
+            runtime_type = step.step_input_named(input_name).runtime_type
+            input_values[input_name] = _marshalling_strategy_for(runtime_type).unmarshal_value(
+                input_path
+            )
+
+        # Each output is sent to the parent as soon as it is yielded, so that the steps
+        # consuming it can be dispatched while this one is still running
+        for step_result in execute_step(step, context, input_values):
+            if step_result.success:
+                output_name = step_result.success_data.output_name
+                output_path = os.path.join(
+                    marshal_dir,
+                    '{step_key}.{output_name}'.format(step_key=step_key, output_name=output_name),
+                )
+                runtime_type = step.step_output_named(output_name).runtime_type
+                _marshalling_strategy_for(runtime_type).marshal_value(
+                    step_result.success_data.value, output_path
+                )
+                marshalled_result = MarshalledStepResult(True, output_name, output_path, None)
+            else:
+                dagster_error = _picklable_dagster_error(step_result.failure_data.dagster_error)
+                marshalled_result = MarshalledStepResult(False, None, None, dagster_error)
+            message_queue.put(StepOutputMarshalled(step_key, marshalled_result))
+
+        message_queue.put(StepProcessDone(step_key, None))
+    except:  # pylint: disable=W0702
+        message_queue.put(
+            StepProcessDone(step_key, serializable_error_info_from_exc_info(sys.exc_info()))
+        )
+
+
+def _unmarshal_step_result(step, marshalled_result):
+    if not marshalled_result.success:
+        return StepResult.failure_result(
+            step=step,
+            tag=step.tag,
+            failure_data=StepFailureData(dagster_error=marshalled_result.dagster_error),
+        )
+
+    runtime_type = step.step_output_named(marshalled_result.output_name).runtime_type
+    return StepResult.success_result(
+        step=step,
+        tag=step.tag,
+        success_data=StepSuccessData(
+            output_name=marshalled_result.output_name,
+            value=_marshalling_strategy_for(runtime_type).unmarshal_value(
+                marshalled_result.marshalled_path
+            ),
+        ),
+    )
+
+
+def _remove_marshalled_files(paths):
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _get_multiprocessing_context():
+    # Workers must be forked so that they inherit the plan, which cannot be pickled
+    if hasattr(multiprocessing, 'get_context'):
+        check.invariant(
+            'fork' in multiprocessing.get_all_start_methods(),
+            'The multiprocess engine requires the fork start method, which is not available '
+            'on this platform',
+        )
+        return multiprocessing.get_context('fork')
+    return multiprocessing
+
+
+def execute_plan_multiprocess(context, execution_plan, max_workers=None):
+    '''
+    Executes the plan on a pool of forked worker processes, kept warm for the whole plan.
+    Steps are dispatched as soon as every output they consume has been yielded. max_workers
+    defaults to the number of cores on the machine.
+
+    StepResults are yielded in the order they are produced.
+    '''
+    check.inst_param(context, 'context', RuntimeExecutionContext)
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.opt_int_param(max_workers, 'max_workers')
+    check.param_invariant(
+        max_workers is None or max_workers > 0, 'max_workers', 'Must use at least one worker'
+    )
+
+    mp_context = _get_multiprocessing_context()
+
+    context.debug(
+        'Entering multiprocess execution with {max_workers} workers. Order: {order}'.format(
+            max_workers=max_workers or multiprocessing.cpu_count(),
+            order=[step.key for step in execution_plan.topological_steps()],
+        )
+    )
+
+    # Maps StepOutputHandle to the path the output was marshalled to
+    intermediate_paths = IntermediateStore(execution_plan)
+    ready_queue = StepReadyQueue(execution_plan)
+    message_queue = mp_context.Queue()
+    marshal_dir = tempfile.mkdtemp(prefix='dagster_{run_id}_'.format(run_id=context.run_id))
+    in_flight = 0
+
+    pool = mp_context.Pool(
+        max_workers, initializer=_init_worker, initargs=(context, execution_plan, message_queue)
+    )
+    try:
+        while ready_queue.has_ready_steps() or in_flight:
+            while ready_queue.has_ready_steps():
+                step = ready_queue.pop_ready_step()
+                if not _all_inputs_covered(step, intermediate_paths):
+                    _log_inputs_not_covered(context, step, intermediate_paths)
+                    _remove_marshalled_files(intermediate_paths.release_inputs(step))
+                    ready_queue.mark_complete(step.key)
+                    continue
+
+                input_paths = {
+                    step_input.name: intermediate_paths[step_input.prev_output_handle]
+                    for step_input in step.step_inputs
+                }
+                pool.apply_async(_execute_step_in_process, (step.key, input_paths, marshal_dir))
+                in_flight += 1
+
+            if not in_flight:
+                break
+
+            message = message_queue.get()
+
+            if isinstance(message, ForwardedLogMessage):
+                context.forward_structured_message(
+                    message.level, message.message, message.meta, message.timestamp
+                )
+                continue
+
+            if isinstance(message, StepOutputMarshalled):
+                step = execution_plan.get_step_by_key(message.step_key)
+                marshalled_result = message.marshalled_result
+                yield _unmarshal_step_result(step, marshalled_result)
+                if marshalled_result.success:
+                    output_handle = StepOutputHandle(step, marshalled_result.output_name)
+                    intermediate_paths.put(output_handle, marshalled_result.marshalled_path)
+                    ready_queue.mark_output_available(output_handle)
+                continue
+
+            check.invariant(isinstance(message, StepProcessDone))
+            in_flight -= 1
+
+            if message.error_info:
+                check.failed(
+                    'Worker process failed executing step {step_key}: {message}{stack}'.format(
+                        step_key=message.step_key,
+                        message=message.error_info.message,
+                        stack=''.join(message.error_info.stack),
+                    )
+                )
+
+            step = execution_plan.get_step_by_key(message.step_key)
+            _remove_marshalled_files(intermediate_paths.release_inputs(step))
+            ready_queue.mark_complete(step.key)
+
+        pool.close()
+    except:  # pylint: disable=W0702
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+        shutil.rmtree(marshal_dir, ignore_errors=True)
@@ -3,19 +3,20 @@ from enum import Enum
 import toposort
 
 from dagster import check
+from dagster.check import hot_path
 from dagster.core.system_config.objects import EnvironmentConfig
 from dagster.core.definitions import PipelineDefinition, Solid
 from dagster.core.errors import DagsterError
 from dagster.core.execution_context import RuntimeExecutionContext
-from dagster.core.types.runtime import RuntimeType
+from dagster.core.types.runtime import RuntimeType, TypeCheckPolicy
 
 
 class StepOutputHandle(namedtuple('_StepOutputHandle', 'step output_name')):
     def __new__(cls, step, output_name):
         return super(StepOutputHandle, cls).__new__(
             cls,
-            step=check.inst_param(step, 'step', ExecutionStep),
-            output_name=check.str_param(output_name, 'output_name'),
+            step=hot_path.inst_param(step, 'step', ExecutionStep),
+            output_name=hot_path.str_param(output_name, 'output_name'),
         )
 
     # Make this hashable so it be a key in a dictionary
@@ -37,17 +38,24 @@ class StepOutputHandle(namedtuple('_StepOutputHandle', 'step output_name')):
         return self.step.key == other.step.key and self.output_name == other.output_name
 
 
-class StepSuccessData(namedtuple('_StepSuccessData', 'output_name value')):
-    def __new__(cls, output_name, value):
+class StepSuccessData(namedtuple('_StepSuccessData', 'output_name value value_released')):
+    def __new__(cls, output_name, value, value_released=False):
         return super(StepSuccessData, cls).__new__(
-            cls, output_name=check.str_param(output_name, 'output_name'), value=value
+            cls,
+            output_name=hot_path.str_param(output_name, 'output_name'),
+            value=value,
+            value_released=hot_path.bool_param(value_released, 'value_released'),
         )
 
+    def with_value_released(self):
+        '''A copy of this StepSuccessData that no longer references the value.'''
+        return StepSuccessData(output_name=self.output_name, value=None, value_released=True)
+
 
 class StepFailureData(namedtuple('_StepFailureData', 'dagster_error')):
     def __new__(cls, dagster_error):
         return super(StepFailureData, cls).__new__(
-            cls, dagster_error=check.inst_param(dagster_error, 'dagster_error', DagsterError)
+            cls, dagster_error=hot_path.inst_param(dagster_error, 'dagster_error', DagsterError)
         )
 
 
@@ -56,9 +64,9 @@ class StepResult(namedtuple('_StepResult', 'success step tag success_data failur
     def success_result(step, tag, success_data):
         return StepResult(
             success=True,
-            step=check.inst_param(step, 'step', ExecutionStep),
-            tag=check.inst_param(tag, 'tag', StepTag),
-            success_data=check.inst_param(success_data, 'success_data', StepSuccessData),
+            step=hot_path.inst_param(step, 'step', ExecutionStep),
+            tag=hot_path.inst_param(tag, 'tag', StepTag),
+            success_data=hot_path.inst_param(success_data, 'success_data', StepSuccessData),
             failure_data=None,
         )
 
@@ -66,10 +74,10 @@ class StepResult(namedtuple('_StepResult', 'success step tag success_data failur
     def failure_result(step, tag, failure_data):
         return StepResult(
             success=False,
-            step=check.inst_param(step, 'step', ExecutionStep),
-            tag=check.inst_param(tag, 'tag', StepTag),
+            step=hot_path.inst_param(step, 'step', ExecutionStep),
+            tag=hot_path.inst_param(tag, 'tag', StepTag),
             success_data=None,
-            failure_data=check.inst_param(failure_data, 'failure_data', StepFailureData),
+            failure_data=hot_path.inst_param(failure_data, 'failure_data', StepFailureData),
         )
 
 
@@ -84,24 +92,34 @@ class StepTag(Enum):
     VALUE_THUNK = 'VALUE_THUNK'
 
 
-class StepInput(namedtuple('_StepInput', 'name runtime_type prev_output_handle')):
-    def __new__(cls, name, runtime_type, prev_output_handle):
+class StepInput(
+    namedtuple('_StepInput', 'name runtime_type prev_output_handle type_check_policy')
+):
+    def __new__(cls, name, runtime_type, prev_output_handle, type_check_policy=None):
         return super(StepInput, cls).__new__(
             cls,
-            name=check.str_param(name, 'name'),
-            runtime_type=check.inst_param(runtime_type, 'runtime_type', RuntimeType),
-            prev_output_handle=check.inst_param(
+            name=hot_path.str_param(name, 'name'),
+            runtime_type=hot_path.inst_param(runtime_type, 'runtime_type', RuntimeType),
+            prev_output_handle=hot_path.inst_param(
                 prev_output_handle, 'prev_output_handle', StepOutputHandle
             ),
+            # None defers to the policy of the run
+            type_check_policy=hot_path.opt_inst_param(
+                type_check_policy, 'type_check_policy', TypeCheckPolicy
+            ),
         )
 
 
-class StepOutput(namedtuple('_StepOutput', 'name runtime_type')):
-    def __new__(cls, name, runtime_type):
+class StepOutput(namedtuple('_StepOutput', 'name runtime_type type_check_policy')):
+    def __new__(cls, name, runtime_type, type_check_policy=None):
         return super(StepOutput, cls).__new__(
             cls,
-            name=check.str_param(name, 'name'),
-            runtime_type=check.inst_param(runtime_type, 'runtime_type', RuntimeType),
+            name=hot_path.str_param(name, 'name'),
+            runtime_type=hot_path.inst_param(runtime_type, 'runtime_type', RuntimeType),
+            # None defers to the policy of the run
+            type_check_policy=hot_path.opt_inst_param(
+                type_check_policy, 'type_check_policy', TypeCheckPolicy
+            ),
         )
 
 
@@ -114,14 +132,14 @@ class ExecutionStep(
     def __new__(cls, key, step_inputs, step_outputs, compute_fn, tag, solid):
         return super(ExecutionStep, cls).__new__(
             cls,
-            key=check.str_param(key, 'key'),
-            step_inputs=check.list_param(step_inputs, 'step_inputs', of_type=StepInput),
+            key=hot_path.str_param(key, 'key'),
+            step_inputs=hot_path.list_param(step_inputs, 'step_inputs', of_type=StepInput),
             step_input_dict={si.name: si for si in step_inputs},
-            step_outputs=check.list_param(step_outputs, 'step_outputs', of_type=StepOutput),
+            step_outputs=hot_path.list_param(step_outputs, 'step_outputs', of_type=StepOutput),
             step_output_dict={so.name: so for so in step_outputs},
-            compute_fn=check.callable_param(compute_fn, 'compute_fn'),
-            tag=check.inst_param(tag, 'tag', StepTag),
-            solid=check.inst_param(solid, 'solid', Solid),
+            compute_fn=hot_path.callable_param(compute_fn, 'compute_fn'),
+            tag=hot_path.inst_param(tag, 'tag', StepTag),
+            solid=hot_path.inst_param(solid, 'solid', Solid),
         )
 
     def __getnewargs__(self):
@@ -196,6 +214,8 @@ class ExecutionPlan(object):
         )
         self.deps = check.dict_param(deps, 'deps', key_type=str, value_type=set)
         self.steps = list(step_dict.values())
+        # Plans are cached and executed many times, so the order is only computed once
+        self._topological_step_keys = None
 
     def get_step_by_key(self, key):
         return self.step_dict[key]
@@ -204,8 +224,9 @@ class ExecutionPlan(object):
         return list(self._topological_steps())
 
     def _topological_steps(self):
-        ordered_step_keys = toposort.toposort_flatten(self.deps)
-        for step_key in ordered_step_keys:
+        if self._topological_step_keys is None:
+            self._topological_step_keys = toposort.toposort_flatten(self.deps)
+        for step_key in self._topological_step_keys:
             yield self.step_dict[step_key]
 
 
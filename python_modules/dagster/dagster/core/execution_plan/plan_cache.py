@@ -0,0 +1,97 @@
+'''
+A bounded, in-memory cache of execution plans.
+
+Building a plan walks the pipeline in topological order and constructs every step, which adds
+up for large pipelines that are launched or previewed over and over with the same config. The
+steps of a plan only depend on the pipeline definition and the environment config it was
+built for, so plans are keyed by the identity of the pipeline and a fingerprint of the
+environment.
+
+The steps of a plan hold on to their pipeline, so the plans are stored on the pipeline itself,
+rather than in a mapping from pipelines to plans, which would keep every pipeline alive. Plans
+are collected along with their pipeline, e.g. the subset pipelines that dagit builds for every
+run of a subset of solids.
+'''
+
+from collections import OrderedDict
+import hashlib
+import pickle
+import threading
+import weakref
+
+from dagster import check
+
+from dagster.core.definitions import PipelineDefinition
+from dagster.core.system_config.objects import EnvironmentConfig
+
+from .objects import ExecutionPlan
+
+DEFAULT_MAX_CACHED_PLANS = 64
+
+
+def environment_fingerprint(environment):
+    '''
+    Returns None if the environment cannot be fingerprinted, e.g. because it holds config
+    values that cannot be pickled. Plans for such environments are not cached.
+    '''
+    check.inst_param(environment, 'environment', EnvironmentConfig)
+    try:
+        return hashlib.sha256(pickle.dumps(environment, protocol=2)).hexdigest()
+    except Exception:  # pylint: disable=W0703
+        return None
+
+
+class ExecutionPlanCache(object):
+    '''
+    Caches at most max_plans plans per pipeline, evicting the least recently used ones.
+    '''
+
+    def __init__(self, max_plans=DEFAULT_MAX_CACHED_PLANS):
+        self.max_plans = check.int_param(max_plans, 'max_plans')
+        self._pipelines = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(self._plans_of(pipeline)) for pipeline in self._pipelines)
+
+    def _plans_of(self, pipeline):
+        # pylint: disable=W0212
+        return pipeline._execution_plans.setdefault(self, OrderedDict())
+
+    def get_or_create(self, pipeline, environment, create_plan_fn):
+        '''
+        Returns the cached plan for the pipeline and environment, calling create_plan_fn to
+        build and cache it on a miss.
+        '''
+        check.inst_param(pipeline, 'pipeline', PipelineDefinition)
+        check.inst_param(environment, 'environment', EnvironmentConfig)
+        check.callable_param(create_plan_fn, 'create_plan_fn')
+
+        fingerprint = environment_fingerprint(environment)
+        if fingerprint is None:
+            return create_plan_fn()
+
+        with self._lock:
+            plans = self._plans_of(pipeline)
+            if fingerprint in plans:
+                plan = plans.pop(fingerprint)
+                plans[fingerprint] = plan
+                return plan
+
+        # Built outside of the lock; two threads racing on the same key both build a plan and
+        # the last one wins, which is harmless
+        plan = check.inst(create_plan_fn(), ExecutionPlan)
+
+        with self._lock:
+            self._pipelines.add(pipeline)
+            plans[fingerprint] = plan
+            while len(plans) > self.max_plans:
+                plans.popitem(last=False)
+
+        return plan
+
+    def clear(self):
+        with self._lock:
+            for pipeline in list(self._pipelines):
+                self._plans_of(pipeline).clear()
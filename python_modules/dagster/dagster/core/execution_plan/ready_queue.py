@@ -0,0 +1,63 @@
+from collections import defaultdict, deque
+
+from dagster import check
+
+from .objects import ExecutionPlan, StepOutputHandle
+
+
+class StepReadyQueue(object):
+    '''
+    Tracks which steps of an execution plan can run. A step becomes ready once every output
+    it consumes is available, or once the step producing an output it consumes has completed
+    without it. Engines that learn of outputs as they are yielded can so start downstream
+    steps before the upstream step is done. Steps that are ready at the same time come out in
+    the order they became ready.
+    '''
+
+    def __init__(self, execution_plan):
+        self._execution_plan = check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+
+        steps = execution_plan.topological_steps()
+        self._pending_outputs = {
+            step.key: set(step_input.prev_output_handle for step_input in step.step_inputs)
+            for step in steps
+        }
+
+        # Step keys of the consumers of each output
+        self._consumers = defaultdict(set)
+        # Outputs with consumers, by the key of the step producing them
+        self._consumed_outputs = defaultdict(set)
+        for step in steps:
+            for step_input in step.step_inputs:
+                output_handle = step_input.prev_output_handle
+                self._consumers[output_handle].add(step.key)
+                self._consumed_outputs[output_handle.step.key].add(output_handle)
+
+        self._ready = deque(step for step in steps if not self._pending_outputs[step.key])
+
+    def has_ready_steps(self):
+        return bool(self._ready)
+
+    def pop_ready_step(self):
+        return self._ready.popleft()
+
+    def mark_output_available(self, output_handle):
+        check.inst_param(output_handle, 'output_handle', StepOutputHandle)
+        self._resolve_outputs([output_handle])
+
+    def mark_complete(self, step_key):
+        '''Resolves the outputs of the step that have not been marked available.'''
+        check.str_param(step_key, 'step_key')
+        self._resolve_outputs(self._consumed_outputs[step_key])
+
+    def _resolve_outputs(self, output_handles):
+        newly_ready = set()
+        for output_handle in output_handles:
+            for step_key in self._consumers.pop(output_handle, ()):
+                pending = self._pending_outputs[step_key]
+                pending.discard(output_handle)
+                if not pending:
+                    newly_ready.add(step_key)
+
+        for step_key in sorted(newly_ready):
+            self._ready.append(self._execution_plan.get_step_by_key(step_key))
@@ -21,6 +21,8 @@ from dagster.core.errors import (
 
 from dagster.core.execution_context import RuntimeExecutionContext
 
+from .intermediates import IntermediateStore
+from .step_cache import StepCache
 from .objects import (
     ExecutionPlan,
     ExecutionStep,
@@ -38,42 +40,103 @@ def _all_inputs_covered(step, results):
     return True
 
 
-def execute_plan_core(context, execution_plan):
+def _log_inputs_not_covered(context, step, results):
+    result_keys = set(results.keys())
+    expected_outputs = [ni.prev_output_handle for ni in step.step_inputs]
+
+    context.debug(
+        'Not all inputs covered for {step}. Not executing.'.format(step=step.key)
+        + '\nKeys in result: {result_keys}.'.format(result_keys=result_keys)
+        + '\nOutputs need for inputs {expected_outputs}'.format(expected_outputs=expected_outputs)
+    )
+
+
+def _get_input_values(step, results):
+    input_values = {}
+    for step_input in step.step_inputs:
+        prev_output_handle = step_input.prev_output_handle
+        input_value = results[prev_output_handle].success_data.value
+        input_values[step_input.name] = input_value
+    return input_values
+
+
+def execute_plan_core(context, execution_plan, step_cache=None):
     check.inst_param(context, 'context', RuntimeExecutionContext)
     check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.opt_inst_param(step_cache, 'step_cache', StepCache)
     steps = list(execution_plan.topological_steps())
 
-    intermediate_results = {}
+    intermediate_results = IntermediateStore(execution_plan)
     context.debug(
         'Entering execute_steps loop. Order: {order}'.format(order=[step.key for step in steps])
     )
 
     for step in steps:
         if not _all_inputs_covered(step, intermediate_results):
-            result_keys = set(intermediate_results.keys())
-            expected_outputs = [ni.prev_output_handle for ni in step.step_inputs]
-
-            context.debug(
-                'Not all inputs covered for {step}. Not executing.'.format(step=step.key)
-                + '\nKeys in result: {result_keys}.'.format(result_keys=result_keys)
-                + '\nOutputs need for inputs {expected_outputs}'.format(
-                    expected_outputs=expected_outputs
-                )
-            )
+            _log_inputs_not_covered(context, step, intermediate_results)
+            intermediate_results.release_inputs(step)
             continue
 
-        input_values = {}
-        for step_input in step.step_inputs:
-            prev_output_handle = step_input.prev_output_handle
-            input_value = intermediate_results[prev_output_handle].success_data.value
-            input_values[step_input.name] = input_value
+        input_values = _get_input_values(step, intermediate_results)
+        intermediate_results.release_inputs(step)
 
-        for result in execute_step(step, context, input_values):
+        if step_cache and step_cache.is_cacheable(step):
+            step_results = _execute_step_with_cache(step_cache, step, context, input_values)
+        else:
+            step_results = execute_step(step, context, input_values)
+
+        for result in step_results:
             check.invariant(isinstance(result, StepResult))
             yield result
             if result.success:
                 output_handle = StepOutputHandle(step, result.success_data.output_name)
-                intermediate_results[output_handle] = result
+                intermediate_results.put(output_handle, result)
+
+
+def _execute_step_with_cache(step_cache, step, context, input_values):
+    cache_key = step_cache.cache_key(step, input_values)
+    if cache_key is None:
+        context.debug(
+            'Inputs of {step} cannot be fingerprinted. Not caching.'.format(step=step.key)
+        )
+        for step_result in execute_step(step, context, input_values):
+            yield step_result
+        return
+
+    # Cache events are step events, so they carry the same context values as the others
+    context_values = {'solid': step.solid.name, 'solid_definition': step.solid.definition.name}
+    with context.values(context_values):
+        with time_execution_scope() as timer_result:
+            cached_results = step_cache.get(step, cache_key)
+        if cached_results is not None:
+            # A hit is still a step that ran, just from the cache, so tools tracking the
+            # progress of the run see it start and succeed like any other
+            context.events.execution_plan_step_start(step.key)
+            context.events.execution_plan_step_cache_hit(step.key, cache_key)
+        else:
+            context.events.execution_plan_step_cache_miss(step.key, cache_key)
+
+    if cached_results is not None:
+        for step_result in cached_results:
+            yield step_result
+        with context.values(context_values):
+            context.events.execution_plan_step_success(step.key, timer_result.millis)
+        return
+
+    step_results = []
+    for step_result in execute_step(step, context, input_values):
+        step_results.append(step_result)
+        yield step_result
+
+    if all(step_result.success for step_result in step_results):
+        try:
+            step_cache.put(step, cache_key, step_results)
+        except Exception as e:  # pylint: disable=W0703
+            context.warning(
+                'Could not store outputs of {step} in the step cache: {error}'.format(
+                    step=step.key, error=e
+                )
+            )
 
 
 def execute_step(step, context, inputs):
@@ -83,13 +146,23 @@ def execute_step(step, context, inputs):
 
     try:
         for step_result in _execute_steps_core_loop(step, context, inputs):
-            context.info(
-                'Step {step} emitted {value} for output {output}'.format(
-                    step=step.key,
-                    value=repr(step_result.success_data.value),
-                    output=step_result.success_data.output_name,
+            if context.log_value_summaries:
+                output_name = step_result.success_data.output_name
+                context.info(
+                    'Step {step} emitted {value} for output {output}'.format(
+                        step=step.key,
+                        value=step.step_output_named(output_name).runtime_type.summarize_value(
+                            step_result.success_data.value
+                        ),
+                        output=output_name,
+                    )
+                )
+            else:
+                context.info(
+                    'Step {step} emitted output {output}'.format(
+                        step=step.key, output=step_result.success_data.output_name
+                    )
                 )
-            )
             yield step_result
     except DagsterError as dagster_error:
         context.error(str(dagster_error))
@@ -99,52 +172,53 @@ def execute_step(step, context, inputs):
         return
 
 
-def _error_check_results(step, results):
-    seen_outputs = set()
-    for result in results:
-        if not step.has_step_output(result.output_name):
-            output_names = list(
-                [output_def.name for output_def in step.solid.definition.output_defs]
-            )
-            raise DagsterInvariantViolationError(
-                '''Core transform for {step.solid.name} returned an output
-                {result.output_name} that does not exist. The available
-                outputs are {output_names}'''.format(
-                    step=step, result=result, output_names=output_names
-                )
+def _error_check_result(step, result, seen_outputs):
+    if not step.has_step_output(result.output_name):
+        output_names = list([output_def.name for output_def in step.solid.definition.output_defs])
+        raise DagsterInvariantViolationError(
+            '''Core transform for {step.solid.name} returned an output
+            {result.output_name} that does not exist. The available
+            outputs are {output_names}'''.format(
+                step=step, result=result, output_names=output_names
             )
+        )
 
-        if result.output_name in seen_outputs:
-            raise DagsterInvariantViolationError(
-                '''Core transform for {step.solid.name} returned an output
-                {result.output_name} multiple times'''.format(
-                    step=step, result=result
-                )
+    if result.output_name in seen_outputs:
+        raise DagsterInvariantViolationError(
+            '''Core transform for {step.solid.name} returned an output
+            {result.output_name} multiple times'''.format(
+                step=step, result=result
             )
+        )
 
-        seen_outputs.add(result.output_name)
+    seen_outputs.add(result.output_name)
 
 
 def _execute_steps_core_loop(step, context, inputs):
     evaluated_inputs = {}
     # do runtime type checks of inputs versus step inputs
-    for input_name, input_value in inputs.items():
-        evaluated_inputs[input_name] = _get_evaluated_input(step, input_name, input_value)
-
-    results = _compute_result_list(step, context, evaluated_inputs)
-
-    _error_check_results(step, results)
+    with time_execution_scope() as timer_result:
+        for input_name, input_value in inputs.items():
+            evaluated_inputs[input_name] = _get_evaluated_input(
+                step, context, input_name, input_value
+            )
 
-    return [_create_step_result(step, result) for result in results]
+    for step_result in _iterate_step_results(
+        step, context, evaluated_inputs, timer_result.millis
+    ):
+        yield step_result
 
 
-def _create_step_result(step, result):
+def _create_step_result(step, context, result):
     check.inst_param(result, 'result', Result)
 
     step_output = step.step_output_named(result.output_name)
+    type_check_policy = step_output.type_check_policy or context.type_check_policy
 
     try:
-        coerced_value = step_output.runtime_type.coerce_runtime_value(result.value)
+        coerced_value = type_check_policy.coerce_runtime_value(
+            step_output.runtime_type, result.value
+        )
     except DagsterRuntimeCoercionError as e:
         raise DagsterInvariantViolationError(
             '''Solid {step.solid.name} output name {output_name} output {result.value}
@@ -160,10 +234,11 @@ def _create_step_result(step, result):
     )
 
 
-def _get_evaluated_input(step, input_name, input_value):
+def _get_evaluated_input(step, context, input_name, input_value):
     step_input = step.step_input_named(input_name)
+    type_check_policy = step_input.type_check_policy or context.type_check_policy
     try:
-        return step_input.runtime_type.coerce_runtime_value(input_value)
+        return type_check_policy.coerce_runtime_value(step_input.runtime_type, input_value)
     except DagsterRuntimeCoercionError as evaluate_error:
         raise_from(
             DagsterTypeError(
@@ -179,22 +254,53 @@ def _get_evaluated_input(step, input_name, input_value):
         )
 
 
-def _compute_result_list(step, context, evaluated_inputs):
-    error_str = 'Error occured during step {key}'.format(key=step.key)
+_NO_MORE_RESULTS = object()
 
-    def_name = step.solid.definition.name
 
-    with context.values({'solid': step.solid.name, 'solid_definition': def_name}):
-        with _execution_step_error_boundary(context, step, error_str):
-            gen = step.compute_fn(context, step, evaluated_inputs)
+def _iterate_step_results(step, context, evaluated_inputs, type_check_millis):
+    '''
+    Yields a StepResult for each Result of the step's transform as soon as the transform yields
+    it, so that each output can be checked, coerced and handed downstream before the next one
+    is computed, rather than holding every output of the step in memory until the transform is
+    done. Outputs yielded before a failure have already been handed downstream.
 
-            if gen is None:
-                check.invariant(not step.step_outputs)
-                return
+    The step is only timed over the time spent in the transform, not in the consumers of its
+    results. The time spent type checking its inputs and outputs is reported separately.
+    '''
+    error_str = 'Error occured during step {key}'.format(key=step.key)
+    context_values = {'solid': step.solid.name, 'solid_definition': step.solid.definition.name}
+
+    with context.values(context_values):
+        context.events.execution_plan_step_start(step.key)
 
-            results = list(gen)
+    results_iter = None
+    millis = 0.0
+    seen_outputs = set()
+    while True:
+        with context.values(context_values):
+            with _execution_step_error_boundary(context, step, error_str):
+                with time_execution_scope() as timer_result:
+                    if results_iter is None:
+                        results = step.compute_fn(context, step, evaluated_inputs)
+                        if results is None:
+                            check.invariant(not step.step_outputs)
+                            results = []
+                        # Compute functions may return any iterable, not only generators
+                        results_iter = iter(results)
+                    result = next(results_iter, _NO_MORE_RESULTS)
+                millis += timer_result.millis
+
+                if result is not _NO_MORE_RESULTS:
+                    _error_check_result(step, result, seen_outputs)
+                    with time_execution_scope() as type_check_timer_result:
+                        step_result = _create_step_result(step, context, result)
+                    type_check_millis += type_check_timer_result.millis
+
+            if result is _NO_MORE_RESULTS:
+                context.events.execution_plan_step_success(step.key, millis, type_check_millis)
+                return
 
-        return results
+        yield step_result
 
 
 @contextmanager
@@ -210,12 +316,8 @@ def _execution_step_error_boundary(context, step, msg, **kwargs):
     check.inst_param(context, 'context', RuntimeExecutionContext)
     check.str_param(msg, 'msg')
 
-    context.events.execution_plan_step_start(step.key)
     try:
-        with time_execution_scope() as timer_result:
-            yield
-
-        context.events.execution_plan_step_success(step.key, timer_result.millis)
+        yield
     except Exception as e:  # pylint: disable=W0703
         context.events.execution_plan_step_failure(step.key, sys.exc_info())
 
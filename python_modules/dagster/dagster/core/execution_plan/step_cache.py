@@ -0,0 +1,205 @@
+'''
+A content-addressed cache of transform step outputs, kept in a local directory.
+
+A step is looked up by a key derived from its solid's definition name and version, the
+solid's config, and a fingerprint of every input value. Only solids that declare a version
+are cached: without one there is no way to tell that the transform itself has changed.
+
+Steps with Stream inputs or outputs are never cached, since a stream can only be consumed once.
+
+Each entry is a directory named by its key, holding one file per output written with the
+output runtime type's MarshallingStrategy and a manifest of the outputs that were emitted.
+Once the cache outgrows max_bytes, least recently used entries are evicted.
+'''
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import uuid
+
+from dagster import check
+
+from dagster.core.system_config.objects import EnvironmentConfig
+from dagster.core.types.marshal import DEFAULT_MARSHALLING_STRATEGY
+
+from .objects import ExecutionStep, StepResult, StepSuccessData, StepTag
+
+MANIFEST_FILE_NAME = 'manifest.json'
+
+
+def _marshalling_strategy_for(runtime_type):
+    return runtime_type.marshalling_strategy or DEFAULT_MARSHALLING_STRATEGY
+
+
+def _contains_stream(runtime_type):
+    if runtime_type.is_stream:
+        return True
+    if runtime_type.is_list or runtime_type.is_nullable:
+        return _contains_stream(runtime_type.inner_type)
+    return False
+
+
+def _fingerprint_value(value):
+    # Values whose pickle is not stable across runs just miss the cache
+    return hashlib.sha256(pickle.dumps(value, protocol=2)).hexdigest()
+
+
+def _entry_size(entry_path):
+    return sum(
+        os.path.getsize(os.path.join(entry_path, file_name))
+        for file_name in os.listdir(entry_path)
+    )
+
+
+class StepCache(object):
+    def __init__(self, directory, max_bytes, environment):
+        self.directory = check.str_param(directory, 'directory')
+        self.max_bytes = check.int_param(max_bytes, 'max_bytes')
+        self.environment = check.inst_param(environment, 'environment', EnvironmentConfig)
+
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+    def is_cacheable(self, step):
+        check.inst_param(step, 'step', ExecutionStep)
+        if step.tag != StepTag.TRANSFORM or step.solid.definition.version is None:
+            return False
+
+        # Streams can only be consumed once, so they can neither be fingerprinted nor stored
+        return not any(
+            _contains_stream(step_io.runtime_type)
+            for step_io in step.step_inputs + step.step_outputs
+        )
+
+    def cache_key(self, step, input_values):
+        '''
+        Returns None if the step cannot be cached, e.g. because one of its input values cannot
+        be pickled to compute its fingerprint.
+        '''
+        check.inst_param(step, 'step', ExecutionStep)
+        check.dict_param(input_values, 'input_values', key_type=str)
+        check.invariant(self.is_cacheable(step))
+
+        solid_config = (
+            self.environment.solids[step.solid.name].config
+            if step.solid.name in self.environment.solids
+            else None
+        )
+
+        try:
+            input_fingerprints = {
+                input_name: _fingerprint_value(input_value)
+                for input_name, input_value in input_values.items()
+            }
+        except Exception:  # pylint: disable=W0703
+            return None
+
+        key_material = json.dumps(
+            {
+                'solid_definition': step.solid.definition.name,
+                'version': step.solid.definition.version,
+                'config': solid_config,
+                'inputs': input_fingerprints,
+            },
+            sort_keys=True,
+            default=repr,
+        )
+        return hashlib.sha256(key_material.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, cache_key):
+        return os.path.join(self.directory, cache_key)
+
+    def get(self, step, cache_key):
+        '''
+        Returns the StepResults stored for the key, or None on a miss.
+        '''
+        check.inst_param(step, 'step', ExecutionStep)
+        check.str_param(cache_key, 'cache_key')
+
+        entry_path = self._entry_path(cache_key)
+        manifest_path = os.path.join(entry_path, MANIFEST_FILE_NAME)
+        if not os.path.exists(manifest_path):
+            return None
+
+        with open(manifest_path, 'r') as ff:
+            output_names = json.load(ff)['outputs']
+
+        step_results = []
+        for output_name in output_names:
+            runtime_type = step.step_output_named(output_name).runtime_type
+            value = _marshalling_strategy_for(runtime_type).unmarshal_value(
+                os.path.join(entry_path, output_name)
+            )
+            step_results.append(
+                StepResult.success_result(
+                    step=step,
+                    tag=step.tag,
+                    success_data=StepSuccessData(output_name=output_name, value=value),
+                )
+            )
+
+        # The modification time of an entry tracks when it was last used
+        os.utime(entry_path, None)
+        return step_results
+
+    def put(self, step, cache_key, step_results):
+        check.inst_param(step, 'step', ExecutionStep)
+        check.str_param(cache_key, 'cache_key')
+        check.list_param(step_results, 'step_results', of_type=StepResult)
+        check.invariant(all(step_result.success for step_result in step_results))
+
+        entry_path = self._entry_path(cache_key)
+        if os.path.exists(entry_path):
+            return
+
+        # Written to a temporary directory and moved into place so that readers never see a
+        # partial entry
+        tmp_path = os.path.join(self.directory, '.tmp-{uuid}'.format(uuid=uuid.uuid4()))
+        os.makedirs(tmp_path)
+        try:
+            for step_result in step_results:
+                output_name = step_result.success_data.output_name
+                runtime_type = step.step_output_named(output_name).runtime_type
+                _marshalling_strategy_for(runtime_type).marshal_value(
+                    step_result.success_data.value, os.path.join(tmp_path, output_name)
+                )
+
+            with open(os.path.join(tmp_path, MANIFEST_FILE_NAME), 'w') as ff:
+                json.dump(
+                    {
+                        'outputs': [
+                            step_result.success_data.output_name for step_result in step_results
+                        ]
+                    },
+                    ff,
+                )
+
+            os.rename(tmp_path, entry_path)
+        except OSError:
+            # Another process stored the same entry first
+            if not os.path.exists(entry_path):
+                raise
+        finally:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+        self.evict()
+
+    def evict(self):
+        '''
+        Removes least recently used entries until the cache fits in max_bytes.
+        '''
+        entries = []
+        for entry_name in os.listdir(self.directory):
+            if entry_name.startswith('.'):
+                continue
+            entry_path = os.path.join(self.directory, entry_name)
+            entries.append((os.path.getmtime(entry_path), _entry_size(entry_path), entry_path))
+
+        total_bytes = sum(size for _mtime, size, _path in entries)
+        for _mtime, size, entry_path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            shutil.rmtree(entry_path, ignore_errors=True)
+            total_bytes -= size
@@ -0,0 +1,101 @@
+from multiprocessing.pool import ThreadPool
+import sys
+
+import six
+from six.moves import queue
+
+from dagster import check
+
+from dagster.core.execution_context import RuntimeExecutionContext
+
+from .intermediates import IntermediateStore
+from .objects import ExecutionPlan, StepOutputHandle, StepResult
+from .ready_queue import StepReadyQueue
+from .simple_engine import (
+    _all_inputs_covered,
+    _get_input_values,
+    _log_inputs_not_covered,
+    execute_step,
+)
+
+
+def _execute_step_in_thread(step, context, input_values, done_queue):
+    '''
+    Puts (step, step_result, None) on the done queue for every result of the step as soon as
+    it is yielded, then (step, None, exc_info) once the step is done.
+    '''
+    try:
+        for step_result in execute_step(step, context, input_values):
+            done_queue.put((step, step_result, None))
+        done_queue.put((step, None, None))
+    except:  # pylint: disable=W0702
+        # Framework errors are re-raised on the thread consuming the results
+        done_queue.put((step, None, sys.exc_info()))
+
+
+def execute_plan_thread_pool(context, execution_plan, max_workers):
+    '''
+    Executes the plan on a pool of max_workers threads. Rather than walking the plan in
+    topological order, steps are kept in a ready queue and dispatched as soon as every output
+    they consume has been yielded, so independent branches of the plan run concurrently and
+    downstream steps can start before every output of their upstream steps is in.
+
+    StepResults are yielded on the calling thread in the order they are produced.
+    '''
+    check.inst_param(context, 'context', RuntimeExecutionContext)
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.int_param(max_workers, 'max_workers')
+    check.param_invariant(max_workers > 0, 'max_workers', 'Must use at least one worker')
+
+    context.debug(
+        'Entering thread pool execution with {max_workers} workers. Order: {order}'.format(
+            max_workers=max_workers, order=[step.key for step in execution_plan.topological_steps()]
+        )
+    )
+
+    intermediate_results = IntermediateStore(execution_plan)
+    ready_queue = StepReadyQueue(execution_plan)
+    done_queue = queue.Queue()
+    in_flight = 0
+
+    pool = ThreadPool(max_workers)
+    try:
+        while ready_queue.has_ready_steps() or in_flight:
+            while ready_queue.has_ready_steps():
+                step = ready_queue.pop_ready_step()
+                if not _all_inputs_covered(step, intermediate_results):
+                    _log_inputs_not_covered(context, step, intermediate_results)
+                    intermediate_results.release_inputs(step)
+                    ready_queue.mark_complete(step.key)
+                    continue
+
+                input_values = _get_input_values(step, intermediate_results)
+                intermediate_results.release_inputs(step)
+                pool.apply_async(
+                    _execute_step_in_thread, (step, context.fork(), input_values, done_queue)
+                )
+                in_flight += 1
+
+            if not in_flight:
+                break
+
+            step, result, exc_info = done_queue.get()
+
+            if result is not None:
+                check.invariant(isinstance(result, StepResult))
+                yield result
+                if result.success:
+                    output_handle = StepOutputHandle(step, result.success_data.output_name)
+                    intermediate_results.put(output_handle, result)
+                    ready_queue.mark_output_available(output_handle)
+                continue
+
+            in_flight -= 1
+
+            if exc_info:
+                six.reraise(*exc_info)
+
+            ready_queue.mark_complete(step.key)
+    finally:
+        pool.close()
+        pool.join()
@@ -1,5 +1,5 @@
 from dagster import check
-from dagster.core.definitions import Result, Solid, TransformExecutionInfo
+from dagster.core.definitions import PipelineDefinition, Result, Solid, TransformExecutionInfo
 from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.execution_context import RuntimeExecutionContext
 
@@ -15,20 +15,30 @@ def create_transform_step(execution_info, solid, step_inputs, conf):
         key='{solid.name}.transform'.format(solid=solid),
         step_inputs=step_inputs,
         step_outputs=[
-            StepOutput(name=output_def.name, runtime_type=output_def.runtime_type)
+            StepOutput(
+                name=output_def.name,
+                runtime_type=output_def.runtime_type,
+                type_check_policy=output_def.type_check_policy,
+            )
             for output_def in solid.definition.output_defs
         ],
-        compute_fn=lambda context, step, inputs: _execute_core_transform(
-            execution_info, context, step, conf, inputs
-        ),
+        compute_fn=_create_transform_lambda(execution_info.pipeline, conf),
         tag=StepTag.TRANSFORM,
         solid=solid,
     )
 
 
-def _yield_transform_results(execution_info, context, step, conf, inputs):
+def _create_transform_lambda(pipeline, conf):
+    # Plans are cached across runs, so steps must not hold on to the context of the run that
+    # built them: only the pipeline is captured
+    return lambda context, step, inputs: _execute_core_transform(
+        pipeline, context, step, conf, inputs
+    )
+
+
+def _yield_transform_results(pipeline, context, step, conf, inputs):
     gen = step.solid.definition.transform_fn(
-        TransformExecutionInfo(context, conf, step.solid, execution_info.pipeline), inputs
+        TransformExecutionInfo(context, conf, step.solid, pipeline), inputs
     )
 
     if isinstance(gen, Result):
@@ -52,20 +62,32 @@ def _yield_transform_results(execution_info, context, step, conf, inputs):
                 ).format(result=repr(result), solid_name=step.solid.name)
             )
 
-        context.info(
-            'Solid {solid} emitted output "{output}" value {value}'.format(
-                solid=step.solid.name, output=result.output_name, value=repr(result.value)
+        # Unknown outputs are reported by the engine when the result reaches it
+        if context.log_value_summaries and step.has_step_output(result.output_name):
+            context.info(
+                'Solid {solid} emitted output "{output}" value {value}'.format(
+                    solid=step.solid.name,
+                    output=result.output_name,
+                    value=step.step_output_named(
+                        result.output_name
+                    ).runtime_type.summarize_value(result.value),
+                )
+            )
+        else:
+            context.info(
+                'Solid {solid} emitted output "{output}"'.format(
+                    solid=step.solid.name, output=result.output_name
+                )
             )
-        )
         yield result
 
 
-def _execute_core_transform(execution_info, context, step, conf, inputs):
+def _execute_core_transform(pipeline, context, step, conf, inputs):
     '''
     Execute the user-specified transform for the solid. Wrap in an error boundary and do
     all relevant logging and metrics tracking
     '''
-    check.inst_param(execution_info, 'execution_info', ExecutionPlanInfo)
+    check.inst_param(pipeline, 'pipeline', PipelineDefinition)
     check.inst_param(context, 'context', RuntimeExecutionContext)
     check.inst_param(step, 'step', ExecutionStep)
     check.dict_param(inputs, 'inputs', key_type=str)
@@ -74,10 +96,15 @@ def _execute_core_transform(execution_info, context, step, conf, inputs):
 
     context.debug('Executing core transform for solid {solid}.'.format(solid=solid.name))
 
-    all_results = list(_yield_transform_results(execution_info, context, step, conf, inputs))
+    # Results are passed on as they are yielded, rather than once the transform is done
+    num_results = 0
+    emitted_result_names = set()
+    for result in _yield_transform_results(pipeline, context, step, conf, inputs):
+        num_results += 1
+        emitted_result_names.add(result.output_name)
+        yield result
 
-    if len(all_results) != len(solid.definition.output_defs):
-        emitted_result_names = set([r.output_name for r in all_results])
+    if num_results != len(solid.definition.output_defs):
         solid_output_names = set([output_def.name for output_def in solid.definition.output_defs])
         omitted_outputs = solid_output_names.difference(emitted_result_names)
         context.info(
@@ -85,5 +112,3 @@ def _execute_core_transform(execution_info, context, step, conf, inputs):
                 solid=solid.name, outputs=repr(omitted_outputs)
             )
         )
-
-    return all_results
@@ -1,6 +1,7 @@
 from collections import namedtuple
 
 from dagster import check
+from dagster.core.types.runtime import TypeCheckPolicy
 
 DEFAULT_CONTEXT_NAME = 'default'
 
@@ -57,7 +58,57 @@ class ExpectationsConfig(namedtuple('_ExpecationsConfig', 'evaluate')):
         )
 
 
-class ExecutionConfig(namedtuple('_ExecutionConfig', '')):
-    def __new__(cls):
+IN_PROCESS_ENGINE = 'in_process'
+THREAD_POOL_ENGINE = 'thread_pool'
+MULTIPROCESS_ENGINE = 'multiprocess'
 
-        return super(ExecutionConfig, cls).__new__(cls)
+
+class EngineConfig(namedtuple('_EngineConfig', 'name config')):
+    def __new__(cls, name=None, config=None):
+        return super(EngineConfig, cls).__new__(
+            cls,
+            check.opt_str_param(name, 'name', IN_PROCESS_ENGINE),
+            check.opt_dict_param(config, 'config', key_type=str),
+        )
+
+
+class StepCacheConfig(namedtuple('_StepCacheConfig', 'directory max_bytes')):
+    def __new__(cls, directory, max_bytes):
+        return super(StepCacheConfig, cls).__new__(
+            cls,
+            directory=check.str_param(directory, 'directory'),
+            max_bytes=check.int_param(max_bytes, 'max_bytes'),
+        )
+
+
+class ExecutionConfig(
+    namedtuple(
+        '_ExecutionConfig',
+        'engine retain_intermediate_values step_cache log_value_summaries type_check_policy',
+    )
+):
+    def __new__(
+        cls,
+        engine=None,
+        retain_intermediate_values=True,
+        step_cache=None,
+        log_value_summaries=True,
+        type_check_policy=None,
+    ):
+        check.opt_inst_param(engine, 'engine', EngineConfig)
+
+        if engine is None:
+            engine = EngineConfig()
+
+        return super(ExecutionConfig, cls).__new__(
+            cls,
+            engine=engine,
+            retain_intermediate_values=check.bool_param(
+                retain_intermediate_values, 'retain_intermediate_values'
+            ),
+            step_cache=check.opt_inst_param(step_cache, 'step_cache', StepCacheConfig),
+            log_value_summaries=check.bool_param(log_value_summaries, 'log_value_summaries'),
+            type_check_policy=check.opt_inst_param(
+                type_check_policy, 'type_check_policy', TypeCheckPolicy, TypeCheckPolicy.full()
+            ),
+        )
@@ -12,19 +12,35 @@ from dagster.core.definitions import (
 )
 
 
-from dagster.core.types import Bool, Field, List, NamedDict, NamedSelector
+from dagster.core.types import Bool, Field, Int, List, NamedDict, NamedSelector, String
 from dagster.core.types.config import ConfigType, ConfigTypeAttributes
 from dagster.core.types.default_applier import apply_default_values
 from dagster.core.types.field_utils import check_opt_field_param, FieldImpl
+from dagster.core.types.runtime import (
+    DEFAULT_TYPE_CHECK_SAMPLE_SIZE,
+    FULL_TYPE_CHECK,
+    NO_TYPE_CHECK,
+    SAMPLED_TYPE_CHECK,
+    TypeCheckPolicy,
+)
 
 from .objects import (
     ContextConfig,
+    EngineConfig,
     EnvironmentConfig,
     ExecutionConfig,
     ExpectationsConfig,
     SolidConfig,
+    StepCacheConfig,
+    IN_PROCESS_ENGINE,
+    MULTIPROCESS_ENGINE,
+    THREAD_POOL_ENGINE,
 )
 
+DEFAULT_MAX_WORKERS = 4
+
+DEFAULT_STEP_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
 
 def SystemNamedDict(name, fields, description=None):
     return NamedDict(name, fields, description, ConfigTypeAttributes(is_system_config=True))
@@ -272,15 +288,109 @@ def define_solid_dictionary_cls(name, pipeline_def):
     return SystemNamedDict(name, fields)
 
 
+def define_engine_config_cls(name):
+    check.str_param(name, 'name')
+
+    return SystemNamedSelector(
+        name,
+        {
+            IN_PROCESS_ENGINE: Field(
+                SystemNamedDict('{name}.InProcess'.format(name=name), {}), is_optional=True
+            ),
+            THREAD_POOL_ENGINE: Field(
+                SystemNamedDict(
+                    '{name}.ThreadPool'.format(name=name),
+                    {
+                        'max_workers': Field(
+                            Int, is_optional=True, default_value=DEFAULT_MAX_WORKERS
+                        )
+                    },
+                ),
+                is_optional=True,
+            ),
+            MULTIPROCESS_ENGINE: Field(
+                SystemNamedDict(
+                    '{name}.Multiprocess'.format(name=name),
+                    # Defaults to the number of cores on the machine
+                    {'max_workers': Field(Int, is_optional=True)},
+                ),
+                is_optional=True,
+            ),
+        },
+    )
+
+
+def define_type_check_config_cls(name):
+    check.str_param(name, 'name')
+
+    return SystemNamedSelector(
+        name,
+        {
+            FULL_TYPE_CHECK: Field(
+                SystemNamedDict('{name}.Full'.format(name=name), {}), is_optional=True
+            ),
+            SAMPLED_TYPE_CHECK: Field(
+                SystemNamedDict(
+                    '{name}.Sampled'.format(name=name),
+                    {
+                        'sample_size': Field(
+                            Int, is_optional=True, default_value=DEFAULT_TYPE_CHECK_SAMPLE_SIZE
+                        )
+                    },
+                ),
+                is_optional=True,
+            ),
+            NO_TYPE_CHECK: Field(
+                SystemNamedDict('{name}.Off'.format(name=name), {}), is_optional=True
+            ),
+        },
+    )
+
+
 def define_execution_config_cls(name):
     check.str_param(name, 'name')
-    return NamedDict(name, {}, type_attributes=ConfigTypeAttributes(is_system_config=True))
+    return SystemNamedDict(
+        name,
+        fields={
+            'engine': Field(
+                define_engine_config_cls('{name}.Engine'.format(name=name)),
+                is_optional=True,
+                default_value={IN_PROCESS_ENGINE: {}},
+            ),
+            # When false, only the values of outputs that no other solid consumes are kept in
+            # the results of the run
+            'retain_intermediate_values': Field(Bool, is_optional=True, default_value=True),
+            'step_cache': Field(
+                SystemNamedDict(
+                    '{name}.StepCache'.format(name=name),
+                    {
+                        'directory': Field(String),
+                        'max_bytes': Field(
+                            Int, is_optional=True, default_value=DEFAULT_STEP_CACHE_MAX_BYTES
+                        ),
+                    },
+                ),
+                is_optional=True,
+            ),
+            # Whether the values emitted by steps are summarized in log messages. See
+            # RuntimeType.summarize_value
+            'log_value_summaries': Field(Bool, is_optional=True, default_value=True),
+            # How thoroughly values are checked against the runtime types of the inputs and
+            # outputs they flow through, unless their definitions say otherwise. See
+            # TypeCheckPolicy
+            'type_check': Field(
+                define_type_check_config_cls('{name}.TypeCheck'.format(name=name)),
+                is_optional=True,
+                default_value={FULL_TYPE_CHECK: {}},
+            ),
+        },
+    )
 
 
 def construct_environment_config(config_value):
     return EnvironmentConfig(
         solids=construct_solid_dictionary(config_value['solids']),
-        execution=ExecutionConfig(**config_value['execution']),
+        execution=construct_execution_config(config_value['execution']),
         expectations=ExpectationsConfig(**config_value['expectations']),
         context=construct_context_config(config_value['context']),
     )
@@ -293,6 +403,23 @@ def construct_context_config(config_value):
     )
 
 
+def construct_execution_config(config_value):
+    engine_name, engine_value = single_item(config_value['engine'])
+    step_cache_value = config_value.get('step_cache')
+    return ExecutionConfig(
+        engine=EngineConfig(name=engine_name, config=engine_value),
+        retain_intermediate_values=config_value['retain_intermediate_values'],
+        step_cache=StepCacheConfig(**step_cache_value) if step_cache_value else None,
+        log_value_summaries=config_value['log_value_summaries'],
+        type_check_policy=construct_type_check_policy(config_value['type_check']),
+    )
+
+
+def construct_type_check_policy(config_value):
+    mode, mode_value = single_item(config_value)
+    return TypeCheckPolicy(mode, **mode_value)
+
+
 def construct_solid_dictionary(solid_dict_value):
     return {
         key: SolidConfig(
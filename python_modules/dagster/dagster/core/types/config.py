@@ -40,6 +40,9 @@ class ConfigType(object):
             type_attributes, 'type_attributes', ConfigTypeAttributes
         )
 
+        # Compiled on first use by evaluate_config_value
+        self._compiled_evaluator = None
+
     __cache = {}
 
     @classmethod
@@ -13,7 +13,13 @@ def _create_object_type_class(**kwargs):
 
 
 def _decorate_as_dagster_type(
-    bare_cls, name, description, input_schema=None, output_schema=None, marshalling_strategy=None
+    bare_cls,
+    name,
+    description,
+    input_schema=None,
+    output_schema=None,
+    marshalling_strategy=None,
+    value_summary_fn=None,
 ):
     _ObjectType = _create_object_type_class(
         name=name,
@@ -22,6 +28,7 @@ def _decorate_as_dagster_type(
         input_schema=input_schema,
         output_schema=output_schema,
         marshalling_strategy=marshalling_strategy,
+        value_summary_fn=value_summary_fn,
     )
 
     type_inst = _ObjectType.inst()
@@ -71,6 +78,7 @@ def as_dagster_type(
     input_schema=None,
     output_schema=None,
     marshalling_strategy=None,
+    value_summary_fn=None,
 ):
     check.type_param(existing_type, 'existing_type')
     check.opt_str_param(name, 'name')
@@ -78,6 +86,7 @@ def as_dagster_type(
     check.opt_inst_param(input_schema, 'input_schema', InputSchema)
     check.opt_inst_param(output_schema, 'output_schema', OutputSchema)
     check.opt_inst_param(marshalling_strategy, 'marshalling_strategy', MarshallingStrategy)
+    check.opt_callable_param(value_summary_fn, 'value_summary_fn')
 
     if marshalling_strategy is None:
         marshalling_strategy = PickleMarshallingStrategy()
@@ -89,4 +98,5 @@ def as_dagster_type(
         input_schema=input_schema,
         output_schema=output_schema,
         marshalling_strategy=marshalling_strategy,
+        value_summary_fn=value_summary_fn,
     )
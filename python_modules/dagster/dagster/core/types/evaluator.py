@@ -4,13 +4,13 @@ from enum import Enum
 import six
 
 from dagster import check
+from dagster.check import hot_path
 
 from dagster.core.errors import DagsterError
 from dagster.utils import single_item
 
 from .config import ConfigType
-from .default_applier import apply_default_values
-from .field_utils import check_field_param
+from .field_utils import FieldImpl
 
 
 class DagsterEvaluationErrorReason(Enum):
@@ -23,7 +23,7 @@ class DagsterEvaluationErrorReason(Enum):
 class FieldNotDefinedErrorData(namedtuple('_FieldNotDefinedErrorData', 'field_name')):
     def __new__(cls, field_name):
         return super(FieldNotDefinedErrorData, cls).__new__(
-            cls, check.str_param(field_name, 'field_name')
+            cls, hot_path.str_param(field_name, 'field_name')
         )
 
 
@@ -31,8 +31,8 @@ class MissingFieldErrorData(namedtuple('_MissingFieldErrorData', 'field_name fie
     def __new__(cls, field_name, field_def):
         return super(MissingFieldErrorData, cls).__new__(
             cls,
-            check.str_param(field_name, 'field_name'),
-            check_field_param(field_def, 'field_def'),
+            hot_path.str_param(field_name, 'field_name'),
+            hot_path.inst_param(field_def, 'field_def', FieldImpl),
         )
 
 
@@ -40,16 +40,16 @@ class RuntimeMismatchErrorData(namedtuple('_RuntimeMismatchErrorData', 'config_t
     def __new__(cls, config_type, value_rep):
         return super(RuntimeMismatchErrorData, cls).__new__(
             cls,
-            check.inst_param(config_type, 'config_type', ConfigType),
-            check.str_param(value_rep, 'value_rep'),
+            hot_path.inst_param(config_type, 'config_type', ConfigType),
+            hot_path.str_param(value_rep, 'value_rep'),
         )
 
 
 class SelectorTypeErrorData(namedtuple('_SelectorTypeErrorData', 'dagster_type incoming_fields')):
     def __new__(cls, dagster_type, incoming_fields):
-        check.param_invariant(dagster_type.is_selector, 'dagster_type')
+        hot_path.param_invariant(dagster_type.is_selector, 'dagster_type')
         return super(SelectorTypeErrorData, cls).__new__(
-            cls, dagster_type, check.list_param(incoming_fields, 'incoming_fields', of_type=str)
+            cls, dagster_type, hot_path.list_param(incoming_fields, 'incoming_fields', of_type=str)
         )
 
 
@@ -65,8 +65,8 @@ class EvaluationStack(namedtuple('_EvaluationStack', 'config_type entries')):
     def __new__(cls, config_type, entries):
         return super(EvaluationStack, cls).__new__(
             cls,
-            check.inst_param(config_type, 'config_type', ConfigType),
-            check.list_param(entries, 'entries', of_type=EvaluationStackEntry),
+            hot_path.inst_param(config_type, 'config_type', ConfigType),
+            hot_path.list_param(entries, 'entries', of_type=EvaluationStackEntry),
         )
 
     @property
@@ -98,8 +98,8 @@ class EvaluationStackPathEntry(
     def __new__(cls, field_name, field_def):
         return super(EvaluationStackPathEntry, cls).__new__(
             cls,
-            check.str_param(field_name, 'field_name'),
-            check_field_param(field_def, 'field_def'),
+            hot_path.str_param(field_name, 'field_name'),
+            hot_path.inst_param(field_def, 'field_def', FieldImpl),
         )
 
     @property
@@ -111,10 +111,10 @@ class EvaluationStackListItemEntry(
     namedtuple('_EvaluationStackListItemEntry', 'config_type list_index'), EvaluationStackEntry
 ):
     def __new__(cls, config_type, list_index):
-        check.int_param(list_index, 'list_index')
-        check.param_invariant(list_index >= 0, 'list_index')
+        hot_path.int_param(list_index, 'list_index')
+        hot_path.param_invariant(list_index >= 0, 'list_index')
         return super(EvaluationStackListItemEntry, cls).__new__(
-            cls, check.inst_param(config_type, 'config_type', ConfigType), list_index
+            cls, hot_path.inst_param(config_type, 'config_type', ConfigType), list_index
         )
 
 
@@ -122,10 +122,10 @@ class EvaluationError(namedtuple('_EvaluationError', 'stack reason message error
     def __new__(cls, stack, reason, message, error_data):
         return super(EvaluationError, cls).__new__(
             cls,
-            check.inst_param(stack, 'stack', EvaluationStack),
-            check.inst_param(reason, 'reason', DagsterEvaluationErrorReason),
-            check.str_param(message, 'message'),
-            check.inst_param(error_data, 'error_data', ERROR_DATA_TYPES),
+            hot_path.inst_param(stack, 'stack', EvaluationStack),
+            hot_path.inst_param(reason, 'reason', DagsterEvaluationErrorReason),
+            hot_path.str_param(message, 'message'),
+            hot_path.inst_param(error_data, 'error_data', ERROR_DATA_TYPES),
         )
 
 
@@ -205,9 +205,9 @@ class EvaluateValueResult(namedtuple('_EvaluateValueResult', 'success value erro
     def __new__(cls, success, value, errors):
         return super(EvaluateValueResult, cls).__new__(
             cls,
-            check.bool_param(success, 'success'),
+            hot_path.bool_param(success, 'success'),
             value,
-            check.list_param(errors, 'errors', of_type=EvaluationError),
+            hot_path.list_param(errors, 'errors', of_type=EvaluationError),
         )
 
     def errors_at_level(self, *levels):
@@ -244,16 +244,270 @@ def hard_create_config_value(config_type, config_value):
 
 
 def evaluate_config_value(config_type, config_value):
+    '''
+    Validates the config value against the config type and applies the default values of the
+    type to it, in a single pass of the evaluator compiled for the type. The result is the
+    same as that of validate_config followed by apply_default_values.
+    '''
     check.inst_param(config_type, 'config_type', ConfigType)
-    errors = validate_config(config_type, config_value)
+
+    errors = []
+    value = get_compiled_evaluator(config_type)(config_value, (config_type,), errors)
     if errors:
         return EvaluateValueResult(success=False, value=None, errors=errors)
 
-    value = apply_default_values(config_type, config_value)
-
     return EvaluateValueResult(success=True, value=value, errors=[])
 
 
+## Compiled evaluators
+#
+# A compiled evaluator is a tree of closures that mirrors the config type, with everything
+# that only depends on the type (which kind of type it is, its fields and their stack entries)
+# looked up once, when the evaluator is compiled. Evaluators are called with the config value,
+# the path to the value and a list that errors are appended to, and return the value with
+# defaults applied. The result is only meaningful if no errors were appended.
+#
+# Paths are linked tuples that are only turned into an EvaluationStack when there is an error
+# to report: (config_type,) at the root, (parent, EvaluationStackPathEntry) for fields and
+# (parent, item_type, index) for list items.
+
+
+def get_compiled_evaluator(config_type):
+    '''Returns the evaluator of the config type, compiling it on first use.'''
+    check.inst_param(config_type, 'config_type', ConfigType)
+
+    # Config types do not change once constructed, so each is only compiled once
+    # pylint: disable=W0212
+    if config_type._compiled_evaluator is None:
+        config_type._compiled_evaluator = _compile_evaluator(config_type)
+    return config_type._compiled_evaluator
+
+
+def _stack_from_path(path):
+    entries = []
+    while len(path) > 1:
+        if len(path) == 2:
+            path, entry = path
+        else:
+            path, item_type, index = path
+            entry = EvaluationStackListItemEntry(item_type, index)
+        entries.append(entry)
+
+    return EvaluationStack(config_type=path[0], entries=list(reversed(entries)))
+
+
+def _compile_evaluator(config_type):
+    if config_type.is_scalar:
+        return _compile_scalar_evaluator(config_type)
+    elif config_type.is_any:
+        return lambda config_value, _path, _errors: config_value
+    elif config_type.is_selector:
+        return _compile_selector_evaluator(config_type)
+    elif config_type.is_composite:
+        return _compile_composite_evaluator(config_type)
+    elif config_type.is_list:
+        return _compile_list_evaluator(config_type)
+    elif config_type.is_nullable:
+        return _compile_nullable_evaluator(config_type)
+    elif config_type.is_enum:
+        return _compile_enum_evaluator(config_type)
+    else:
+        check.failed('Unsupported type {name}'.format(name=config_type.name))
+
+
+def _compile_scalar_evaluator(scalar_type):
+    is_valid = scalar_type.is_config_scalar_valid
+
+    def _evaluate_scalar(config_value, path, errors):
+        if not is_valid(config_value):
+            errors.append(
+                create_scalar_mismatch_error(scalar_type, _stack_from_path(path), config_value)
+            )
+        return config_value
+
+    return _evaluate_scalar
+
+
+def _compile_nullable_evaluator(nullable_type):
+    evaluate_inner = get_compiled_evaluator(nullable_type.inner_type)
+
+    def _evaluate_nullable(config_value, path, errors):
+        if config_value is None:
+            return None
+        return evaluate_inner(config_value, path, errors)
+
+    return _evaluate_nullable
+
+
+def _compile_enum_evaluator(enum_type):
+    def _evaluate_enum(config_value, path, errors):
+        if not isinstance(config_value, six.string_types):
+            errors.append(
+                create_type_mismatch_error(
+                    enum_type, _stack_from_path(path), config_value, 'enum', 'a string'
+                )
+            )
+            return None
+
+        if not enum_type.is_valid_config_enum_value(config_value):
+            errors.append(
+                create_enum_value_missing_error(enum_type, _stack_from_path(path), config_value)
+            )
+            return None
+
+        return enum_type.to_python_value(config_value)
+
+    return _evaluate_enum
+
+
+def _compile_list_evaluator(list_type):
+    item_type = list_type.inner_type
+    evaluate_item = get_compiled_evaluator(item_type)
+
+    def _evaluate_list(config_value, path, errors):
+        if not isinstance(config_value, list):
+            errors.append(
+                create_type_mismatch_error(
+                    list_type, _stack_from_path(path), config_value, 'list', 'a list'
+                )
+            )
+            return None
+
+        return [
+            evaluate_item(item, (path, item_type, index), errors)
+            for index, item in enumerate(config_value)
+        ]
+
+    return _evaluate_list
+
+
+def _compile_fields(config_type):
+    '''Returns (field_name, (field_def, stack entry, evaluator)) in the order of the fields.'''
+    return [
+        (
+            field_name,
+            (
+                field_def,
+                EvaluationStackPathEntry(field_name, field_def),
+                get_compiled_evaluator(field_def.config_type),
+            ),
+        )
+        for field_name, field_def in config_type.fields.items()
+    ]
+
+
+def _compile_selector_evaluator(selector_type):
+    compiled_fields = dict(_compile_fields(selector_type))
+
+    def _evaluate_selector(config_value, path, errors):
+        if config_value and not isinstance(config_value, dict):
+            errors.append(
+                create_type_mismatch_error(
+                    selector_type, _stack_from_path(path), config_value, 'selector', 'a dict'
+                )
+            )
+            return None
+
+        if config_value and len(config_value) > 1:
+            errors.append(
+                create_selector_multiple_fields_error(
+                    selector_type, _stack_from_path(path), config_value
+                )
+            )
+            return None
+
+        elif not config_value:
+            if len(compiled_fields) > 1:
+                errors.append(
+                    create_selector_unspecified_field_error(
+                        selector_type,
+                        _stack_from_path(path),
+                        'Must specify a field if more one defined.',
+                    )
+                )
+                return None
+
+            field_name, (field_def, _entry, _evaluate) = single_item(compiled_fields)
+            if not field_def.is_optional:
+                errors.append(
+                    create_selector_unspecified_field_error(
+                        selector_type, _stack_from_path(path), 'Must specify the required field.'
+                    )
+                )
+                return None
+
+            incoming_field_value = field_def.default_value if field_def.default_provided else None
+
+        else:
+            field_name, incoming_field_value = single_item(config_value)
+            if field_name not in compiled_fields:
+                errors.append(
+                    create_field_not_defined_error(
+                        selector_type,
+                        _stack_from_path(path),
+                        set(selector_type.fields.keys()),
+                        field_name,
+                    )
+                )
+                return None
+
+        _field_def, entry, evaluate_field = compiled_fields[field_name]
+        return {field_name: evaluate_field(incoming_field_value, (path, entry), errors)}
+
+    return _evaluate_selector
+
+
+def _compile_composite_evaluator(composite_type):
+    compiled_fields = _compile_fields(composite_type)
+    defined_fields = set(composite_type.fields.keys())
+
+    def _evaluate_composite(config_value, path, errors):
+        if config_value and not isinstance(config_value, dict):
+            errors.append(
+                create_type_mismatch_error(
+                    composite_type, _stack_from_path(path), config_value, 'composite', 'a dict'
+                )
+            )
+            return None
+
+        if not config_value:
+            config_value = {}
+        elif not defined_fields.issuperset(config_value):
+            # ASK: this can crash on user error
+            check.dict_param(config_value, 'incoming_value', key_type=str)
+            for received_field in set(config_value.keys()):
+                if received_field not in defined_fields:
+                    errors.append(
+                        create_field_not_defined_error(
+                            composite_type, _stack_from_path(path), defined_fields, received_field
+                        )
+                    )
+
+        processed_fields = {}
+        for field_name, (field_def, entry, evaluate_field) in compiled_fields:
+            if field_name in config_value:
+                processed_fields[field_name] = evaluate_field(
+                    config_value[field_name], (path, entry), errors
+                )
+
+            elif field_def.default_provided:
+                processed_fields[field_name] = field_def.default_value
+
+            elif not field_def.is_optional:
+                errors.append(
+                    create_missing_required_field_error(
+                        composite_type, _stack_from_path(path), defined_fields, field_name
+                    )
+                )
+
+        return processed_fields
+
+    return _evaluate_composite
+
+
+## Interpreted validation
+
+
 def validate_config(config_type, config_value):
     check.inst_param(config_type, 'config_type', ConfigType)
 
@@ -270,16 +524,7 @@ def _validate_config(config_type, config_value, stack):
 
     if config_type.is_scalar:
         if not config_type.is_config_scalar_valid(config_value):
-            yield EvaluationError(
-                stack=stack,
-                reason=DagsterEvaluationErrorReason.RUNTIME_TYPE_MISMATCH,
-                message='Value {value} is not valid for type {type_name}'.format(
-                    value=config_value, type_name=config_type.name
-                ),
-                error_data=RuntimeMismatchErrorData(
-                    config_type=config_type, value_rep=repr(config_value)
-                ),
-            )
+            yield create_scalar_mismatch_error(config_type, stack, config_value)
         return
 
     errors = []
@@ -313,34 +558,11 @@ def validate_enum_value(enum_type, config_value, stack):
     check.inst_param(stack, 'stack', EvaluationStack)
 
     if not isinstance(config_value, six.string_types):
-        yield EvaluationError(
-            stack=stack,
-            reason=DagsterEvaluationErrorReason.RUNTIME_TYPE_MISMATCH,
-            message='Value for enum type {type_name} must be a string got {value}'.format(
-                type_name=enum_type.name, value=config_value
-            ),
-            error_data=RuntimeMismatchErrorData(
-                config_type=enum_type, value_rep=repr(config_value)
-            ),
-        )
+        yield create_type_mismatch_error(enum_type, stack, config_value, 'enum', 'a string')
         return
 
     if not enum_type.is_valid_config_enum_value(config_value):
-        yield EvaluationError(
-            stack=stack,
-            reason=DagsterEvaluationErrorReason.RUNTIME_TYPE_MISMATCH,
-            message=(
-                'Value not in enum type {type_name}. Got: {value}. '
-                'Possible values: {possible_values}.'
-            ).format(
-                type_name=enum_type.name,
-                value=repr(config_value),
-                possible_values=enum_type.config_values,
-            ),
-            error_data=RuntimeMismatchErrorData(
-                config_type=enum_type, value_rep=repr(config_value)
-            ),
-        )
+        yield create_enum_value_missing_error(enum_type, stack, config_value)
         return
 
 
@@ -352,57 +574,25 @@ def validate_selector_config_value(selector_type, config_value, stack):
     check.inst_param(stack, 'stack', EvaluationStack)
 
     if config_value and not isinstance(config_value, dict):
-        yield EvaluationError(
-            stack=stack,
-            reason=DagsterEvaluationErrorReason.RUNTIME_TYPE_MISMATCH,
-            message='Value for selector type {type_name} must be a dict got {value}'.format(
-                type_name=selector_type.name, value=config_value
-            ),
-            error_data=RuntimeMismatchErrorData(
-                config_type=selector_type, value_rep=repr(config_value)
-            ),
-        )
+        yield create_type_mismatch_error(selector_type, stack, config_value, 'selector', 'a dict')
         return
 
     if config_value and len(config_value) > 1:
-        incoming_fields = sorted(list(config_value.keys()))
-        defined_fields = sorted(list(selector_type.fields.keys()))
-        yield EvaluationError(
-            stack=stack,
-            reason=DagsterEvaluationErrorReason.SELECTOR_FIELD_ERROR,
-            message=(
-                'You can only specify a single field. You specified {incoming_fields}. '
-                'The available fields are {defined_fields}'
-            ).format(incoming_fields=incoming_fields, defined_fields=defined_fields),
-            error_data=SelectorTypeErrorData(
-                dagster_type=selector_type, incoming_fields=incoming_fields
-            ),
-        )
+        yield create_selector_multiple_fields_error(selector_type, stack, config_value)
         return
 
     elif not config_value:
-        defined_fields = sorted(list(selector_type.fields.keys()))
         if len(selector_type.fields) > 1:
-            yield EvaluationError(
-                stack=stack,
-                reason=DagsterEvaluationErrorReason.SELECTOR_FIELD_ERROR,
-                message=(
-                    'Must specify a field if more one defined. Defined fields: ' '{defined_fields}'
-                ).format(defined_fields=defined_fields),
-                error_data=SelectorTypeErrorData(dagster_type=selector_type, incoming_fields=[]),
+            yield create_selector_unspecified_field_error(
+                selector_type, stack, 'Must specify a field if more one defined.'
             )
             return
 
         field_name, field_def = single_item(selector_type.fields)
 
         if not field_def.is_optional:
-            yield EvaluationError(
-                stack=stack,
-                reason=DagsterEvaluationErrorReason.SELECTOR_FIELD_ERROR,
-                message=(
-                    'Must specify the required field. Defined fields: ' '{defined_fields}'
-                ).format(defined_fields=defined_fields),
-                error_data=SelectorTypeErrorData(dagster_type=selector_type, incoming_fields=[]),
+            yield create_selector_unspecified_field_error(
+                selector_type, stack, 'Must specify the required field.'
             )
             return
 
@@ -436,16 +626,7 @@ def validate_composite_config_value(composite_type, config_value, stack):
     check.inst_param(stack, 'stack', EvaluationStack)
 
     if config_value and not isinstance(config_value, dict):
-        yield EvaluationError(
-            stack=stack,
-            reason=DagsterEvaluationErrorReason.RUNTIME_TYPE_MISMATCH,
-            message='Value for composite type {type_name} must be a dict got {value}'.format(
-                type_name=composite_type.name, value=config_value
-            ),
-            error_data=RuntimeMismatchErrorData(
-                config_type=composite_type, value_rep=repr(config_value)
-            ),
-        )
+        yield create_type_mismatch_error(composite_type, stack, config_value, 'composite', 'a dict')
         return
 
     # ASK: this can crash on user error
@@ -489,16 +670,7 @@ def validate_list_value(list_type, config_value, stack):
     check.inst_param(stack, 'stack', EvaluationStack)
 
     if not isinstance(config_value, list):
-        yield EvaluationError(
-            stack=stack,
-            reason=DagsterEvaluationErrorReason.RUNTIME_TYPE_MISMATCH,
-            message='Value for list type {type_name} must be a list got {value}'.format(
-                type_name=list_type.name, value=config_value
-            ),
-            error_data=RuntimeMismatchErrorData(
-                config_type=list_type, value_rep=repr(config_value)
-            ),
-        )
+        yield create_type_mismatch_error(list_type, stack, config_value, 'list', 'a list')
         return
 
     for index, item in enumerate(config_value):
@@ -535,3 +707,69 @@ def create_missing_required_field_error(config_type, stack, defined_fields, expe
             field_name=expected_field, field_def=config_type.fields[expected_field]
         ),
     )
+
+
+def create_scalar_mismatch_error(config_type, stack, config_value):
+    return EvaluationError(
+        stack=stack,
+        reason=DagsterEvaluationErrorReason.RUNTIME_TYPE_MISMATCH,
+        message='Value {value} is not valid for type {type_name}'.format(
+            value=config_value, type_name=config_type.name
+        ),
+        error_data=RuntimeMismatchErrorData(config_type=config_type, value_rep=repr(config_value)),
+    )
+
+
+def create_type_mismatch_error(config_type, stack, config_value, kind, expected):
+    return EvaluationError(
+        stack=stack,
+        reason=DagsterEvaluationErrorReason.RUNTIME_TYPE_MISMATCH,
+        message='Value for {kind} type {type_name} must be {expected} got {value}'.format(
+            kind=kind, type_name=config_type.name, expected=expected, value=config_value
+        ),
+        error_data=RuntimeMismatchErrorData(config_type=config_type, value_rep=repr(config_value)),
+    )
+
+
+def create_enum_value_missing_error(enum_type, stack, config_value):
+    return EvaluationError(
+        stack=stack,
+        reason=DagsterEvaluationErrorReason.RUNTIME_TYPE_MISMATCH,
+        message=(
+            'Value not in enum type {type_name}. Got: {value}. '
+            'Possible values: {possible_values}.'
+        ).format(
+            type_name=enum_type.name,
+            value=repr(config_value),
+            possible_values=enum_type.config_values,
+        ),
+        error_data=RuntimeMismatchErrorData(config_type=enum_type, value_rep=repr(config_value)),
+    )
+
+
+def create_selector_multiple_fields_error(selector_type, stack, config_value):
+    incoming_fields = sorted(list(config_value.keys()))
+    defined_fields = sorted(list(selector_type.fields.keys()))
+    return EvaluationError(
+        stack=stack,
+        reason=DagsterEvaluationErrorReason.SELECTOR_FIELD_ERROR,
+        message=(
+            'You can only specify a single field. You specified {incoming_fields}. '
+            'The available fields are {defined_fields}'
+        ).format(incoming_fields=incoming_fields, defined_fields=defined_fields),
+        error_data=SelectorTypeErrorData(
+            dagster_type=selector_type, incoming_fields=incoming_fields
+        ),
+    )
+
+
+def create_selector_unspecified_field_error(selector_type, stack, message):
+    defined_fields = sorted(list(selector_type.fields.keys()))
+    return EvaluationError(
+        stack=stack,
+        reason=DagsterEvaluationErrorReason.SELECTOR_FIELD_ERROR,
+        message='{message} Defined fields: {defined_fields}'.format(
+            message=message, defined_fields=defined_fields
+        ),
+        error_data=SelectorTypeErrorData(dagster_type=selector_type, incoming_fields=[]),
+    )
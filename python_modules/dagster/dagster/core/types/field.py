@@ -2,7 +2,7 @@ from dagster import check
 from .builtin_enum import BuiltinEnum
 from .config import Any, ConfigType, List, Nullable
 from .field_utils import FieldImpl, FIELD_NO_DEFAULT_PROVIDED, INFER_OPTIONAL_COMPOSITE_FIELD
-from .wrapping import WrappingListType, WrappingNullableType
+from .wrapping import WrappingListType, WrappingNullableType, WrappingStreamType
 
 
 def resolve_to_config_list(list_type):
@@ -25,6 +25,8 @@ def resolve_to_config_type(dagster_type):
         return resolve_to_config_list(dagster_type).inst()
     if isinstance(dagster_type, WrappingNullableType):
         return resolve_to_config_nullable(dagster_type).inst()
+    if isinstance(dagster_type, WrappingStreamType):
+        check.failed('Stream types are runtime only and cannot be used in config')
     if issubclass(dagster_type, ConfigType):
         return dagster_type.inst()
 
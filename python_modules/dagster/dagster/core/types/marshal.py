@@ -23,3 +23,27 @@ class PickleMarshallingStrategy(MarshallingStrategy):
     def unmarshal_value(self, from_file):
         with open(from_file, 'rb') as ff:
             return pickle.load(ff)
+
+
+DEFAULT_MARSHALLING_STRATEGY = PickleMarshallingStrategy()
+
+
+class ChunkedPickleMarshallingStrategy(MarshallingStrategy):
+    '''
+    Marshals an iterable of chunks by pickling one chunk after the other into the file, and
+    unmarshals it as a generator that unpickles one chunk at a time, so that neither side holds
+    more than one chunk in memory.
+    '''
+
+    def marshal_value(self, value, to_file):
+        with open(to_file, 'wb') as ff:
+            for chunk in value:
+                pickle.dump(chunk, ff)
+
+    def unmarshal_value(self, from_file):
+        with open(from_file, 'rb') as ff:
+            while True:
+                try:
+                    yield pickle.load(ff)
+                except EOFError:
+                    return
@@ -1,8 +1,11 @@
+from collections import namedtuple
+
 import six
+from six.moves import reprlib
 
 from dagster import check
 
-from dagster.core.errors import DagsterRuntimeCoercionError
+from dagster.core.errors import DagsterInvariantViolationError, DagsterRuntimeCoercionError
 
 from .builtin_enum import BuiltinEnum
 from .builtin_config_schemas import BuiltinSchemas
@@ -13,9 +16,83 @@ from .config import Nullable as ConfigNullable
 
 from .config_schema import InputSchema, OutputSchema
 
-from .marshal import MarshallingStrategy
+from .marshal import ChunkedPickleMarshallingStrategy, MarshallingStrategy
 from .dagster_type import check_dagster_type_param
-from .wrapping import WrappingListType, WrappingNullableType
+from .wrapping import WrappingListType, WrappingNullableType, WrappingStreamType
+
+
+# Hard cap on the length of the summary of a value that is logged during execution
+MAX_VALUE_SUMMARY_CHARS = 500
+
+
+def _create_summary_repr():
+    summary_repr = reprlib.Repr()
+    summary_repr.maxstring = MAX_VALUE_SUMMARY_CHARS
+    summary_repr.maxother = MAX_VALUE_SUMMARY_CHARS
+    return summary_repr
+
+
+_SUMMARY_REPR = _create_summary_repr()
+
+
+def truncate_value_summary(summary):
+    check.str_param(summary, 'summary')
+    if len(summary) <= MAX_VALUE_SUMMARY_CHARS:
+        return summary
+    return summary[: MAX_VALUE_SUMMARY_CHARS - 3] + '...'
+
+
+FULL_TYPE_CHECK = 'full'
+SAMPLED_TYPE_CHECK = 'sampled'
+NO_TYPE_CHECK = 'off'
+
+TYPE_CHECK_MODES = (FULL_TYPE_CHECK, SAMPLED_TYPE_CHECK, NO_TYPE_CHECK)
+
+DEFAULT_TYPE_CHECK_SAMPLE_SIZE = 100
+
+
+class TypeCheckPolicy(namedtuple('_TypeCheckPolicy', 'mode sample_size')):
+    '''
+    How thoroughly the values that flow between steps are checked against their runtime types.
+
+    Attributes:
+        mode (str):
+            'full' checks every value, 'sampled' only checks up to sample_size evenly spaced
+            elements of each list (the list itself is returned as is), and 'off' skips the
+            checks entirely.
+        sample_size (int): The number of elements checked per list in 'sampled' mode.
+    '''
+
+    def __new__(cls, mode=FULL_TYPE_CHECK, sample_size=DEFAULT_TYPE_CHECK_SAMPLE_SIZE):
+        check.param_invariant(mode in TYPE_CHECK_MODES, 'mode')
+        check.int_param(sample_size, 'sample_size')
+        check.param_invariant(sample_size > 0, 'sample_size')
+        return super(TypeCheckPolicy, cls).__new__(cls, mode, sample_size)
+
+    @staticmethod
+    def full():
+        return TypeCheckPolicy(FULL_TYPE_CHECK)
+
+    @staticmethod
+    def sampled(sample_size=DEFAULT_TYPE_CHECK_SAMPLE_SIZE):
+        return TypeCheckPolicy(SAMPLED_TYPE_CHECK, sample_size)
+
+    @staticmethod
+    def off():
+        return TypeCheckPolicy(NO_TYPE_CHECK)
+
+    def coerce_runtime_value(self, runtime_type, value):
+        if self.mode == NO_TYPE_CHECK:
+            return value
+        if self.mode == SAMPLED_TYPE_CHECK:
+            return runtime_type.coerce_sampled_runtime_value(value, self.sample_size)
+        return runtime_type.coerce_runtime_value(value)
+
+
+def _sample_indices(length, sample_size):
+    if length <= sample_size:
+        return range(length)
+    return (index * length // sample_size for index in range(sample_size))
 
 
 def check_opt_config_cls_param(config_cls, param_name):
@@ -34,6 +111,7 @@ class RuntimeType(object):
         input_schema=None,
         output_schema=None,
         marshalling_strategy=None,
+        value_summary_fn=None,
     ):
 
         type_obj = type(self)
@@ -52,6 +130,7 @@ class RuntimeType(object):
         self.marshalling_strategy = check.opt_inst_param(
             marshalling_strategy, 'marshalling_strategy', MarshallingStrategy
         )
+        self.value_summary_fn = check.opt_callable_param(value_summary_fn, 'value_summary_fn')
 
     __cache = {}
 
@@ -69,6 +148,31 @@ class RuntimeType(object):
     def coerce_runtime_value(self, value):
         return value
 
+    def coerce_sampled_runtime_value(self, value, sample_size):  # pylint: disable=W0613
+        '''
+        Like coerce_runtime_value, but collection types only check a sample of sample_size of
+        their elements. See TypeCheckPolicy.
+        '''
+        return self.coerce_runtime_value(value)
+
+    def summarize_value(self, value):
+        '''
+        A short description of a value of this type, used when logging the values that flow
+        through a pipeline. Unlike repr(), it is bounded in length, and types whose values are
+        large or expensive to render (e.g. data frames) can supply a value_summary_fn that
+        describes them without rendering them, e.g. by shape or row count.
+        '''
+        if self.value_summary_fn:
+            try:
+                return truncate_value_summary(self.value_summary_fn(value))
+            except Exception:  # pylint: disable=W0703
+                # Summaries are only logged, and may be asked for before the value has been
+                # type checked, so they must never fail a step
+                pass
+
+        # reprlib bounds the size of builtin containers and strings before rendering them
+        return truncate_value_summary(_SUMMARY_REPR.repr(value))
+
     def throw_if_false(self, fn, value):
         if not fn(value):
             raise DagsterRuntimeCoercionError(
@@ -97,6 +201,10 @@ class RuntimeType(object):
     def is_nullable(self):
         return False
 
+    @property
+    def is_stream(self):
+        return False
+
 
 class BuiltinScalarRuntimeType(RuntimeType):
     @property
@@ -206,6 +314,11 @@ class NullableType(RuntimeType):
     def coerce_runtime_value(self, value):
         return None if value is None else self.inner_type.coerce_runtime_value(value)
 
+    def coerce_sampled_runtime_value(self, value, sample_size):
+        if value is None:
+            return None
+        return self.inner_type.coerce_sampled_runtime_value(value, sample_size)
+
     @property
     def is_nullable(self):
         return True
@@ -237,13 +350,96 @@ class ListType(RuntimeType):
 
     def coerce_runtime_value(self, value):
         value = self.throw_if_false(lambda v: isinstance(value, list), value)
-        return [self.inner_type.coerce_runtime_value(item) for item in value]
+
+        # Lists can be very large, so they are only copied if coercing changes an element
+        coerced = None
+        for index, item in enumerate(value):
+            coerced_item = self.inner_type.coerce_runtime_value(item)
+            if coerced is None and coerced_item is not item:
+                coerced = value[:index]
+            if coerced is not None:
+                coerced.append(coerced_item)
+
+        return value if coerced is None else coerced
+
+    def coerce_sampled_runtime_value(self, value, sample_size):
+        value = self.throw_if_false(lambda v: isinstance(value, list), value)
+        for index in _sample_indices(len(value), sample_size):
+            self.inner_type.coerce_sampled_runtime_value(value[index], sample_size)
+        return value
 
     @property
     def is_list(self):
         return True
 
 
+class ChunkStream(six.Iterator):
+    '''
+    The value of a Stream type: a lazy iterator over chunks that can be consumed only once. The
+    elements of each chunk are type checked when the chunk is pulled.
+    '''
+
+    def __init__(self, stream_type, chunks):
+        self._stream_type = check.inst_param(stream_type, 'stream_type', StreamType)
+        self._chunks = chunks
+        self._started = False
+
+    def __iter__(self):
+        if self._started:
+            raise DagsterInvariantViolationError(
+                (
+                    'Value of type {type_name} has already been consumed. Streams can only be '
+                    'iterated once, by a single consumer.'
+                ).format(type_name=self._stream_type.name)
+            )
+        self._started = True
+        return self
+
+    def __next__(self):
+        self._started = True
+        chunk = next(self._chunks)
+        return self._stream_type.coerce_chunk(chunk)
+
+
+class StreamType(RuntimeType):
+    '''
+    An iterable of chunks, each a list of values of the inner type, e.g. the record batches of a
+    file that does not fit in memory. Values are not materialized: the stream is type checked one
+    chunk at a time as its consumer pulls it, which also paces the producer, so a type failure is
+    raised in the step that consumes the stream. A stream can only be consumed once, so it must
+    not be passed to more than one downstream input.
+    '''
+
+    def __init__(self, inner_type):
+        super(StreamType, self).__init__(
+            name='Stream.' + inner_type.name,
+            marshalling_strategy=ChunkedPickleMarshallingStrategy(),
+        )
+        self.inner_type = inner_type
+
+    def coerce_runtime_value(self, value):
+        if isinstance(value, ChunkStream):
+            return value
+
+        value = self.throw_if_false(
+            lambda v: not isinstance(v, six.string_types + (dict,)) and hasattr(v, '__iter__'),
+            value,
+        )
+        return ChunkStream(self, iter(value))
+
+    def coerce_chunk(self, chunk):
+        chunk = self.throw_if_false(lambda v: isinstance(v, list), chunk)
+        return [self.inner_type.coerce_runtime_value(item) for item in chunk]
+
+    def summarize_value(self, value):
+        # Summarizing must not consume the stream
+        return self.name
+
+    @property
+    def is_stream(self):
+        return True
+
+
 def Nullable(inner_type):
     check.inst_param(inner_type, 'inner_type', RuntimeType)
 
@@ -264,6 +460,16 @@ def List(inner_type):
     return _List.inst()
 
 
+def Stream(inner_type):
+    check.inst_param(inner_type, 'inner_type', RuntimeType)
+
+    class _Stream(StreamType):
+        def __init__(self):
+            super(_Stream, self).__init__(inner_type)
+
+    return _Stream.inst()
+
+
 class Stringish(RuntimeType):
     def is_scalar(self):
         return True
@@ -296,6 +502,8 @@ def resolve_to_runtime_type(dagster_type):
         return resolve_to_runtime_list(dagster_type)
     if isinstance(dagster_type, WrappingNullableType):
         return resolve_to_runtime_nullable(dagster_type)
+    if isinstance(dagster_type, WrappingStreamType):
+        return resolve_to_runtime_stream(dagster_type)
     if is_runtime_type_decorated_klass(dagster_type):
         return get_runtime_type_on_decorated_klass(dagster_type)
     if issubclass(dagster_type, RuntimeType):
@@ -312,3 +520,8 @@ def resolve_to_runtime_list(list_type):
 def resolve_to_runtime_nullable(nullable_type):
     check.inst_param(nullable_type, 'nullable_type', WrappingNullableType)
     return Nullable(resolve_to_runtime_type(nullable_type.inner_type))
+
+
+def resolve_to_runtime_stream(stream_type):
+    check.inst_param(stream_type, 'stream_type', WrappingStreamType)
+    return Stream(resolve_to_runtime_type(stream_type.inner_type))
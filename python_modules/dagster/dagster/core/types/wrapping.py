@@ -19,3 +19,15 @@ def Nullable(inner_type):
 
 class WrappingNullableType(WrappingType):
     pass
+
+
+def Stream(inner_type):
+    '''
+    A lazily consumed iterable of chunks, each a list of values of inner_type. Only valid as the
+    type of inputs and outputs, not of config.
+    '''
+    return WrappingStreamType(inner_type)
+
+
+class WrappingStreamType(WrappingType):
+    pass
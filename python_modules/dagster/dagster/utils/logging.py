@@ -24,6 +24,10 @@ class CompositeLogger(object):
     def __init__(self, loggers=None):
         self.loggers = check.opt_list_param(loggers, 'loggers', of_type=logging.Logger)
 
+    def isEnabledFor(self, level):  # pylint: disable=C0103
+        # Mirrors logging.Logger.isEnabledFor
+        return any(logger.isEnabledFor(level) for logger in self.loggers)
+
     def __getattr__(self, name):
         def _invoke_logger_method(*args, **kwargs):
             for logger in self.loggers:
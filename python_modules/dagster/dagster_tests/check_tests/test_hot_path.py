@@ -0,0 +1,55 @@
+import pytest
+
+from dagster import PipelineDefinition, check
+from dagster.check import ParameterCheckError, hot_path
+from dagster.core.execution_plan.objects import StepOutput
+
+
+@pytest.fixture
+def production_mode():
+    hot_path.set_production_mode(True)
+    try:
+        yield
+    finally:
+        hot_path.set_production_mode(False)
+
+
+def test_checks_enabled_by_default():
+    assert not hot_path.is_production_mode()
+
+    with pytest.raises(ParameterCheckError):
+        hot_path.str_param(1, 'param_name')
+
+    with pytest.raises(ParameterCheckError):
+        StepOutput(name=1, runtime_type=None)
+
+
+def test_production_mode_skips_checks(production_mode):  # pylint: disable=W0621,W0613
+    assert hot_path.is_production_mode()
+
+    assert hot_path.str_param(1, 'param_name') == 1
+    assert hot_path.inst_param('foo', 'param_name', int) == 'foo'
+    assert hot_path.list_param([1], 'param_name', of_type=str) == [1]
+    hot_path.param_invariant(False, 'param_name')
+
+    step_output = StepOutput(name=1, runtime_type=None)
+    assert step_output.name == 1
+
+    # User-facing validation is unaffected
+    with pytest.raises(ParameterCheckError):
+        check.str_param(1, 'param_name')
+
+    with pytest.raises(ParameterCheckError):
+        PipelineDefinition(name=1, solids=[])
+
+
+def test_production_mode_keeps_defaults(production_mode):  # pylint: disable=W0621,W0613
+    assert hot_path.opt_str_param(None, 'param_name', 'default') == 'default'
+    assert hot_path.opt_str_param('value', 'param_name', 'default') == 'value'
+    assert hot_path.opt_inst_param(None, 'param_name', int, 1) == 1
+    assert hot_path.opt_callable_param(None, 'param_name', len) is len
+    assert hot_path.opt_list_param(None, 'param_name') == []
+    assert hot_path.opt_dict_param(None, 'param_name') == {}
+
+    some_list = [1]
+    assert hot_path.opt_list_param(some_list, 'param_name', of_type=int) is some_list
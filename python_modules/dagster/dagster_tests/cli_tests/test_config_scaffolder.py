@@ -64,7 +64,17 @@ def test_basic_solids_config():
         'context': {'default': {'config': {'log_level': ''}, 'resources': {}}},
         'solids': {'required_field_solid': {'config': {'required_int': 0}}},
         'expectations': {'evaluate': True},
-        'execution': {},
+        'execution': {
+            'engine': {
+                'in_process': {},
+                'multiprocess': {'max_workers': 0},
+                'thread_pool': {'max_workers': 0},
+            },
+            'retain_intermediate_values': True,
+            'step_cache': {'directory': '', 'max_bytes': 0},
+            'log_value_summaries': True,
+            'type_check': {'full': {}, 'sampled': {'sample_size': 0}, 'off': {}},
+        },
     }
 
 
@@ -93,5 +103,15 @@ def test_two_contexts():
         },
         'solids': {},
         'expectations': {'evaluate': True},
-        'execution': {},
+        'execution': {
+            'engine': {
+                'in_process': {},
+                'multiprocess': {'max_workers': 0},
+                'thread_pool': {'max_workers': 0},
+            },
+            'retain_intermediate_values': True,
+            'step_cache': {'directory': '', 'max_bytes': 0},
+            'log_value_summaries': True,
+            'type_check': {'full': {}, 'sampled': {'sample_size': 0}, 'off': {}},
+        },
     }
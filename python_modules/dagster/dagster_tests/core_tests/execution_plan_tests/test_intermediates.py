@@ -0,0 +1,149 @@
+import gc
+import weakref
+
+import pytest
+
+from dagster import (
+    DagsterInvariantViolationError,
+    DependencyDefinition,
+    InputDefinition,
+    PipelineDefinition,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.execution import create_execution_plan, execute_plan
+from dagster.core.execution_plan.intermediates import (
+    IntermediateStore,
+    terminal_step_output_handles,
+)
+from dagster.core.execution_plan.objects import StepOutputHandle
+
+
+class Payload(object):
+    def __init__(self, num):
+        self.num = num
+
+
+def define_chain_pipeline(check_released=None):
+    @lambda_solid
+    def produce():
+        return Payload(1)
+
+    @lambda_solid(inputs=[InputDefinition('payload')])
+    def consume(payload):
+        if check_released:
+            check_released(payload)
+        return Payload(payload.num + 1)
+
+    @lambda_solid(inputs=[InputDefinition('payload')])
+    def finish(payload):
+        return payload.num + 1
+
+    return PipelineDefinition(
+        name='chain_pipeline',
+        solids=[produce, consume, finish],
+        dependencies={
+            'consume': {'payload': DependencyDefinition('produce')},
+            'finish': {'payload': DependencyDefinition('consume')},
+        },
+    )
+
+
+def test_intermediate_store_consumer_counts():
+    pipeline_def = define_chain_pipeline()
+    execution_plan = create_execution_plan(pipeline_def)
+    produce_step = execution_plan.get_step_by_key('produce.transform')
+    consume_step = execution_plan.get_step_by_key('consume.transform')
+    finish_step = execution_plan.get_step_by_key('finish.transform')
+
+    store = IntermediateStore(execution_plan)
+
+    store.put(StepOutputHandle(produce_step, 'result'), 'produced')
+    assert StepOutputHandle(produce_step, 'result') in store
+
+    assert store.release_inputs(consume_step) == ['produced']
+    assert StepOutputHandle(produce_step, 'result') not in store
+
+    # Nothing consumes the output of the last step, so it is never held
+    store.put(StepOutputHandle(finish_step, 'result'), 'finished')
+    assert StepOutputHandle(finish_step, 'result') not in store
+
+
+def test_terminal_step_output_handles():
+    execution_plan = create_execution_plan(define_chain_pipeline())
+    assert [handle.step.key for handle in terminal_step_output_handles(execution_plan)] == [
+        'finish.transform'
+    ]
+
+
+@pytest.mark.parametrize('engine', [{'in_process': {}}, {'thread_pool': {'max_workers': 2}}])
+def test_intermediate_value_released_after_last_consumer(engine):
+    produced = []
+
+    @lambda_solid
+    def produce():
+        payload = Payload(1)
+        produced.append(weakref.ref(payload))
+        return payload
+
+    @lambda_solid(inputs=[InputDefinition('payload')])
+    def consume(payload):
+        return payload.num + 1
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def finish(num):
+        gc.collect()
+        assert produced[0]() is None
+        return num + 1
+
+    pipeline_def = PipelineDefinition(
+        name='release_pipeline',
+        solids=[produce, consume, finish],
+        dependencies={
+            'consume': {'payload': DependencyDefinition('produce')},
+            'finish': {'num': DependencyDefinition('consume')},
+        },
+    )
+
+    result = execute_pipeline(
+        pipeline_def,
+        environment={'execution': {'engine': engine, 'retain_intermediate_values': False}},
+    )
+    assert result.success
+    assert result.result_for_solid('finish').transformed_value() == 3
+
+
+def test_retain_intermediate_values_by_default():
+    result = execute_pipeline(define_chain_pipeline())
+    assert result.success
+    assert result.result_for_solid('produce').transformed_value().num == 1
+    assert result.result_for_solid('consume').transformed_value().num == 2
+    assert result.result_for_solid('finish').transformed_value() == 3
+
+
+def test_only_terminal_values_in_results():
+    result = execute_pipeline(
+        define_chain_pipeline(), environment={'execution': {'retain_intermediate_values': False}}
+    )
+    assert result.success
+    assert result.result_for_solid('finish').transformed_value() == 3
+
+    with pytest.raises(DagsterInvariantViolationError, match='was released'):
+        result.result_for_solid('produce').transformed_value()
+
+    with pytest.raises(DagsterInvariantViolationError, match='was released'):
+        result.result_for_solid('consume').transformed_values  # pylint: disable=W0104
+
+
+def test_execute_plan_only_terminal_values():
+    pipeline_def = define_chain_pipeline()
+    environment = {'execution': {'retain_intermediate_values': False}}
+    execution_plan = create_execution_plan(pipeline_def, environment)
+    step_results = execute_plan(pipeline_def, execution_plan, environment)
+
+    assert [step_result.success_data.value_released for step_result in step_results] == [
+        True,
+        True,
+        False,
+    ]
+    assert step_results[-1].success_data.value == 3
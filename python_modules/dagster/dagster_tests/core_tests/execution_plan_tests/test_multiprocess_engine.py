@@ -0,0 +1,220 @@
+import json
+import os
+
+import pytest
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    Int,
+    OutputDefinition,
+    PipelineDefinition,
+    ReentrantInfo,
+    Stream,
+    as_dagster_type,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.events import EventType
+from dagster.core.execution import create_execution_plan, execute_plan
+from dagster.core.types.marshal import MarshallingStrategy
+
+MULTIPROCESS_ENVIRONMENT = {'execution': {'engine': {'multiprocess': {'max_workers': 2}}}}
+
+
+class JsonMarshallingStrategy(MarshallingStrategy):
+    def marshal_value(self, value, to_file):
+        with open(to_file, 'w') as ff:
+            json.dump({'json_marshalled': value.data}, ff)
+
+    def unmarshal_value(self, from_file):
+        with open(from_file, 'r') as ff:
+            return JsonPayload(json.load(ff)['json_marshalled'])
+
+
+class JsonPayload(object):
+    def __init__(self, data):
+        self.data = data
+
+
+as_dagster_type(JsonPayload, marshalling_strategy=JsonMarshallingStrategy())
+
+
+class MultiprocessTestError(Exception):
+    pass
+
+
+def define_diamond_pipeline():
+    @lambda_solid
+    def return_two():
+        return 2
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def add_three(num):
+        return num + 3
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def mult_three(num):
+        return num * 3
+
+    @lambda_solid(inputs=[InputDefinition('left'), InputDefinition('right')])
+    def adder(left, right):
+        return left + right
+
+    return PipelineDefinition(
+        name='diamond_pipeline',
+        solids=[return_two, add_three, mult_three, adder],
+        dependencies={
+            'add_three': {'num': DependencyDefinition('return_two')},
+            'mult_three': {'num': DependencyDefinition('return_two')},
+            'adder': {
+                'left': DependencyDefinition('add_three'),
+                'right': DependencyDefinition('mult_three'),
+            },
+        },
+    )
+
+
+def test_multiprocess_diamond():
+    result = execute_pipeline(define_diamond_pipeline(), environment=MULTIPROCESS_ENVIRONMENT)
+    assert result.success
+    assert result.result_for_solid('add_three').transformed_value() == 5
+    assert result.result_for_solid('mult_three').transformed_value() == 6
+    assert result.result_for_solid('adder').transformed_value() == 11
+
+
+def test_multiprocess_scaffolded_max_workers():
+    # The value the config scaffolder emits
+    result = execute_pipeline(
+        define_diamond_pipeline(),
+        environment={'execution': {'engine': {'multiprocess': {'max_workers': 0}}}},
+    )
+    assert result.success
+    assert result.result_for_solid('adder').transformed_value() == 11
+
+
+def test_multiprocess_execute_plan():
+    pipeline_def = define_diamond_pipeline()
+    execution_plan = create_execution_plan(pipeline_def, MULTIPROCESS_ENVIRONMENT)
+    step_results = execute_plan(pipeline_def, execution_plan, MULTIPROCESS_ENVIRONMENT)
+
+    assert len(step_results) == 4
+    assert all(step_result.success for step_result in step_results)
+    assert step_results[0].step.key == 'return_two.transform'
+    assert step_results[-1].step.key == 'adder.transform'
+    assert step_results[-1].success_data.value == 11
+
+
+def test_multiprocess_steps_run_in_worker_processes():
+    @lambda_solid
+    def get_pid():
+        return os.getpid()
+
+    pipeline_def = PipelineDefinition(name='pid_pipeline', solids=[get_pid])
+
+    result = execute_pipeline(
+        pipeline_def, environment={'execution': {'engine': {'multiprocess': {}}}}
+    )
+    assert result.success
+    assert result.result_for_solid('get_pid').transformed_value() != os.getpid()
+
+
+def test_multiprocess_uses_marshalling_strategy():
+    @lambda_solid(output=OutputDefinition(JsonPayload))
+    def produce():
+        return JsonPayload([1, 2])
+
+    @lambda_solid(inputs=[InputDefinition('payload', JsonPayload)])
+    def consume(payload):
+        return sum(payload.data)
+
+    pipeline_def = PipelineDefinition(
+        name='marshalling_pipeline',
+        solids=[produce, consume],
+        dependencies={'consume': {'payload': DependencyDefinition('produce')}},
+    )
+
+    result = execute_pipeline(pipeline_def, environment=MULTIPROCESS_ENVIRONMENT)
+    assert result.success
+    assert result.result_for_solid('produce').transformed_value().data == [1, 2]
+    assert result.result_for_solid('consume').transformed_value() == 3
+
+
+def test_multiprocess_stream():
+    @lambda_solid(output=OutputDefinition(Stream(Int)))
+    def produce_batches():
+        return ([start, start + 1] for start in range(0, 10, 2))
+
+    @lambda_solid(inputs=[InputDefinition('batches', Stream(Int))])
+    def sum_batches(batches):
+        return sum(sum(batch) for batch in batches)
+
+    pipeline_def = PipelineDefinition(
+        name='stream_pipeline',
+        solids=[produce_batches, sum_batches],
+        dependencies={'sum_batches': {'batches': DependencyDefinition('produce_batches')}},
+    )
+
+    result = execute_pipeline(pipeline_def, environment=MULTIPROCESS_ENVIRONMENT)
+    assert result.success
+    assert result.result_for_solid('sum_batches').transformed_value() == 45
+
+
+def test_multiprocess_step_events():
+    events = []
+    execute_pipeline(
+        define_diamond_pipeline(),
+        environment=MULTIPROCESS_ENVIRONMENT,
+        reentrant_info=ReentrantInfo(event_callback=events.append),
+    )
+
+    step_events = [
+        event
+        for event in events
+        if event.event_type
+        in {EventType.EXECUTION_PLAN_STEP_START, EventType.EXECUTION_PLAN_STEP_SUCCESS}
+    ]
+    assert len(step_events) == 8
+
+    # Events for a single step arrive in the order they were emitted
+    adder_events = [
+        event.event_type for event in step_events if event.step_key == 'adder.transform'
+    ]
+    assert adder_events == [
+        EventType.EXECUTION_PLAN_STEP_START,
+        EventType.EXECUTION_PLAN_STEP_SUCCESS,
+    ]
+    assert {event.solid_name for event in step_events} == {
+        'return_two',
+        'add_three',
+        'mult_three',
+        'adder',
+    }
+
+
+def test_multiprocess_user_error():
+    @lambda_solid
+    def throw():
+        raise MultiprocessTestError('bad')
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def downstream(num):
+        return num
+
+    pipeline_def = PipelineDefinition(
+        name='failing_pipeline',
+        solids=[throw, downstream],
+        dependencies={'downstream': {'num': DependencyDefinition('throw')}},
+    )
+
+    result = execute_pipeline(
+        pipeline_def, environment=MULTIPROCESS_ENVIRONMENT, throw_on_error=False
+    )
+    assert not result.success
+    assert len(result.result_list) == 1
+    assert isinstance(
+        result.result_for_solid('throw').dagster_error.user_exception, MultiprocessTestError
+    )
+
+    with pytest.raises(MultiprocessTestError):
+        execute_pipeline(pipeline_def, environment=MULTIPROCESS_ENVIRONMENT)
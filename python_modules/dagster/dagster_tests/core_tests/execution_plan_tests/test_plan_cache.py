@@ -0,0 +1,159 @@
+import gc
+import threading
+import weakref
+
+from dagster import (
+    DependencyDefinition,
+    Field,
+    InputDefinition,
+    Int,
+    PipelineDefinition,
+    execute_pipeline,
+    lambda_solid,
+    solid,
+)
+from dagster.core.definitions import solids_in_topological_order
+from dagster.core.execution import (
+    EXECUTION_PLAN_CACHE,
+    create_execution_plan,
+    create_typed_environment,
+)
+from dagster.core.execution_plan.plan_cache import ExecutionPlanCache, environment_fingerprint
+
+
+def define_pipeline():
+    @solid(config_field=Field(Int))
+    def load_num(info):
+        return info.config
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def add_one(num):
+        return num + 1
+
+    return PipelineDefinition(
+        name='plan_cache_pipeline',
+        solids=[add_one, load_num],
+        dependencies={'add_one': {'num': DependencyDefinition('load_num')}},
+    )
+
+
+def environment_with_num(num):
+    return {'solids': {'load_num': {'config': num}}}
+
+
+def test_plan_reused_for_same_pipeline_and_environment():
+    pipeline_def = define_pipeline()
+
+    plan = create_execution_plan(pipeline_def, environment_with_num(1))
+    assert create_execution_plan(pipeline_def, environment_with_num(1)) is plan
+    assert create_execution_plan(pipeline_def, environment_with_num(2)) is not plan
+    assert create_execution_plan(define_pipeline(), environment_with_num(1)) is not plan
+
+
+def test_cached_plan_executes_with_its_environment():
+    pipeline_def = define_pipeline()
+
+    for num in [1, 2, 1, 2]:
+        result = execute_pipeline(pipeline_def, environment_with_num(num))
+        assert result.result_for_solid('add_one').transformed_value() == num + 1
+
+
+def test_plan_cache_evicts_least_recently_used():
+    pipeline_def = define_pipeline()
+    plan_cache = ExecutionPlanCache(max_plans=2)
+    created = []
+
+    def get_or_create(num):
+        def _create():
+            created.append(num)
+            return create_execution_plan(pipeline_def, environment_with_num(num))
+
+        return plan_cache.get_or_create(
+            pipeline_def, create_typed_environment(pipeline_def, environment_with_num(num)), _create
+        )
+
+    get_or_create(1)
+    get_or_create(2)
+    # Touch 1 so that 2 is the least recently used
+    get_or_create(1)
+    get_or_create(3)
+    assert created == [1, 2, 3]
+    assert len(plan_cache) == 2
+
+    get_or_create(1)
+    get_or_create(3)
+    assert created == [1, 2, 3]
+
+    get_or_create(2)
+    assert created == [1, 2, 3, 2]
+
+
+def test_unpicklable_environment_not_cached():
+    pipeline_def = define_pipeline()
+    typed_environment = create_typed_environment(pipeline_def, environment_with_num(1))
+    assert environment_fingerprint(typed_environment) is not None
+
+    unpicklable_environment = typed_environment._replace(
+        solids={'load_num': typed_environment.solids['load_num']._replace(config=threading.Lock())}
+    )
+    assert environment_fingerprint(unpicklable_environment) is None
+
+    plan_cache = ExecutionPlanCache()
+    calls = []
+
+    def _create():
+        calls.append(None)
+        return create_execution_plan(pipeline_def, environment_with_num(1))
+
+    plan_cache.get_or_create(pipeline_def, unpicklable_environment, _create)
+    plan_cache.get_or_create(pipeline_def, unpicklable_environment, _create)
+    assert len(calls) == 2
+    assert len(plan_cache) == 0
+
+
+def test_topological_order_memoized():
+    pipeline_def = define_pipeline()
+
+    order = solids_in_topological_order(pipeline_def)
+    assert [solid.name for solid in order] == ['load_num', 'add_one']
+
+    # Callers get their own list
+    order.reverse()
+    assert [solid.name for solid in solids_in_topological_order(pipeline_def)] == [
+        'load_num',
+        'add_one',
+    ]
+
+
+def test_cached_plan_does_not_keep_run_context_alive():
+    contexts = []
+
+    @solid
+    def keep_context(info):
+        contexts.append(weakref.ref(info.context))
+
+    pipeline_def = PipelineDefinition(name='context_pipeline', solids=[keep_context])
+
+    for _ in range(2):
+        assert execute_pipeline(pipeline_def).success
+    assert len(EXECUTION_PLAN_CACHE._plans_of(pipeline_def)) == 1  # pylint: disable=W0212
+
+    gc.collect()
+    assert [context_ref() for context_ref in contexts] == [None, None]
+
+
+def test_cached_plans_collected_with_pipeline():
+    pipeline_def = define_pipeline()
+    plan_cache = ExecutionPlanCache()
+    plan_cache.get_or_create(
+        pipeline_def,
+        create_typed_environment(pipeline_def, environment_with_num(1)),
+        lambda: create_execution_plan(pipeline_def, environment_with_num(1)),
+    )
+    assert len(plan_cache) == 1
+
+    pipeline_ref = weakref.ref(pipeline_def)
+    del pipeline_def
+    gc.collect()
+    assert pipeline_ref() is None
+    assert len(plan_cache) == 0
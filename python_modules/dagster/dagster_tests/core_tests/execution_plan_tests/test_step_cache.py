@@ -0,0 +1,184 @@
+import os
+
+import pytest
+
+from dagster import (
+    DagsterInvariantViolationError,
+    DependencyDefinition,
+    Field,
+    InputDefinition,
+    Int,
+    OutputDefinition,
+    PipelineDefinition,
+    ReentrantInfo,
+    Stream,
+    execute_pipeline,
+    lambda_solid,
+    solid,
+)
+from dagster.core.events import EventType
+
+
+def define_cached_pipeline(calls):
+    @solid(config_field=Field(Int), version='1')
+    def load_num(info):
+        calls.append('load_num')
+        return info.config
+
+    @lambda_solid(inputs=[InputDefinition('num')], version='1')
+    def double(num):
+        calls.append('double')
+        return num * 2
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def unversioned(num):
+        calls.append('unversioned')
+        return num + 1
+
+    return PipelineDefinition(
+        name='cached_pipeline',
+        solids=[load_num, double, unversioned],
+        dependencies={
+            'double': {'num': DependencyDefinition('load_num')},
+            'unversioned': {'num': DependencyDefinition('double')},
+        },
+    )
+
+
+def cache_environment(cache_dir, num, **step_cache_config):
+    step_cache_config['directory'] = str(cache_dir)
+    return {
+        'solids': {'load_num': {'config': num}},
+        'execution': {'step_cache': step_cache_config},
+    }
+
+
+def execute_with_events(pipeline_def, environment):
+    events = []
+    result = execute_pipeline(
+        pipeline_def,
+        environment=environment,
+        reentrant_info=ReentrantInfo(event_callback=events.append),
+    )
+    return result, events
+
+
+def cache_events(events, event_type):
+    return [event.step_key for event in events if event.event_type == event_type]
+
+
+def test_step_cache_miss_then_hit(tmpdir):
+    calls = []
+    pipeline_def = define_cached_pipeline(calls)
+
+    result, events = execute_with_events(pipeline_def, cache_environment(tmpdir, 2))
+    assert result.success
+    assert result.result_for_solid('unversioned').transformed_value() == 5
+    assert calls == ['load_num', 'double', 'unversioned']
+    assert cache_events(events, EventType.EXECUTION_PLAN_STEP_CACHE_MISS) == [
+        'load_num.transform',
+        'double.transform',
+    ]
+    assert not cache_events(events, EventType.EXECUTION_PLAN_STEP_CACHE_HIT)
+
+    del calls[:]
+    result, events = execute_with_events(pipeline_def, cache_environment(tmpdir, 2))
+    assert result.success
+    assert result.result_for_solid('double').transformed_value() == 4
+    assert result.result_for_solid('unversioned').transformed_value() == 5
+    # Solids without a version are never cached
+    assert calls == ['unversioned']
+    assert cache_events(events, EventType.EXECUTION_PLAN_STEP_CACHE_HIT) == [
+        'load_num.transform',
+        'double.transform',
+    ]
+    assert not cache_events(events, EventType.EXECUTION_PLAN_STEP_CACHE_MISS)
+    # Steps served from the cache start and succeed like any other
+    all_step_keys = ['load_num.transform', 'double.transform', 'unversioned.transform']
+    assert cache_events(events, EventType.EXECUTION_PLAN_STEP_START) == all_step_keys
+    assert cache_events(events, EventType.EXECUTION_PLAN_STEP_SUCCESS) == all_step_keys
+
+
+def test_step_cache_keyed_on_config_and_inputs(tmpdir):
+    calls = []
+    pipeline_def = define_cached_pipeline(calls)
+
+    execute_pipeline(pipeline_def, environment=cache_environment(tmpdir, 2))
+
+    del calls[:]
+    result = execute_pipeline(pipeline_def, environment=cache_environment(tmpdir, 3))
+    assert result.result_for_solid('unversioned').transformed_value() == 7
+    # New config for load_num, and therefore a new input for double
+    assert calls == ['load_num', 'double', 'unversioned']
+
+
+def test_step_cache_keyed_on_version(tmpdir):
+    calls = []
+    execute_pipeline(define_cached_pipeline(calls), environment=cache_environment(tmpdir, 2))
+
+    @lambda_solid(version='2')
+    def load_num():
+        calls.append('load_num_v2')
+        return 2
+
+    pipeline_def = PipelineDefinition(name='versioned_pipeline', solids=[load_num])
+
+    del calls[:]
+    execute_pipeline(
+        pipeline_def, environment={'execution': {'step_cache': {'directory': str(tmpdir)}}}
+    )
+    assert calls == ['load_num_v2']
+
+
+def test_step_cache_evicts_least_recently_used(tmpdir):
+    calls = []
+    pipeline_def = define_cached_pipeline(calls)
+
+    execute_pipeline(pipeline_def, environment=cache_environment(tmpdir, 2))
+    entries = os.listdir(str(tmpdir))
+    assert len(entries) == 2
+
+    # Room for about one entry
+    max_bytes = max(
+        sum(
+            os.path.getsize(os.path.join(str(tmpdir), entry, file_name))
+            for file_name in os.listdir(os.path.join(str(tmpdir), entry))
+        )
+        for entry in entries
+    )
+    execute_pipeline(pipeline_def, environment=cache_environment(tmpdir, 3, max_bytes=max_bytes))
+    assert len(os.listdir(str(tmpdir))) == 1
+
+
+def test_step_cache_requires_in_process_engine(tmpdir):
+    environment = cache_environment(tmpdir, 2)
+    environment['execution']['engine'] = {'thread_pool': {}}
+
+    with pytest.raises(DagsterInvariantViolationError, match='step cache'):
+        execute_pipeline(define_cached_pipeline([]), environment=environment)
+
+
+def test_step_cache_skips_streams(tmpdir):
+    @lambda_solid(output=OutputDefinition(Stream(Int)), version='1')
+    def batches():
+        return iter([[1, 2], [3]])
+
+    @lambda_solid(inputs=[InputDefinition('batches', Stream(Int))], version='1')
+    def total(batches):
+        return sum(sum(batch) for batch in batches)
+
+    pipeline_def = PipelineDefinition(
+        name='stream_pipeline',
+        solids=[batches, total],
+        dependencies={'total': {'batches': DependencyDefinition('batches')}},
+    )
+    environment = {'execution': {'step_cache': {'directory': str(tmpdir)}}}
+
+    for _ in range(2):
+        result, events = execute_with_events(pipeline_def, environment)
+        assert result.success
+        assert result.result_for_solid('total').transformed_value() == 6
+        assert not cache_events(events, EventType.EXECUTION_PLAN_STEP_CACHE_HIT)
+        assert not cache_events(events, EventType.EXECUTION_PLAN_STEP_CACHE_MISS)
+
+    assert os.listdir(str(tmpdir)) == []
@@ -0,0 +1,248 @@
+import threading
+import time
+
+import pytest
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    OutputDefinition,
+    PipelineConfigEvaluationError,
+    PipelineDefinition,
+    ReentrantInfo,
+    Result,
+    execute_pipeline,
+    lambda_solid,
+    solid,
+)
+from dagster.core.events import EventType
+from dagster.core.execution import create_execution_plan, execute_plan
+
+THREAD_POOL_ENVIRONMENT = {'execution': {'engine': {'thread_pool': {'max_workers': 2}}}}
+
+
+def define_diamond_pipeline():
+    @lambda_solid
+    def return_two():
+        return 2
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def add_three(num):
+        return num + 3
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def mult_three(num):
+        return num * 3
+
+    @lambda_solid(inputs=[InputDefinition('left'), InputDefinition('right')])
+    def adder(left, right):
+        return left + right
+
+    return PipelineDefinition(
+        name='diamond_pipeline',
+        solids=[return_two, add_three, mult_three, adder],
+        dependencies={
+            'add_three': {'num': DependencyDefinition('return_two')},
+            'mult_three': {'num': DependencyDefinition('return_two')},
+            'adder': {
+                'left': DependencyDefinition('add_three'),
+                'right': DependencyDefinition('mult_three'),
+            },
+        },
+    )
+
+
+def test_thread_pool_diamond():
+    result = execute_pipeline(define_diamond_pipeline(), environment=THREAD_POOL_ENVIRONMENT)
+    assert result.success
+    assert result.result_for_solid('add_three').transformed_value() == 5
+    assert result.result_for_solid('mult_three').transformed_value() == 6
+    assert result.result_for_solid('adder').transformed_value() == 11
+
+
+def test_thread_pool_default_max_workers():
+    result = execute_pipeline(
+        define_diamond_pipeline(), environment={'execution': {'engine': {'thread_pool': {}}}}
+    )
+    assert result.success
+    assert result.result_for_solid('adder').transformed_value() == 11
+
+
+def test_thread_pool_scaffolded_max_workers():
+    # The value the config scaffolder emits
+    result = execute_pipeline(
+        define_diamond_pipeline(),
+        environment={'execution': {'engine': {'thread_pool': {'max_workers': 0}}}},
+    )
+    assert result.success
+    assert result.result_for_solid('adder').transformed_value() == 11
+
+
+def test_thread_pool_execute_plan():
+    pipeline_def = define_diamond_pipeline()
+    execution_plan = create_execution_plan(pipeline_def, THREAD_POOL_ENVIRONMENT)
+    step_results = execute_plan(pipeline_def, execution_plan, THREAD_POOL_ENVIRONMENT)
+
+    assert len(step_results) == 4
+    assert all(step_result.success for step_result in step_results)
+    assert step_results[0].step.key == 'return_two.transform'
+    assert step_results[-1].step.key == 'adder.transform'
+    assert step_results[-1].success_data.value == 11
+
+
+def test_thread_pool_runs_independent_steps_concurrently():
+    left_started = threading.Event()
+    right_started = threading.Event()
+
+    # Each solid waits for the other to start, which can only happen if they overlap
+    @lambda_solid
+    def left():
+        left_started.set()
+        return right_started.wait(5)
+
+    @lambda_solid
+    def right():
+        right_started.set()
+        return left_started.wait(5)
+
+    pipeline_def = PipelineDefinition(name='concurrent_pipeline', solids=[left, right])
+
+    result = execute_pipeline(pipeline_def, environment=THREAD_POOL_ENVIRONMENT)
+    assert result.success
+    assert result.result_for_solid('left').transformed_value() is True
+    assert result.result_for_solid('right').transformed_value() is True
+
+
+def test_thread_pool_starts_downstream_steps_on_first_output():
+    first_consumed = threading.Event()
+
+    @solid(outputs=[OutputDefinition(name='first'), OutputDefinition(name='second')])
+    def yield_two(_info):
+        yield Result(1, 'first')
+        # Only returns True if the consumer of first ran before this step was done
+        yield Result(first_consumed.wait(5), 'second')
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def consume_first(num):
+        first_consumed.set()
+        return num
+
+    pipeline_def = PipelineDefinition(
+        name='streaming_pipeline',
+        solids=[yield_two, consume_first],
+        dependencies={'consume_first': {'num': DependencyDefinition('yield_two', 'first')}},
+    )
+
+    result = execute_pipeline(pipeline_def, environment=THREAD_POOL_ENVIRONMENT)
+    assert result.success
+    assert result.result_for_solid('yield_two').transformed_value('second') is True
+    assert result.result_for_solid('consume_first').transformed_value() == 1
+
+
+def test_thread_pool_failure_skips_downstream():
+    @lambda_solid
+    def return_one():
+        return 1
+
+    @lambda_solid
+    def throw():
+        raise Exception('bad')
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def downstream_of_throw(num):
+        return num
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def downstream_of_one(num):
+        return num
+
+    pipeline_def = PipelineDefinition(
+        name='failing_pipeline',
+        solids=[return_one, throw, downstream_of_throw, downstream_of_one],
+        dependencies={
+            'downstream_of_throw': {'num': DependencyDefinition('throw')},
+            'downstream_of_one': {'num': DependencyDefinition('return_one')},
+        },
+    )
+
+    result = execute_pipeline(
+        pipeline_def, environment=THREAD_POOL_ENVIRONMENT, throw_on_error=False
+    )
+    assert not result.success
+    assert not result.result_for_solid('throw').success
+    assert result.result_for_solid('downstream_of_one').transformed_value() == 1
+
+    executed_solids = {solid_result.solid.name for solid_result in result.result_list}
+    assert 'downstream_of_throw' not in executed_solids
+
+
+def test_thread_pool_step_events():
+    events = []
+    execute_pipeline(
+        define_diamond_pipeline(),
+        environment=THREAD_POOL_ENVIRONMENT,
+        reentrant_info=ReentrantInfo(event_callback=events.append),
+    )
+
+    def _step_keys_for(event_type):
+        return {event.step_key for event in events if event.event_type == event_type}
+
+    all_step_keys = {
+        'return_two.transform',
+        'add_three.transform',
+        'mult_three.transform',
+        'adder.transform',
+    }
+    assert _step_keys_for(EventType.EXECUTION_PLAN_STEP_START) == all_step_keys
+    assert _step_keys_for(EventType.EXECUTION_PLAN_STEP_SUCCESS) == all_step_keys
+
+    success_events = [
+        event for event in events if event.event_type == EventType.EXECUTION_PLAN_STEP_SUCCESS
+    ]
+    assert {event.solid_name for event in success_events} == {
+        'return_two',
+        'add_three',
+        'mult_three',
+        'adder',
+    }
+
+
+def test_thread_pool_serializes_event_callback():
+    in_callback = threading.Lock()
+    overlaps = []
+
+    def _event_callback(_record):
+        # Fails to acquire only if another thread is in the callback at the same time
+        if not in_callback.acquire(False):
+            overlaps.append(True)
+            return
+        try:
+            time.sleep(0.001)
+        finally:
+            in_callback.release()
+
+    @lambda_solid
+    def left():
+        return 1
+
+    @lambda_solid
+    def right():
+        return 2
+
+    pipeline_def = PipelineDefinition(name='concurrent_pipeline', solids=[left, right])
+
+    result = execute_pipeline(
+        pipeline_def,
+        environment=THREAD_POOL_ENVIRONMENT,
+        reentrant_info=ReentrantInfo(event_callback=_event_callback),
+    )
+    assert result.success
+    assert not overlaps
+
+
+def test_thread_pool_invalid_max_workers_type():
+    with pytest.raises(PipelineConfigEvaluationError):
+        execute_pipeline(
+            define_diamond_pipeline(),
+            environment={'execution': {'engine': {'thread_pool': {'max_workers': 'two'}}}},
+        )
@@ -2,7 +2,7 @@ from collections import namedtuple
 import logging
 import uuid
 
-from dagster.core.execution_context import DAGSTER_META_KEY
+from dagster.core.execution_context import DAGSTER_META_KEY, RuntimeExecutionContext
 from dagster.utils.logging import DEBUG, INFO, WARNING, ERROR, CRITICAL
 from dagster.utils.test import create_test_runtime_execution_context
 
@@ -101,8 +101,58 @@ def test_log_message_id():
     logger = LoggerForTest()
     context = create_test_runtime_execution_context(loggers=[logger])
     context.info('something')
+    context.info('something else')
 
-    assert isinstance(uuid.UUID(logger.messages[0].dagster_meta['log_message_id']), uuid.UUID)
+    first_id, second_id = [message.dagster_meta['log_message_id'] for message in logger.messages]
+    assert first_id != second_id
+
+    first_prefix, first_count = first_id.rsplit('-', 1)
+    second_prefix, second_count = second_id.rsplit('-', 1)
+    assert first_prefix == second_prefix
+    assert int(second_count) == int(first_count) + 1
+
+
+def test_log_skipped_below_logger_level():
+    logger = LoggerForTest()
+    logger.setLevel(INFO)
+    context = create_test_runtime_execution_context(loggers=[logger])
+
+    context.debug('dropped', unserializable=object())
+    context.info('kept')
+
+    assert [message.dagster_meta['orig_message'] for message in logger.messages] == ['kept']
+
+
+def test_log_not_rendered_for_event_callback_below_logger_level():
+    logger = LoggerForTest()
+    logger.setLevel(INFO)
+    records = []
+    context = RuntimeExecutionContext(
+        str(uuid.uuid4()), loggers=[logger], event_callback=records.append
+    )
+
+    # Rendering the message would fail to json encode the object
+    context.debug('dropped', unserializable=object())
+    context.info('kept')
+
+    assert [message.dagster_meta['orig_message'] for message in logger.messages] == ['kept']
+    assert [record.user_message for record in records] == ['dropped', 'kept']
+    # Records render their message from their props when it is asked for
+    assert records[1].message == logger.messages[0].msg
+
+
+def test_log_accepted_by_any_logger():
+    info_logger = LoggerForTest()
+    info_logger.setLevel(INFO)
+    debug_logger = LoggerForTest()
+    debug_logger.setLevel(DEBUG)
+    context = create_test_runtime_execution_context(loggers=[info_logger, debug_logger])
+
+    context.debug('debug message')
+
+    assert [message.dagster_meta['orig_message'] for message in debug_logger.messages] == [
+        'debug message'
+    ]
 
 
 def test_interleaved_context_value():
@@ -2,15 +2,20 @@ from collections import defaultdict
 
 from dagster import (
     ExecutionContext,
+    ExpectationDefinition,
+    ExpectationResult,
+    OutputDefinition,
     PipelineDefinition,
     PipelineContextDefinition,
+    ReentrantInfo,
     execute_pipeline,
     lambda_solid,
 )
 
 from dagster.core.events import construct_event_logger, EventRecord, EventType
 
-from dagster.utils.logging import define_colored_console_logger
+from dagster.utils.error import SerializableErrorInfo
+from dagster.utils.logging import ERROR, define_colored_console_logger
 
 
 def single_event(events, event_type):
@@ -114,3 +119,123 @@ def test_single_solid_pipeline_failure():
     assert failure_event.pipeline_name == 'single_solid_pipeline'
     assert failure_event.solid_name == 'solid_one'
     assert failure_event.solid_definition_name == 'solid_one'
+
+
+class ReprCounter(object):
+    num_reprs = 0
+
+    def __repr__(self):
+        ReprCounter.num_reprs += 1
+        return 'ReprCounter'
+
+
+def _emitted_messages(log_value_summaries):
+    ReprCounter.num_reprs = 0
+    messages = []
+
+    @lambda_solid
+    def emit_value():
+        return ReprCounter()
+
+    pipeline_def = define_event_logging_pipeline(
+        name='value_summary_pipeline',
+        solids=[emit_value],
+        event_callback=lambda record: messages.append(record.user_message),
+    )
+
+    result = execute_pipeline(
+        pipeline_def, environment={'execution': {'log_value_summaries': log_value_summaries}}
+    )
+    assert result.success
+    return [message for message in messages if 'emitted' in message]
+
+
+def test_log_value_summaries():
+    assert _emitted_messages(log_value_summaries=True) == [
+        'Solid emit_value emitted output "result" value ReprCounter',
+        'Step emit_value.transform emitted ReprCounter for output result',
+    ]
+    assert ReprCounter.num_reprs == 2
+
+
+def test_log_value_summaries_off():
+    assert _emitted_messages(log_value_summaries=False) == [
+        'Solid emit_value emitted output "result"',
+        'Step emit_value.transform emitted output result',
+    ]
+    assert ReprCounter.num_reprs == 0
+
+
+def _expectation_messages(log_value_summaries):
+    ReprCounter.num_reprs = 0
+    messages = []
+
+    @lambda_solid(
+        output=OutputDefinition(
+            expectations=[
+                ExpectationDefinition(
+                    name='always', expectation_fn=lambda _info, _value: ExpectationResult(True)
+                )
+            ]
+        )
+    )
+    def emit_value():
+        return ReprCounter()
+
+    pipeline_def = define_event_logging_pipeline(
+        name='expectation_pipeline',
+        solids=[emit_value],
+        event_callback=lambda record: messages.append(record.user_message),
+    )
+
+    result = execute_pipeline(
+        pipeline_def, environment={'execution': {'log_value_summaries': log_value_summaries}}
+    )
+    assert result.success
+    return [message for message in messages if message.startswith('Expectation')]
+
+
+def test_expectation_value_summaries():
+    assert _expectation_messages(log_value_summaries=False) == [
+        'Expectation emit_value.output.result.expectation.always succeeded.'
+    ]
+    assert ReprCounter.num_reprs == 0
+
+    assert _expectation_messages(log_value_summaries=True) == [
+        'Expectation emit_value.output.result.expectation.always succeeded on ReprCounter.'
+    ]
+
+
+def test_event_callback_receives_records_whatever_the_log_level():
+    events = defaultdict(list)
+
+    @lambda_solid
+    def solid_one():
+        raise Exception('nope')
+
+    pipeline_def = PipelineDefinition(
+        name='single_solid_pipeline',
+        solids=[solid_one],
+        context_definitions={
+            'default': PipelineContextDefinition(
+                context_fn=lambda info: ExecutionContext.console_logging(log_level=ERROR)
+            )
+        },
+    )
+
+    result = execute_pipeline(
+        pipeline_def,
+        throw_on_error=False,
+        reentrant_info=ReentrantInfo(
+            event_callback=lambda record: events[record.event_type].append(record)
+        ),
+    )
+    assert not result.success
+
+    assert single_event(events, EventType.PIPELINE_START).pipeline_name == 'single_solid_pipeline'
+    assert single_event(events, EventType.EXECUTION_PLAN_STEP_START).solid_name == 'solid_one'
+    assert events[EventType.UNCATEGORIZED]
+
+    failure_event = single_event(events, EventType.EXECUTION_PLAN_STEP_FAILURE)
+    assert isinstance(failure_event.error_info, SerializableErrorInfo)
+    assert 'nope' in failure_event.error_info.message
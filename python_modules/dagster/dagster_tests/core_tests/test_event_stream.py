@@ -0,0 +1,150 @@
+import time
+
+from dagster.core.event_stream import EventLogReader, EventStreamDecoder, EventStreamEncoder
+from dagster.core.events import (
+    EventType,
+    ExecutionStepEventRecord,
+    ExecutionStepSuccessRecord,
+    LogMessageRecord,
+    PipelineEventRecord,
+)
+from dagster.utils.error import SerializableErrorInfo
+from dagster.utils.logging import INFO
+
+
+def _base_kwargs(event_type, message='message', error_info=None):
+    return dict(
+        error_info=error_info,
+        message=message,
+        level=INFO,
+        user_message='user ' + message,
+        event_type=event_type,
+        run_id='run_id',
+        timestamp=time.time(),
+    )
+
+
+def _step_kwargs(event_type, step_key='solid.transform', error_info=None):
+    kwargs = _base_kwargs(event_type, error_info=error_info)
+    kwargs.update(
+        step_key=step_key,
+        pipeline_name='pipeline',
+        solid_name='solid',
+        solid_definition_name='solid_def',
+    )
+    return kwargs
+
+
+def _define_events():
+    return [
+        PipelineEventRecord(pipeline_name='pipeline', **_base_kwargs(EventType.PIPELINE_START)),
+        LogMessageRecord(**_base_kwargs(EventType.UNCATEGORIZED, message=u'unicodé')),
+        ExecutionStepEventRecord(**_step_kwargs(EventType.EXECUTION_PLAN_STEP_START)),
+        ExecutionStepSuccessRecord(
+            millis=1.5,
+            type_check_millis=0.25,
+            **_step_kwargs(EventType.EXECUTION_PLAN_STEP_SUCCESS)
+        ),
+        ExecutionStepEventRecord(
+            **_step_kwargs(
+                EventType.EXECUTION_PLAN_STEP_FAILURE,
+                error_info=SerializableErrorInfo('Exception: nope\n', ['line 1\n', 'line 2\n']),
+            )
+        ),
+    ]
+
+
+class CustomPipelineEvent(PipelineEventRecord):
+    def __init__(self, process_id, **kwargs):
+        super(CustomPipelineEvent, self).__init__(**kwargs)
+        self.process_id = process_id
+
+
+def test_round_trip():
+    events = _define_events()
+    encoder = EventStreamEncoder()
+    decoder = EventStreamDecoder()
+
+    decoded = decoder.decode(b''.join(encoder.encode(event) for event in events))
+    assert [type(event) for event in decoded] == [type(event) for event in events]
+    assert [event.to_dict() for event in decoded] == [event.to_dict() for event in events]
+    assert decoded[-1].error_info == events[-1].error_info
+    assert decoded[3].type_check_millis == 0.25
+
+
+def test_pickled_objects():
+    encoder = EventStreamEncoder()
+    decoder = EventStreamDecoder()
+
+    custom_event = CustomPipelineEvent(
+        process_id=123, pipeline_name='pipeline', **_base_kwargs(EventType.PIPELINE_START)
+    )
+    (decoded_event,) = decoder.decode(encoder.encode(custom_event))
+    assert isinstance(decoded_event, CustomPipelineEvent)
+    assert decoded_event.process_id == 123
+
+    assert decoder.decode(encoder.encode({'not': 'an event'})) == [{'not': 'an event'}]
+
+
+def test_strings_are_interned():
+    encoder = EventStreamEncoder()
+    first = encoder.encode(
+        ExecutionStepEventRecord(**_step_kwargs(EventType.EXECUTION_PLAN_STEP_START))
+    )
+    second = encoder.encode(
+        ExecutionStepEventRecord(**_step_kwargs(EventType.EXECUTION_PLAN_STEP_START))
+    )
+    assert len(second) < len(first)
+
+
+def test_log_reader(tmpdir):
+    path = str(tmpdir.join('run.events'))
+    reader = EventLogReader(path)
+    assert reader.count() == 0
+    assert reader.events_after(-1) == []
+
+    events = _define_events()
+    encoder = EventStreamEncoder()
+    data = [encoder.encode(event) for event in events]
+
+    with open(path, 'wb') as ff:
+        ff.write(b''.join(data[:2]))
+        # Only part of the third event has been written
+        ff.write(data[2][:10])
+
+    assert reader.count() == 2
+    assert [event.message for event in reader.events_after(0)] == [events[1].message]
+
+    with open(path, 'ab') as ff:
+        ff.write(data[2][10:])
+        ff.write(b''.join(data[3:]))
+
+    assert reader.count() == 5
+    assert [event.to_dict() for event in reader.events_after(1, limit=2)] == [
+        event.to_dict() for event in events[2:4]
+    ]
+    assert [event.to_dict() for event in reader.events_after(3)] == [events[4].to_dict()]
+    assert reader.events_after(4) == []
+
+    # A new reader finds the same events
+    assert [event.to_dict() for event in EventLogReader(path).events_after(-1)] == [
+        event.to_dict() for event in events
+    ]
+
+
+def test_continue_log(tmpdir):
+    path = str(tmpdir.join('run.events'))
+    events = _define_events()
+    encoder = EventStreamEncoder()
+    with open(path, 'wb') as ff:
+        ff.write(b''.join(encoder.encode(event) for event in events[:2]))
+
+    # An encoder that continues the stream refers to the strings already in it
+    reader = EventLogReader(path)
+    encoder = EventStreamEncoder(strings=reader.strings)
+    with open(path, 'ab') as ff:
+        ff.write(b''.join(encoder.encode(event) for event in events[2:]))
+
+    assert [event.to_dict() for event in EventLogReader(path).events_after(-1)] == [
+        event.to_dict() for event in events
+    ]
@@ -163,6 +163,57 @@ def test_disconnected_graphs_adjaceny_lists():
     assert backwards_edges == {'B': {'A'}, 'A': set(), 'D': {'C'}, 'C': set()}
 
 
+def test_dependency_structure_lookups():
+    solids = {s.name: Solid(name=s.name, definition=s) for s in create_diamond_solids()}
+    dependency_structure = DependencyStructure.from_definitions(solids, diamond_deps())
+
+    assert [handle.solid.name for handle in dependency_structure.deps_of_solid('D')] == [
+        'B',
+        'C',
+    ]
+    assert dependency_structure.deps_of_solid('A_source') == []
+
+    deps_with_input = dependency_structure.deps_of_solid_with_input('D')
+    assert {
+        input_handle.input_def.name: output_handle.solid.name
+        for input_handle, output_handle in deps_with_input.items()
+    } == {'B': 'B', 'C': 'C'}
+
+    depended_by = dependency_structure.depended_by_of_solid('A')
+    assert list(depended_by.keys()) == [solids['A'].output_handle('result')]
+    assert sorted(
+        input_handle.solid.name for input_handle in depended_by[solids['A'].output_handle('result')]
+    ) == ['B', 'C']
+    assert dependency_structure.depended_by_of_solid('D') == {}
+
+
+def test_deep_chain_adjacency_lists():
+    # Deeper than the default recursion limit
+    num_solids = 3000
+    solid_defs = [create_root_solid('solid_0')] + [
+        SolidDefinition(
+            name='solid_{index}'.format(index=index),
+            inputs=[InputDefinition('prev')],
+            transform_fn=_transform_fn,
+            outputs=[OutputDefinition()],
+        )
+        for index in range(1, num_solids)
+    ]
+    dependencies = {
+        'solid_{index}'.format(index=index): {
+            'prev': DependencyDefinition('solid_{index}'.format(index=index - 1))
+        }
+        for index in range(1, num_solids)
+    }
+
+    # Downstream solids first, so that a recursive walk would go all the way up the chain
+    forward_edges, backwards_edges = _do_construct(list(reversed(solid_defs)), dependencies)
+    assert forward_edges['solid_0'] == {'solid_1'}
+    assert backwards_edges['solid_{index}'.format(index=num_solids - 1)] == {
+        'solid_{index}'.format(index=num_solids - 2)
+    }
+
+
 def create_diamond_solids():
     a_source = define_stub_solid('A_source', [input_set('A_input')])
     node_a = create_root_solid('A')
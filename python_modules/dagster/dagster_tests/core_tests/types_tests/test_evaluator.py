@@ -6,7 +6,10 @@ from dagster.core.types.evaluator import (
     EvaluationStackPathEntry,
     EvaluateValueResult,
     evaluate_config_value,
+    get_compiled_evaluator,
+    validate_config,
 )
+from dagster.core.types.default_applier import apply_default_values
 from dagster.core.types.field import resolve_to_config_type
 
 
@@ -532,3 +535,53 @@ def test_any_with_default_value():
     result = eval_config_value_from_dagster_type(dict_with_any, None)
     assert result.success
     assert result.value == {'any_field': 'foo'}
+
+
+def test_compiled_evaluator_matches_interpreter():
+    config_type = resolve_to_config_type(
+        Dict(
+            {
+                'name': Field(String),
+                'count': Field(Int, is_optional=True, default_value=3),
+                'tags': Field(List(Nullable(String)), is_optional=True),
+                'nested': Field(
+                    Dict({'flag': Field(Bool), 'extra': Field(Any, is_optional=True)}),
+                    is_optional=True,
+                ),
+                'source': Field(
+                    Selector({'path': Field(String), 'inline': Field(List(Int))}),
+                    is_optional=True,
+                ),
+            }
+        )
+    )
+
+    values = [
+        {'name': 'foo'},
+        {'name': 'foo', 'count': 1, 'tags': ['a', None], 'source': {'inline': [1, 2]}},
+        {'name': 'foo', 'nested': {'flag': True, 'extra': [1]}},
+        None,
+        {},
+        'not_a_dict',
+        {'name': 1, 'undefined': 2, 'other_undefined': 3},
+        {'name': 'foo', 'tags': 'not_a_list'},
+        {'name': 'foo', 'tags': [1, None, 2]},
+        {'name': 'foo', 'nested': {}},
+        {'name': 'foo', 'source': {'path': 'a', 'inline': [1]}},
+        {'name': 'foo', 'source': {'undefined': 'a'}},
+        {'name': 'foo', 'source': {'inline': ['a', 1, 'b']}},
+    ]
+
+    for value in values:
+        result = evaluate_config_value(config_type, value)
+        assert result.errors == validate_config(config_type, value)
+        if result.success:
+            assert result.value == apply_default_values(config_type, value)
+
+
+def test_compiled_evaluator_cached_per_type():
+    config_type = resolve_to_config_type(Dict({'list': Field(List(Int))}))
+    evaluator = get_compiled_evaluator(config_type)
+    assert get_compiled_evaluator(config_type) is evaluator
+    assert evaluate_config_value(config_type, {'list': [1]}).value == {'list': [1]}
+    assert get_compiled_evaluator(config_type) is evaluator
@@ -1,9 +1,21 @@
 import pytest
 
-from dagster.core.errors import DagsterRuntimeCoercionError
+from dagster.core.errors import DagsterInvariantViolationError, DagsterRuntimeCoercionError
 
-from dagster.core.types import Int, Nullable, List, PythonObjectType
-from dagster.core.types.runtime import resolve_to_runtime_type
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    OutputDefinition,
+    PipelineDefinition,
+    ReentrantInfo,
+    TypeCheckPolicy,
+    as_dagster_type,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.events import EventType
+from dagster.core.types import Any, Int, Nullable, List, PythonObjectType, Stream
+from dagster.core.types.runtime import MAX_VALUE_SUMMARY_CHARS, resolve_to_runtime_type
 
 
 class BarObj(object):
@@ -86,3 +98,205 @@ def test_nullable_list_combos_coerciion():
     assert_success(nullable_list_of_nullable_int.coerce_runtime_value, [])
     assert_success(nullable_list_of_nullable_int.coerce_runtime_value, [1])
     assert_success(nullable_list_of_nullable_int.coerce_runtime_value, [None])
+
+
+def test_value_summary_is_bounded():
+    any_type = resolve_to_runtime_type(Any)
+
+    assert any_type.summarize_value([1, 2]) == '[1, 2]'
+
+    assert len(any_type.summarize_value('x' * 10000)) <= MAX_VALUE_SUMMARY_CHARS
+    assert len(any_type.summarize_value(list(range(10000)))) <= MAX_VALUE_SUMMARY_CHARS
+
+    class BigRepr(object):
+        def __repr__(self):
+            return 'y' * 10000
+
+    assert len(any_type.summarize_value(BigRepr())) <= MAX_VALUE_SUMMARY_CHARS
+
+
+class Table(object):
+    def __init__(self, rows):
+        self.rows = rows
+
+
+as_dagster_type(
+    Table, value_summary_fn=lambda table: 'Table with {num} rows'.format(num=len(table.rows))
+)
+
+
+def test_value_summary_fn():
+    table_type = resolve_to_runtime_type(Table)
+    assert table_type.summarize_value(Table([1, 2, 3])) == 'Table with 3 rows'
+
+    # Falls back to the bounded repr rather than failing
+    assert table_type.summarize_value('not a table') == "'not a table'"
+
+
+def test_stream_coercion_is_lazy():
+    stream_of_int = resolve_to_runtime_type(Stream(Int))
+    assert stream_of_int.name == 'Stream.Int'
+    assert stream_of_int.is_stream
+
+    assert_failure(stream_of_int.coerce_runtime_value, None)
+    assert_failure(stream_of_int.coerce_runtime_value, 'not_chunks')
+
+    pulled = []
+
+    def _chunks():
+        for chunk in [[1, 2], [3], ['not_an_int']]:
+            pulled.append(chunk)
+            yield chunk
+
+    stream = stream_of_int.coerce_runtime_value(_chunks())
+    assert pulled == []
+    assert stream_of_int.summarize_value(stream) == 'Stream.Int'
+
+    chunks = iter(stream)
+    assert next(chunks) == [1, 2]
+    assert next(chunks) == [3]
+    assert len(pulled) == 2
+
+    with pytest.raises(DagsterRuntimeCoercionError):
+        next(chunks)
+
+    with pytest.raises(DagsterRuntimeCoercionError):
+        list(stream_of_int.coerce_runtime_value([1, 2]))
+
+
+def test_stream_can_only_be_consumed_once():
+    stream_of_int = resolve_to_runtime_type(Stream(Int))
+    stream = stream_of_int.coerce_runtime_value([[1], [2]])
+
+    # Coercing again, e.g. as the input of the downstream step, keeps the same stream
+    assert stream_of_int.coerce_runtime_value(stream) is stream
+    assert list(stream) == [[1], [2]]
+
+    with pytest.raises(DagsterInvariantViolationError):
+        list(stream)
+
+
+def test_stream_between_solids():
+    produced = []
+
+    @lambda_solid(output=OutputDefinition(Stream(Int)))
+    def produce_batches():
+        def _batches():
+            for start in range(0, 10, 2):
+                produced.append(start)
+                yield [start, start + 1]
+
+        return _batches()
+
+    @lambda_solid(inputs=[InputDefinition('batches', Stream(Int))])
+    def sum_batches(batches):
+        total = 0
+        for batch in batches:
+            # The producer runs ahead of the consumer by at most one chunk
+            assert len(produced) == batch[0] // 2 + 1
+            total += sum(batch)
+        return total
+
+    pipeline_def = PipelineDefinition(
+        name='stream_pipeline',
+        solids=[produce_batches, sum_batches],
+        dependencies={'sum_batches': {'batches': DependencyDefinition('produce_batches')}},
+    )
+
+    result = execute_pipeline(pipeline_def)
+    assert result.success
+    assert result.result_for_solid('sum_batches').transformed_value() == 45
+
+
+def test_list_coercion_does_not_copy():
+    list_of_int = resolve_to_runtime_type(List(Int))
+    value = [1, 2, 3]
+    assert list_of_int.coerce_runtime_value(value) is value
+
+
+def test_type_check_policies():
+    list_of_int = resolve_to_runtime_type(List(Int))
+    value = list(range(1000))
+
+    value[1] = 'not_an_int'
+    with pytest.raises(DagsterRuntimeCoercionError):
+        TypeCheckPolicy.full().coerce_runtime_value(list_of_int, value)
+
+    # Only every tenth element is sampled
+    assert TypeCheckPolicy.sampled(100).coerce_runtime_value(list_of_int, value) is value
+
+    value[10] = 'not_an_int'
+    with pytest.raises(DagsterRuntimeCoercionError):
+        TypeCheckPolicy.sampled(100).coerce_runtime_value(list_of_int, value)
+
+    with pytest.raises(DagsterRuntimeCoercionError):
+        TypeCheckPolicy.sampled(100).coerce_runtime_value(list_of_int, 'not_a_list')
+
+    nullable_list_of_int = resolve_to_runtime_type(Nullable(List(Int)))
+    assert TypeCheckPolicy.sampled().coerce_runtime_value(nullable_list_of_int, None) is None
+
+    assert TypeCheckPolicy.off().coerce_runtime_value(list_of_int, 'not_a_list') == 'not_a_list'
+
+
+def define_type_check_pipeline(output_type_check_policy=None, input_type_check_policy=None):
+    @lambda_solid(output=OutputDefinition(List(Int), type_check_policy=output_type_check_policy))
+    def produce_list():
+        return [1, 'not_an_int']
+
+    @lambda_solid(
+        inputs=[InputDefinition('nums', List(Int), type_check_policy=input_type_check_policy)]
+    )
+    def count(nums):
+        return len(nums)
+
+    return PipelineDefinition(
+        name='type_check_pipeline',
+        solids=[produce_list, count],
+        dependencies={'count': {'nums': DependencyDefinition('produce_list')}},
+    )
+
+
+def test_type_check_policy_of_run():
+    result = execute_pipeline(define_type_check_pipeline(), throw_on_error=False)
+    assert not result.success
+
+    events = []
+    result = execute_pipeline(
+        define_type_check_pipeline(),
+        environment={'execution': {'type_check': {'off': {}}}},
+        reentrant_info=ReentrantInfo(event_callback=events.append),
+    )
+    assert result.success
+    assert result.result_for_solid('count').transformed_value() == 2
+
+    success_events = [
+        event for event in events if event.event_type == EventType.EXECUTION_PLAN_STEP_SUCCESS
+    ]
+    assert len(success_events) == 2
+    assert all(event.type_check_millis >= 0.0 for event in success_events)
+
+
+def test_type_check_policy_of_definitions():
+    result = execute_pipeline(
+        define_type_check_pipeline(input_type_check_policy=TypeCheckPolicy.off()),
+        throw_on_error=False,
+    )
+    assert not result.success
+    assert not result.result_for_solid('produce_list').success
+
+    result = execute_pipeline(
+        define_type_check_pipeline(output_type_check_policy=TypeCheckPolicy.off()),
+        throw_on_error=False,
+    )
+    assert not result.success
+    assert result.result_for_solid('produce_list').success
+    assert not result.result_for_solid('count').success
+
+    # Sampling one element only checks the first element of the list
+    result = execute_pipeline(
+        define_type_check_pipeline(
+            output_type_check_policy=TypeCheckPolicy.sampled(1),
+            input_type_check_policy=TypeCheckPolicy.sampled(1),
+        )
+    )
+    assert result.success